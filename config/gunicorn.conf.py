@@ -0,0 +1,35 @@
+"""
+gunicorn 설정 (프로덕션 서빙 모드)
+
+@FEAT:framework @COMP:config @TYPE:config
+
+모든 값은 환경변수로 조정합니다. 용량 산정은 docs/operations/production_server.md 참조.
+
+- GUNICORN_WORKERS: 워커 프로세스 수 (기본 1)
+    SSE 이벤트 구독(EventService)과 WebSocket 체결 이벤트는 프로세스 메모리 기반이므로
+    워커가 2개 이상이면 다른 워커에서 발생한 이벤트가 해당 워커의 SSE 클라이언트에 전달되지 않습니다.
+- GUNICORN_THREADS: 워커당 요청 스레드 수 (기본 64) = 워커당 최대 동시 요청 수 (SSE 연결 포함)
+- GUNICORN_WORKER_CLASS: gthread (기본)
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '5001')}"
+if os.path.isdir('/app/web_server'):
+    chdir = '/app/web_server'  # logs/ 상대 경로 기준 (Dockerfile WORKDIR과 동일)
+pythonpath = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread')
+workers = int(os.environ.get('GUNICORN_WORKERS', '1'))
+threads = int(os.environ.get('GUNICORN_THREADS', '64'))
+
+# gthread 워커 하트비트 기준 (개별 요청 시간 제한 아님 - SSE 장기 연결 허용)
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', '120'))
+graceful_timeout = int(os.environ.get('GUNICORN_GRACEFUL_TIMEOUT', '30'))
+keepalive = int(os.environ.get('GUNICORN_KEEPALIVE', '5'))
+
+# 워커마다 앱을 생성 (preload 시 fork 이전에 시작된 스레드/이벤트 루프가 자식 프로세스에서 동작하지 않음)
+preload_app = False
+
+accesslog = os.environ.get('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'INFO').lower()
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""
+트레이딩 자동화 시스템 프로덕션 WSGI 진입점 (gunicorn)
+
+실행:
+    gunicorn -c /app/config/gunicorn.conf.py wsgi:app
+
+개발 서버(scripts/app.py)와 달리 워커/스레드 수로 동시 요청 수를 제한하며,
+백그라운드 서비스(APScheduler, WebSocketManager, OrderFillMonitor)는
+잠금을 획득한 워커 1개에서만 실행됩니다 (app.claim_background_services 참조).
+"""
+import os
+import sys
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+for relative_path in ('web_server', 'config'):
+    path = os.path.abspath(os.path.join(script_dir, '..', relative_path))
+    if os.path.exists(path) and path not in sys.path:
+        sys.path.insert(0, path)
+
+# 백그라운드 서비스 소유 워커 선출 모드 (WERKZEUG_RUN_MAIN 대신 파일 잠금 사용)
+os.environ.setdefault('APP_SERVER', 'gunicorn')
+
+from app import create_app  # noqa: E402
+
+app = create_app()
@@ -6,6 +6,37 @@ pytest configuration for tests
 
 import sys
 import os
+import tempfile
+
+import pytest
+
+# Set testing database URL BEFORE any test module imports the app
+# (app.DefaultConfig reads DATABASE_URL at import time)
+# Use a temp file for SQLite to avoid pool parameter issues with :memory:
+db_fd, db_path = tempfile.mkstemp(suffix='.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+os.environ['FLASK_ENV'] = 'testing'
 
 # Add web_server to Python path for importing app modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'web_server'))
+
+
+def pytest_unconfigure(config):
+    """Remove the temp SQLite database after the session"""
+    os.close(db_fd)
+    if os.path.exists(db_path):
+        os.unlink(db_path)
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'benchmark: wall-clock comparison, runs only with RUN_BENCHMARKS=1')
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip wall-clock benchmarks unless explicitly enabled (timing asserts are flaky on shared CI)"""
+    if os.getenv('RUN_BENCHMARKS', 'false').lower() in ('1', 'true', 'yes'):
+        return
+    skip_benchmark = pytest.mark.skip(reason='benchmark: set RUN_BENCHMARKS=1 to run')
+    for item in items:
+        if 'benchmark' in item.keywords:
+            item.add_marker(skip_benchmark)
@@ -0,0 +1,192 @@
+"""
+계좌별 거래소 클라이언트 레지스트리 테스트
+
+@FEAT:exchange-integration @COMP:test @TYPE:unit
+"""
+
+import asyncio
+import threading
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from app.exchanges.exceptions import ExchangeError
+from app.exchanges.client_registry import ExchangeClientRegistry
+from app.exchanges.crypto.binance import BinanceExchange
+from app.exchanges.market_store import market_store
+from app.exchanges.models import MarketInfo
+from app.services.exchange import ExchangeService
+
+
+class _FakeClient:
+    def __init__(self, account):
+        self.account_id = account.id
+        self.closed = False
+
+    def close_http_session(self):
+        self.closed = True
+
+
+def _account(account_id, public_api='key', secret_api='secret', is_testnet=False):
+    return SimpleNamespace(
+        id=account_id, exchange='BINANCE', account_type='CRYPTO',
+        public_api=public_api, secret_api=secret_api, passphrase=None,
+        is_testnet=is_testnet, _securities_config=None
+    )
+
+
+def _registry(max_size=10):
+    created = []
+
+    def factory(account):
+        client = _FakeClient(account)
+        created.append(client)
+        return client
+
+    return ExchangeClientRegistry(max_size=max_size, factory=factory), created
+
+
+def test_reuses_client_per_account():
+    registry, created = _registry()
+
+    first = registry.get(_account(1))
+    assert registry.get(_account(1)) is first
+    assert registry.get(_account(2)) is not first
+    assert len(created) == 2
+    assert registry.get_stats()['hits'] == 1
+
+
+def test_cache_hit_does_not_mutate_shared_client():
+    # 요청마다 다른 Account 인스턴스가 들어와도 공유 클라이언트의 상태는 생성 시점 그대로 유지
+    created_with = []
+
+    def factory(account):
+        created_with.append(account)
+        client = _FakeClient(account)
+        client.account = account
+        return client
+
+    registry = ExchangeClientRegistry(factory=factory)
+    client = registry.get(_account(1))
+    snapshot = dict(vars(client))
+
+    barrier = threading.Barrier(8)
+
+    def hit():
+        barrier.wait(5)
+        assert registry.get(_account(1)) is client
+
+    threads = [threading.Thread(target=hit) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert vars(client) == snapshot
+    assert client.account is created_with[0]
+    assert registry.get_stats()['hits'] == 8
+
+
+def test_credential_change_replaces_and_closes_client():
+    registry, created = _registry()
+
+    old = registry.get(_account(1, secret_api='old'))
+    new = registry.get(_account(1, secret_api='rotated'))
+
+    assert new is not old
+    assert old.closed is True
+    assert registry.get_stats()['size'] == 1
+
+
+def test_invalidate_and_lru_eviction():
+    registry, created = _registry(max_size=2)
+
+    a = registry.get(_account(1))
+    registry.get(_account(2))
+    registry.get(_account(1))       # 1번을 최근 사용으로 갱신
+    registry.get(_account(3))       # 가장 오래된 2번이 제거됨
+
+    assert set(registry.clients()) == {1, 3}
+    assert created[1].closed is True
+
+    assert registry.invalidate(1) is True
+    assert a.closed is True
+    assert registry.invalidate(1) is False
+    assert registry.clear() == 1
+
+
+def test_eviction_closes_aiohttp_sessions_on_their_loops():
+    client = BinanceExchange(api_key='k', api_secret='s')
+
+    # 1) 다른 스레드에서 계속 실행 중인 루프에 바인딩된 세션 (fan-out 루프)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    running_session = asyncio.run_coroutine_threadsafe(client._get_session(), loop).result(5)
+
+    # 2) 이미 종료된 asyncio.run 루프에 바인딩된 세션
+    async def _open():
+        return await client._get_session()
+    finished_session = asyncio.run(_open())
+
+    registry = ExchangeClientRegistry(factory=lambda account: client)
+    registry.get(_account(1))
+    try:
+        assert registry.invalidate(1) is True
+        assert running_session.closed is True
+        assert finished_session.closed is True
+        assert client._sessions == {}
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(5)
+        loop.close()
+
+
+def test_securities_account_needs_no_shared_registration():
+    service = ExchangeService()
+    created = []
+
+    def factory(account):
+        if account.exchange != 'KIS':
+            raise ValueError(f"지원되지 않는 증권사: {account.exchange}")
+        client = _FakeClient(account)
+        created.append(client)
+        return client
+
+    service.client_registry = ExchangeClientRegistry(factory=factory)
+    kis = SimpleNamespace(
+        id=7, exchange='KIS', account_type='STOCK', public_api='key', secret_api='secret',
+        passphrase=None, is_testnet=False, _securities_config=None
+    )
+
+    assert service.get_exchange(kis) is created[0]
+    with pytest.raises(ExchangeError, match='Unsupported exchange'):
+        service.get_exchange(SimpleNamespace(**{**vars(kis), 'id': 8, 'exchange': 'NOPE'}))
+
+
+def test_clients_share_market_store_tables():
+    market_store.clear()
+    public = BinanceExchange(api_key='', api_secret='')
+    public._publish_markets('spot', {'BTC/USDT': _market_info('BTCUSDT')})
+
+    client = BinanceExchange(api_key='k', api_secret='s')
+    assert client.load_markets('spot') is market_store.get_markets('binance', 'spot')
+    assert client.load_markets('spot', force_cache=True)['BTC/USDT'].symbol == 'BTCUSDT'
+    assert client.order_type_mappings is not public.order_type_mappings
+
+    # 테스트넷 클라이언트는 실거래 테이블을 보지 않음
+    testnet = BinanceExchange(api_key='k', api_secret='s', testnet=True)
+    assert testnet.market_store_exchange == 'binance_testnet'
+    assert testnet._get_stored_markets('spot') is None
+    market_store.clear()
+
+
+def _market_info(symbol):
+    return MarketInfo(
+        symbol=symbol, base_asset='BTC', quote_asset='USDT', status='TRADING', active=True,
+        price_precision=2, amount_precision=5, base_precision=8, quote_precision=8,
+        min_qty=Decimal('0.00001'), max_qty=Decimal('9000'), step_size=Decimal('0.00001'),
+        min_price=Decimal('0.01'), max_price=Decimal('1000000'), tick_size=Decimal('0.01'),
+        min_notional=Decimal('5')
+    )
@@ -0,0 +1,54 @@
+"""
+거래소 동기 HTTP Keep-Alive 커넥션 풀 테스트
+
+@FEAT:exchange-integration @COMP:test @TYPE:unit
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.exchanges.crypto.binance import BinanceExchange
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = json.dumps({'ok': True}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_sync_requests_reuse_pooled_connection(local_server):
+    client = BinanceExchange(api_key='', api_secret='')
+
+    for _ in range(5):
+        assert client._request('GET', f"{local_server}/ping") == {'ok': True}
+
+    stats = client.get_http_pool_stats()
+    assert stats['active'] is True
+    assert stats['requests'] == 5
+    assert stats['new_connections'] == 1
+    assert stats['reused_requests'] == 4
+
+    client.close_http_session()
+    assert client.get_http_pool_stats()['active'] is False
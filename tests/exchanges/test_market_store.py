@@ -0,0 +1,184 @@
+"""
+공유 MarketInfo 저장소 테스트 (copy-on-write 스냅샷 + 메모리/조회 지연 측정)
+
+@FEAT:exchange-integration @FEAT:symbol-validation @COMP:test @TYPE:unit
+"""
+
+import gc
+import json
+import threading
+import time
+import tracemalloc
+from dataclasses import field, fields, make_dataclass, MISSING
+from decimal import Decimal
+
+import pytest
+
+from app.exchanges.market_store import MarketStore
+from app.exchanges.models import MarketInfo
+from app.exchanges.precision_providers import ApiBasedPrecisionProvider
+
+
+def _exchange_info_json(count):
+    symbols = []
+    for i in range(count):
+        base = f"C{i:04d}"
+        symbols.append({
+            'symbol': f"{base}USDT", 'baseAsset': base, 'quoteAsset': 'USDT', 'status': 'TRADING',
+            'pricePrecision': 4, 'quantityPrecision': 1, 'baseAssetPrecision': 8, 'quotePrecision': 8,
+            'filters': [
+                {'filterType': 'PRICE_FILTER', 'minPrice': '0.000100', 'maxPrice': '200000',
+                 'tickSize': ['0.000100', '0.0100', '0.10'][i % 3]},
+                {'filterType': 'LOT_SIZE', 'minQty': '0.1', 'maxQty': '10000000', 'stepSize': '0.1'},
+                {'filterType': 'MIN_NOTIONAL', 'notional': '5'},
+            ],
+        })
+    return json.dumps({'symbols': symbols})
+
+
+def _parse(raw):
+    """exchangeInfo 응답 파싱 (매번 새 문자열/Decimal 객체 생성 - 실제 API 응답과 동일)"""
+    markets = {}
+    for item in json.loads(raw)['symbols']:
+        info = MarketInfo.from_binance_futures(item)
+        info.precision_provider = ApiBasedPrecisionProvider(info)
+        markets[f"{item['baseAsset']}/{item['quoteAsset']}"] = info
+    return markets
+
+
+# 기존 구조: __slots__ 없는 dataclass + __dict__ 있는 provider
+_LegacyMarketInfo = make_dataclass('LegacyMarketInfo', [
+    (f.name, f.type, field(default=f.default) if f.default is not MISSING else field())
+    for f in fields(MarketInfo)
+])
+
+
+class _LegacyProvider:
+    def __init__(self, market_info):
+        self.market_info = market_info
+
+
+def _legacy_table(raw):
+    table = {}
+    for symbol, info in _parse(raw).items():
+        legacy = _LegacyMarketInfo(**{f.name: getattr(info, f.name) for f in fields(MarketInfo)})
+        legacy.precision_provider = _LegacyProvider(legacy)
+        table[symbol] = legacy
+    return table
+
+
+def _traced_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = build()
+        gc.collect()
+        return result, tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def _market(symbol, step='0.001'):
+    return MarketInfo(
+        symbol=symbol.replace('/', ''), base_asset=symbol.split('/')[0], quote_asset=symbol.split('/')[1],
+        status='TRADING', active=True,
+        price_precision=2, amount_precision=3, base_precision=8, quote_precision=8,
+        min_qty=Decimal('0.001'), max_qty=Decimal('9000'), step_size=Decimal(step),
+        min_price=Decimal('0.01'), max_price=Decimal('1000000'), tick_size=Decimal('0.01'),
+        min_notional=Decimal('5'), market_type='SPOT'
+    )
+
+
+def test_publish_swaps_one_table_and_keeps_old_snapshot_intact():
+    store = MarketStore()
+    store.publish_many({
+        ('binance', 'spot'): {'BTC/USDT': _market('BTC/USDT'), 'OLD/USDT': _market('OLD/USDT')},
+        ('binance', 'futures'): {'BTC/USDT': _market('BTC/USDT')},
+    })
+    before = store.snapshot
+
+    store.publish('BINANCE', 'SPOT', {'BTC/USDT': _market('BTC/USDT', step='0.0001')})
+
+    assert store.get('binance', 'spot', 'OLD/USDT') is None
+    assert store.get('Binance', 'SPOT', 'BTC/USDT').step_size == Decimal('0.0001')
+    assert store.get('binance', 'futures', 'BTC/USDT') is before.get('binance', 'futures', 'BTC/USDT')
+    # 이미 받아 간 스냅샷은 그대로 (락 없이 읽는 쪽이 중간 상태를 보지 않음)
+    assert before.get('binance', 'spot', 'OLD/USDT') is not None
+    assert store.snapshot.version == before.version + 1
+    with pytest.raises(TypeError):
+        store.get_markets('binance', 'spot')['ETH/USDT'] = _market('ETH/USDT')
+
+    assert store.invalidate('binance') == 2
+    assert store.loaded_at('binance', 'spot') == 0.0
+    assert store.get('binance', 'spot', 'BTC/USDT') is not None
+
+
+def test_publish_shares_equal_values_without_changing_precision():
+    store = MarketStore()
+    first, second = _market('BTC/USDT'), _market('ETH/USDT', step='0.0010')
+    store.publish('binance', 'spot', {'BTC/USDT': first, 'ETH/USDT': second})
+
+    assert first.min_notional is second.min_notional
+    assert first.quote_asset is second.quote_asset
+    # 0.001과 0.0010은 같은 값이지만 quantize 자릿수가 달라 공유하지 않음
+    assert first.step_size is not second.step_size
+    assert str(second.step_size) == '0.0010'
+
+
+def _build_tables(raw):
+    # 기존: SymbolValidator 캐시 + 거래소 클라이언트 캐시가 각자 파싱한 2벌
+    def build_legacy():
+        validator_cache = {f"BINANCE_{symbol}_FUTURES": info for symbol, info in _legacy_table(raw).items()}
+        client_cache = _legacy_table(raw)
+        return validator_cache, client_cache
+
+    # 신규: 한 번 파싱 → 공유 저장소 1벌 (slots + interning + Decimal 공유)
+    def build_new():
+        store = MarketStore()
+        store.publish('binance', 'futures', _parse(raw))
+        return store
+
+    (validator_cache, _), legacy_bytes = _traced_bytes(build_legacy)
+    store, new_bytes = _traced_bytes(build_new)
+    return validator_cache, legacy_bytes, store, new_bytes
+
+
+def test_shared_store_uses_less_than_half_the_memory():
+    raw = _exchange_info_json(3000)
+    symbols = list(_parse(raw))
+    _, legacy_bytes, store, new_bytes = _build_tables(raw)
+
+    print(f"\n{len(symbols)} markets: memory legacy={legacy_bytes / 1024:.0f}KiB new={new_bytes / 1024:.0f}KiB")
+    assert store.get('binance', 'futures', symbols[0]) is not None
+    assert new_bytes < legacy_bytes / 2
+
+
+@pytest.mark.benchmark
+def test_benchmark_lookup_latency():
+    raw = _exchange_info_json(3000)
+    symbols = list(_parse(raw))
+    validator_cache, _, store, _ = _build_tables(raw)
+
+    lock = threading.RLock()
+
+    def legacy_lookup(symbol):
+        cache_key = f"{'binance'.upper()}_{symbol.upper()}_{'futures'.upper()}"
+        with lock:
+            return validator_cache.get(cache_key)
+
+    iterations = 100_000
+    lookups = [symbols[i * 7919 % len(symbols)] for i in range(iterations)]
+
+    started = time.perf_counter()
+    for symbol in lookups:
+        legacy_lookup(symbol)
+    legacy_ns = (time.perf_counter() - started) / iterations * 1e9
+
+    started = time.perf_counter()
+    for symbol in lookups:
+        store.get('binance', 'futures', symbol)
+    new_ns = (time.perf_counter() - started) / iterations * 1e9
+
+    print(f"\n{len(symbols)} markets: lookup legacy={legacy_ns:.0f}ns new={new_ns:.0f}ns")
+    assert new_ns < legacy_ns
@@ -0,0 +1,104 @@
+"""
+Integration test for set-based strategy performance calculation
+
+@FEAT:analytics @COMP:test @TYPE:integration
+
+Validates that calculate_performance_range() aggregates trade_executions per
+(strategy, date), carries cumulative PnL across days and calls, and upserts
+into strategy_performance without duplicating rows on recalculation.
+"""
+
+import uuid
+from datetime import date, datetime, time, timedelta
+
+from app import db
+from app.models import StrategyCapital, StrategyPerformance, TradeExecution
+from app.services.performance_tracking import performance_tracking_service
+
+
+def _add_execution(strategy_account_id, execution_time, realized_pnl, commission=0.1):
+    db.session.add(TradeExecution(
+        strategy_account_id=strategy_account_id,
+        exchange_trade_id=f'perf-{uuid.uuid4().hex[:12]}',
+        exchange_order_id=f'perf-{uuid.uuid4().hex[:12]}',
+        symbol='BTC/USDT',
+        side='SELL',
+        execution_price=50000.0,
+        execution_quantity=0.01,
+        commission=commission,
+        execution_time=execution_time,
+        realized_pnl=realized_pnl,
+        market_type='FUTURES',
+    ))
+
+
+def _performance_rows(strategy_id):
+    return (
+        StrategyPerformance.query
+        .filter_by(strategy_id=strategy_id)
+        .order_by(StrategyPerformance.date)
+        .all()
+    )
+
+
+def test_range_calculation_upserts_daily_rows(app, test_data):
+    strategy_id = test_data['strategy_id']
+    sa_id = test_data['strategy_account_id']
+    start = date(2025, 3, 1)
+
+    with app.app_context():
+        db.session.add(StrategyCapital(strategy_account_id=sa_id, allocated_capital=1000.0))
+        _add_execution(sa_id, datetime.combine(start, time(9)), 10.0)
+        _add_execution(sa_id, datetime.combine(start, time(15)), -4.0)
+        # 3/2는 체결 없음 → 0으로 채우고 누적 유지
+        _add_execution(sa_id, datetime.combine(start + timedelta(days=2), time(12)), 20.0)
+        db.session.commit()
+
+        result = performance_tracking_service.calculate_performance_range(
+            start, start + timedelta(days=2), [strategy_id]
+        )
+        assert result['success'] is True
+        assert result['processed'] == 3
+
+        rows = _performance_rows(strategy_id)
+        assert [row.daily_pnl for row in rows] == [6.0, 0.0, 20.0]
+        assert [row.cumulative_pnl for row in rows] == [6.0, 6.0, 26.0]
+        assert [row.total_trades for row in rows] == [2, 0, 1]
+        assert rows[0].win_rate == 50.0
+        assert rows[0].daily_return == 0.6
+        assert rows[2].cumulative_return == 2.6
+        assert rows[0].total_commission == 0.2
+
+        # 재계산은 기존 행을 갱신 (ON CONFLICT DO UPDATE)
+        _add_execution(sa_id, datetime.combine(start, time(20)), 4.0)
+        db.session.commit()
+        performance_tracking_service.calculate_performance_range(
+            start, start + timedelta(days=2), [strategy_id]
+        )
+        db.session.expire_all()
+
+        rows = _performance_rows(strategy_id)
+        assert len(rows) == 3
+        assert [row.cumulative_pnl for row in rows] == [10.0, 10.0, 30.0]
+
+
+def test_single_day_wrapper_continues_cumulative_pnl(app, test_data):
+    strategy_id = test_data['strategy_id']
+    sa_id = test_data['strategy_account_id']
+    start = date(2025, 4, 1)
+
+    with app.app_context():
+        _add_execution(sa_id, datetime.combine(start, time(10)), 5.0)
+        _add_execution(sa_id, datetime.combine(start + timedelta(days=1), time(10)), -2.0)
+        db.session.commit()
+
+        first = performance_tracking_service.calculate_daily_performance(strategy_id, start)
+        assert first.cumulative_pnl == 5.0
+
+        second = performance_tracking_service.calculate_daily_performance(
+            strategy_id, start + timedelta(days=1)
+        )
+        assert second.daily_pnl == -2.0
+        assert second.cumulative_pnl == 3.0
+        # 자본 미설정 시 수익률 0
+        assert second.daily_return == 0.0
@@ -0,0 +1,150 @@
+"""
+Integration test for the daily PnL rollup (strategy_account_daily_pnl)
+
+@FEAT:pnl-rollup @FEAT:analytics @COMP:test @TYPE:integration
+
+Validates that incremental updates from RecordManager.apply_realized_pnl match a
+full rebuild from the trades table, and that the dashboard reads the rollup.
+"""
+
+import uuid
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from app import db
+from app.models import StrategyAccountDailyPnl, StrategyCapital, Trade
+from app.services.analytics import AnalyticsService
+from app.services.pnl_rollup import pnl_rollup_service
+from app.services.trading import trading_service
+
+_COLUMNS = (
+    'date', 'realized_pnl', 'trade_count', 'winning_trades', 'losing_trades',
+    'gross_profit', 'gross_loss', 'cumulative_pnl', 'peak_pnl',
+    'current_streak', 'max_win_streak', 'max_loss_streak', 'fees',
+)
+
+
+def _add_trade(strategy_account_id, timestamp):
+    trade = Trade(
+        strategy_account_id=strategy_account_id,
+        exchange_order_id=f'rollup-{uuid.uuid4().hex[:12]}',
+        symbol='BTC/USDT',
+        side='SELL',
+        order_type='MARKET',
+        price=50000.0,
+        quantity=0.01,
+        timestamp=timestamp,
+        is_entry=False,
+    )
+    db.session.add(trade)
+    db.session.commit()
+    return trade.id
+
+
+def _snapshot(strategy_account_id):
+    rows = (
+        StrategyAccountDailyPnl.query
+        .filter_by(strategy_account_id=strategy_account_id)
+        .order_by(StrategyAccountDailyPnl.date)
+        .all()
+    )
+    return [tuple(getattr(row, column) for column in _COLUMNS) for row in rows]
+
+
+def test_incremental_rollup_matches_rebuild(app, test_data):
+    sa_id = test_data['strategy_account_id']
+    record_manager = trading_service.record_manager
+    base = datetime.combine(datetime.utcnow().date() - timedelta(days=3), time(1))
+
+    with app.app_context():
+        fills = [
+            (base, Decimal('10')),
+            (base + timedelta(hours=1), Decimal('-4')),
+            (base + timedelta(days=1), Decimal('-3')),
+            (base + timedelta(days=1, hours=2), Decimal('-2')),
+            (base + timedelta(days=2), Decimal('7')),
+        ]
+        trade_ids = []
+        for timestamp, pnl in fills:
+            trade_id = _add_trade(sa_id, timestamp)
+            trade_ids.append(trade_id)
+            assert record_manager.apply_realized_pnl(trade_id, pnl) is True
+
+        # 부분 체결 누적: 같은 거래에 손익이 추가되어도 거래 수는 그대로
+        assert record_manager.apply_realized_pnl(trade_ids[-1], Decimal('1')) is True
+
+        incremental = _snapshot(sa_id)
+        assert [row[1] for row in incremental] == [6.0, -5.0, 8.0]
+        assert incremental[-1][2] == 1
+        assert incremental[-1][7] == 9.0  # cumulative_pnl
+        assert incremental[-1][8] == 9.0  # peak_pnl (일 종료 기준)
+        assert incremental[1][11] == 3  # max_loss_streak
+
+        pnl_rollup_service.rebuild([sa_id])
+        db.session.expire_all()
+        assert _snapshot(sa_id) == incremental
+
+
+def test_recorded_fees_match_rebuild(app, test_data):
+    sa_id = test_data['strategy_account_id']
+    record_manager = trading_service.record_manager
+
+    with app.app_context():
+        from app.models import Account, Strategy
+        strategy = db.session.get(Strategy, test_data['strategy_id'])
+        account = db.session.get(Account, test_data['account_id'])
+        order_id = f'rollup-fee-{uuid.uuid4().hex[:12]}'
+
+        # 부분 체결: 누적 수수료가 갱신될 때마다 증분만 반영
+        for quantity, fee in ((Decimal('0.01'), Decimal('0.5')), (Decimal('0.02'), Decimal('1.25'))):
+            result = record_manager.create_trade_record(
+                strategy, account, 'BTC/USDT', 'SELL', quantity, Decimal('50000'),
+                order_id, 'MARKET', fee=fee
+            )
+            assert result['success'] is True
+        assert record_manager.apply_realized_pnl(result['trade_id'], Decimal('5')) is True
+
+        # 체결일이 바뀐 거래의 기여분은 새 체결일로 이동
+        trade = db.session.get(Trade, result['trade_id'])
+        previous = (trade.pnl, trade.fee, trade.timestamp)
+        trade.timestamp = trade.timestamp - timedelta(days=2)
+        pnl_rollup_service.apply_trade_pnl(
+            trade, previous_pnl=previous[0], previous_fee=previous[1], previous_timestamp=previous[2]
+        )
+        db.session.commit()
+
+        incremental = _snapshot(sa_id)
+        by_date = {row[0]: row for row in incremental}
+        moved = by_date[trade.timestamp.date()]
+        assert moved[-1] == 1.25 and moved[1] == 5.0 and moved[2] == 1
+        assert by_date[previous[2].date()][-1] == 0.0
+
+        pnl_rollup_service.rebuild([sa_id])
+        db.session.expire_all()
+        assert [row for row in _snapshot(sa_id) if row[2] or row[-1]] == \
+            [row for row in incremental if row[2] or row[-1]]
+
+
+def test_dashboard_stats_read_rollup(app, test_data):
+    sa_id = test_data['strategy_account_id']
+    record_manager = trading_service.record_manager
+
+    with app.app_context():
+        db.session.add(StrategyCapital(strategy_account_id=sa_id, allocated_capital=1000.0))
+        db.session.commit()
+
+        now = datetime.utcnow()
+        for offset, pnl in ((2, Decimal('20')), (1, Decimal('-5'))):
+            trade_id = _add_trade(sa_id, now - timedelta(days=offset))
+            record_manager.apply_realized_pnl(trade_id, pnl)
+
+        stats = AnalyticsService().get_user_dashboard_stats(test_data['user_id'])
+        strategy = stats['strategies_detail'][0]
+
+        assert stats['realized_pnl'] == 15.0
+        assert stats['total_trades'] == 2
+        assert strategy['win_rate'] == 50.0
+        assert strategy['profit_factor'] == 4.0
+        assert strategy['mdd'] == 0.5
+        assert strategy['pnl_30d'] == 15.0
+        assert strategy['accounts_detail'][0]['realized_pnl'] == 15.0
@@ -0,0 +1,64 @@
+"""
+Integration test for the batched unrealized PnL job
+
+@FEAT:position-tracking @COMP:test @TYPE:integration
+
+Validates that calculate_unrealized_pnl() prices every open position with one
+price-cache multi-get, writes long/short PnL with a single UPDATE ... FROM
+(VALUES ...), resets closed positions, and keeps the stored value when no
+price is available.
+"""
+
+import pytest
+
+from app import db
+from app.models import StrategyPosition
+from app.services.price_cache import price_cache
+from app.services.trading.position_manager import PositionManager
+
+
+def test_unrealized_pnl_bulk_update(app, test_data, monkeypatch):
+    batch_requests = []
+
+    def update_batch_prices(symbols, exchange, market_type):
+        batch_requests.append((sorted(symbols), exchange, market_type))
+        return {}
+
+    monkeypatch.setattr(price_cache, 'update_batch_prices', update_batch_prices)
+
+    with app.app_context():
+        StrategyPosition.query.delete()
+        strategy_account_id = test_data['strategy_account_id']
+        db.session.add_all([
+            StrategyPosition(strategy_account_id=strategy_account_id, symbol='BTCUSDT', quantity=0.5, entry_price=100.0),
+            StrategyPosition(strategy_account_id=strategy_account_id, symbol='ETHUSDT', quantity=-2.0, entry_price=50.0),
+            StrategyPosition(strategy_account_id=strategy_account_id, symbol='SOLUSDT', quantity=0.0, entry_price=0.0,
+                             unrealized_pnl=12.5),
+            StrategyPosition(strategy_account_id=strategy_account_id, symbol='XRPUSDT', quantity=10.0, entry_price=1.0,
+                             unrealized_pnl=3.0),
+        ])
+        db.session.commit()
+
+        # 테스트 전략은 SPOT 마켓
+        price_cache.set_price('BTCUSDT', 110.0, 'BINANCE', 'SPOT')
+        price_cache.set_price('ETHUSDT', 45.0, 'binance', 'spot')
+
+        result = PositionManager().calculate_unrealized_pnl()
+
+        assert result == {'positions': 4, 'updated': 3, 'missing_price': 1}
+        # 캐시 미스 심볼만 거래소·마켓별 배치 조회 1회
+        assert batch_requests == [(['XRPUSDT'], 'BINANCE', 'SPOT')]
+
+        db.session.expire_all()
+        pnl = {p.symbol: p.unrealized_pnl for p in StrategyPosition.query.filter_by(strategy_account_id=strategy_account_id)}
+        assert pnl['BTCUSDT'] == pytest.approx(5.0)    # 롱: 0.5 * (110 - 100)
+        assert pnl['ETHUSDT'] == pytest.approx(10.0)   # 숏: 2 * (50 - 45)
+        assert pnl['SOLUSDT'] == 0.0                   # 청산 → 초기화
+        assert pnl['XRPUSDT'] == 3.0                   # 가격 없음 → 기존 값 유지
+
+        # 가격 변화 없으면 쓰기 없음, 청산 포지션은 다시 조회되지 않음
+        result = PositionManager().calculate_unrealized_pnl()
+        assert result == {'positions': 3, 'updated': 0, 'missing_price': 1}
+
+        StrategyPosition.query.delete()
+        db.session.commit()
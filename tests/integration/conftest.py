@@ -1,28 +1,12 @@
 """
-pytest fixtures for race condition integration tests
+Shared app/DB fixtures for integration tests
 
-@FEAT:order-tracking @FEAT:position-tracking @COMP:test @TYPE:integration
-@ISSUE:38
+@FEAT:testing @COMP:test @TYPE:integration
+
+Testing DATABASE_URL (temp SQLite file) is set by tests/conftest.py before the app is imported.
 """
 
 import pytest
-import sys
-import os
-import tempfile
-
-# Set testing database URL BEFORE importing the app
-# Use a temp file for SQLite to avoid pool parameter issues with :memory:
-db_fd, db_path = tempfile.mkstemp(suffix='.db')
-os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
-os.environ['FLASK_ENV'] = 'testing'
-
-# Add worktree root directory to path (parent of .test directory)
-worktree_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
-sys.path.insert(0, worktree_root)
-
-# Add web_server/app to path for proper imports
-web_server_app_path = os.path.join(worktree_root, 'web_server')
-sys.path.insert(0, web_server_app_path)
 
 from app import create_app, db
 from app.models import Strategy, Account, StrategyAccount
@@ -40,16 +24,10 @@ def app():
         db.session.remove()
         db.drop_all()
 
-    # Cleanup
-    import os
-    if os.path.exists(db_path):
-        os.close(db_fd)
-        os.unlink(db_path)
-
 
 @pytest.fixture(scope='function')
 def test_data(app, request):
-    """Setup test strategy, account, and strategy_account with unique data per test"""
+    """Setup user, strategy, account and strategy_account with unique data per test"""
     from app.models import User
     import uuid
 
@@ -67,8 +45,8 @@ def test_data(app, request):
         # Create test strategy with unique group_name to avoid UNIQUE constraint violation
         strategy = Strategy(
             user_id=user.id,
-            name='test_race_strategy',
-            description='Test strategy for race condition tests',
+            name='test_strategy',
+            description='Test strategy for integration tests',
             group_name=f'test_group_{unique_id}',
             is_active=True
         )
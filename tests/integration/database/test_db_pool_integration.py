@@ -0,0 +1,101 @@
+"""
+Integration test for role-separated DB pools and pool instrumentation
+
+@FEAT:framework @COMP:test @TYPE:integration
+
+Validates that db.session work runs on the engine of the current thread's
+role (web = default engine, scheduler/fill_monitor = 'pool:<role>' binds),
+including APScheduler-style executor threads and child threads that inherit
+the role explicitly, and that the instrumented pool records checkout wait
+time, in-use/peak counts, holders and pool_timeout failures.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from sqlalchemy import create_engine, exc as sa_exc, text
+
+from app import db
+from app.utils.db_pool import (
+    DB_POOL_ROLE_FILL_MONITOR, DB_POOL_ROLE_SCHEDULER, current_db_pool_role, db_pool_bind_key,
+    db_pool_monitor, db_pool_role, instrumented_pool_class, set_db_pool_role
+)
+
+
+def test_session_routes_to_role_engine(app):
+    with app.app_context():
+        web_engine = db.engines[None]
+        scheduler_engine = db.engines[db_pool_bind_key(DB_POOL_ROLE_SCHEDULER)]
+        fill_engine = db.engines[db_pool_bind_key(DB_POOL_ROLE_FILL_MONITOR)]
+        assert len({web_engine, scheduler_engine, fill_engine}) == 3
+        assert db.session.get_bind() is web_engine
+
+        with db_pool_role(DB_POOL_ROLE_FILL_MONITOR):
+            assert db.session.get_bind() is fill_engine
+        assert current_db_pool_role() == 'web'
+
+    before = db_pool_monitor.get_stats()['roles'].get(DB_POOL_ROLE_SCHEDULER, {}).get('checkouts', 0)
+
+    # APScheduler executor와 같은 방식: initializer로 스레드 역할 지정
+    def job():
+        with app.app_context():
+            db.session.execute(text('SELECT 1'))
+            return db.session.get_bind()
+
+    with ThreadPoolExecutor(1, initializer=set_db_pool_role, initargs=(DB_POOL_ROLE_SCHEDULER,)) as executor:
+        assert executor.submit(job).result() is scheduler_engine
+
+    stats = db_pool_monitor.get_stats()['roles'][DB_POOL_ROLE_SCHEDULER]
+    assert stats['checkouts'] == before + 1
+    assert stats['in_use'] == 0
+
+
+def test_pool_contention_records_wait_holders_and_timeout(tmp_path):
+    role = 'test_contention'
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}", poolclass=instrumented_pool_class(role),
+        pool_size=1, max_overflow=0, pool_timeout=0.5
+    )
+    warn_ms = db_pool_monitor.wait_warn_ms
+    db_pool_monitor.wait_warn_ms = 100
+    try:
+        held = threading.Event()
+        release = threading.Event()
+
+        def holder():
+            with engine.connect():
+                held.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=holder, name='pool-holder')
+        thread.start()
+        held.wait(5)
+
+        stats = db_pool_monitor.get_stats()['roles'][role]
+        assert stats['in_use'] == 1
+        assert stats['holders'][0]['thread'] == 'pool-holder'
+
+        # 커넥션을 보유 중인 동안 추가 요청은 pool_timeout 후 실패
+        with pytest.raises(sa_exc.TimeoutError):
+            engine.connect()
+        assert db_pool_monitor.get_stats()['roles'][role]['timeouts'] == 1
+
+        # 대기 중 반납되면 획득 성공 + 대기 시간 기록
+        threading.Timer(0.15, release.set).start()
+        started = time.perf_counter()
+        with engine.connect() as conn:
+            conn.execute(text('SELECT 1'))
+        assert time.perf_counter() - started >= 0.1
+        thread.join(5)
+
+        stats = db_pool_monitor.get_stats()['roles'][role]
+        assert stats['checkouts'] == 2
+        assert stats['in_use'] == 0 and stats['peak_in_use'] == 1
+        assert stats['slow_waits'] == 1
+        assert stats['wait_ms']['max'] >= 100
+        assert stats['holders'] == []
+    finally:
+        db_pool_monitor.wait_warn_ms = warn_ms
+        engine.dispose()
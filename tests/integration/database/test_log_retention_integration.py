@@ -0,0 +1,117 @@
+"""
+Integration test for log table retention
+
+@FEAT:log-retention @COMP:test @TYPE:integration
+
+SQLite has no native partitioning, so this exercises the DELETE fallback and
+the archive export, plus the month/partition-name helpers the PostgreSQL path
+relies on.
+"""
+
+import csv
+import gzip
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+from app import db
+from app.models import TrackingLog, WebhookLog
+from app.services import log_retention
+from app.services.log_retention import (
+    LOG_RETENTION_DAYS, LogRetentionService, add_months, parse_partition_month, partition_name
+)
+
+
+def test_partition_month_helpers():
+    assert add_months(date(2025, 11, 1), 2) == date(2026, 1, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partition_name('webhook_logs', date(2025, 3, 1)) == 'webhook_logs_p202503'
+    assert parse_partition_month('webhook_logs', 'webhook_logs_p202503') == date(2025, 3, 1)
+    assert parse_partition_month('webhook_logs', 'webhook_logs_default') is None
+    assert parse_partition_month('tracking_logs', 'webhook_logs_p202503') is None
+
+
+def test_retention_deletes_and_archives_expired_rows(app, tmp_path, monkeypatch):
+    # 아카이브는 배치 단위 스트리밍 (여러 배치에 걸쳐도 전체 행 기록)
+    monkeypatch.setattr(log_retention, 'LOG_ARCHIVE_BATCH_SIZE', 1)
+    service = LogRetentionService(archive_dir=str(tmp_path))
+    today = date(2025, 6, 30)
+    expired = datetime.combine(today - timedelta(days=LOG_RETENTION_DAYS['webhook_logs'] + 1), datetime.min.time())
+    recent = datetime.combine(today - timedelta(days=1), datetime.min.time())
+
+    with app.app_context():
+        WebhookLog.query.delete()
+        TrackingLog.query.delete()
+        db.session.add_all([
+            WebhookLog(received_at=expired, payload='{"old": 1}', status='SUCCESS'),
+            WebhookLog(received_at=expired, payload='{"old": 2}', status='FAILED'),
+            WebhookLog(received_at=recent, payload='{"new": 1}', status='SUCCESS'),
+            TrackingLog(log_type='sync', source='test', message='old', created_at=expired),
+        ])
+        db.session.commit()
+
+        # SQLite: 파티션 없음 → 생성할 파티션 없음
+        assert service.ensure_partitions(today=today) == {}
+
+        results = service.apply_retention(today=today, archive=True)
+
+        assert results['webhook_logs']['deleted_rows'] == 2
+        assert results['tracking_logs']['deleted_rows'] == 1
+        assert [log.payload for log in WebhookLog.query.all()] == ['{"new": 1}']
+
+        archive_path = results['webhook_logs']['archives'][0]
+        with gzip.open(archive_path, 'rt', encoding='utf-8') as archive_file:
+            rows = list(csv.DictReader(archive_file))
+        assert [row['payload'] for row in rows] == ['{"old": 1}', '{"old": 2}']
+
+        # 다시 실행해도 추가 삭제/아카이브 없음
+        again = service.apply_retention(today=today, archive=True)
+        assert again['webhook_logs']['deleted_rows'] == 0
+        assert again['webhook_logs']['archives'] == []
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+        self.commits = 0
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+
+def test_partition_archived_before_detach_and_default_partition_cleaned(tmp_path, monkeypatch):
+    session = _RecordingSession()
+    monkeypatch.setattr(log_retention, 'db', SimpleNamespace(session=session))
+    monkeypatch.setattr(log_retention, 'PARTITIONED_LOG_TABLES', {'webhook_logs': 'received_at'})
+    service = LogRetentionService(archive_dir=str(tmp_path))
+    monkeypatch.setattr(service, 'is_partitioned', lambda table: True)
+    monkeypatch.setattr(service, 'list_partitions', lambda table: [
+        ('webhook_logs_p202501', date(2025, 1, 1)), ('webhook_logs_p202506', date(2025, 6, 1)),
+    ])
+    monkeypatch.setattr(service, 'default_partition', lambda table: 'webhook_logs_default')
+    default_deletes = []
+    monkeypatch.setattr(service, '_delete_expired_rows',
+                        lambda table, *args: default_deletes.append(table))
+
+    # 아카이브 실패 → DETACH/DROP 없이 파티션 유지
+    def failing_archive(name):
+        raise OSError('disk full')
+    monkeypatch.setattr(service, '_archive_table', failing_archive)
+    result = service.apply_retention(today=date(2025, 6, 30), archive=True)['webhook_logs']
+    assert 'disk full' in result['error']
+    assert session.statements == [] and result['dropped_partitions'] == []
+
+    # 아카이브 성공 → DETACH + DROP 한 번의 커밋, DEFAULT 파티션도 보존 정책 적용
+    archived = []
+    monkeypatch.setattr(service, '_archive_table', lambda name: archived.append(name) or name)
+    result = service.apply_retention(today=date(2025, 6, 30), archive=True)['webhook_logs']
+    assert archived == ['webhook_logs_p202501']
+    assert result['dropped_partitions'] == ['webhook_logs_p202501']
+    assert [stmt.split()[0] for stmt in session.statements] == ['ALTER', 'DROP']
+    assert session.commits == 1
+    assert default_deletes == ['webhook_logs_default']
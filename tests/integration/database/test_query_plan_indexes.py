@@ -0,0 +1,50 @@
+"""
+Integration test for the hot query indexes
+
+@FEAT:order-tracking @FEAT:analytics @COMP:test @TYPE:integration
+
+Runs web_server/scripts/check_query_plans.py against the test database and
+verifies that none of the hot order/trade query shapes scan their table.
+"""
+
+import importlib.util
+import os
+
+from app import db
+
+_SCRIPT_PATH = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', '..', '..', 'web_server', 'scripts', 'check_query_plans.py'
+))
+
+
+def _load_script():
+    spec = importlib.util.spec_from_file_location('check_query_plans', _SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_hot_queries_use_indexes(app):
+    check_query_plans = _load_script()
+
+    with app.app_context():
+        with db.engine.connect() as connection:
+            results = check_query_plans.check_query_plans(connection)
+
+    assert results
+    assert [r['name'] for r in results if r['seq_scan']] == [], {
+        r['name']: r['plan'] for r in results
+    }
+
+
+def test_sequential_scan_detection():
+    check_query_plans = _load_script()
+
+    assert check_query_plans.find_sequential_scans(
+        ['SCAN open_orders', 'SEARCH trades USING INDEX idx_trades_account_timestamp (strategy_account_id=?)'],
+        'sqlite'
+    ) == ['open_orders']
+    assert check_query_plans.find_sequential_scans(
+        ['Sort  (cost=1.0..1.1 rows=1)', '  ->  Seq Scan on webhook_logs  (cost=0.00..1.01 rows=1)'],
+        'postgresql'
+    ) == ['webhook_logs']
@@ -0,0 +1,153 @@
+"""
+Integration test for the persisted market-metadata snapshot
+
+@FEAT:symbol-validation @COMP:test @TYPE:integration
+
+Validates that SymbolValidator restores MarketInfo tables from
+market_metadata_snapshots without touching the network, serves validation
+immediately, then refreshes every exchange x market_type in parallel in the
+background and swaps the new tables in atomically (delisted symbols removed,
+failed partitions kept). Without a snapshot it falls back to the blocking
+API load and persists what it fetched.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from app import db
+from app.exchanges.crypto.factory import crypto_factory
+from app.exchanges.market_store import market_store
+from app.exchanges.models import MarketInfo
+from app.models import MarketMetadataSnapshot
+from app.services.market_snapshot import (
+    MARKET_SNAPSHOT_MAX_AGE_HOURS, decode_markets, encode_markets, market_snapshot_store
+)
+from app.services.symbol_validator import SymbolValidator
+
+
+def _market(symbol, market_type='SPOT', step='0.001'):
+    return MarketInfo(
+        symbol=symbol.replace('/', ''), base_asset=symbol.split('/')[0], quote_asset=symbol.split('/')[1],
+        status='TRADING', active=True,
+        price_precision=2, amount_precision=3, base_precision=8, quote_precision=8,
+        min_qty=Decimal('0.001'), max_qty=Decimal('9000'), step_size=Decimal(step),
+        min_price=Decimal('0.01'), max_price=Decimal('1000000'), tick_size=Decimal('0.01'),
+        min_notional=Decimal('5'), market_type=market_type
+    )
+
+
+class _FakeExchange:
+    def __init__(self, tables, gate, calls, lock):
+        self.tables, self.gate, self.calls, self.lock = tables, gate, calls, lock
+
+    def _create_precision_provider(self, market_info):
+        return 'provider'
+
+    def load_markets_impl(self, market_type, reload=False, force_cache=False):
+        with self.lock:
+            self.calls.append((market_type, threading.current_thread().name))
+        self.gate.wait(5)
+        result = self.tables[market_type]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def fake_exchange(monkeypatch):
+    state = {'tables': {}, 'gate': threading.Event(), 'calls': [], 'lock': threading.Lock()}
+    monkeypatch.setattr(crypto_factory, 'SUPPORTED_EXCHANGES', ['binance'])
+    monkeypatch.setattr(crypto_factory, 'create', lambda name, key, secret, testnet=False: _FakeExchange(
+        state['tables'], state['gate'], state['calls'], state['lock']))
+    market_store.clear()
+    yield state
+    market_store.clear()
+
+
+def test_snapshot_payload_round_trip():
+    markets = {'BTC/USDT': _market('BTC/USDT', step='0.00001000')}
+    restored = decode_markets(encode_markets(markets))
+
+    assert restored['BTC/USDT'].step_size == Decimal('0.00001000')
+    assert str(restored['BTC/USDT'].step_size) == '0.00001000'
+    assert restored['BTC/USDT'] == markets['BTC/USDT']
+
+
+def test_startup_restores_snapshot_then_refreshes_in_background(app, fake_exchange):
+    with app.app_context():
+        MarketMetadataSnapshot.query.delete()
+        market_snapshot_store.save('binance', 'spot', {'BTC/USDT': _market('BTC/USDT'),
+                                                       'OLD/USDT': _market('OLD/USDT')})
+        market_snapshot_store.save('binance', 'futures', {'BTC/USDT': _market('BTC/USDT', 'FUTURES')})
+
+        fake_exchange['tables'].update({
+            'spot': {'BTC/USDT': _market('BTC/USDT', step='0.0001'), 'NEW/USDT': _market('NEW/USDT')},
+            'futures': RuntimeError('exchangeInfo timeout'),
+        })
+
+        validator = SymbolValidator()
+        started = time.perf_counter()
+        validator.load_initial_symbols()
+        assert time.perf_counter() - started < 1.0
+
+        # 네트워크 응답 전에도 스냅샷으로 즉시 검증 가능
+        assert validator.is_initialized and validator.cache_source == 'snapshot'
+        assert validator.get_market_info('BINANCE', 'BTC/USDT', 'SPOT').step_size == Decimal('0.001')
+        assert validator.get_market_info('BINANCE', 'BTC/USDT', 'SPOT').precision_provider == 'provider'
+        result = validator.validate_order_params('BINANCE', 'BTC/USDT', 'SPOT', Decimal('0.12345'), Decimal('100'))
+        assert result['success'] and result['adjusted_quantity'] == Decimal('0.123')
+
+        fake_exchange['gate'].set()
+        for thread in threading.enumerate():
+            if thread.name == 'symbol-snapshot-refresh':
+                thread.join(5)
+        assert validator.cache_source == 'exchange'
+
+        # 백그라운드 스레드에서 두 market_type 병렬 조회
+        assert sorted(market for market, _ in fake_exchange['calls']) == ['futures', 'spot']
+        assert all(name.startswith('symbol-load') for _, name in fake_exchange['calls'])
+
+        # 성공한 SPOT만 교체 (상장 폐지 제거), 실패한 FUTURES는 스냅샷 유지
+        assert validator.get_market_info('BINANCE', 'BTC/USDT', 'SPOT').step_size == Decimal('0.0001')
+        assert validator.get_market_info('BINANCE', 'NEW/USDT', 'SPOT') is not None
+        assert validator.get_market_info('BINANCE', 'OLD/USDT', 'SPOT') is None
+        assert validator.get_market_info('BINANCE', 'BTC/USDT', 'FUTURES') is not None
+
+        db.session.expire_all()
+        spot_row = db.session.get(MarketMetadataSnapshot, ('binance', 'spot'))
+        assert sorted(decode_markets(spot_row.payload)) == ['BTC/USDT', 'NEW/USDT']
+
+        MarketMetadataSnapshot.query.delete()
+        db.session.commit()
+
+
+def test_startup_without_snapshot_loads_from_api_and_persists(app, fake_exchange):
+    with app.app_context():
+        MarketMetadataSnapshot.query.delete()
+        # 만료된 스냅샷은 무시
+        market_snapshot_store.save('binance', 'spot', {'BTC/USDT': _market('BTC/USDT')},
+                                   fetched_at=datetime.utcnow() - timedelta(hours=MARKET_SNAPSHOT_MAX_AGE_HOURS + 1))
+
+        fake_exchange['gate'].set()
+        fake_exchange['tables'].update({
+            'spot': {'ETH/USDT': _market('ETH/USDT')},
+            'futures': {'ETH/USDT': _market('ETH/USDT', 'FUTURES')},
+        })
+
+        validator = SymbolValidator()
+        validator.load_initial_symbols()
+
+        assert validator.cache_source == 'exchange'
+        assert validator.get_market_info('BINANCE', 'BTC/USDT', 'SPOT') is None
+        assert validator.get_market_info('BINANCE', 'ETH/USDT', 'FUTURES') is not None
+
+        db.session.expire_all()
+        rows = {(row.exchange, row.market_type): row.market_count for row in MarketMetadataSnapshot.query.all()}
+        assert rows == {('binance', 'spot'): 1, ('binance', 'futures'): 1}
+
+        MarketMetadataSnapshot.query.delete()
+        db.session.commit()
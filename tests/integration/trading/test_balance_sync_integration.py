@@ -0,0 +1,91 @@
+"""
+Integration test for the concurrent/incremental account balance sync
+
+@FEAT:account-management @COMP:test @TYPE:integration
+
+Validates that balances are upserted into DailyAccountSummary in one statement
+(starting_balance preserved on conflict), and that markets covered by a connected
+user data stream are only re-polled after a balance event.
+"""
+
+from datetime import date
+
+from app import db
+from app.models import Account, DailyAccountSummary
+from app.services.balance_sync import BalanceSyncService
+
+
+def _fake_balances(monkeypatch, totals, calls, accounts=None):
+    from app.services.exchange import exchange_service
+
+    def fetch_balance(account, market_type):
+        calls.append(market_type)
+        if accounts is not None:
+            accounts.append(account)
+        return {'success': True, 'balance': {'USDT': {'free': str(totals[market_type]), 'locked': '0'}}}
+
+    monkeypatch.setattr(exchange_service, 'fetch_balance', fetch_balance)
+
+
+def test_sync_upserts_summary_and_skips_stream_fresh_markets(app, test_data, monkeypatch):
+    service = BalanceSyncService(max_workers=4, full_refresh_seconds=600)
+    monkeypatch.setattr(BalanceSyncService, '_stream_connected', staticmethod(lambda account_id: True))
+    totals = {'spot': 100, 'futures': 50}
+    calls, fetched_accounts = [], []
+    _fake_balances(monkeypatch, totals, calls, fetched_accounts)
+
+    with app.app_context():
+        account = db.session.get(Account, test_data['account_id'])
+
+        stats = service.sync([account])
+        assert sorted(calls) == ['futures', 'spot']
+        # 워커는 자신의 세션에서 계좌를 다시 로드 (스케줄러 세션의 인스턴스를 공유하지 않음)
+        assert all(fetched is not account and fetched.id == account.id for fetched in fetched_accounts)
+        assert stats['synced_accounts'] == 1 and stats['failed_accounts'] == []
+
+        summary = DailyAccountSummary.query.filter_by(account_id=account.id, date=date.today()).one()
+        assert (summary.starting_balance, summary.ending_balance) == (150.0, 150.0)
+        assert (summary.spot_balance, summary.futures_balance) == (100.0, 50.0)
+
+        # Binance 선물은 스트림이 최신이므로 현물만 재조회, 선물은 직전 값 사용
+        calls.clear()
+        totals['spot'] = 120
+        stats = service.sync([account])
+        assert calls == ['spot']
+        assert stats['polled_markets'] == 1
+
+        # ACCOUNT_UPDATE 수신 후에는 선물도 재조회, starting_balance는 유지
+        calls.clear()
+        totals['futures'] = 80
+        service.mark_stream_event(account.id)
+        service.sync([account])
+        assert sorted(calls) == ['futures', 'spot']
+
+        db.session.expire_all()
+        summary = DailyAccountSummary.query.filter_by(account_id=account.id, date=date.today()).one()
+        assert summary.starting_balance == 150.0
+        assert summary.ending_balance == 200.0
+        assert summary.futures_balance == 80.0
+
+        DailyAccountSummary.query.filter_by(account_id=account.id).delete()
+        db.session.commit()
+
+
+def test_stream_disconnected_polls_all_markets_and_reports_failures(app, test_data, monkeypatch):
+    service = BalanceSyncService(max_workers=2)
+    monkeypatch.setattr(BalanceSyncService, '_stream_connected', staticmethod(lambda account_id: False))
+
+    from app.services.exchange import exchange_service
+    monkeypatch.setattr(exchange_service, 'fetch_balance',
+                        lambda account, market_type: {'success': False, 'error': 'timeout'})
+
+    with app.app_context():
+        account = db.session.get(Account, test_data['account_id'])
+        today = date.today()
+        assert service.plan_markets(account, 0.0, today, stream_connected=False) == ['spot', 'futures']
+
+        stats = service.sync([account])
+        assert stats['synced_accounts'] == 0
+        assert stats['failed_accounts'][0]['account_id'] == account.id
+        assert DailyAccountSummary.query.filter_by(account_id=account.id).count() == 0
+        assert service.get_stats()['last_run']['polled_accounts'] == 1
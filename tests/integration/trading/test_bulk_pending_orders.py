@@ -0,0 +1,160 @@
+"""
+Integration test for bulk PENDING order insert/transition (orphan-order prevention)
+
+@FEAT:webhook-order @FEAT:orphan-order-prevention @COMP:test @TYPE:integration
+
+Validates that the multi-account/batch paths create every PENDING row with one
+INSERT ... RETURNING and apply PENDING→OPEN/FAILED with one bulk UPDATE, keeping
+the same orphan-prevention guarantees as the single-order path.
+"""
+
+import time
+from decimal import Decimal
+
+from app import db
+from app.constants import OrderStatus
+from app.models import OpenOrder
+from app.services.trading import trading_service
+
+
+def _pending_rows(core, strategy_account_id, count):
+    return [
+        core._pending_order_row(
+            strategy_account_id, 'BTC/USDT', 'BUY', Decimal('0.01'), 'LIMIT',
+            'futures', Decimal(50000 + i)
+        )
+        for i in range(count)
+    ]
+
+
+def test_bulk_insert_returns_ids_in_row_order(app, test_data):
+    core = trading_service.core
+    with app.app_context():
+        rows = _pending_rows(core, test_data['strategy_account_id'], 3)
+        ids = core._create_pending_orders_bulk(rows)
+
+        assert len(ids) == 3
+        for row, order_id in zip(rows, ids):
+            order = db.session.get(OpenOrder, order_id)
+            assert order.exchange_order_id == row['exchange_order_id']
+            assert order.status == OrderStatus.PENDING
+            assert order.price == row['price']
+
+
+def test_bulk_transition_open_and_failed(app, test_data):
+    core = trading_service.core
+    with app.app_context():
+        ids = core._create_pending_orders_bulk(_pending_rows(core, test_data['strategy_account_id'], 3))
+        pending_key = db.session.get(OpenOrder, ids[2]).exchange_order_id
+
+        transitions = [
+            core._pending_transition(ids[0], {'success': True, 'order_id': 'ex-bulk-1', 'filled_quantity': 0.004}),
+            core._pending_transition(ids[1], {'success': False, 'error': 'Account 123456789 insufficient balance'}),
+            # 거래소 주문 ID가 없는 성공 응답은 PENDING-uuid를 유지
+            core._pending_transition(ids[2], {'success': True, 'order_id': None}),
+        ]
+        assert core._finalize_pending_orders_bulk(transitions) is True
+
+        db.session.expire_all()
+        opened = db.session.get(OpenOrder, ids[0])
+        failed = db.session.get(OpenOrder, ids[1])
+        kept = db.session.get(OpenOrder, ids[2])
+
+        assert opened.status == OrderStatus.OPEN
+        assert opened.exchange_order_id == 'ex-bulk-1'
+        assert opened.filled_quantity == 0.004
+        assert failed.status == OrderStatus.FAILED
+        assert failed.error_message == 'Account [REDACTED] insufficient balance'
+        assert kept.status == OrderStatus.OPEN
+        assert kept.exchange_order_id == pending_key
+
+
+def test_bulk_transition_commit_failure_leaves_pending(app, test_data, monkeypatch):
+    core = trading_service.core
+    with app.app_context():
+        ids = core._create_pending_orders_bulk(_pending_rows(core, test_data['strategy_account_id'], 2))
+
+        def failing_commit():
+            raise RuntimeError('stale connection')
+
+        monkeypatch.setattr('app.services.trading.core.time.sleep', lambda _: None)
+        monkeypatch.setattr(db.session, 'commit', failing_commit)
+        result = core._finalize_pending_orders_bulk([
+            core._pending_transition(order_id, {'success': True, 'order_id': f'ex-orphan-{order_id}'})
+            for order_id in ids
+        ])
+        monkeypatch.undo()
+
+        assert result is False
+        db.session.expire_all()
+        for order_id in ids:
+            assert db.session.get(OpenOrder, order_id).status == OrderStatus.PENDING
+
+
+def test_parallel_timeout_keeps_pending_without_failed_order(app, test_data, monkeypatch):
+    from app.models import Account, FailedOrder, Strategy, StrategyAccount
+    from app.services.exchange import exchange_service
+    from app.services.trading.order_fanout import order_fanout_engine
+
+    core = trading_service.core
+    with app.app_context():
+        strategy = db.session.get(Strategy, test_data['strategy_id'])
+        account = db.session.get(Account, test_data['account_id'])
+        sa = db.session.get(StrategyAccount, test_data['strategy_account_id'])
+
+        monkeypatch.setattr(core.service.quantity_calculator, 'calculate_order_quantity',
+                            lambda **kwargs: Decimal('0.01'))
+        monkeypatch.setattr(exchange_service, 'get_exchange', lambda account: object())
+        # POST는 이미 나갔지만 BATCH_ACCOUNT_TIMEOUT_SEC 안에 응답이 오지 않은 상황
+        monkeypatch.setattr(order_fanout_engine, 'execute', lambda jobs, **kwargs: {
+            job.key: {'success': False, 'error': '거래소 응답 시간 초과 (30s)', 'error_type': 'timeout'}
+            for job in jobs
+        })
+        failed_before = FailedOrder.query.filter_by(strategy_account_id=sa.id).count()
+
+        results = core._execute_trades_parallel(
+            [(strategy, account, sa)], 'BTC/USDT', 'BUY', 'LIMIT', Decimal('50000'),
+            None, None, Decimal('0.01'), 'futures'
+        )
+
+        assert len(results) == 1 and results[0]['error_type'] == 'timeout'
+        db.session.expire_all()
+        order = db.session.get(OpenOrder, results[0]['pending_order_id'])
+        assert order.status == OrderStatus.PENDING
+        assert FailedOrder.query.filter_by(strategy_account_id=sa.id).count() == failed_before
+
+
+def test_parallel_post_processing_runs_accounts_concurrently(app, test_data, monkeypatch):
+    from app.models import Account, Strategy, StrategyAccount
+    from app.services.exchange import exchange_service
+    from app.services.trading.order_fanout import order_fanout_engine
+
+    core = trading_service.core
+    with app.app_context():
+        strategy = db.session.get(Strategy, test_data['strategy_id'])
+        account = db.session.get(Account, test_data['account_id'])
+        sa = db.session.get(StrategyAccount, test_data['strategy_account_id'])
+
+        monkeypatch.setattr(core.service.quantity_calculator, 'calculate_order_quantity',
+                            lambda **kwargs: Decimal('0.01'))
+        monkeypatch.setattr(exchange_service, 'get_exchange', lambda account: object())
+        monkeypatch.setattr(order_fanout_engine, 'execute', lambda jobs, **kwargs: {
+            job.key: {'success': True, 'order_id': f'ex-post-{job.key}'} for job in jobs
+        })
+
+        # 체결 재조회 등으로 계좌당 0.3초 걸리는 후처리
+        def slow_complete(strategy, sa, account, order_result, *args):
+            time.sleep(0.3)
+            return {'success': True, 'order_id': order_result['order_id'], 'account_id': account.id}
+
+        monkeypatch.setattr(core, '_complete_trade', slow_complete)
+
+        started = time.time()
+        results = core._execute_trades_parallel(
+            [(strategy, account, sa)] * 4, 'BTC/USDT', 'BUY', 'LIMIT', Decimal('50000'),
+            None, None, Decimal('0.01'), 'futures'
+        )
+
+        assert time.time() - started < 1.0
+        assert [r['success'] for r in results] == [True] * 4
+        assert len({r['order_id'] for r in results}) == 4
@@ -0,0 +1,155 @@
+"""
+Integration test for parallel CANCEL_ALL_ORDER with native cancel-all endpoints
+
+@FEAT:order-cancellation @FEAT:webhook-order @COMP:test @TYPE:integration
+
+Validates that process_cancel_all_orders() fans out across subscriber accounts,
+uses one exchange cancel-all call per (account, symbol, market_type) when every
+active DB order on that symbol is a cancel target, reconciles the DB in bulk,
+and falls back to per-order cancellation for symbols shared with another
+strategy, for side-filtered requests, for orders missing from the Spot
+cancel-all response, and for Futures orders whose cancellation fetch_order
+does not confirm.
+"""
+
+import threading
+import time
+import uuid
+
+from app import db
+from app.models import Account, OpenOrder, Strategy, StrategyAccount, User
+from app.services.exchange import exchange_service
+from app.services.trading import trading_service
+from app.services.webhook_service import WebhookService
+
+
+def _add_order(strategy_account_id, order_id, symbol, market_type, side='BUY'):
+    db.session.add(OpenOrder(
+        strategy_account_id=strategy_account_id, exchange_order_id=order_id, symbol=symbol,
+        side=side, order_type='LIMIT', price=100.0, quantity=1.0, status='OPEN', market_type=market_type
+    ))
+
+
+def _patch_exchange(monkeypatch, spot_reported=None, fetched_status=None):
+    lock = threading.Lock()
+    calls = {'native': [], 'single': [], 'fetch': []}
+
+    def cancel_all_orders(account, symbol, market_type='spot'):
+        with lock:
+            calls['native'].append((account.id, symbol, market_type))
+        ids = spot_reported if market_type == 'spot' else None
+        return {'success': True, 'result': {'cancelled_order_ids': ids}}
+
+    def cancel_order(order_id, symbol, account_id, strategy_account_id=None, open_order=None):
+        with lock:
+            calls['single'].append(order_id)
+        OpenOrder.query.filter_by(exchange_order_id=order_id).delete()
+        db.session.commit()
+        return {'success': True, 'order_id': order_id, 'symbol': symbol}
+
+    def fetch_order(account, symbol, order_id, market_type='spot'):
+        with lock:
+            calls['fetch'].append(order_id)
+        return {'success': True, 'status': (fetched_status or {}).get(order_id, 'CANCELED')}
+
+    monkeypatch.setattr(exchange_service, 'fetch_order', fetch_order, raising=False)
+    monkeypatch.setattr(exchange_service, 'supports_native_cancel_all',
+                        lambda account, market_type='spot': account.exchange.lower() == 'binance')
+    monkeypatch.setattr(exchange_service, 'cancel_all_orders', cancel_all_orders)
+    monkeypatch.setattr(trading_service, 'cancel_order', cancel_order)
+    monkeypatch.setattr(trading_service, 'unsubscribe_symbol', lambda account_id, symbol: None)
+    return calls
+
+
+def _add_subscriber(strategy_id):
+    unique_id = str(uuid.uuid4())[:8]
+    user = User(username=f'sub_{unique_id}', email=f'sub_{unique_id}@example.com')
+    user.set_password('test_password')
+    db.session.add(user)
+    db.session.flush()
+    account = Account(user_id=user.id, name='subscriber', exchange='binance',
+                      public_api='k', secret_api='s', is_active=True)
+    db.session.add(account)
+    db.session.flush()
+    sa = StrategyAccount(strategy_id=strategy_id, account_id=account.id, weight=1.0, leverage=1.0, is_active=True)
+    db.session.add(sa)
+    db.session.flush()
+
+    # 같은 계좌를 쓰는 다른 전략의 BTCUSDT 주문 → 전체 취소 불가
+    other = Strategy(user_id=user.id, name='other', group_name=f'other_{unique_id}', is_active=True)
+    db.session.add(other)
+    db.session.flush()
+    other_sa = StrategyAccount(strategy_id=other.id, account_id=account.id, weight=1.0, leverage=1.0, is_active=True)
+    db.session.add(other_sa)
+    db.session.flush()
+    return account.id, sa.id, other_sa.id
+
+
+def test_cancel_all_fans_out_and_uses_native_endpoint(app, test_data, monkeypatch):
+    # 선물 전체 취소 직전 F2 체결 → 취소 미확인
+    calls = _patch_exchange(monkeypatch, spot_reported=['S1'], fetched_status={'F2': 'FILLED'})
+
+    with app.app_context():
+        OpenOrder.query.delete()
+        owner = db.session.get(User, test_data['user_id'])
+        owner.webhook_token = f'tok_{uuid.uuid4().hex[:16]}'
+        sub_account_id, sub_sa_id, other_sa_id = _add_subscriber(test_data['strategy_id'])
+
+        owner_sa_id = test_data['strategy_account_id']
+        _add_order(owner_sa_id, 'F1', 'BTCUSDT', 'FUTURES')
+        _add_order(owner_sa_id, 'F2', 'BTCUSDT', 'FUTURES', side='SELL')
+        _add_order(owner_sa_id, 'S1', 'BTCUSDT', 'SPOT')
+        _add_order(owner_sa_id, 'S2', 'BTCUSDT', 'SPOT')
+        _add_order(owner_sa_id, 'E1', 'ETHUSDT', 'FUTURES')
+        _add_order(sub_sa_id, 'B1', 'BTCUSDT', 'FUTURES')
+        _add_order(other_sa_id, 'X1', 'BTCUSDT', 'FUTURES')
+        db.session.commit()
+
+        strategy = db.session.get(Strategy, test_data['strategy_id'])
+        result = WebhookService().process_cancel_all_orders(
+            {'group_name': strategy.group_name, 'token': owner.webhook_token, 'symbol': 'BTCUSDT'},
+            time.time() + 1
+        )
+
+        assert result['summary']['processed_accounts'] == 2
+        assert result['summary']['total_cancelled_orders'] == 5
+        # 소유자 계좌: 선물·현물 각 1회 전체 취소, 구독자 계좌: 다른 전략 주문 공존 → 주문별 취소
+        assert sorted(calls['native']) == [
+            (test_data['account_id'], 'BTCUSDT', 'futures'),
+            (test_data['account_id'], 'BTCUSDT', 'spot'),
+        ]
+        # 선물은 응답에 취소 목록이 없어 주문별 조회로 확인
+        assert sorted(calls['fetch']) == ['F1', 'F2']
+        # 현물 응답에 없던 S2, 취소가 확인되지 않은 F2는 원래 상태로 복원 후 주문별 취소 경로
+        assert sorted(calls['single']) == ['B1', 'F2', 'S2']
+
+        db.session.expire_all()
+        remaining = {o.exchange_order_id: o.status for o in OpenOrder.query.all()}
+        assert remaining == {'E1': 'OPEN', 'X1': 'OPEN'}
+        assert sub_account_id != test_data['account_id']
+
+        OpenOrder.query.delete()
+        db.session.commit()
+
+
+def test_side_filter_skips_native_cancel_all(app, test_data, monkeypatch):
+    calls = _patch_exchange(monkeypatch)
+
+    with app.app_context():
+        OpenOrder.query.delete()
+        _add_order(test_data['strategy_account_id'], 'F1', 'BTCUSDT', 'FUTURES')
+        _add_order(test_data['strategy_account_id'], 'F2', 'BTCUSDT', 'FUTURES', side='SELL')
+        db.session.commit()
+
+        result = trading_service.cancel_all_orders_by_user(
+            user_id=test_data['user_id'], strategy_id=test_data['strategy_id'],
+            account_id=test_data['account_id'], symbol='BTCUSDT', side='BUY'
+        )
+
+        assert result['success'] is True
+        assert calls['native'] == []
+        assert calls['single'] == ['F1']
+        assert [o.exchange_order_id for o in OpenOrder.query.all()] == ['F2']
+
+        OpenOrder.query.delete()
+        db.session.commit()
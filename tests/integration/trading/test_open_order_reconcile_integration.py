@@ -0,0 +1,179 @@
+"""
+Integration test for open-order reconciliation planning
+
+@FEAT:order-tracking @COMP:test @TYPE:integration
+
+Validates that update_open_orders_status() queries open orders per
+(account, market_type) bucket, uses per-symbol calls when they are lighter
+than the account-wide call, skips buckets covered by a healthy user data
+stream, falls back to fetch_order only for failed buckets, reports the
+API weight consumed by the run, and applies the per-exchange circuit breaker
+while planning and fetching.
+"""
+
+from app import db
+from app.models import Account, OpenOrder
+from app.services.trading import open_order_reconciler as reconciler_module
+from app.services.trading.open_order_reconciler import OpenOrderReconciler
+from app.services.trading.order_manager import OrderManager
+
+
+def _add_order(strategy_account_id, order_id, symbol, market_type):
+    db.session.add(OpenOrder(
+        strategy_account_id=strategy_account_id, exchange_order_id=order_id, symbol=symbol,
+        side='BUY', order_type='LIMIT', price=100.0, quantity=1.0, status='OPEN', market_type=market_type
+    ))
+
+
+def _fake_exchange(monkeypatch, open_orders, fetch_results, fail_markets=()):
+    from app.services.exchange import exchange_service
+
+    calls = []
+
+    def get_open_orders(account, symbol=None, market_type='spot'):
+        calls.append(('open_orders', market_type, symbol))
+        if market_type in fail_markets:
+            return {'success': False, 'error': 'timeout'}
+        return {'success': True, 'orders': [
+            order for order in open_orders.get(market_type, []) if symbol in (None, order['symbol'])
+        ]}
+
+    def fetch_order(account, symbol, order_id, market_type='spot'):
+        calls.append(('fetch_order', market_type, order_id))
+        return fetch_results[order_id]
+
+    monkeypatch.setattr(exchange_service, 'get_open_orders', get_open_orders)
+    monkeypatch.setattr(exchange_service, 'fetch_order', fetch_order, raising=False)
+    return calls
+
+
+def test_reconcile_buckets_by_market_and_reports_weight(app, test_data, monkeypatch):
+    reconciler = OpenOrderReconciler(max_workers=4, stream_stale_seconds=60, full_refresh_seconds=300)
+    stream_healthy = {'value': False}
+    monkeypatch.setattr(reconciler, '_stream_healthy', lambda account_id: stream_healthy['value'])
+    monkeypatch.setattr(reconciler_module, 'open_order_reconciler', reconciler)
+
+    calls = _fake_exchange(
+        monkeypatch,
+        open_orders={'futures': [{'id': 'F1', 'symbol': 'BTCUSDT', 'status': 'NEW'}]},
+        fetch_results={
+            'F2': {'success': True, 'status': 'CANCELED'},
+            'S1': {'success': True, 'status': 'PARTIALLY_FILLED', 'filled_quantity': 0.5},
+        },
+        fail_markets=('spot',),
+    )
+
+    with app.app_context():
+        strategy_account_id = test_data['strategy_account_id']
+        OpenOrder.query.delete()
+        _add_order(strategy_account_id, 'F1', 'BTCUSDT', 'FUTURES')
+        _add_order(strategy_account_id, 'F2', 'ETHUSDT', 'FUTURES')
+        _add_order(strategy_account_id, 'S1', 'BTCUSDT', 'SPOT')
+        db.session.commit()
+
+        OrderManager().update_open_orders_status()
+
+        # 선물 2심볼(6 x 2 < 80) → 심볼별 조회, 현물 조회 실패 → 개별 조회 폴백
+        assert sorted(c for c in calls if c[0] == 'open_orders') == [
+            ('open_orders', 'futures', 'BTCUSDT'),
+            ('open_orders', 'futures', 'ETHUSDT'),
+            ('open_orders', 'spot', 'BTCUSDT'),
+        ]
+        assert sorted((c[0], c[1].lower(), c[2]) for c in calls if c[0] == 'fetch_order') == [
+            ('fetch_order', 'futures', 'F2'),
+            ('fetch_order', 'spot', 'S1'),
+        ]
+
+        db.session.expire_all()
+        remaining = {o.exchange_order_id: o for o in OpenOrder.query.filter_by(strategy_account_id=strategy_account_id)}
+        assert set(remaining) == {'F1', 'S1'}
+        assert remaining['F1'].status == 'NEW'
+        assert (remaining['S1'].status, remaining['S1'].filled_quantity) == ('PARTIALLY_FILLED', 0.5)
+
+        last_run = reconciler.get_stats()['last_run']
+        assert (last_run['polled_buckets'], last_run['skipped_buckets']) == (2, 0)
+        assert last_run['api_calls'] == 5
+        # Binance: 심볼별 미체결 6 x 3 + 개별 조회 4 x 2
+        assert last_run['api_weight'] == 26
+        assert last_run['deleted'] == 1
+        assert [b['market_type'] for b in last_run['failed_buckets']] == ['spot']
+
+        # 스트림 정상 → 선물(스트림 대상, 직전 확인 성공)은 생략, 현물은 계속 조회
+        stream_healthy['value'] = True
+        calls.clear()
+        OrderManager().update_open_orders_status()
+        assert {c[1] for c in calls} == {'spot'}
+        last_run = reconciler.get_stats()['last_run']
+        assert (last_run['polled_buckets'], last_run['skipped_buckets']) == (1, 1)
+
+        OpenOrder.query.filter_by(strategy_account_id=strategy_account_id).delete()
+        db.session.commit()
+
+
+def test_circuit_breaker_applies_during_planning_and_fetching(app, test_data, monkeypatch):
+    reconciler = OpenOrderReconciler(max_workers=1, circuit_breaker_threshold=2)
+    monkeypatch.setattr(reconciler, '_stream_healthy', lambda account_id: False)
+    monkeypatch.setattr(reconciler_module, 'open_order_reconciler', reconciler)
+
+    fail_markets = {'spot', 'futures'}
+    calls = _fake_exchange(
+        monkeypatch,
+        open_orders={
+            'spot': [{'id': 'S1', 'symbol': 'BTCUSDT', 'status': 'NEW'}],
+            'futures': [{'id': 'F1', 'symbol': 'BTCUSDT', 'status': 'NEW'}],
+        },
+        fetch_results={
+            'S1': {'success': False, 'error': 'timeout'},
+            'F1': {'success': False, 'error': 'timeout'},
+        },
+        fail_markets=fail_markets,
+    )
+
+    def run():
+        calls.clear()
+        OrderManager().update_open_orders_status()
+        return [c[0] for c in calls], reconciler.get_stats()
+
+    with app.app_context():
+        strategy_account_id = test_data['strategy_account_id']
+        OpenOrder.query.delete()
+        _add_order(strategy_account_id, 'S1', 'BTCUSDT', 'SPOT')
+        _add_order(strategy_account_id, 'F1', 'BTCUSDT', 'FUTURES')
+        db.session.commit()
+
+        # 두 번째 버킷 실패로 임계값 도달 → 해당 버킷의 개별 조회 폴백 중단
+        names, stats = run()
+        assert names == ['open_orders', 'fetch_order', 'open_orders']
+        assert stats['exchange_failures'] == {'binance': 2}
+        assert stats['last_run']['circuit_open_buckets'] == 1
+        assert stats['last_run']['failed'] == 2
+
+        # 발동 중: 계획 단계에서 시험 조회 1개만, 실패하면 폴백 없음
+        names, stats = run()
+        assert names == ['open_orders']
+        assert stats['last_run']['circuit_open_buckets'] == 2
+
+        # 복구: 시험 조회 성공 → 카운터 감소, 다음 실행부터 전체 조회
+        fail_markets.clear()
+        names, stats = run()
+        assert names == ['open_orders']
+        assert stats['exchange_failures'] == {'binance': 1}
+        names, stats = run()
+        assert names == ['open_orders', 'open_orders']
+        assert stats['exchange_failures'] == {}
+
+        OpenOrder.query.filter_by(strategy_account_id=strategy_account_id).delete()
+        db.session.commit()
+
+
+def test_many_symbols_use_account_wide_query(app, test_data):
+    with app.app_context():
+        account = db.session.get(Account, test_data['account_id'])
+        few = [f'SYM{i}USDT' for i in range(3)]
+        many = [f'SYM{i}USDT' for i in range(20)]
+
+        assert OpenOrderReconciler.choose_symbols('binance', few + few) == sorted(few)
+        assert OpenOrderReconciler.choose_symbols('binance', many) is None
+        # 가중치 정보가 없는 거래소는 전체 조회 1회가 가장 저렴
+        assert OpenOrderReconciler.choose_symbols('upbit', few) is None
+        assert account.exchange.lower() == 'binance'
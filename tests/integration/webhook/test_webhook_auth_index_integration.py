@@ -0,0 +1,39 @@
+"""
+Integration test for the webhook authentication index
+
+@FEAT:webhook-order @COMP:test @TYPE:integration
+
+Validates the joined index query (owner + public-strategy subscriber tokens) and
+that committed strategy/token changes invalidate the in-process index.
+"""
+
+from app import db
+from app.models import Strategy, User
+from app.services.webhook_auth_index import strategy_token_index
+
+
+def test_index_reflects_committed_token_and_strategy_changes(app, test_data):
+    with app.app_context():
+        strategy = db.session.get(Strategy, test_data['strategy_id'])
+        owner = db.session.get(User, test_data['user_id'])
+        owner.webhook_token = f"owner-{test_data['strategy_id']}"
+        db.session.commit()
+
+        entry = strategy_token_index.lookup(strategy.group_name)
+        assert entry.strategy_id == strategy.id
+        assert strategy_token_index.verify_token(entry, owner.webhook_token)
+        assert strategy_token_index.is_active_strategy(strategy.id)
+
+        # 토큰 재발급 커밋 → 즉시 무효화
+        owner.webhook_token = f"rotated-{test_data['strategy_id']}"
+        db.session.commit()
+        entry = strategy_token_index.lookup(strategy.group_name)
+        assert strategy_token_index.verify_token(entry, owner.webhook_token)
+        assert not strategy_token_index.verify_token(entry, f"owner-{test_data['strategy_id']}")
+
+        # 전략 비활성화 커밋 → 인덱스에서 제외
+        group_name = strategy.group_name
+        strategy.is_active = False
+        db.session.commit()
+        assert strategy_token_index.lookup(group_name) is None
+        assert not strategy_token_index.is_active_strategy(strategy.id)
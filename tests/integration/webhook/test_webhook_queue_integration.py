@@ -0,0 +1,114 @@
+"""
+Integration test for the async webhook ingestion queue
+
+@FEAT:webhook-queue @COMP:test @TYPE:integration
+
+Validates that enqueue authenticates before persisting (without storing the
+token), that workers claim items in per-(strategy, symbol) FIFO order with at
+most one PROCESSING item per key, and that finished items are purged after the
+retention period.
+"""
+
+import json
+import time
+
+import pytest
+
+from app import db
+from app.models import Strategy, User, WebhookQueueItem
+from app.services.webhook_queue import WebhookQueue
+from app.services.webhook_service import WebhookError
+
+
+def _setup(test_data):
+    db.session.query(WebhookQueueItem).delete()
+    owner = db.session.get(User, test_data['user_id'])
+    owner.webhook_token = f"queue-{test_data['strategy_id']}"
+    db.session.commit()
+    group_name = db.session.get(Strategy, test_data['strategy_id']).group_name
+    return group_name, owner.webhook_token
+
+
+def _signal(group_name, token, symbol, price):
+    return {'group_name': group_name, 'token': token, 'symbol': symbol,
+            'side': 'buy', 'order_type': 'LIMIT', 'price': price, 'qty_per': 10}
+
+
+def test_enqueue_validates_token_and_claims_fifo_per_key(app, test_data):
+    queue = WebhookQueue(enabled=True)
+    with app.app_context():
+        group_name, token = _setup(test_data)
+
+        with pytest.raises(WebhookError):
+            queue.enqueue(_signal(group_name, 'wrong-token', 'BTC/USDT', 1))
+        assert db.session.query(WebhookQueueItem).count() == 0
+
+        btc_1 = queue.enqueue(_signal(group_name, token, 'BTC/USDT', 1))
+        btc_2 = queue.enqueue(_signal(group_name, token, 'BTC/USDT', 2))
+        eth_1 = queue.enqueue(_signal(group_name, token, 'ETH/USDT', 1))
+
+        # 토큰은 검증 후 저장하지 않음
+        payload = json.loads(db.session.get(WebhookQueueItem, btc_1).payload)
+        assert 'token' not in payload and payload['symbol'] == 'BTC/USDT'
+
+        # BTC 선두 처리 중에는 BTC 후속 항목을 건너뛰고 다른 키(ETH)를 선점
+        assert queue.claim_next().id == btc_1
+        assert queue.claim_next().id == eth_1
+        assert queue.claim_next() is None
+
+        queue._finish(btc_1, 'DONE', 'ok')
+        claimed = queue.claim_next()
+        assert claimed.id == btc_2
+        assert claimed.status == 'PROCESSING'
+        assert claimed.attempts == 1
+
+
+def test_process_next_runs_in_order_and_records_failures(app, test_data, monkeypatch):
+    queue = WebhookQueue(enabled=True)
+    with app.app_context():
+        group_name, token = _setup(test_data)
+        first = queue.enqueue(_signal(group_name, token, 'BTC/USDT', 1))
+        second = queue.enqueue(_signal(group_name, token, 'BTC/USDT', 2))
+
+        processed_prices = []
+
+        def fake_process_webhook(webhook_data, webhook_received_at=None, authenticated_strategy_id=None):
+            assert authenticated_strategy_id == test_data['strategy_id']
+            processed_prices.append(webhook_data['price'])
+            if webhook_data['price'] == 2:
+                raise WebhookError('잔고 부족')
+            return {'action': 'trading_signal', 'summary': {'successful_orders': 1}}
+
+        monkeypatch.setattr('app.services.webhook_queue.webhook_service.process_webhook', fake_process_webhook)
+
+        assert queue.process_next() is True
+        assert queue.process_next() is True
+        assert queue.process_next() is False
+        assert processed_prices == [1, 2]
+
+        db.session.expire_all()
+        assert db.session.get(WebhookQueueItem, first).status == 'DONE'
+        failed = db.session.get(WebhookQueueItem, second)
+        assert failed.status == 'FAILED'
+        assert failed.message == '잔고 부족'
+        assert queue.get_stats()['status_counts'] == {'DONE': 1, 'FAILED': 1}
+
+
+def test_purge_finished_deletes_expired_done_and_failed(app, test_data):
+    queue = WebhookQueue(enabled=True)
+    with app.app_context():
+        group_name, token = _setup(test_data)
+        ids = [queue.enqueue(_signal(group_name, token, f'SYM{i}/USDT', 1)) for i in range(4)]
+        queue._finish(ids[0], 'DONE', 'ok')
+        queue._finish(ids[1], 'FAILED', 'error')
+        queue._finish(ids[2], 'DONE', 'ok')
+        # ids[0], ids[1]은 보존 기간 경과, ids[2]는 최근 완료, ids[3]은 대기 중
+        db.session.query(WebhookQueueItem).filter(WebhookQueueItem.id.in_(ids[:2])).update(
+            {'completed_at': time.time() - 7200}, synchronize_session=False
+        )
+        db.session.commit()
+
+        assert queue.purge_finished(retention_seconds=3600, batch_size=1) == 2
+        db.session.expire_all()
+        assert sorted(item.id for item in db.session.query(WebhookQueueItem)) == ids[2:]
+        assert queue.get_stats()['purged'] == 2
@@ -0,0 +1,249 @@
+"""
+컬럼 기반 분석 엔진 테스트 (기존 Decimal 구현과의 결과 일치 + 벤치마크)
+
+@FEAT:analytics @COMP:test @TYPE:unit
+
+_legacy_* 함수는 AnalyticsService/PerformanceTrackingService의 기존 Trade 리스트 순회 구현을
+그대로 옮긴 기준 구현입니다.
+"""
+
+import random
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from math import sqrt
+from statistics import mean, pstdev
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services import analytics_engine
+from app.services.analytics_engine import TradeColumns
+
+
+def _make_trades(count, days=120, accounts=(1, 2, 3), seed=7):
+    rng = random.Random(seed)
+    start = datetime.utcnow() - timedelta(days=days)
+    trades = []
+    for i in range(count):
+        trades.append(SimpleNamespace(
+            strategy_account_id=rng.choice(accounts),
+            timestamp=start + timedelta(seconds=rng.uniform(0, days * 86400)),
+            pnl=round(rng.gauss(1.5, 40.0), 4) if rng.random() > 0.1 else None,
+            fee=round(rng.uniform(0, 0.5), 4),
+        ))
+    trades.sort(key=lambda trade: trade.timestamp)
+    return trades
+
+
+def _columns(trades):
+    return TradeColumns(
+        strategy_account_id=np.array([t.strategy_account_id for t in trades], dtype=np.int64),
+        timestamp=np.array([t.timestamp for t in trades], dtype='datetime64[us]'),
+        pnl=np.array([t.pnl for t in trades], dtype=np.float64),
+        fee=np.array([t.fee for t in trades], dtype=np.float64),
+        notional=np.zeros(len(trades)),
+    )
+
+
+# === 기존 구현 (기준) ===
+
+def _legacy_daily_pnl_map(trades, period_days=None):
+    daily_pnl = defaultdict(lambda: Decimal('0'))
+    cutoff_date = None
+    if period_days is not None:
+        cutoff_date = (datetime.utcnow() - timedelta(days=period_days)).date()
+    for trade in trades:
+        if not trade.timestamp or trade.pnl is None:
+            continue
+        trade_date = trade.timestamp.date()
+        if cutoff_date and trade_date < cutoff_date:
+            continue
+        daily_pnl[trade_date] += Decimal(str(trade.pnl))
+    return daily_pnl
+
+
+def _legacy_drawdown(trades, capital):
+    cumulative = Decimal('0')
+    peak = Decimal('0')
+    max_drawdown = Decimal('0')
+    for trade in sorted(trades, key=lambda t: t.timestamp or datetime.min):
+        cumulative += Decimal(str(trade.pnl or 0))
+        if cumulative > peak:
+            peak = cumulative
+        drawdown = peak - cumulative
+        if drawdown > max_drawdown:
+            max_drawdown = drawdown
+    return float((max_drawdown / capital) * 100) if max_drawdown > 0 else 0.0
+
+
+def _legacy_daily_returns(trades, capital, period_days=None):
+    daily_pnl_map = _legacy_daily_pnl_map(trades, period_days)
+    return [float((pnl / capital) * 100) for _, pnl in sorted(daily_pnl_map.items())]
+
+
+def _legacy_sharpe(daily_returns):
+    if len(daily_returns) < 2:
+        return 0.0
+    volatility = pstdev(daily_returns)
+    if volatility == 0:
+        return 0.0
+    return (mean(daily_returns) / volatility) * sqrt(252)
+
+
+def _legacy_sortino(daily_returns):
+    negative_returns = [ret for ret in daily_returns if ret < 0]
+    if not daily_returns or not negative_returns:
+        return 0.0
+    downside_deviation = sqrt(sum(ret ** 2 for ret in negative_returns) / len(negative_returns))
+    if downside_deviation == 0:
+        return 0.0
+    return (mean(daily_returns) / downside_deviation) * sqrt(252)
+
+
+def _legacy_equity_curve(trades, period_days):
+    end_date = datetime.utcnow().date()
+    current_date = end_date - timedelta(days=period_days)
+    daily_pnl_map = _legacy_daily_pnl_map(trades, period_days)
+    dates, values = [], []
+    cumulative = Decimal('0')
+    while current_date <= end_date:
+        dates.append(current_date.isoformat())
+        cumulative += daily_pnl_map.get(current_date, Decimal('0'))
+        values.append(float(cumulative))
+        current_date += timedelta(days=1)
+    return dates, values
+
+
+def _legacy_sample_risk(daily_returns):
+    if len(daily_returns) < 2:
+        return None, None, None
+    returns_array = np.array(daily_returns)
+    volatility = float(np.std(returns_array, ddof=1))
+    avg_return = float(np.mean(returns_array))
+    sharpe_ratio = (avg_return / volatility) if volatility > 0 else None
+    negative_returns = returns_array[returns_array < 0]
+    sortino_ratio = None
+    if len(negative_returns) > 1:
+        downside_deviation = float(np.std(negative_returns, ddof=1))
+        sortino_ratio = (avg_return / downside_deviation) if downside_deviation > 0 else None
+    return sharpe_ratio, sortino_ratio, volatility
+
+
+# === 엔진 파이프라인 ===
+
+def _engine_pipeline(columns, capital, period_days):
+    pnl = columns.realized_pnl
+    days, daily_pnl = analytics_engine.daily_sums(columns.day[~np.isnan(columns.pnl)], columns.pnl[~np.isnan(columns.pnl)])
+    returns = analytics_engine.returns_pct(daily_pnl, capital)
+    dates, curve = analytics_engine.equity_curve(days, daily_pnl, period_days)
+    return {
+        'mdd': analytics_engine.max_drawdown_pct(pnl, capital),
+        'sharpe': analytics_engine.sharpe_ratio(returns),
+        'sortino': analytics_engine.sortino_ratio(returns),
+        'returns': returns,
+        'dates': dates,
+        'curve': curve,
+    }
+
+
+def _legacy_pipeline(trades, capital, period_days):
+    returns = _legacy_daily_returns(trades, Decimal(str(capital)))
+    dates, curve = _legacy_equity_curve(trades, period_days)
+    return {
+        'mdd': _legacy_drawdown(trades, Decimal(str(capital))),
+        'sharpe': _legacy_sharpe(returns),
+        'sortino': _legacy_sortino(returns),
+        'returns': returns,
+        'dates': dates,
+        'curve': curve,
+    }
+
+
+def _assert_pipeline_match(engine_result, legacy_result):
+    assert engine_result['mdd'] == pytest.approx(legacy_result['mdd'], rel=1e-9, abs=1e-9)
+    assert engine_result['sharpe'] == pytest.approx(legacy_result['sharpe'], rel=1e-9, abs=1e-9)
+    assert engine_result['sortino'] == pytest.approx(legacy_result['sortino'], rel=1e-9, abs=1e-9)
+    np.testing.assert_allclose(engine_result['returns'], legacy_result['returns'], rtol=1e-9, atol=1e-9)
+    assert engine_result['dates'] == legacy_result['dates']
+    np.testing.assert_allclose(engine_result['curve'], legacy_result['curve'], rtol=1e-9, atol=1e-6)
+
+
+def test_metrics_match_legacy_implementation():
+    trades = _make_trades(2000)
+
+    _assert_pipeline_match(
+        _engine_pipeline(_columns(trades), 10000.0, 30),
+        _legacy_pipeline(trades, 10000.0, 30),
+    )
+
+
+def test_empty_and_degenerate_inputs():
+    empty = np.empty(0)
+
+    assert analytics_engine.max_drawdown_pct(empty, 1000.0) == 0.0
+    assert analytics_engine.max_drawdown_pct(np.array([5.0, -1.0]), 0.0) == 0.0
+    assert analytics_engine.sharpe_ratio(np.array([1.0])) == 0.0
+    assert analytics_engine.sharpe_ratio(np.array([1.0, 1.0])) == 0.0
+    assert analytics_engine.sortino_ratio(np.array([1.0, 2.0])) == 0.0
+    assert analytics_engine.sample_risk_metrics(np.array([1.0])) == (None, None, None)
+
+    dates, curve = analytics_engine.equity_curve(np.empty(0, dtype='datetime64[D]'), empty, 7)
+    assert len(dates) == 8
+    assert not curve.any()
+
+
+def test_grouped_daily_sums_match_per_strategy_loop():
+    trades = [t for t in _make_trades(3000) if t.pnl is not None]
+    columns = _columns(trades)
+
+    grouped = analytics_engine.grouped_daily_sums(columns.strategy_account_id, columns.day, columns.pnl)
+
+    for account_id in (1, 2, 3):
+        legacy = _legacy_daily_pnl_map([t for t in trades if t.strategy_account_id == account_id])
+        days, sums = grouped[account_id]
+        assert analytics_engine.to_dates(days) == sorted(legacy)
+        np.testing.assert_allclose(sums, [float(legacy[d]) for d in sorted(legacy)], rtol=1e-9)
+
+
+def test_rolling_risk_metrics_match_window_loop():
+    rng = random.Random(3)
+    start = date(2025, 1, 1)
+    # 거래가 없는 날이 섞인 불규칙 일자
+    days = sorted(rng.sample(range(200), 120))
+    calendar = [start + timedelta(days=d) for d in days]
+    returns = [rng.gauss(0.1, 1.5) for _ in days]
+
+    sharpe, sortino, volatility = analytics_engine.rolling_risk_metrics(
+        np.array(calendar, dtype='datetime64[D]'), np.array(returns), window_days=30
+    )
+
+    for i, target in enumerate(calendar):
+        window = [r for d, r in zip(calendar, returns) if target - timedelta(days=30) <= d <= target]
+        expected = _legacy_sample_risk(window)
+        for actual, wanted in zip((sharpe[i], sortino[i], volatility[i]), expected):
+            if wanted is None:
+                assert np.isnan(actual)
+            else:
+                assert actual == pytest.approx(wanted, rel=1e-7)
+
+
+@pytest.mark.benchmark
+def test_benchmark_against_legacy_implementation():
+    trades = _make_trades(100_000, days=365)
+    columns = _columns(trades)
+
+    started = time.perf_counter()
+    legacy_result = _legacy_pipeline(trades, 50000.0, 30)
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    engine_result = _engine_pipeline(columns, 50000.0, 30)
+    engine_elapsed = time.perf_counter() - started
+
+    _assert_pipeline_match(engine_result, legacy_result)
+    print(f"\nlegacy={legacy_elapsed * 1000:.1f}ms engine={engine_elapsed * 1000:.1f}ms "
+          f"speedup={legacy_elapsed / engine_elapsed:.1f}x")
+    assert engine_elapsed < legacy_elapsed
@@ -0,0 +1,65 @@
+"""
+SSE 이벤트 링 버퍼 fan-out 테스트
+
+@FEAT:event-sse @COMP:test @TYPE:unit
+"""
+
+import time
+
+from app.services.event_service import EventService
+
+
+def _service(monkeypatch, buffer_size=4):
+    service = EventService(buffer_size=buffer_size)
+    monkeypatch.setattr(EventService, '_is_strategy_active', staticmethod(lambda strategy_id: strategy_id != 99))
+    return service
+
+
+def _event(n):
+    return {'type': 'order_update', 'data': {'n': n}}
+
+
+def test_emit_does_not_block_on_slow_client_and_counts_overflow(monkeypatch):
+    service = _service(monkeypatch)
+    channel = service.add_client(1, 10)
+
+    started = time.monotonic()
+    for n in range(10):
+        service._emit_to_user(1, 10, _event(n))
+    service._emit_to_user(1, 99, _event('inactive'))
+    assert time.monotonic() - started < 0.1
+
+    # 읽지 않은 클라이언트는 버퍼(4개)에 남은 최신 이벤트만 받고, 밀려난 6개는 누락 집계
+    events, dropped = channel.read_after(0, timeout=0)
+    assert [event['data']['n'] for _, event in events] == [6, 7, 8, 9]
+    assert dropped == 6
+
+    stats = service.get_statistics()
+    assert stats['total_connections'] == 1
+    assert stats['emitted_events'] == 10
+    assert stats['skipped_inactive'] == 1
+
+
+def test_stream_resumes_from_last_event_id_and_ends_on_force_disconnect(monkeypatch):
+    service = _service(monkeypatch, buffer_size=16)
+    channel = service.add_client(1, 10)
+    for n in range(3):
+        service._emit_to_user(1, 10, _event(n))
+    service.remove_client(1, 10, channel)
+
+    # 재연결: 두 번째 이벤트까지 받은 상태에서 세 번째 이벤트부터 재전송
+    last_event_id = f"{service._epoch}-2"
+    response = service.get_event_stream(1, 10, last_event_id=last_event_id)
+    stream = iter(response.response)
+    assert 'event: connection' in next(stream)
+    next(stream)  # keepalive
+    replayed = next(stream)
+    assert replayed.startswith(f"id: {service._epoch}-3\nevent: order_update")
+
+    assert service.disconnect_client(1, 10) == 1
+    assert 'event: force_disconnect' in next(stream)
+    assert list(stream) == []
+
+    assert service.get_statistics()['resumed_connections'] == 1
+    # 다른 프로세스(epoch)의 ID는 무시하고 새 이벤트부터 전달
+    assert service._resume_cursor(service.add_client(1, 11), 'other-2') == 0
@@ -0,0 +1,179 @@
+"""
+다계좌 주문 fan-out 엔진 테스트
+
+@FEAT:batch-parallel-processing @COMP:test @TYPE:unit
+"""
+
+import asyncio
+import time
+from decimal import Decimal
+from types import SimpleNamespace
+
+from app.exchanges.crypto.binance import BinanceExchange
+from app.services.trading import order_fanout
+from app.services.trading.order_fanout import (
+    BatchOrderJob, OrderFanoutEngine, OrderJob, chunk_orders, is_unconfirmed, merge_batch_results
+)
+
+
+class _AsyncClient:
+    NATIVE_ASYNC_ORDERS = True
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+
+    async def create_order_async(self, symbol, order_type, side, amount, price=None,
+                                 market_type='spot', **params):
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(id='A1', symbol=symbol, side=side.lower(), type=order_type.lower(),
+                               status='NEW', amount=amount, filled=Decimal('0'), average=None,
+                               price=price, stop_price=params.get('stopPrice'))
+
+
+class _SyncClient:
+    def create_order(self, symbol, order_type, side, amount, price=None, market_type='spot', **params):
+        raise RuntimeError('insufficient balance')
+
+
+def _job(key, client, account_id):
+    return OrderJob(key=key, account_id=account_id, exchange_name='binance', client=client,
+                    symbol='BTC/USDT', side='BUY', order_type='LIMIT',
+                    quantity=Decimal('0.01'), market_type='futures', price=Decimal('50000'))
+
+
+def test_fanout_submits_accounts_concurrently_and_reports_latency():
+    engine = OrderFanoutEngine()
+    try:
+        jobs = [_job(i, _AsyncClient(), 9000 + i) for i in range(20)]
+        jobs.append(_job('sync', _SyncClient(), 9999))
+
+        started = time.time()
+        results = engine.execute(jobs, signal_received_at=started)
+        elapsed = time.time() - started
+
+        # 20건 x 0.2초가 순차가 아니라 동시에 처리됨
+        assert elapsed < 1.0
+        assert all(results[i]['success'] for i in range(20))
+        assert results[0]['order_id'] == 'A1'
+        assert results[0]['order_type'] == 'LIMIT'
+        assert results['sync']['success'] is False
+        assert 'insufficient balance' in results['sync']['error']
+
+        stats = engine.get_stats()
+        assert stats['orders'] == 21
+        assert stats['succeeded'] == 20
+        assert stats['signal_to_last_ack_ms']['p50'] >= 200
+        assert stats['signal_to_last_ack_ms']['p99'] is not None
+    finally:
+        engine.stop()
+
+
+def test_fanout_times_out_slow_orders():
+    engine = OrderFanoutEngine()
+    try:
+        results = engine.execute([_job('slow', _AsyncClient(delay=5), 9100)], timeout=0.2)
+        assert results['slow']['success'] is False
+        assert results['slow']['error_type'] == 'timeout'
+        assert is_unconfirmed(results['slow'])
+        assert engine.get_stats()['timeouts'] == 1
+    finally:
+        engine.stop()
+
+
+def test_outer_result_timeout_is_unconfirmed(monkeypatch):
+    # 루프 안 timeout이 동작하지 않아도 호출 스레드 대기 초과는 접수 미확정으로 처리
+    monkeypatch.setattr(order_fanout, 'FANOUT_RESULT_GRACE_SEC', 0.0)
+    engine = OrderFanoutEngine()
+
+    async def stuck_run_all(jobs, runner, timeout):
+        await asyncio.sleep(5)
+
+    monkeypatch.setattr(engine, '_run_all', stuck_run_all)
+    try:
+        results = engine.execute([_job('stuck', _AsyncClient(), 9200)], timeout=0.2)
+        assert results['stuck']['success'] is False
+        assert is_unconfirmed(results['stuck'])
+        time.sleep(0.05)  # 루프가 취소를 처리한 뒤 종료
+    finally:
+        engine.stop()
+
+
+def test_async_market_order_requeries_fill_like_sync_path():
+    client = BinanceExchange(api_key='k', api_secret='s')
+    calls = []
+
+    async def fake_request(method, url, params=None, signed=False):
+        calls.append(method)
+        if method == 'POST':
+            return {'orderId': 1, 'symbol': 'BTCUSDT', 'status': 'NEW', 'type': 'MARKET', 'side': 'BUY',
+                    'origQty': '0.01', 'executedQty': '0', 'price': '0'}
+        return {'orderId': 1, 'symbol': 'BTCUSDT', 'status': 'FILLED', 'type': 'MARKET', 'side': 'BUY',
+                'origQty': '0.01', 'executedQty': '0.01', 'avgPrice': '50000', 'price': '0'}
+
+    client._request_async = fake_request
+    order = asyncio.run(client.create_order_async('BTC/USDT', 'MARKET', 'BUY', Decimal('0.01'),
+                                                  market_type='futures'))
+
+    assert calls == ['POST', 'GET']
+    assert order.filled == Decimal('0.01')
+
+
+class _BatchClient:
+    """Binance Futures처럼 5건 네이티브 배치를 지원하고 'REJECT' 심볼은 개별 실패로 응답"""
+    NATIVE_BATCH_LIMITS = {'futures': 5}
+
+    def __init__(self):
+        self.requests = []
+
+    def get_batch_order_limit(self, market_type='spot'):
+        return self.NATIVE_BATCH_LIMITS.get(market_type)
+
+    async def create_batch_orders(self, orders, market_type='spot'):
+        self.requests.append(len(orders))
+        await asyncio.sleep(0.05)
+        results = []
+        for idx, order in enumerate(orders):
+            if order['symbol'] == 'REJECT':
+                results.append({'order_index': idx, 'success': False, 'error': 'Margin is insufficient'})
+            else:
+                results.append({'order_index': idx, 'success': True, 'order_id': f"B{order['n']}",
+                                'order': {'id': f"B{order['n']}", 'filled': 0}})
+        return {'success': True, 'results': results, 'implementation': 'NATIVE_BATCH'}
+
+
+def test_batch_fanout_chunks_to_exchange_limit_and_maps_partial_failures():
+    client = _BatchClient()
+    orders = [{'symbol': 'REJECT' if n == 7 else 'BTC/USDT', 'n': n} for n in range(12)]
+    chunks = chunk_orders(orders, client.get_batch_order_limit('futures'))
+    assert [offset for offset, _ in chunks] == [0, 5, 10]
+
+    engine = OrderFanoutEngine()
+    try:
+        jobs = [BatchOrderJob(key=offset, account_id=9200, exchange_name='binance', client=client,
+                              market_type='futures', orders=chunk) for offset, chunk in chunks]
+        chunk_results = engine.execute_batches(jobs)
+    finally:
+        engine.stop()
+
+    merged = merge_batch_results([(offset, len(chunk), chunk_results[offset]) for offset, chunk in chunks])
+
+    # 12건 → 거래소 요청 3회 (5 + 5 + 2)
+    assert sorted(client.requests) == [2, 5, 5]
+    assert merged['requests'] == 3
+    assert [item['order_index'] for item in merged['results']] == list(range(12))
+    assert merged['results'][11]['order_id'] == 'B11'
+    assert merged['results'][7] == {'order_index': 7, 'success': False, 'error': 'Margin is insufficient'}
+    assert merged['summary'] == {'total': 12, 'successful': 11, 'failed': 1}
+
+
+def test_merge_batch_results_expands_chunk_failures_per_order():
+    merged = merge_batch_results([
+        (0, 2, {'success': True, 'results': [{'order_index': 0, 'success': True, 'order_id': 'X'}]}),
+        (2, 3, {'success': False, 'error': '거래소 응답 시간 초과 (30s)', 'error_type': 'timeout'}),
+    ])
+
+    assert merged['success'] is True
+    assert merged['summary'] == {'total': 5, 'successful': 1, 'failed': 4}
+    # 응답 누락 주문과 청크 전체 실패 주문이 모두 원래 인덱스로 매핑
+    assert merged['results'][1]['error'] == '거래소 응답 없음'
+    assert [item.get('error_type') for item in merged['results'][2:]] == ['timeout'] * 3
@@ -0,0 +1,131 @@
+"""
+OrderFillMonitor 스트림 신뢰 모드 테스트
+
+@FEAT:order-tracking @COMP:test @TYPE:unit
+"""
+
+import asyncio
+import threading
+import time
+from decimal import Decimal
+
+from app.services.order_fill_monitor import (
+    OrderFillMonitor, _FillWriter, parse_binance_order_update, parse_bybit_order_update
+)
+
+
+def _binance_event(status, filled, last, update_time, avg='65000'):
+    return {'s': 'BTCUSDT', 'i': 123, 'X': status, 'z': filled, 'l': last, 'ap': avg,
+            'S': 'BUY', 'o': 'LIMIT', 'ot': 'LIMIT', 'T': update_time}
+
+
+def _monitor(monkeypatch):
+    monitor = OrderFillMonitor(app=None, trust_stream=True)
+    monitor._account_exchanges[1] = 'BINANCE'
+    submitted, confirmed = [], []
+    monkeypatch.setattr(monitor._writer, 'submit',
+                        lambda account_id, symbol, info, received_at: submitted.append((symbol, dict(info))))
+
+    async def confirm(account_id, order_id, symbol):
+        confirmed.append(order_id)
+        return {'exchange_order_id': order_id, 'status': 'PARTIALLY_FILLED',
+                'filled_quantity': Decimal('0.3'), 'average_price': Decimal('65000')}
+
+    monkeypatch.setattr(monitor, '_confirm_order_status', confirm)
+    return monitor, submitted, confirmed
+
+
+def _send(monitor, payload):
+    asyncio.run(monitor.on_order_update(1, str(payload['i']), payload['s'], payload['X'], payload=payload))
+
+
+def test_parsers_map_exchange_payloads_to_order_info():
+    info = parse_binance_order_update(_binance_event('PARTIALLY_FILLED', '0.1', '0.1', 1000))
+    assert info['exchange_order_id'] == '123'
+    assert info['filled_quantity'] == Decimal('0.1')
+    assert info['update_time'] == 1000
+
+    bybit = parse_bybit_order_update({'orderId': 'abc', 'orderStatus': 'PartiallyFilledCanceled',
+                                      'cumExecQty': '2', 'avgPrice': '', 'side': 'Sell',
+                                      'orderType': 'Limit', 'updatedTime': '1700000000000'})
+    assert bybit['status'] == 'CANCELLED'
+    assert bybit['average_price'] == Decimal('0')
+    assert bybit['last_filled_quantity'] is None
+
+
+def test_stream_payload_applied_without_rest_and_duplicates_skipped(monkeypatch):
+    monitor, submitted, confirmed = _monitor(monkeypatch)
+
+    _send(monitor, _binance_event('NEW', '0', '0', 1000, avg='0'))
+    _send(monitor, _binance_event('PARTIALLY_FILLED', '0.1', '0.1', 1001))
+    _send(monitor, _binance_event('PARTIALLY_FILLED', '0.1', '0.1', 1001))  # 재전송
+    _send(monitor, _binance_event('FILLED', '0.3', '0.2', 1002))
+    _send(monitor, _binance_event('PARTIALLY_FILLED', '0.1', '0.1', 1001))  # 역순 도착
+
+    assert confirmed == []
+    assert [(info['status'], info['filled_quantity']) for _, info in submitted] == [
+        ('NEW', Decimal('0')), ('PARTIALLY_FILLED', Decimal('0.1')), ('FILLED', Decimal('0.3'))
+    ]
+    assert all(symbol == 'BTC/USDT' and info['source'] == 'stream' for symbol, info in submitted)
+    assert monitor.get_stats()['duplicates_skipped'] == 2
+
+
+def test_gap_or_missing_fill_data_falls_back_to_rest(monkeypatch):
+    monitor, submitted, confirmed = _monitor(monkeypatch)
+
+    _send(monitor, _binance_event('PARTIALLY_FILLED', '0.1', '0.1', 1000))
+    # 0.1 → 0.3 이지만 이번 체결은 0.1 → 중간 이벤트 누락
+    _send(monitor, _binance_event('PARTIALLY_FILLED', '0.3', '0.1', 1002))
+    # 체결 상태인데 평균가 누락
+    _send(monitor, _binance_event('FILLED', '0.5', '0.2', 1003, avg='0'))
+
+    assert confirmed == ['123', '123']
+    assert [info['source'] for _, info in submitted] == ['stream', 'rest', 'rest']
+    assert monitor.get_stats()['rest_reasons'] == {'sequence_gap': 1, 'missing_fill_data': 1}
+
+
+class _SlowMonitor:
+    def __init__(self, delay=0.0, gate=None):
+        self.delay = delay
+        self.gate = gate
+        self.written = []
+
+    def _write_order_update(self, account_id, order_info, received_at):
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        self.written.append(order_info['exchange_order_id'])
+
+
+def test_writer_stop_drains_queued_updates_in_order():
+    monitor = _SlowMonitor(delay=0.01)
+    writer = _FillWriter(monitor, threads=2)
+    for i in range(20):
+        assert writer.submit(1, 'BTC/USDT', {'exchange_order_id': str(i)}, time.monotonic()) is True
+
+    writer.stop(timeout=5)
+
+    # 종료 전에 대기열 전부 반영, 같은 계좌+심볼은 FIFO 유지
+    assert monitor.written == [str(i) for i in range(20)]
+    assert writer.qsize() == 0
+    assert writer.submit(1, 'BTC/USDT', {'exchange_order_id': 'late'}, time.monotonic()) is False
+
+
+def test_full_writer_queue_drops_without_blocking():
+    gate = threading.Event()
+    monitor = _SlowMonitor(gate=gate)
+    writer = _FillWriter(monitor, threads=1, maxsize=1)
+
+    assert writer.submit(1, 'BTC/USDT', {'exchange_order_id': 'a'}, time.monotonic()) is True  # 처리 중 (gate 대기)
+    deadline = time.monotonic() + 2
+    while writer.qsize() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert writer.submit(1, 'BTC/USDT', {'exchange_order_id': 'b'}, time.monotonic()) is True  # 큐 1칸
+    started = time.monotonic()
+    assert writer.submit(1, 'BTC/USDT', {'exchange_order_id': 'c'}, time.monotonic()) is False  # 포화 → 즉시 드롭
+    assert time.monotonic() - started < 0.05  # 이벤트 루프 비차단
+    assert writer.dropped == 1
+
+    gate.set()
+    writer.stop(timeout=5)
+    assert monitor.written == ['a', 'b']
@@ -0,0 +1,92 @@
+"""
+시세 WebSocket 스트림 → PriceCache 테스트
+
+@FEAT:price-cache @COMP:test @TYPE:unit
+"""
+
+import asyncio
+import json
+import time
+from decimal import Decimal
+
+from app.constants import Exchange, MarketType
+from app.services.price_cache import PriceCache
+from app.services.price_stream import (
+    PriceStreamManager, _StreamState, parse_binance_mini_tickers, parse_bybit_ticker, parse_upbit_ticker
+)
+
+
+def test_parsers_normalize_symbols_and_skip_non_price_messages():
+    assert parse_binance_mini_tickers([
+        {'e': '24hrMiniTicker', 's': 'BTCUSDT', 'c': '65000.10'},
+        {'e': '24hrMiniTicker', 's': 'ETHUSDT', 'c': '0'},
+        {'e': 'trade', 's': 'XRPUSDT', 'p': '1'},
+    ]) == [('BTC/USDT', Decimal('65000.10'))]
+
+    assert parse_bybit_ticker({'topic': 'tickers.SOLUSDT', 'type': 'snapshot',
+                               'data': {'symbol': 'SOLUSDT', 'lastPrice': '150.5'}}) == [('SOL/USDT', Decimal('150.5'))]
+    # delta 메시지에 lastPrice가 없거나 pong 응답이면 무시
+    assert parse_bybit_ticker({'topic': 'tickers.SOLUSDT', 'type': 'delta', 'data': {'symbol': 'SOLUSDT'}}) == []
+    assert parse_bybit_ticker({'op': 'pong', 'success': True}) == []
+
+    assert parse_upbit_ticker({'type': 'ticker', 'code': 'KRW-USDT', 'trade_price': 1390.0}) == [('USDT/KRW', Decimal('1390.0'))]
+
+
+def test_stream_prices_update_cache_with_age_and_freshness():
+    cache = PriceCache(ttl_seconds=30)
+    manager = PriceStreamManager(stale_seconds=5, cache=cache)
+    spec = manager.specs[(Exchange.BINANCE, MarketType.FUTURES)]
+    state = _StreamState(connected=True)
+    manager._states[(spec.exchange, spec.market_type)] = state
+
+    cache.set_price('ETH/USDT', Decimal('3000'), Exchange.BINANCE, MarketType.FUTURES)
+    assert manager.is_fresh('binance', 'futures') is False
+
+    applied = manager._apply(spec, state, json.dumps([
+        {'e': '24hrMiniTicker', 's': 'BTCUSDT', 'c': '65000'},
+        {'e': '24hrMiniTicker', 's': 'ETHUSDT', 'c': '3100'},
+    ]))
+    assert applied == 2
+    assert manager.is_fresh('binance', 'futures') is True
+
+    details = cache.get_price('ETH/USDT', Exchange.BINANCE, MarketType.FUTURES,
+                              fallback_to_api=False, return_details=True)
+    assert details['price'] == Decimal('3100')
+    assert details['feed'] == 'stream'
+
+    stats = cache.get_stats()
+    assert stats['source_counts'] == {'stream': 2}
+    assert stats['price_ages']['BINANCE:FUTURES:BTC/USDT']['source'] == 'stream'
+    assert stats['price_ages']['BINANCE:FUTURES:BTC/USDT']['age_seconds'] < 1
+    assert 'price_ages' not in cache.get_stats(include_ages=False)
+
+    # 가격 없는 메시지(heartbeat 응답)만 계속되면 stale로 판단하여 REST 보완 대상
+    state.last_price_at = time.time() - 10
+    manager._apply(spec, state, json.dumps({'result': None, 'id': 1}))
+    assert manager.is_fresh('binance', 'futures') is False
+
+
+def test_subscription_sync_sends_only_new_bybit_symbols():
+    class _FakeSocket:
+        def __init__(self):
+            self.sent = []
+
+        async def send(self, message):
+            self.sent.append(json.loads(message))
+
+    manager = PriceStreamManager(cache=PriceCache())
+    spec = manager.specs[(Exchange.BYBIT, MarketType.FUTURES)]
+    state = _StreamState(connected=True)
+    ws = _FakeSocket()
+
+    manager.track_symbols('bybit', 'futures', ['BTC/USDT', 'ETH/USDT'])
+    asyncio.run(manager._sync_subscriptions(spec, state, ws))
+    manager.track_symbols('bybit', 'futures', ['ETH/USDT', 'SOL/USDT'])
+    asyncio.run(manager._sync_subscriptions(spec, state, ws))
+    asyncio.run(manager._sync_subscriptions(spec, state, ws))
+
+    assert ws.sent == [
+        {'op': 'subscribe', 'args': ['tickers.BTCUSDT', 'tickers.ETHUSDT']},
+        {'op': 'subscribe', 'args': ['tickers.SOLUSDT']},
+        {'op': 'ping'},
+    ]
@@ -0,0 +1,104 @@
+"""
+거래소 토큰 버킷 Rate Limiter 테스트
+
+@FEAT:exchange-integration @COMP:test @TYPE:unit
+"""
+
+import asyncio
+import threading
+import time
+
+from app.services.exchange import EndpointClass, RateLimiter
+
+
+def _limiter(weight_per_minute=1200, orders_per_second=2):
+    return RateLimiter({'binance': {'weight_per_minute': weight_per_minute,
+                                    'orders_per_second': orders_per_second}})
+
+
+def test_order_buckets_are_isolated_per_account():
+    limiter = _limiter(orders_per_second=2)
+
+    assert limiter.try_acquire('binance', 1, EndpointClass.ORDER) == 0.0
+    assert limiter.try_acquire('binance', 1, EndpointClass.ORDER) == 0.0
+    # 계좌 1은 소진 → 대기 시간 반환 (논블로킹)
+    assert limiter.try_acquire('binance', 1, EndpointClass.ORDER) > 0
+    # 계좌 2는 영향 없음
+    assert limiter.try_acquire('binance', 2, EndpointClass.ORDER) == 0.0
+
+
+def test_request_weight_is_shared_across_accounts():
+    limiter = _limiter(weight_per_minute=100)
+
+    # 전체 심볼 미체결 조회 가중치(80) → 두 번째 계좌 요청은 대기
+    assert limiter.try_acquire('binance', 1, EndpointClass.OPEN_ORDERS_ALL) == 0.0
+    assert limiter.try_acquire('binance', 2, EndpointClass.OPEN_ORDERS_ALL) > 0
+
+
+def test_headers_sync_used_weight_and_retry_after():
+    limiter = _limiter(weight_per_minute=1200)
+
+    limiter.update_from_headers('binance', 200, {'X-MBX-USED-WEIGHT-1M': '1199'})
+    assert limiter.get_stats()['binance']['weight_remaining'] < 2
+
+    limiter.update_from_headers('binance', 429, {'Retry-After': '30'})
+    wait = limiter.try_acquire('binance', 1)
+    assert 29 < wait <= 30
+    assert limiter.get_stats()['binance']['server_blocks'] == 1
+
+
+def test_weight_buckets_are_split_per_market_host():
+    limiter = RateLimiter({'binance': {'weight_per_minute': 100, 'orders_per_second': 2,
+                                       'markets': {'futures': {'weight_per_minute': 200}}}})
+
+    # spot 가중치 소진은 futures(별도 호스트/한도)에 영향 없음
+    assert limiter.try_acquire('binance', 1, EndpointClass.OPEN_ORDERS_ALL, market_type='spot') == 0.0
+    assert limiter.try_acquire('binance', 1, EndpointClass.OPEN_ORDERS_ALL, market_type='spot') > 0
+    assert limiter.try_acquire('binance', 1, EndpointClass.OPEN_ORDERS_ALL, market_type='FUTURES') == 0.0
+    assert limiter.try_acquire('binance', 1, EndpointClass.OPEN_ORDERS_ALL, market_type='futures') == 0.0
+
+    # 헤더 보정도 응답한 마켓 버킷에만 반영
+    limiter.update_from_headers('binance', 200, {'X-MBX-USED-WEIGHT-1M': '150'}, market_type='futures')
+    buckets = limiter.get_stats()['binance']['weight_buckets']
+    assert buckets['futures'] < 41
+    assert buckets['default'] < 21
+
+
+def test_used_weight_above_capacity_clamps_at_zero():
+    limiter = _limiter(weight_per_minute=100)
+
+    limiter.update_from_headers('binance', 200, {'X-MBX-USED-WEIGHT-1M': '500'})
+    assert limiter.get_stats()['binance']['weight_remaining'] >= 0
+    # 음수 잔량이 아니므로 1분 이내에 다시 요청 가능
+    assert limiter.try_acquire('binance', 1, EndpointClass.QUERY) <= 4 * 60 / 100 + 0.01
+
+
+def test_async_acquire_waits_for_refill():
+    limiter = _limiter(orders_per_second=20)
+    for _ in range(20):
+        assert limiter.try_acquire('binance', 1, EndpointClass.ORDER) == 0.0
+
+    started = time.monotonic()
+    assert asyncio.run(limiter.acquire('binance', 1, EndpointClass.ORDER)) is True
+    assert time.monotonic() - started < 0.5
+
+
+def test_concurrent_threads_never_over_admit():
+    limiter = _limiter(orders_per_second=5)
+    admitted = []
+    lock = threading.Lock()
+
+    def worker():
+        for _ in range(10):
+            if limiter.try_acquire('binance', 1, EndpointClass.ORDER) == 0.0:
+                with lock:
+                    admitted.append(1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # 버스트 5 + 테스트 실행 중 리필분 이내
+    assert 5 <= len(admitted) <= 7
@@ -0,0 +1,61 @@
+"""
+웹훅 인증 인덱스 테스트
+
+@FEAT:webhook-order @COMP:test @TYPE:unit
+"""
+
+from app.services.webhook_auth_index import StrategyAuthEntry, StrategyTokenIndex, hash_token
+
+
+def _index(entries_source, **kwargs):
+    index = StrategyTokenIndex(**kwargs)
+    loads = []
+
+    def load_entries():
+        loads.append(1)
+        return entries_source()
+
+    index._load_entries = load_entries
+    return index, loads
+
+
+def _entries(tokens):
+    return {'grp': StrategyAuthEntry(1, 'FUTURES', frozenset(hash_token(t) for t in tokens))}
+
+
+def test_lookup_and_token_check_reuse_index():
+    index, loads = _index(lambda: _entries(['owner-token']), ttl_seconds=60, miss_refresh_seconds=60)
+
+    for _ in range(50):
+        entry = index.lookup('grp')
+        assert index.verify_token(entry, 'owner-token')
+
+    assert len(loads) == 1
+    assert index.get_stats()['hits'] == 50
+
+
+def test_invalidate_and_miss_refresh_pick_up_new_tokens():
+    tokens = ['owner-token']
+    index, loads = _index(lambda: _entries(list(tokens)), ttl_seconds=60, miss_refresh_seconds=0)
+
+    entry = index.lookup('grp')
+    tokens.append('subscriber-token')
+    # 다른 워커에서 추가된 토큰: 불일치 시 재구성 후 재확인
+    assert index.verify_token(entry, 'subscriber-token')
+    assert len(loads) == 2
+
+    tokens.remove('subscriber-token')
+    index.invalidate('test')
+    assert not index.verify_token(index.lookup('grp'), 'subscriber-token')
+    assert index.lookup('missing') is None
+
+
+def test_unknown_group_does_not_rebuild_within_refresh_interval():
+    index, loads = _index(lambda: _entries(['owner-token']), ttl_seconds=60, miss_refresh_seconds=60)
+
+    index.lookup('grp')
+    for _ in range(20):
+        assert index.lookup('attacker-group') is None
+        assert not index.verify_token(index.lookup('grp'), 'wrong-token')
+
+    assert len(loads) == 1
@@ -0,0 +1,44 @@
+"""
+분석 관련 CLI 명령어
+
+사용 예시:
+    flask analytics rebuild-pnl-rollup
+    flask analytics rebuild-pnl-rollup --strategy-account-id 3
+"""
+
+import click
+from flask.cli import with_appcontext
+
+
+# @FEAT:analytics @FEAT:pnl-rollup @COMP:cli @TYPE:core
+@click.group()
+def analytics():
+    """분석 관련 명령어 그룹"""
+    pass
+
+
+# @FEAT:analytics @FEAT:pnl-rollup @COMP:cli @TYPE:core
+@analytics.command('rebuild-pnl-rollup')
+@click.option('--strategy-account-id', 'strategy_account_ids', type=int, multiple=True,
+              help='재구성할 전략 계좌 ID (여러 번 지정 가능, 생략 시 전체)')
+@with_appcontext
+def rebuild_pnl_rollup(strategy_account_ids):
+    """
+    일일 손익 롤업 백필/재구성
+
+    Trade 테이블에서 strategy_account_daily_pnl을 다시 계산합니다.
+    최초 배포 후 1회 실행하고, 과거 거래 손익을 수정한 경우 보정용으로 사용합니다.
+
+    사용 예시:
+        flask analytics rebuild-pnl-rollup
+    """
+    from app.services.pnl_rollup import pnl_rollup_service
+
+    click.echo("🔄 일일 손익 롤업 재구성 시작...")
+
+    result = pnl_rollup_service.rebuild(list(strategy_account_ids) or None)
+
+    click.echo("\n📊 재구성 결과:")
+    click.echo(f"  - 전략 계좌: {result['strategy_accounts']}")
+    click.echo(f"  - 일별 행: {result['rows']}")
+    click.echo("\n✅ 완료")
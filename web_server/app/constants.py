@@ -1029,6 +1029,53 @@ class OrderStatus:
 MAX_ORDERS_PER_SYMBOL_SIDE = 10  # 심볼당 side별 전체 제한 (LIMIT + STOP 합계)
 MAX_ORDERS_PER_SYMBOL_TYPE_SIDE = 2  # 심볼당 타입 그룹별 side별 제한
 
+# @FEAT:batch-parallel-processing @COMP:service @TYPE:config
+# 계좌별 병렬 주문 실행 최대 워커 수 (TradingCore fan-out)
+# 거래소 HTTP 커넥션 풀 크기(pool_maxsize)도 이 값에 맞춰 설정됨
+MAX_PARALLEL_ACCOUNT_WORKERS = 10
+
+# @FEAT:exchange-integration @COMP:exchange @TYPE:config
+# 계좌별 거래소 클라이언트 레지스트리 최대 크기 (LRU 초과분은 HTTP 세션 종료 후 제거)
+EXCHANGE_CLIENT_REGISTRY_MAX_SIZE = 256
+
+# @FEAT:webhook-order @COMP:service @TYPE:config
+# 웹훅 인증 인덱스 (group_name → 전략/토큰 해시) 안전망 TTL
+# 같은 프로세스의 변경은 커밋 시 즉시 무효화되며, TTL은 다른 워커 프로세스의 변경 반영용
+WEBHOOK_AUTH_INDEX_TTL_SEC = 30
+# 인덱스에 없는 전략/토큰 요청 시 재구성 최소 간격 (잘못된 토큰 반복 요청의 DB 부하 방지)
+WEBHOOK_AUTH_INDEX_MISS_REFRESH_SEC = 5
+
+# @FEAT:event-sse @COMP:service @TYPE:config
+# SSE (사용자, 전략)별 이벤트 링 버퍼 크기 - 클라이언트가 이보다 뒤처지면 오래된 이벤트부터 누락
+SSE_EVENT_BUFFER_SIZE = 256
+# 클라이언트가 모두 끊긴 채널을 Last-Event-ID 재전송용으로 보관하는 시간
+SSE_REPLAY_RETENTION_SEC = 300
+
+# @FEAT:account-management @COMP:job @TYPE:config
+# 잔고 동기화 거래소별 동시 조회 상한 (RateLimiter 가중치 버킷과 별개로 한 거래소가 워커를 독점하지 않도록)
+BALANCE_SYNC_EXCHANGE_CONCURRENCY = {
+    Exchange.BINANCE_LOWER: 5,
+    Exchange.BYBIT_LOWER: 5,
+    Exchange.OKX_LOWER: 3,
+    Exchange.UPBIT_LOWER: 3,
+    Exchange.BITHUMB_LOWER: 2,
+}
+BALANCE_SYNC_DEFAULT_CONCURRENCY = 2
+# 사용자 데이터 스트림이 잔고 변경 이벤트를 전달하는 거래소별 마켓
+# - Binance: Futures User Data Stream만 연결 (ACCOUNT_UPDATE) → 현물은 항상 REST 조회
+# - Bybit: 통합 계좌 wallet 토픽 → 현물/선물 모두
+BALANCE_STREAM_MARKETS = {
+    Exchange.BINANCE_LOWER: (MarketType.FUTURES_LOWER,),
+    Exchange.BYBIT_LOWER: (MarketType.SPOT_LOWER, MarketType.FUTURES_LOWER),
+}
+# 사용자 데이터 스트림이 주문 체결/취소 이벤트를 전달하는 거래소별 마켓 (미체결 주문 동기화 생략 대상)
+# - Binance: Futures User Data Stream (ORDER_TRADE_UPDATE)
+# - Bybit: 통합 계좌 order 토픽 → 현물/선물 모두
+ORDER_STREAM_MARKETS = {
+    Exchange.BINANCE_LOWER: (MarketType.FUTURES_LOWER,),
+    Exchange.BYBIT_LOWER: (MarketType.SPOT_LOWER, MarketType.FUTURES_LOWER),
+}
+
 # 주문 타입 그룹 분류
 # Purpose: 심볼당 타입 그룹별 주문 제한 관리 (MAX_ORDERS_PER_SYMBOL_TYPE_SIDE 적용)
 # - LIMIT 그룹: 일반 지정가 주문 (심볼당 side별 최대 2개)
@@ -1068,6 +1115,7 @@ class BackgroundJobTag:
     QUEUE_REBAL = "[QUEUE_REBAL]"            # 대기열 재정렬 (1초 주기)
     LOCK_RELEASE = "[LOCK_RELEASE]"          # 오래된 처리 잠금 해제 (5분 주기)
     WS_HEALTH = "[WS_HEALTH]"                # WebSocket 연결 상태 모니터링 (30초 주기)
+    LOG_RETENTION = "[LOG_RETENTION]"        # 로그 파티션 생성/보존 정책 (매일 00:17)
 
 # @FEAT:background-log-tagging @COMP:config @TYPE:core
 # Job ID → Tag 매핑 (admin 페이지 로그 파싱용)
@@ -1096,6 +1144,7 @@ JOB_TAG_MAP = {
     'calculate_daily_performance': BackgroundJobTag.PERF_CALC,        # Line 637
     'securities_token_refresh': BackgroundJobTag.TOKEN_REFRESH,       # Line 668
     'sync_account_balances': BackgroundJobTag.BALANCE_SYNC,              # Line 819 (app/__init__.py)
+    'maintain_log_partitions': BackgroundJobTag.LOG_RETENTION,
 }
 
 
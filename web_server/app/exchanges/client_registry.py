@@ -0,0 +1,171 @@
+# @FEAT:exchange-integration @COMP:exchange @TYPE:core
+"""
+계좌별 거래소 클라이언트 레지스트리 (LRU)
+
+계좌마다 어댑터 인스턴스를 하나씩 유지하여 주문마다 발생하던
+어댑터 생성 / 마켓 파싱 / HTTP 커넥션 수립 비용을 제거합니다.
+계좌 간 가변 상태(order_type_mappings, 토큰 캐시 등)도 더 이상 공유되지 않습니다.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, Union, TYPE_CHECKING
+
+from app.constants import EXCHANGE_CLIENT_REGISTRY_MAX_SIZE
+
+if TYPE_CHECKING:
+    from app.models import Account
+    from .crypto.base import BaseCryptoExchange
+    from .securities.base import BaseSecuritiesExchange
+
+logger = logging.getLogger(__name__)
+
+ExchangeClient = Union['BaseCryptoExchange', 'BaseSecuritiesExchange']
+
+
+def credential_version(account: 'Account') -> str:
+    """
+    계좌 자격 증명 버전 (평문 키를 보관하지 않도록 암호문 기준 해시)
+
+    API 키, 테스트넷 여부, 증권 설정 중 하나라도 바뀌면 버전이 달라져
+    기존 클라이언트 대신 새 클라이언트가 생성됩니다.
+    """
+    parts = (
+        account.exchange or '',
+        account.account_type or '',
+        account.public_api or '',
+        account.secret_api or '',
+        account.passphrase or '',
+        str(bool(account.is_testnet)),
+        getattr(account, '_securities_config', None) or '',
+    )
+    return hashlib.sha256('\x1f'.join(parts).encode()).hexdigest()[:16]
+
+
+class ExchangeClientRegistry:
+    """
+    계좌 ID + 자격 증명 버전으로 키잉된 어댑터 LRU 레지스트리 (스레드 안전)
+
+    - get(account): 캐시 적중 시 기존 인스턴스, 아니면 factory로 생성 후 등록
+    - invalidate(account_id): 계좌 수정/비활성화/삭제 시 제거
+    - 용량 초과 시 가장 오래 사용되지 않은 클라이언트부터 HTTP 세션을 닫고 제거
+
+    등록된 클라이언트는 동시 요청 간에 공유되므로 생성 이후 요청별 상태(Account 인스턴스 등)를
+    주입하지 않습니다. 어댑터는 생성 시점의 불변 값(account_id, 자격 증명)만 보관해야 합니다.
+    """
+
+    def __init__(self, max_size: int = EXCHANGE_CLIENT_REGISTRY_MAX_SIZE,
+                 factory: Optional[Callable[['Account'], ExchangeClient]] = None,
+                 on_create: Optional[Callable[['Account', ExchangeClient], None]] = None):
+        """
+        Args:
+            max_size: 최대 보관 클라이언트 수
+            factory: 클라이언트 생성 함수 (기본: UnifiedExchangeFactory.create)
+            on_create: 신규 생성 직후 호출 (마켓 캐시 예열, 응답 훅 연결 등)
+        """
+        self.max_size = max_size
+        self._factory = factory
+        self._on_create = on_create
+        self._entries: 'OrderedDict[int, Tuple[str, ExchangeClient]]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def _create(self, account: 'Account') -> ExchangeClient:
+        if self._factory is not None:
+            return self._factory(account)
+        from .unified_factory import UnifiedExchangeFactory
+        return UnifiedExchangeFactory.create(account)
+
+    def get(self, account: 'Account') -> ExchangeClient:
+        """계좌 전용 클라이언트 반환 (없거나 자격 증명이 바뀌었으면 새로 생성)"""
+        version = credential_version(account)
+
+        with self._lock:
+            entry = self._entries.get(account.id)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(account.id)
+                self._stats['hits'] += 1
+                # 캐시된 클라이언트는 여러 스레드가 공유 → 생성 이후 변경하지 않음
+                return entry[1]
+
+        # 생성(마켓 로드 등)은 Lock 밖에서 수행해 다른 계좌 요청을 막지 않음
+        client = self._create(account)
+        if self._on_create is not None:
+            try:
+                self._on_create(account, client)
+            except Exception as e:
+                logger.warning(f"클라이언트 초기화 콜백 실패 (account_id={account.id}): {e}")
+
+        stale = []
+        with self._lock:
+            entry = self._entries.get(account.id)
+            if entry is not None and entry[0] == version:
+                # 동시 생성 경합: 먼저 등록된 인스턴스를 사용
+                stale.append(client)
+                client = entry[1]
+                self._entries.move_to_end(account.id)
+                self._stats['hits'] += 1
+            else:
+                if entry is not None:
+                    stale.append(entry[1])
+                self._entries[account.id] = (version, client)
+                self._stats['misses'] += 1
+                while len(self._entries) > self.max_size:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    stale.append(evicted)
+                    self._stats['evictions'] += 1
+
+        for old in stale:
+            self._close(old)
+
+        return client
+
+    def invalidate(self, account_id: int) -> bool:
+        """계좌 클라이언트 제거 (수정/비활성화/삭제 시 호출)"""
+        with self._lock:
+            entry = self._entries.pop(account_id, None)
+            if entry is not None:
+                self._stats['invalidations'] += 1
+
+        if entry is None:
+            return False
+        self._close(entry[1])
+        logger.info(f"🧹 거래소 클라이언트 캐시 무효화 (account_id={account_id})")
+        return True
+
+    def clear(self) -> int:
+        """전체 클라이언트 제거, 제거된 개수 반환"""
+        with self._lock:
+            clients = [client for _, client in self._entries.values()]
+            self._entries.clear()
+
+        for client in clients:
+            self._close(client)
+        return len(clients)
+
+    def clients(self) -> Dict[int, ExchangeClient]:
+        """현재 등록된 {account_id: client} 스냅샷"""
+        with self._lock:
+            return {account_id: client for account_id, (_, client) in self._entries.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                **self._stats
+            }
+
+    @staticmethod
+    def _close(client: ExchangeClient) -> None:
+        """제거된 클라이언트의 동기(requests) 커넥션 풀과 비동기(aiohttp) 세션 종료"""
+        for method in ('close_http_session', 'close_async_sessions'):
+            close = getattr(client, method, None)
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"클라이언트 세션 종료 실패 (무시됨, {method}): {e}")
@@ -5,9 +5,19 @@
 BaseExchange를 상속하여 크립토 특화 기능을 추가합니다.
 """
 
-from typing import TYPE_CHECKING
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.constants import MAX_PARALLEL_ACCOUNT_WORKERS
 from app.exchanges.base import BaseExchange
+from app.exchanges.market_store import market_store
 from app.exchanges.metadata import get_precision_type, PrecisionType
 from app.exchanges.precision_providers import (
     PrecisionProvider,
@@ -18,6 +28,44 @@ from app.exchanges.precision_providers import (
 if TYPE_CHECKING:
     from app.exchanges.models import MarketInfo
 
+logger = logging.getLogger(__name__)
+
+# @FEAT:exchange-integration @COMP:exchange @TYPE:config
+# 동기 HTTP 커넥션 풀 설정 (Keep-Alive)
+# - pool_maxsize: TradingCore 병렬 fan-out(MAX_PARALLEL_ACCOUNT_WORKERS)과 동일하게 맞춰
+#   워커 스레드가 동시에 요청해도 커넥션을 새로 열지 않도록 함
+# - pool_connections: 호스트별 풀 개수 (Binance는 spot/futures 2개 호스트 사용)
+HTTP_POOL_MAXSIZE = int(os.getenv('EXCHANGE_HTTP_POOL_MAXSIZE', str(MAX_PARALLEL_ACCOUNT_WORKERS)))
+HTTP_POOL_CONNECTIONS = int(os.getenv('EXCHANGE_HTTP_POOL_CONNECTIONS', '4'))
+
+
+# @FEAT:exchange-integration @COMP:exchange @TYPE:helper
+def close_aiohttp_session(session, loop: Optional[asyncio.AbstractEventLoop] = None, timeout: float = 5.0) -> None:
+    """
+    aiohttp 세션을 세션이 바인딩된 이벤트 루프에서 종료 (동기 호출, best-effort)
+
+    - 루프가 다른 스레드에서 실행 중: run_coroutine_threadsafe로 해당 루프에서 close
+    - 현재 스레드에서 실행 중: close 태스크 예약
+    - 루프가 멈췄거나 닫힘: 임시 루프에서 close (커넥터 전송 종료는 동기적으로 수행됨)
+    """
+    if session is None or session.closed:
+        return
+    loop = loop or getattr(session, '_loop', None)
+    try:
+        if loop is not None and loop.is_running():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is loop:
+                loop.create_task(session.close())
+            else:
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=timeout)
+        else:
+            asyncio.run(session.close())
+    except Exception as e:
+        logger.debug(f"aiohttp 세션 종료 실패 (무시됨): {e}")
+
 
 class BaseCryptoExchange(BaseExchange):
     """
@@ -29,12 +77,215 @@ class BaseCryptoExchange(BaseExchange):
     - 마진 모드 설정 (격리/교차)
     """
 
+    # 동기 요청에 사용할 User-Agent (거래소별로 재정의)
+    HTTP_USER_AGENT = 'Native-Client/1.0'
+
+    # create_order_async가 실제 비동기 I/O(aiohttp)인지 여부
+    # False면 fan-out 엔진이 동기 create_order를 executor로 위임
+    NATIVE_ASYNC_ORDERS = False
+
+    # 네이티브 배치 주문 API의 요청당 최대 주문 수 (market_type별, 없으면 배치 API 미지원)
+    NATIVE_BATCH_LIMITS: Dict[str, int] = {}
+
+    # 심볼 단위 전체 취소 API를 지원하는 market_type (없으면 주문별 취소로 폴백)
+    NATIVE_CANCEL_ALL_MARKETS = frozenset()
+
+    # 마켓 정보 TTL (초) - 공유 저장소 테이블이 이보다 오래되면 load_markets가 재조회
+    cache_ttl = 300
+
     def __init__(self, api_key: str, secret: str, testnet: bool = False):
         super().__init__()
         self.api_key = api_key
         self.api_secret = secret
         self.testnet = testnet
 
+        # 동기 HTTP 세션 (Keep-Alive 커넥션 풀, 지연 생성)
+        self._http_session: 'requests.Session' = None
+        self._http_session_lock = threading.Lock()
+
+        # 응답 헤더 관찰자 (Rate Limiter가 X-MBX-USED-WEIGHT / Retry-After 반영에 사용)
+        self._response_hooks = []
+
+    # @FEAT:exchange-integration @COMP:exchange @TYPE:helper
+    def add_response_hook(self, hook) -> None:
+        """
+        응답 관찰 콜백 등록
+
+        Args:
+            hook: callable(status_code: int, headers: Mapping, market_type: Optional[str]) - 모든 REST 응답마다 호출됨
+                  (market_type은 응답한 호스트의 마켓, 구분하지 않는 거래소는 None)
+        """
+        if hook not in self._response_hooks:
+            self._response_hooks.append(hook)
+
+    # @FEAT:batch-parallel-processing @COMP:exchange @TYPE:helper
+    def get_batch_order_limit(self, market_type: str = 'spot') -> Optional[int]:
+        """네이티브 배치 주문 요청당 최대 주문 수 (None이면 배치 API 미지원 → 순차 폴백)"""
+        return self.NATIVE_BATCH_LIMITS.get((market_type or 'spot').lower())
+
+    # @FEAT:order-cancellation @COMP:exchange @TYPE:helper
+    def supports_native_cancel_all(self, market_type: str = 'spot') -> bool:
+        """심볼 단위 전체 취소 API 지원 여부 (True면 cancel_all_orders(symbol, market_type) 사용 가능)"""
+        return (market_type or 'spot').lower() in self.NATIVE_CANCEL_ALL_MARKETS
+
+    def _notify_response(self, status_code: int, headers, market_type: Optional[str] = None) -> None:
+        """등록된 응답 콜백 호출 (콜백 오류는 요청 흐름에 영향을 주지 않음)"""
+        for hook in self._response_hooks:
+            try:
+                hook(status_code, headers, market_type)
+            except Exception as e:
+                logger.debug(f"응답 콜백 오류 (무시됨): {e}")
+
+    # @FEAT:exchange-integration @COMP:exchange @TYPE:core
+    def _get_http_session(self) -> requests.Session:
+        """
+        Keep-Alive 커넥션 풀이 적용된 동기 HTTP 세션 반환
+
+        requests.get/post를 직접 호출하면 매 요청마다 TCP+TLS 핸드셰이크가 발생합니다.
+        클라이언트별로 하나의 Session을 유지하여 커넥션을 재사용합니다.
+
+        Note:
+            - urllib3 커넥션 풀은 스레드 안전 (병렬 주문 워커 간 공유)
+            - pool_block=False: 풀이 가득 차면 임시 커넥션을 추가로 열고 반납하지 않음
+            - max_retries=0: 주문 요청의 자동 재시도 금지 (중복 주문 방지)
+        """
+        session = self._http_session
+        if session is not None:
+            return session
+
+        with self._http_session_lock:
+            if self._http_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=HTTP_POOL_CONNECTIONS,
+                    pool_maxsize=HTTP_POOL_MAXSIZE,
+                    max_retries=0,
+                    pool_block=False
+                )
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                session.headers['User-Agent'] = self.HTTP_USER_AGENT
+                self._http_session = session
+                logger.debug(
+                    f"🌐 {self.__class__.__name__} HTTP 커넥션 풀 생성 "
+                    f"(pool_maxsize={HTTP_POOL_MAXSIZE})"
+                )
+            return self._http_session
+
+    # @FEAT:exchange-integration @COMP:exchange @TYPE:core
+    def close_http_session(self) -> None:
+        """동기 HTTP 세션 및 커넥션 풀 종료 (애플리케이션 종료 시 호출)"""
+        with self._http_session_lock:
+            session = self._http_session
+            self._http_session = None
+
+        if session is not None:
+            try:
+                session.close()
+            except Exception as e:
+                logger.debug(f"HTTP 세션 종료 중 오류 (무시됨): {e}")
+
+    # @FEAT:exchange-integration @COMP:exchange @TYPE:core
+    def close_async_sessions(self) -> None:
+        """비동기(aiohttp) 세션 종료 (레지스트리 제거/종료 시 호출, 세션 보관 방식이 다르면 하위 클래스에서 재정의)"""
+        session = getattr(self, 'session', None)
+        if session is not None:
+            self.session = None
+            close_aiohttp_session(session)
+
+    # @FEAT:exchange-integration @COMP:exchange @TYPE:helper
+    @property
+    def market_store_exchange(self) -> str:
+        """공유 마켓 저장소의 거래소 키 (테스트넷은 실거래 테이블과 분리)"""
+        return f"{self.name}_testnet" if self.testnet else self.name
+
+    # @FEAT:exchange-integration @FEAT:precision-system @COMP:exchange @TYPE:helper
+    def _get_stored_markets(self, market_type: str, reload: bool = False,
+                            force_cache: bool = False) -> Optional[Mapping[str, 'MarketInfo']]:
+        """
+        공유 저장소(market_store)의 마켓 테이블 조회 (API 재조회가 필요하면 None)
+
+        마켓 정보는 계좌와 무관한 공개 데이터이므로 같은 거래소/네트워크의 모든 클라이언트와
+        SymbolValidator가 하나의 테이블을 함께 읽습니다.
+
+        Args:
+            force_cache: True면 TTL 무시 (주문 경로), 테이블이 없으면 ExchangeError
+            reload: True면 항상 None (재조회)
+        """
+        from app.exceptions import ExchangeError
+
+        exchange = self.market_store_exchange
+        if force_cache:
+            markets = market_store.get_markets(exchange, market_type)
+            # 캐시 없음 = Warmup 실패 또는 비정상 상황
+            # 주문 경로에서 예상치 못한 API 호출 방지를 위해 명시적 Exception
+            if not markets:
+                raise ExchangeError(
+                    f"Cache miss on order path - warmup failed? "
+                    f"exchange={self.__class__.__name__}, market_type={market_type}"
+                )
+            logger.debug(f"🔒 캐시 강제 사용 (TTL 무시): {exchange} {market_type}, {len(markets)}개 마켓")
+            return markets
+
+        if reload:
+            return None
+
+        loaded_at = market_store.loaded_at(exchange, market_type)
+        if loaded_at is not None and time.time() - loaded_at < self.cache_ttl:
+            return market_store.get_markets(exchange, market_type)
+        return None
+
+    # @FEAT:exchange-integration @COMP:exchange @TYPE:helper
+    def _publish_markets(self, market_type: str,
+                         markets: Dict[str, 'MarketInfo']) -> Mapping[str, 'MarketInfo']:
+        """새로 파싱한 마켓 테이블을 공유 저장소에 게시 (기존 테이블과 원자적 교체)"""
+        return market_store.publish(self.market_store_exchange, market_type, markets)
+
+    # @FEAT:exchange-integration @COMP:exchange @TYPE:helper
+    def get_http_pool_stats(self) -> Dict[str, Any]:
+        """
+        Keep-Alive 커넥션 풀 통계
+
+        urllib3 호스트별 풀의 num_requests/num_connections 카운터를 집계합니다.
+        재사용 요청 수 = 전체 요청 수 - 새로 연 커넥션 수
+
+        Returns:
+            {'active': bool, 'requests': int, 'new_connections': int,
+             'reused_requests': int, 'reuse_ratio': float, 'hosts': {host: {...}}}
+        """
+        session = self._http_session
+        stats = {
+            'active': session is not None,
+            'pool_maxsize': HTTP_POOL_MAXSIZE,
+            'requests': 0,
+            'new_connections': 0,
+            'reused_requests': 0,
+            'reuse_ratio': 0.0,
+            'hosts': {}
+        }
+        if session is None:
+            return stats
+
+        adapter = session.get_adapter('https://')
+        pools = adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            num_requests = getattr(pool, 'num_requests', 0)
+            num_connections = getattr(pool, 'num_connections', 0)
+            stats['hosts'][pool.host] = {
+                'requests': num_requests,
+                'new_connections': num_connections
+            }
+            stats['requests'] += num_requests
+            stats['new_connections'] += num_connections
+
+        stats['reused_requests'] = max(0, stats['requests'] - stats['new_connections'])
+        if stats['requests']:
+            stats['reuse_ratio'] = round(stats['reused_requests'] / stats['requests'], 4)
+        return stats
+
     # @FEAT:precision-system @COMP:exchange @TYPE:core
     def _create_precision_provider(self, market_info: 'MarketInfo') -> 'PrecisionProvider':
         """
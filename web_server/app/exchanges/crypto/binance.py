@@ -16,13 +16,13 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal, InvalidOperation
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Mapping, Optional, Any, Union
 from urllib.parse import urlencode
 
 import aiohttp
 import requests
 
-from .base import BaseCryptoExchange
+from .base import BaseCryptoExchange, close_aiohttp_session
 from app.constants import OrderType
 from app.exchanges.base import ExchangeError, InvalidOrder, InsufficientFunds
 from app.exchanges.models import MarketInfo, Balance, Order, Ticker, Position, PriceQuote
@@ -49,6 +49,7 @@ class SpotEndpoints:
     ACCOUNT = "/api/v3/account"
     ORDER = "/api/v3/order"
     OPEN_ORDERS = "/api/v3/openOrders"
+    CANCEL_ALL_OPEN_ORDERS = "/api/v3/openOrders"  # DELETE: 심볼의 모든 미체결 취소
 
 class FuturesEndpoints:
     EXCHANGE_INFO = "/fapi/v1/exchangeInfo"
@@ -59,6 +60,7 @@ class FuturesEndpoints:
     POSITION_RISK = "/fapi/v2/positionRisk"
     ORDER = "/fapi/v1/order"
     OPEN_ORDERS = "/fapi/v1/openOrders"
+    CANCEL_ALL_OPEN_ORDERS = "/fapi/v1/allOpenOrders"  # DELETE: 심볼의 모든 미체결 취소
     BATCH_ORDERS = "/fapi/v1/batchOrders"  # 배치 주문 엔드포인트
 
 
@@ -73,6 +75,15 @@ class BinanceExchange(BaseCryptoExchange):
     - 1인 사용자에 최적화된 단순한 구조
     """
 
+    HTTP_USER_AGENT = 'Binance-Native-Client/1.0'
+    NATIVE_ASYNC_ORDERS = True
+
+    # Futures batchOrders: 요청당 최대 5건 (Spot은 배치 API 미지원)
+    NATIVE_BATCH_LIMITS = {'futures': 5}
+
+    # Spot DELETE /api/v3/openOrders, Futures DELETE /fapi/v1/allOpenOrders (심볼 단위, weight 1)
+    NATIVE_CANCEL_ALL_MARKETS = frozenset({'spot', 'futures'})
+
     def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
         # BaseCryptoExchange.__init__이 api_key, secret, testnet 속성을 설정함
         super().__init__(api_key, api_secret, testnet)
@@ -85,11 +96,7 @@ class BinanceExchange(BaseCryptoExchange):
             self.spot_base_url = SPOT_BASE_URL
             self.futures_base_url = FUTURES_BASE_URL
 
-        # 캐시
-        self.spot_markets_cache = {}
-        self.futures_markets_cache = {}
-        self.cache_time = {}
-        self.cache_ttl = 300  # 5분
+        # 마켓 정보는 공유 저장소(market_store)에 보관 (TTL: BaseCryptoExchange.cache_ttl)
 
         # @FEAT:stop-limit-activation @ISSUE:45 @COMP:exchange
         # STOP 주문 타입 캐시 (활성화 감지용 - Option C: Graceful Degradation)
@@ -217,6 +224,19 @@ class BinanceExchange(BaseCryptoExchange):
             self._sessions.clear()
             logger.info(f"✅ 전체 세션 정리 완료 (정리된 세션: {num_closed})")
 
+    def close_async_sessions(self) -> None:
+        """모든 스레드의 aiohttp 세션을 각자 바인딩된 이벤트 루프에서 종료 (동기 호출용)"""
+        with self._session_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for session_info in sessions:
+            close_aiohttp_session(session_info['session'], session_info['loop'])
+
+    def _market_of_url(self, url: str) -> str:
+        """요청 URL의 마켓 (spot/futures는 호스트와 가중치 한도가 분리됨)"""
+        return 'futures' if url.startswith(self.futures_base_url) else 'spot'
+
     def _get_base_url(self, market_type: str) -> str:
         """마켓 타입에 따른 기본 URL 반환"""
         if market_type.lower() == 'futures':
@@ -303,6 +323,8 @@ class BinanceExchange(BaseCryptoExchange):
             else:
                 raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
 
+            self._notify_response(response.status, response.headers, self._market_of_url(url))
+
             if 'code' in data and data['code'] != 200:
                 raise ExchangeError(f"Binance API 오류: {data.get('msg', 'Unknown error')}")
 
@@ -355,17 +377,22 @@ class BinanceExchange(BaseCryptoExchange):
             params['recvWindow'] = 5000  # 5초 허용 시간차 (시간 동기화 문제 해결)
             params['signature'] = self._create_signature(params)
 
+        # Keep-Alive 커넥션 풀 재사용 (매 요청 TCP+TLS 핸드셰이크 방지)
+        session = self._get_http_session()
+
         try:
             response = None
             if method.upper() == 'GET':
-                response = requests.get(url, params=params, headers=headers, timeout=30)
+                response = session.get(url, params=params, headers=headers, timeout=30)
             elif method.upper() == 'POST':
-                response = requests.post(url, data=params, headers=headers, timeout=30)
+                response = session.post(url, data=params, headers=headers, timeout=30)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, params=params, headers=headers, timeout=30)
+                response = session.delete(url, params=params, headers=headers, timeout=30)
             else:
                 raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
 
+            self._notify_response(response.status_code, response.headers, self._market_of_url(url))
+
             # HTTP 400 에러의 경우 Binance 에러 메시지 먼저 읽기
             if response.status_code >= 400:
                 try:
@@ -411,34 +438,14 @@ class BinanceExchange(BaseCryptoExchange):
             logger.error(f"Binance API 요청 실패: {error_details}")
             raise ExchangeError(f"Binance API 오류: {str(e)}")
 
-    def load_markets_impl(self, market_type: str = 'spot', reload: bool = False, force_cache: bool = False) -> Dict[str, MarketInfo]:
+    def load_markets_impl(self, market_type: str = 'spot', reload: bool = False, force_cache: bool = False) -> Mapping[str, MarketInfo]:
         """마켓 정보 로드 (동기 구현)"""
-        from app.exceptions import ExchangeError
-
-        cache_key = f"{market_type}_markets"
-
         # @FEAT:precision-system @COMP:exchange @TYPE:core
-        # force_cache=True: 주문 경로 보호 - 캐시 무조건 반환 (TTL 무시)
-        if force_cache:
-            cached_markets = getattr(self, f"{market_type}_markets_cache", {})
-
-            # 캐시 없음 = Warmup 실패 또는 비정상 상황
-            # 주문 경로에서 예상치 못한 API 호출 방지를 위해 명시적 Exception
-            if cache_key not in self.cache_time or not cached_markets:
-                raise ExchangeError(
-                    f"Cache miss on order path - warmup failed? "
-                    f"exchange={self.__class__.__name__}, "
-                    f"market_type={market_type}, cache_key={cache_key}"
-                )
-
-            logger.debug(f"🔒 캐시 강제 사용 (TTL 무시): {cache_key}, {len(cached_markets)}개 마켓")
+        # force_cache=True: 주문 경로 보호 - 캐시 무조건 반환 (TTL 무시), 없으면 ExchangeError
+        cached_markets = self._get_stored_markets(market_type, reload, force_cache)
+        if cached_markets is not None:
             return cached_markets
 
-        # 캐시 확인 (TTL 체크)
-        if not reload and cache_key in self.cache_time:
-            if time.time() - self.cache_time[cache_key] < self.cache_ttl:
-                return getattr(self, f"{market_type}_markets_cache", {})
-
         # API 호출 (캐시 없거나 만료됨)
         logger.info(f"📡 MarketInfo API 호출: {market_type}")
         base_url = self._get_base_url(market_type)
@@ -468,13 +475,8 @@ class BinanceExchange(BaseCryptoExchange):
 
             markets[standard_symbol] = market_info
 
-        # 캐시 업데이트
-        if market_type == 'spot':
-            self.spot_markets_cache = markets
-        else:
-            self.futures_markets_cache = markets
-
-        self.cache_time[cache_key] = time.time()
+        # 공유 저장소 갱신 (다른 클라이언트/SymbolValidator도 같은 테이블 사용)
+        markets = self._publish_markets(market_type, markets)
 
         logger.info(f"✅ {market_type.title()} 마켓 정보 로드 완료: {len(markets)}개")
 
@@ -774,6 +776,44 @@ class BinanceExchange(BaseCryptoExchange):
             'message': f"주문 {order_id} 취소 완료"
         }
 
+    # @FEAT:order-cancellation @COMP:exchange @TYPE:core
+    def cancel_all_orders_impl(self, symbol: str, market_type: str = 'spot') -> Dict[str, Any]:
+        """심볼의 모든 미체결 주문 취소 (동기 구현, 요청 1회)
+
+        Returns:
+            cancelled_order_ids: 취소된 주문 ID 목록 (Spot만 응답에 포함, Futures는 None → 호출자가 주문별 조회로 확인)
+        """
+        base_url = self._get_base_url(market_type)
+        endpoints = self._get_endpoints(market_type)
+
+        # 심볼 변환: 표준 형식 → Binance 형식
+        binance_symbol = to_binance_format(symbol)
+
+        url = f"{base_url}{endpoints.CANCEL_ALL_OPEN_ORDERS}"
+        try:
+            data = self._request('DELETE', url, {'symbol': binance_symbol}, signed=True)
+        except ExchangeError as e:
+            # Spot은 취소할 주문이 없으면 -2011(Unknown order) 반환 → 취소 대상 없음
+            if market_type.lower() == 'spot' and '-2011' in str(e):
+                data = []
+            else:
+                raise
+
+        # Spot: 취소된 주문(OCO는 orderReports) 목록, Futures: {"code": 200, "msg": ...}
+        cancelled_ids = None
+        if isinstance(data, list):
+            cancelled_ids = []
+            for item in data:
+                reports = item.get('orderReports') or [item]
+                cancelled_ids.extend(str(report.get('orderId')) for report in reports if report.get('orderId'))
+
+        return {
+            'success': True,
+            'symbol': symbol,
+            'cancelled_order_ids': cancelled_ids,
+            'message': f"{symbol} 미체결 주문 전체 취소 완료"
+        }
+
     def fetch_positions_impl(self) -> List[Position]:
         """포지션 조회 (Futures 전용, 동기 구현)"""
         base_url = self._get_base_url('futures')
@@ -832,14 +872,11 @@ class BinanceExchange(BaseCryptoExchange):
         logger.debug(f"🔍 주문 상세 조회 완료: order_id={order_id}, market_type={market_type}")
         return self._parse_order(data, market_type)
 
-    async def load_markets_async(self, market_type: str = 'spot', reload: bool = False) -> Dict[str, MarketInfo]:
+    async def load_markets_async(self, market_type: str = 'spot', reload: bool = False) -> Mapping[str, MarketInfo]:
         """마켓 정보 로드"""
-        cache_key = f"{market_type}_markets"
-
-        # 캐시 확인
-        if not reload and cache_key in self.cache_time:
-            if time.time() - self.cache_time[cache_key] < self.cache_ttl:
-                return getattr(self, f"{market_type}_markets_cache", {})
+        cached_markets = self._get_stored_markets(market_type, reload)
+        if cached_markets is not None:
+            return cached_markets
 
         base_url = self._get_base_url(market_type)
         endpoints = self._get_endpoints(market_type)
@@ -868,13 +905,7 @@ class BinanceExchange(BaseCryptoExchange):
 
             markets[standard_symbol] = market_info
 
-        # 캐시 업데이트
-        if market_type == 'spot':
-            self.spot_markets_cache = markets
-        else:
-            self.futures_markets_cache = markets
-
-        self.cache_time[cache_key] = time.time()
+        markets = self._publish_markets(market_type, markets)
 
         logger.info(f"✅ {market_type.title()} 마켓 정보 로드 완료: {len(markets)}개")
         return markets
@@ -985,10 +1016,30 @@ class BinanceExchange(BaseCryptoExchange):
             binance_order_type, amount, price, params
         )
 
-
         url = f"{base_url}{endpoints.ORDER}"
         data = await self._request_async('POST', url, order_params, signed=True)
 
+        # 시장가 주문의 경우 즉시 주문 상태 재조회 (동기 버전과 동일, 체결 정보 확인)
+        if order_type.upper() == 'MARKET' and data.get('status') == 'NEW':
+            logger.info(f"🔄 시장가 주문 상태 재조회 (비동기): {data.get('orderId')}")
+            try:
+                await asyncio.sleep(0.1)  # 100ms 대기 (이벤트 루프의 다른 주문은 계속 진행)
+
+                status_params = {
+                    'symbol': binance_symbol,
+                    'orderId': data.get('orderId')
+                }
+                updated_data = await self._request_async('GET', url, status_params, signed=True)
+                logger.info(f"🔍 재조회된 주문 상태 (비동기): {updated_data}")
+
+                # 체결량이 있으면 업데이트된 데이터 사용
+                if float(updated_data.get('executedQty', '0')) > 0:
+                    data = updated_data
+                    logger.info(f"✅ 시장가 주문 체결 확인 (비동기): 체결량={updated_data.get('executedQty')}")
+
+            except Exception as e:
+                logger.warning(f"⚠️ 주문 상태 재조회 실패 (비동기): {e}")
+
         # 주문 매핑 저장 (동기 버전과 동일)
         order_id = str(data.get('orderId'))
         if order_id and original_order_type != binance_order_type:
@@ -1228,7 +1279,7 @@ class BinanceExchange(BaseCryptoExchange):
 
         return self.create_order_impl(symbol, order_type, side, amount, price, market_type, **params)
 
-    def load_markets(self, market_type: str = 'spot', reload: bool = False, force_cache: bool = False) -> Dict[str, MarketInfo]:
+    def load_markets(self, market_type: str = 'spot', reload: bool = False, force_cache: bool = False) -> Mapping[str, MarketInfo]:
         """마켓 정보 로드 (동기)"""
         return self.load_markets_impl(market_type, reload, force_cache)
 
@@ -1237,6 +1288,10 @@ class BinanceExchange(BaseCryptoExchange):
         """주문 취소 (동기)"""
         return self.cancel_order_impl(order_id, symbol, market_type)
 
+    def cancel_all_orders(self, symbol: str, market_type: str = 'spot') -> Dict[str, Any]:
+        """심볼의 모든 미체결 주문 취소 (동기)"""
+        return self.cancel_all_orders_impl(symbol, market_type)
+
     def fetch_open_orders(self, symbol: Optional[str] = None, market_type: str = 'spot') -> List[Order]:
         """미체결 주문 조회 (동기)"""
         return self.fetch_open_orders_impl(symbol, market_type)
@@ -1343,7 +1398,7 @@ class BinanceExchange(BaseCryptoExchange):
         failed_count = 0
 
         # 5건씩 청크로 분할
-        chunk_size = 5
+        chunk_size = self.NATIVE_BATCH_LIMITS['futures']
         for chunk_idx in range(0, total_orders, chunk_size):
             chunk = orders[chunk_idx:chunk_idx + chunk_size]
             chunk_start_idx = chunk_idx
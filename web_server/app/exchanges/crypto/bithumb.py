@@ -14,7 +14,7 @@ import time
 import uuid
 from decimal import Decimal
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Mapping, Optional, Any
 from urllib.parse import urlencode
 
 import asyncio
@@ -73,6 +73,8 @@ class BithumbExchange(BaseCryptoExchange):
     - Testnet 미지원
     """
 
+    HTTP_USER_AGENT = 'Bithumb-Native-Client/1.0'
+
     def __init__(self, api_key: str, api_secret: str, testnet: bool = False):
         if testnet:
             logger.error("❌ Bithumb testnet 요청 거부 - testnet 미지원")
@@ -83,10 +85,7 @@ class BithumbExchange(BaseCryptoExchange):
 
         self.base_url = BASE_URL
 
-        # 캐시
-        self.markets_cache = {}
-        self.cache_time = {}
-        self.cache_ttl = 300  # 5분
+        # 마켓 정보는 공유 저장소(market_store)에 보관 (TTL: BaseCryptoExchange.cache_ttl)
 
         # HTTP 세션
         self.session = None
@@ -214,18 +213,23 @@ class BithumbExchange(BaseCryptoExchange):
             token = self._create_jwt_token(params)
             headers['Authorization'] = f'Bearer {token}'
 
+        # Keep-Alive 커넥션 풀 재사용 (매 요청 TCP+TLS 핸드셰이크 방지)
+        session = self._get_http_session()
+
         try:
             response = None
             if method.upper() == 'GET':
-                response = requests.get(url, params=params, headers=headers, timeout=30)
+                response = session.get(url, params=params, headers=headers, timeout=30)
             elif method.upper() == 'POST':
                 headers['Content-Type'] = 'application/json'
-                response = requests.post(url, json=params, headers=headers, timeout=30)
+                response = session.post(url, json=params, headers=headers, timeout=30)
             elif method.upper() == 'DELETE':
-                response = requests.delete(url, params=params, headers=headers, timeout=30)
+                response = session.delete(url, params=params, headers=headers, timeout=30)
             else:
                 raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
 
+            self._notify_response(response.status_code, response.headers)
+
             # HTTP 에러 처리
             if response.status_code >= 400:
                 try:
@@ -260,17 +264,15 @@ class BithumbExchange(BaseCryptoExchange):
 
     # ===== 핵심 거래 메서드 구현 =====
 
-    def load_markets_impl(self, market_type: str = 'spot', reload: bool = False) -> Dict[str, MarketInfo]:
+    def load_markets_impl(self, market_type: str = 'spot', reload: bool = False) -> Mapping[str, MarketInfo]:
         """마켓 정보 로드 (동기)"""
         if market_type.lower() != 'spot':
             raise ValueError("Bithumb은 Spot 거래만 지원합니다")
 
-        cache_key = "markets"
-
-        # 캐시 확인
-        if not reload and cache_key in self.cache_time:
-            if time.time() - self.cache_time[cache_key] < self.cache_ttl:
-                return self.markets_cache
+        # 캐시 확인 (공유 저장소)
+        cached_markets = self._get_stored_markets(market_type, reload)
+        if cached_markets is not None:
+            return cached_markets
 
         # 마켓 코드 조회 (Public API - 인증 불필요)
         data = self._request('GET', BithumbEndpoints.MARKET_ALL, params={'isDetails': 'true'})
@@ -312,9 +314,8 @@ class BithumbExchange(BaseCryptoExchange):
                 market_type='SPOT'
             )
 
-        # 캐시 업데이트
-        self.markets_cache = markets
-        self.cache_time[cache_key] = time.time()
+        # 공유 저장소 갱신
+        markets = self._publish_markets(market_type, markets)
 
         logger.info(f"✅ Bithumb 마켓 정보 로드 완료: {len(markets)}개")
         return markets
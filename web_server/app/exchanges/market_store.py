@@ -0,0 +1,179 @@
+# @FEAT:exchange-integration @FEAT:symbol-validation @FEAT:precision-system @COMP:exchange @TYPE:core
+"""
+프로세스 공용 MarketInfo 저장소
+
+같은 거래소 메타데이터가 SymbolValidator 캐시, 거래소 클라이언트별 *_markets_cache에
+각각 따로 파싱되어 중복 보관되던 것을 하나의 저장소로 통합합니다.
+
+- 키: (exchange, market_type, symbol) 튜플 (publish 시 sys.intern으로 문자열 공유)
+- 값: MarketInfo (slots dataclass) — 거래소 × market_type 단위로 교체
+- 읽기: 불변 스냅샷(MappingProxyType) 참조를 한 번 읽고 락 없이 조회
+- 쓰기: 락 안에서 새 스냅샷을 만들어 참조만 교체 (copy-on-write)
+- 적재 시 반복되는 문자열(base/quote asset, status)과 Decimal 값은 하나의 객체를 공유
+
+테스트넷 클라이언트는 exchange 키에 '_testnet' 접미사를 붙여 실거래 테이블과 분리합니다.
+"""
+
+import sys
+import threading
+import time
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from app.exchanges.models import MarketInfo
+
+MarketKey = Tuple[str, str, str]
+PartitionKey = Tuple[str, str]
+
+_EMPTY: Mapping[str, MarketInfo] = MappingProxyType({})
+
+# 적재 시 interning 대상 문자열 필드 / 값 공유 대상 Decimal 필드
+_STRING_FIELDS = ('base_asset', 'quote_asset', 'status', 'market_type')
+_DECIMAL_FIELDS = ('min_qty', 'max_qty', 'step_size', 'min_price', 'max_price', 'tick_size', 'min_notional')
+
+
+# @FEAT:exchange-integration @COMP:exchange @TYPE:core
+class MarketSnapshot:
+    """특정 시점의 전체 마켓 테이블 (생성 후 변경되지 않음)"""
+
+    __slots__ = ('markets', 'partitions', 'loaded_at', 'version')
+
+    def __init__(self, markets: Mapping[MarketKey, MarketInfo],
+                 partitions: Mapping[PartitionKey, Mapping[str, MarketInfo]],
+                 loaded_at: Mapping[PartitionKey, float], version: int):
+        self.markets = markets
+        self.partitions = partitions
+        self.loaded_at = loaded_at
+        self.version = version
+
+    def get(self, exchange: str, market_type: str, symbol: str) -> Optional[MarketInfo]:
+        return self.markets.get((exchange.lower(), market_type.lower(), symbol))
+
+    def get_markets(self, exchange: str, market_type: str) -> Mapping[str, MarketInfo]:
+        return self.partitions.get((exchange.lower(), market_type.lower()), _EMPTY)
+
+
+# @FEAT:exchange-integration @COMP:exchange @TYPE:core
+class MarketStore:
+    """거래소 × market_type별 MarketInfo 테이블을 보관하는 copy-on-write 저장소"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._snapshot = MarketSnapshot(_EMPTY, MappingProxyType({}), MappingProxyType({}), 0)
+
+    @property
+    def snapshot(self) -> MarketSnapshot:
+        """현재 스냅샷 (여러 번 조회할 때는 한 번 받아서 재사용)"""
+        return self._snapshot
+
+    def get(self, exchange: str, market_type: str, symbol: str) -> Optional[MarketInfo]:
+        """단일 심볼 조회 (락 없음)"""
+        return self._snapshot.markets.get((exchange.lower(), market_type.lower(), symbol))
+
+    def get_markets(self, exchange: str, market_type: str) -> Mapping[str, MarketInfo]:
+        """거래소 × market_type 테이블 ({표준 심볼: MarketInfo}, 읽기 전용)"""
+        return self._snapshot.get_markets(exchange, market_type)
+
+    def loaded_at(self, exchange: str, market_type: str) -> Optional[float]:
+        """테이블 적재 시각 (time.time, 없으면 None)"""
+        return self._snapshot.loaded_at.get((exchange.lower(), market_type.lower()))
+
+    def publish(self, exchange: str, market_type: str,
+                markets: Mapping[str, MarketInfo]) -> Mapping[str, MarketInfo]:
+        """테이블 하나 교체 → 저장소에 들어간 읽기 전용 테이블 반환"""
+        self.publish_many({(exchange, market_type): markets})
+        return self.get_markets(exchange, market_type)
+
+    def publish_many(self, tables: Mapping[PartitionKey, Mapping[str, MarketInfo]]) -> MarketSnapshot:
+        """
+        여러 테이블을 한 번에 교체 (포함되지 않은 거래소 × market_type은 유지)
+
+        교체되는 테이블에서 빠진 심볼(상장 폐지)은 새 스냅샷에서 제거됩니다.
+        전달된 MarketInfo 객체는 문자열 interning/Decimal 공유를 위해 제자리에서 정리됩니다.
+        """
+        now = time.time()
+        prepared = {}
+        for (exchange, market_type), markets in tables.items():
+            partition = (sys.intern(exchange.lower()), sys.intern(market_type.lower()))
+            prepared[partition] = self._compact(markets)
+
+        with self._lock:
+            current = self._snapshot
+            partitions = dict(current.partitions)
+            loaded_at = dict(current.loaded_at)
+            for partition, markets in prepared.items():
+                partitions[partition] = MappingProxyType(markets)
+                loaded_at[partition] = now
+
+            flat = {}
+            for (exchange, market_type), markets in partitions.items():
+                for symbol, market_info in markets.items():
+                    flat[(exchange, market_type, symbol)] = market_info
+
+            self._snapshot = MarketSnapshot(
+                MappingProxyType(flat), MappingProxyType(partitions),
+                MappingProxyType(loaded_at), current.version + 1
+            )
+            return self._snapshot
+
+    def invalidate(self, exchange: Optional[str] = None) -> int:
+        """
+        TTL 만료 처리 (테이블은 유지 → 주문 경로 force_cache 조회는 계속 가능)
+
+        Returns:
+            int: 만료 처리된 테이블 수
+        """
+        with self._lock:
+            current = self._snapshot
+            loaded_at = dict(current.loaded_at)
+            targets = [p for p in loaded_at if exchange is None or p[0] == exchange.lower()]
+            for partition in targets:
+                loaded_at[partition] = 0.0
+            self._snapshot = MarketSnapshot(
+                current.markets, current.partitions, MappingProxyType(loaded_at), current.version + 1
+            )
+            return len(targets)
+
+    def clear(self) -> None:
+        """전체 비우기 (테스트용)"""
+        with self._lock:
+            self._snapshot = MarketSnapshot(_EMPTY, MappingProxyType({}), MappingProxyType({}),
+                                            self._snapshot.version + 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        snapshot = self._snapshot
+        now = time.time()
+        return {
+            'version': snapshot.version,
+            'total_markets': len(snapshot.markets),
+            'tables': {
+                f"{exchange}_{market_type}": {
+                    'markets': len(markets),
+                    'age_sec': round(now - snapshot.loaded_at.get((exchange, market_type), 0.0), 1)
+                }
+                for (exchange, market_type), markets in snapshot.partitions.items()
+            }
+        }
+
+    @staticmethod
+    def _compact(markets: Mapping[str, MarketInfo]) -> Dict[str, MarketInfo]:
+        """심볼 키/반복 문자열 interning + 같은 표기의 Decimal 객체 공유"""
+        decimals: Dict[str, Decimal] = {}
+        compacted = {}
+        for symbol, market_info in markets.items():
+            for name in _STRING_FIELDS:
+                value = getattr(market_info, name)
+                if isinstance(value, str):
+                    setattr(market_info, name, sys.intern(value))
+            for name in _DECIMAL_FIELDS:
+                value = getattr(market_info, name)
+                # 지수(표기)가 다르면 quantize 결과가 달라지므로 문자열 표기 기준으로만 공유
+                setattr(market_info, name, decimals.setdefault(str(value), value))
+            market_info.symbol = sys.intern(market_info.symbol)
+            compacted[sys.intern(symbol)] = market_info
+        return compacted
+
+
+# 전역 인스턴스
+market_store = MarketStore()
@@ -41,9 +41,9 @@ def extract_timestamp_ms(data: Dict[str, Any], keys: Sequence[str],
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketInfo:
-    """마켓 정보 모델"""
+    """마켓 정보 모델 (거래소당 수천 건 상주 → __slots__로 인스턴스 __dict__ 제거)"""
     symbol: str
     base_asset: str
     quote_asset: str
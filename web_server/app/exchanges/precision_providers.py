@@ -24,6 +24,9 @@ class PrecisionProvider(ABC):
     - 규칙 기반 거래소: 가격대별 동적 계산 (RuleBasedPrecisionProvider)
     """
 
+    # 마켓마다 하나씩 생성되므로 인스턴스 __dict__ 제거
+    __slots__ = ('market_info',)
+
     def __init__(self, market_info: 'MarketInfo'):
         """
         Args:
@@ -70,6 +73,8 @@ class ApiBasedPrecisionProvider(PrecisionProvider):
     가격대와 무관하게 항상 동일한 값을 반환합니다.
     """
 
+    __slots__ = ()
+
     def get_tick_size(self, price: Decimal) -> Decimal:
         """
         고정 tick_size 반환 (가격 무관)
@@ -109,6 +114,8 @@ class RuleBasedPrecisionProvider(PrecisionProvider):
         - 현재는 market_info.tick_size를 그대로 반환 (기존 동작 유지)
     """
 
+    __slots__ = ('exchange_name',)
+
     def __init__(self, market_info: 'MarketInfo', exchange_name: str):
         """
         Args:
@@ -47,7 +47,8 @@ class BaseSecuritiesExchange(ABC):
         Args:
             account (Account): 증권 계좌 모델 (DB)
         """
-        self.account = account
+        # 레지스트리가 스레드 간 공유하는 인스턴스 → 세션 종속 Account 대신 불변 식별값만 보관
+        self.account_id = account.id
         self.name = self.__class__.__name__.replace('Exchange', '').lower()
 
         # 증권 설정 로드
@@ -114,19 +115,19 @@ class BaseSecuritiesExchange(ABC):
             # DB에서 토큰 캐시 조회 (FOR UPDATE 락 적용)
             token_cache = (
                 SecuritiesToken.query
-                .filter_by(account_id=self.account.id)
+                .filter_by(account_id=self.account_id)
                 .with_for_update()
                 .first()
             )
 
             if not token_cache or token_cache.is_expired():
                 # 토큰이 없거나 만료됨 → 재발급
-                logger.info(f"🔄 토큰 재발급 필요 (account_id={self.account.id})")
+                logger.info(f"🔄 토큰 재발급 필요 (account_id={self.account_id})")
 
                 try:
                     token_data = self.authenticate()
                 except Exception as e:
-                    logger.error(f"❌ 토큰 발급 실패 (account_id={self.account.id}): {e}")
+                    logger.error(f"❌ 토큰 발급 실패 (account_id={self.account_id}): {e}")
                     raise AuthenticationError(f"OAuth 토큰 발급 실패: {e}")
 
                 if token_cache:
@@ -137,7 +138,7 @@ class BaseSecuritiesExchange(ABC):
                 else:
                     # 새 토큰 생성
                     token_cache = SecuritiesToken(
-                        account_id=self.account.id,
+                        account_id=self.account_id,
                         access_token=token_data['access_token'],
                         token_type=token_data.get('token_type', 'Bearer'),
                         expires_in=token_data['expires_in'],
@@ -150,17 +151,17 @@ class BaseSecuritiesExchange(ABC):
                     logger.info(f"✅ 토큰 발급 완료 (만료: {token_data['expires_at']})")
                 except Exception as e:
                     db.session.rollback()
-                    logger.error(f"❌ 토큰 저장 실패 (account_id={self.account.id}): {e}")
+                    logger.error(f"❌ 토큰 저장 실패 (account_id={self.account_id}): {e}")
                     raise AuthenticationError(f"토큰 DB 저장 실패: {e}")
 
             elif token_cache.needs_refresh():
                 # 토큰이 곧 만료 → 갱신
-                logger.info(f"🔄 토큰 갱신 (account_id={self.account.id})")
+                logger.info(f"🔄 토큰 갱신 (account_id={self.account_id})")
 
                 try:
                     token_data = self.refresh_token()
                 except Exception as e:
-                    logger.error(f"❌ 토큰 갱신 실패 (account_id={self.account.id}): {e}")
+                    logger.error(f"❌ 토큰 갱신 실패 (account_id={self.account_id}): {e}")
                     raise AuthenticationError(f"OAuth 토큰 갱신 실패: {e}")
 
                 token_cache.access_token = token_data['access_token']
@@ -172,7 +173,7 @@ class BaseSecuritiesExchange(ABC):
                     logger.info(f"✅ 토큰 갱신 완료 (만료: {token_data['expires_at']})")
                 except Exception as e:
                     db.session.rollback()
-                    logger.error(f"❌ 토큰 갱신 저장 실패 (account_id={self.account.id}): {e}")
+                    logger.error(f"❌ 토큰 갱신 저장 실패 (account_id={self.account_id}): {e}")
                     raise AuthenticationError(f"토큰 갱신 저장 실패: {e}")
 
             return token_cache.access_token
@@ -183,7 +184,7 @@ class BaseSecuritiesExchange(ABC):
         except Exception as e:
             # 예상치 못한 에러
             db.session.rollback()
-            logger.error(f"❌ 토큰 관리 중 예외 (account_id={self.account.id}): {e}")
+            logger.error(f"❌ 토큰 관리 중 예외 (account_id={self.account_id}): {e}")
             raise AuthenticationError(f"토큰 관리 중 예외 발생: {e}")
 
     # ========================================
@@ -96,7 +96,7 @@ class KoreaInvestmentExchange(BaseSecuritiesExchange):
             'appsecret': self.appsecret
         }
 
-        logger.info(f"🔑 한투 OAuth 토큰 발급 요청 (account_id={self.account.id})")
+        logger.info(f"🔑 한투 OAuth 토큰 발급 요청 (account_id={self.account_id})")
 
         try:
             response = requests.post(url, headers=headers, json=body, timeout=10)
@@ -144,7 +144,7 @@ class KoreaInvestmentExchange(BaseSecuritiesExchange):
         Returns:
             authenticate()와 동일한 포맷
         """
-        logger.info(f"🔄 한투 토큰 갱신 (실제로는 재발급, account_id={self.account.id})")
+        logger.info(f"🔄 한투 토큰 갱신 (실제로는 재발급, account_id={self.account_id})")
         return self.authenticate()
 
     # ========================================
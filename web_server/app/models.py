@@ -5,7 +5,7 @@ from flask_sqlalchemy import SQLAlchemy
 from flask_login import UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
 from app import db
-from app.constants import MarketType
+from app.constants import MarketType, OrderStatus
 from app.security.encryption import decrypt_value, is_likely_legacy_hash
 import logging
 
@@ -293,6 +293,7 @@ class StrategyAccount(db.Model):
     strategy_positions = db.relationship('StrategyPosition', backref='strategy_account', lazy=True, cascade='all, delete-orphan')
     trades = db.relationship('Trade', backref='strategy_account', lazy=True, cascade='all, delete-orphan')
     open_orders = db.relationship('OpenOrder', backref='strategy_account', lazy=True, cascade='all, delete-orphan')
+    daily_pnl_rollups = db.relationship('StrategyAccountDailyPnl', backref='strategy_account', lazy=True, cascade='all, delete-orphan')
 
     def __repr__(self):
         max_symbols_str = f", max_symbols: {self.max_symbols}" if self.max_symbols is not None else ""
@@ -322,6 +323,8 @@ class StrategyPosition(db.Model):
     quantity = db.Column(db.Float, default=0.0, nullable=False)  # 포지션 수량 (양수: 롱, 음수: 숏)
     entry_price = db.Column(db.Float, default=0.0, nullable=False)  # 평균 진입 가격
     last_updated = db.Column(db.DateTime, default=datetime.utcnow)
+    # 미실현 손익 (calculate_unrealized_pnl 백그라운드 작업이 일괄 UPDATE로 갱신, last_updated는 변경하지 않음)
+    unrealized_pnl = db.Column(db.Float, default=0.0, nullable=False)
 
     # 복합 유니크 제약조건
     __table_args__ = (db.UniqueConstraint('strategy_account_id', 'symbol'),)
@@ -365,11 +368,48 @@ class Trade(db.Model):
     __table_args__ = (
         db.UniqueConstraint('strategy_account_id', 'exchange_order_id',
                           name='unique_order_per_account'),
+        # 분석 일괄 로더: strategy_account_id IN (...) AND timestamp 범위, timestamp 정렬
+        db.Index('idx_trades_account_timestamp', 'strategy_account_id', 'timestamp'),
     )
 
     def __repr__(self):
         return f'<Trade {self.symbol} {self.side} {self.quantity} @ {self.price} ({self.market_type})>'
 
+
+# @FEAT:analytics @FEAT:pnl-rollup @COMP:model @TYPE:core
+class StrategyAccountDailyPnl(db.Model):
+    """전략 계좌별 일일 실현 손익 롤업 테이블
+
+    Trade.pnl이 기록될 때 증분 갱신되며 대시보드/분석 쿼리는 거래 대신 일별 행을 읽습니다.
+    cumulative_pnl/peak_pnl은 해당 일자 종료 시점의 누적 손익과 누적 최고점(0 기준)입니다.
+    current_streak은 일자 종료 시점의 연속 승(+)/패(-) 수, max_*_streak은 해당 일자까지의 최대값입니다.
+    """
+    __tablename__ = 'strategy_account_daily_pnl'
+
+    id = db.Column(db.Integer, primary_key=True)
+    strategy_account_id = db.Column(db.Integer, db.ForeignKey('strategy_accounts.id', ondelete='CASCADE'), nullable=False)
+    date = db.Column(db.Date, nullable=False)  # 체결일 (UTC)
+    realized_pnl = db.Column(db.Float, default=0.0, nullable=False)  # 일일 실현 손익
+    fees = db.Column(db.Float, default=0.0, nullable=False)  # 일일 수수료
+    trade_count = db.Column(db.Integer, default=0, nullable=False)  # 손익이 기록된 거래 수
+    winning_trades = db.Column(db.Integer, default=0, nullable=False)
+    losing_trades = db.Column(db.Integer, default=0, nullable=False)
+    gross_profit = db.Column(db.Float, default=0.0, nullable=False)  # 수익 거래 손익 합계
+    gross_loss = db.Column(db.Float, default=0.0, nullable=False)  # 손실 거래 손익 합계 (음수)
+    cumulative_pnl = db.Column(db.Float, default=0.0, nullable=False)  # 누적 실현 손익
+    peak_pnl = db.Column(db.Float, default=0.0, nullable=False)  # 누적 손익 최고점
+    current_streak = db.Column(db.Integer, default=0, nullable=False)
+    max_win_streak = db.Column(db.Integer, default=0, nullable=False)
+    max_loss_streak = db.Column(db.Integer, default=0, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        db.UniqueConstraint('strategy_account_id', 'date', name='uq_strategy_account_daily_pnl'),
+    )
+
+    def __repr__(self):
+        return f'<StrategyAccountDailyPnl {self.strategy_account_id} {self.date}: {self.realized_pnl}>'
+
 class OpenOrder(db.Model):
     """미체결 주문 정보 테이블 (Phase 5 이후 유일한 주문 모델)
 
@@ -416,6 +456,26 @@ class OpenOrder(db.Model):
     # Used for: (1) Debugging stuck CANCELLING orders, (2) Background cleanup timeout detection
     cancel_attempted_at = db.Column(db.DateTime, nullable=True)
 
+    # @FEAT:order-tracking @COMP:model @TYPE:config
+    # 핫 쿼리 인덱스 (migrations/20251112_add_hot_query_indexes.py)
+    # - 상태 동기화: status IN (활성) AND is_processing = false → 부분 인덱스
+    # - 일괄 취소/심볼별 조회: (strategy_account_id, symbol, status)
+    __table_args__ = (
+        db.Index('idx_open_orders_status', 'status'),
+        db.Index('idx_open_orders_account_symbol_status', 'strategy_account_id', 'symbol', 'status'),
+        db.Index(
+            'idx_open_orders_active_unlocked', 'strategy_account_id', 'symbol',
+            postgresql_where=db.and_(status.in_(OrderStatus.get_active_statuses()), is_processing == False),
+            sqlite_where=db.and_(status.in_(OrderStatus.get_active_statuses()), is_processing == False),
+        ),
+        # CANCELLING 타임아웃 정리 (migrations/20251030_add_cancelling_state.py)
+        db.Index(
+            'idx_open_orders_cancelling_cleanup', 'status', 'cancel_attempted_at',
+            postgresql_where=(status == OrderStatus.CANCELLING),
+            sqlite_where=(status == OrderStatus.CANCELLING),
+        ),
+    )
+
     def __repr__(self):
         return (
             f'<OpenOrder {self.symbol} {self.side} {self.order_type} '
@@ -424,7 +484,7 @@ class OpenOrder(db.Model):
         )
 
 class WebhookLog(db.Model):
-    """웹훅 수신 로그 테이블"""
+    """웹훅 수신 로그 테이블 (PostgreSQL: received_at 월별 파티션, app/services/log_retention.py)"""
     __tablename__ = 'webhook_logs'
 
     id = db.Column(db.Integer, primary_key=True)
@@ -447,9 +507,46 @@ class WebhookLog(db.Model):
     trade_processing_time_ms = db.Column(db.Float, nullable=True)  # 거래 처리 소요 시간
     total_processing_time_ms = db.Column(db.Float, nullable=True)  # 총 처리 소요 시간
 
+    __table_args__ = (
+        db.Index('idx_webhook_logs_received_at', 'received_at'),
+        db.Index('idx_webhook_logs_webhook_received_at', 'webhook_received_at'),
+    )
+
     def __repr__(self):
         return f'<WebhookLog {self.status} at {self.received_at}>'
 
+
+# @FEAT:webhook-queue @COMP:model @TYPE:core
+class WebhookQueueItem(db.Model):
+    """
+    웹훅 수신 대기열 (비동기 수신 모드)
+
+    수신 즉시 검증 후 저장하고 워커 풀이 처리합니다.
+    동일 (strategy_id, symbol) 항목은 id 순서대로 한 번에 하나만 PROCESSING 상태가 됩니다.
+    """
+    __tablename__ = 'webhook_queue'
+
+    id = db.Column(db.Integer, primary_key=True)
+    strategy_id = db.Column(db.Integer, nullable=False)  # FIFO 키 (테스트 모드는 가상 전략 ID)
+    symbol = db.Column(db.String(50), nullable=False)  # FIFO 키
+    group_name = db.Column(db.String(100), nullable=False)
+    payload = db.Column(db.Text, nullable=False)  # 웹훅 데이터 (JSON, 토큰 제거)
+    status = db.Column(db.String(20), nullable=False, default='PENDING')  # PENDING, PROCESSING, DONE, FAILED
+    webhook_received_at = db.Column(db.Float, nullable=False)  # Unix timestamp (초)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    locked_at = db.Column(db.Float, nullable=True)  # PROCESSING 전환 시점
+    completed_at = db.Column(db.Float, nullable=True)
+    message = db.Column(db.Text, nullable=True)  # 처리 결과 요약 또는 오류 내용
+
+    __table_args__ = (
+        db.Index('idx_webhook_queue_status_id', 'status', 'id'),
+        db.Index('idx_webhook_queue_key', 'strategy_id', 'symbol', 'status'),
+        db.Index('idx_webhook_queue_completed', 'status', 'completed_at'),
+    )
+
+    def __repr__(self):
+        return f'<WebhookQueueItem {self.id} {self.strategy_id}:{self.symbol} {self.status}>'
+
 class DailyAccountSummary(db.Model):
     """일일 계정 요약 테이블"""
     __tablename__ = 'daily_account_summaries'
@@ -531,6 +628,27 @@ class SystemSetting(db.Model):
     def __repr__(self):
         return f'<SystemSetting {self.key}={self.value}>'
 
+
+# @FEAT:symbol-validation @COMP:model @TYPE:core
+class MarketMetadataSnapshot(db.Model):
+    """거래소 × market_type별 파싱된 MarketInfo 테이블 스냅샷
+
+    기동 시 exchangeInfo 다운로드 없이 심볼 캐시를 복원하는 데 사용합니다.
+    payload는 zlib 압축 JSON(심볼당 한 행)이며 schema_version이 다르면 무시됩니다.
+    """
+    __tablename__ = 'market_metadata_snapshots'
+
+    exchange = db.Column(db.String(20), primary_key=True)  # 소문자 거래소명 (binance 등)
+    market_type = db.Column(db.String(10), primary_key=True)  # spot, futures
+    schema_version = db.Column(db.Integer, nullable=False)
+    market_count = db.Column(db.Integer, default=0, nullable=False)
+    payload = db.Column(db.LargeBinary, nullable=False)
+    fetched_at = db.Column(db.DateTime, nullable=False)  # 거래소에서 받아온 시각 (UTC)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<MarketMetadataSnapshot {self.exchange} {self.market_type}: {self.market_count}>'
+
 # ============================================
 # Phase 1: 열린 주문 트래킹 시스템 테이블
 # ============================================
@@ -598,6 +716,7 @@ class TradeExecution(db.Model):
         db.Index('idx_trade_exec_symbol', 'symbol'),
         db.Index('idx_trade_exec_time', 'execution_time'),
         db.Index('idx_trade_exec_strategy', 'strategy_account_id'),
+        db.Index('idx_trade_exec_account_time', 'strategy_account_id', 'execution_time'),
         db.UniqueConstraint('exchange_trade_id', 'strategy_account_id', name='uq_exchange_trade'),
     )
 
@@ -667,7 +786,7 @@ class StrategyPerformance(db.Model):
 
 
 class TrackingLog(db.Model):
-    """시스템 추적 로그 테이블"""
+    """시스템 추적 로그 테이블 (PostgreSQL: created_at 월별 파티션, app/services/log_retention.py)"""
     __tablename__ = 'tracking_logs'
 
     id = db.Column(db.Integer, primary_key=True)
@@ -795,6 +914,7 @@ class OrderFillEvent(db.Model):
 
     WebSocket 또는 REST API로 감지된 주문 체결 이벤트를 기록합니다.
     대기열 시스템의 재정렬 트리거로 사용됩니다.
+    PostgreSQL에서는 created_at 월별 파티션 테이블입니다 (app/services/log_retention.py).
     """
     __tablename__ = 'order_fill_events'
 
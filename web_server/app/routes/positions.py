@@ -299,7 +299,9 @@ def event_stream():
         # EventService로 SSE 스트림 생성
         current_app.logger.info(f'🔗 SSE 연결 요청 - 사용자: {current_user.id}, 전략: {strategy_id}')
         from app.services.event_service import event_service
-        response = event_service.get_event_stream(current_user.id, strategy_id)
+        # 재연결 시 마지막 수신 이벤트 이후부터 재전송 (브라우저 자동 재연결: 헤더, 수동 재연결: 쿼리)
+        last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+        response = event_service.get_event_stream(current_user.id, strategy_id, last_event_id)
         current_app.logger.info(f'✅ SSE 스트림 생성 완료 - 사용자: {current_user.id}, 전략: {strategy_id}')
         return response
 
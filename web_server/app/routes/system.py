@@ -259,6 +259,233 @@ def cache_stats():
             'error': str(e)
         }), 500
 
+# @FEAT:health-monitoring @FEAT:price-cache @COMP:route @TYPE:core
+@bp.route('/system/price-cache-stats', methods=['GET'])
+@login_required
+def price_cache_stats():
+    """가격 캐시 심볼별 경과 시간/출처 및 시세 스트림 상태 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.services.price_cache import price_cache
+        from app.services.price_stream import price_stream_manager
+
+        return jsonify({
+            'success': True,
+            'price_cache': price_cache.get_stats(),
+            'price_stream': price_stream_manager.get_stats()
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f'가격 캐시 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# @FEAT:health-monitoring @COMP:route @TYPE:core
+@bp.route('/system/http-pool-stats', methods=['GET'])
+@login_required
+def http_pool_stats():
+    """거래소 Keep-Alive HTTP 커넥션 풀 통계 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.services.exchange import exchange_service
+
+        stats = exchange_service.get_http_pool_stats()
+        return jsonify(stats), 200 if stats['success'] else 500
+    except Exception as e:
+        current_app.logger.error(f'HTTP 커넥션 풀 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# @FEAT:health-monitoring @COMP:route @TYPE:core
+@bp.route('/system/rate-limit-stats', methods=['GET'])
+@login_required
+def rate_limit_stats():
+    """거래소 Rate Limiter 토큰 버킷 통계 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.services.exchange import exchange_service
+
+        return jsonify({
+            'success': True,
+            'rate_limits': exchange_service.rate_limiter.get_stats()
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f'Rate Limit 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# @FEAT:health-monitoring @COMP:route @TYPE:core
+@bp.route('/system/order-fanout-stats', methods=['GET'])
+@login_required
+def order_fanout_stats():
+    """다계좌 주문 fan-out 지연(p50/p99 signal-to-last-ack) 통계 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.services.trading.order_fanout import order_fanout_engine
+
+        return jsonify({
+            'success': True,
+            'order_fanout': order_fanout_engine.get_stats()
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f'주문 fan-out 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# @FEAT:health-monitoring @FEAT:webhook-queue @COMP:route @TYPE:core
+@bp.route('/system/webhook-queue-stats', methods=['GET'])
+@login_required
+def webhook_queue_stats():
+    """웹훅 비동기 수신 대기열 상태(상태별 건수, 가장 오래된 대기 항목) 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.services.webhook_queue import webhook_queue
+
+        return jsonify({
+            'success': True,
+            'webhook_queue': webhook_queue.get_stats()
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f'웹훅 대기열 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# @FEAT:health-monitoring @FEAT:order-tracking @COMP:route @TYPE:core
+@bp.route('/system/order-fill-stats', methods=['GET'])
+@login_required
+def order_fill_stats():
+    """체결 모니터 통계(스트림 직접 적용/중복/REST 재확인 사유, 이벤트~DB 커밋 지연) 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.services import order_fill_monitor as monitor_module
+
+        # 백그라운드 서비스 비소유 프로세스에서는 체결 모니터가 없음
+        monitor = monitor_module.order_fill_monitor
+        return jsonify({
+            'success': True,
+            'order_fill_monitor': monitor.get_stats() if monitor else {'enabled': False}
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f'체결 모니터 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# @FEAT:health-monitoring @FEAT:account-management @COMP:route @TYPE:core
+@bp.route('/system/balance-sync-stats', methods=['GET'])
+@login_required
+def balance_sync_stats():
+    """잔고 동기화 마지막 실행 통계(실행 시간, 조회/건너뜀 계좌 수, 잔고 데이터 경과 시간) 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.services.balance_sync import balance_sync_service
+
+        return jsonify({
+            'success': True,
+            'balance_sync': balance_sync_service.get_stats()
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f'잔고 동기화 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# @FEAT:health-monitoring @FEAT:order-tracking @COMP:route @TYPE:core
+@bp.route('/system/order-reconcile-stats', methods=['GET'])
+@login_required
+def order_reconcile_stats():
+    """미체결 주문 동기화 마지막 실행 통계(조회/생략 버킷 수, API 호출 수, 소모 가중치) 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.services.trading.open_order_reconciler import open_order_reconciler
+
+        return jsonify({
+            'success': True,
+            'order_reconcile': open_order_reconciler.get_stats()
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f'미체결 주문 동기화 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+# @FEAT:health-monitoring @COMP:route @TYPE:core
+@bp.route('/system/db-pool-stats', methods=['GET'])
+@login_required
+def db_pool_stats():
+    """역할별 DB 커넥션 풀 통계(획득 대기 시간, 사용 중 커넥션 수, 보유자) 조회"""
+    try:
+        if not current_user.is_admin:
+            return jsonify({
+                'success': False,
+                'error': '관리자 권한이 필요합니다.'
+            }), 403
+
+        from app.utils.db_pool import db_pool_monitor
+
+        return jsonify({
+            'success': True,
+            'db_pool': db_pool_monitor.get_stats()
+        }), 200
+    except Exception as e:
+        current_app.logger.error(f'DB 풀 통계 조회 오류: {str(e)}')
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 # @FEAT:health-monitoring @COMP:route @TYPE:core
 @bp.route('/system/cache-clear', methods=['POST'])
 @login_required
@@ -13,6 +13,7 @@ from flask import Blueprint, request, jsonify, current_app
 from app import db, csrf
 from app.models import WebhookLog
 from app.services.webhook_service import webhook_service, WebhookError
+from app.services.webhook_queue import webhook_queue
 from app.services.telegram import telegram_service
 from app.utils.response_formatter import (
     create_success_response, create_error_response, exception_to_error_response,
@@ -108,6 +109,9 @@ def webhook():
     - Queue 진입 제거, 모든 주문 즉시 실행
     - 10초 타임아웃 (threading.Timer, 멀티스레드 안전)
     - 배치 크기 30개 제한
+
+    WEBHOOK_ASYNC_INGESTION=true 이면 검증 후 webhook_queue에 저장하고 즉시 응답합니다
+    (처리는 워커 풀, 전략+심볼 FIFO 유지).
     """
     # 웹훅 수신 시점 기록 (표준화된 명명 규칙)
     webhook_received_at = time.time()
@@ -151,6 +155,21 @@ def webhook():
 
             current_app.logger.info(f'🔔 웹훅 수신: {json.dumps(data, ensure_ascii=False)}')
 
+            # 비동기 수신 모드: 검증 + 대기열 저장 후 즉시 응답 (처리는 워커 풀)
+            if webhook_queue.enabled:
+                queue_id = webhook_queue.enqueue(data, webhook_received_at)
+                return create_success_response(
+                    data={
+                        'success': True,
+                        'queued': True,
+                        'queue_id': queue_id,
+                        'performance_metrics': {
+                            'total_processing_time_ms': round((time.time() - webhook_received_at) * 1000, 2)
+                        }
+                    },
+                    message="웹훅 접수 완료"
+                )
+
             # 웹훅 서비스를 통해 웹훅 처리 (표준화된 타이밍 전달)
             result = webhook_service.process_webhook(data, webhook_received_at)
 
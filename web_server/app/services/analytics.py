@@ -8,25 +8,30 @@ Analytics + Dashboard + Capital 관련 모든 기능 통합
 
 import logging
 from collections import defaultdict
-from math import sqrt
-from statistics import mean, pstdev, StatisticsError
 from typing import Dict, Any, Optional, List, Tuple
 from decimal import Decimal, InvalidOperation
 from datetime import datetime, timedelta
-from sqlalchemy import func, and_, desc, or_
+import numpy as np
+from sqlalchemy import func, desc, or_
 from sqlalchemy.orm import selectinload
 
 from app import db
 from app.constants import MarketType, Exchange
 from app.models import (
     Strategy, StrategyPosition, OpenOrder, Trade, Account,
-    StrategyAccount, User, StrategyCapital, DailyAccountSummary, TradeExecution
+    StrategyAccount, User, StrategyCapital, DailyAccountSummary, TradeExecution,
+    StrategyAccountDailyPnl
 )
+from app.services import analytics_engine
+from app.services.pnl_rollup import pnl_rollup_service
 from app.services.security import security_service
 from app.services.utils import to_decimal
 
 logger = logging.getLogger(__name__)
 
+# (일자 datetime64[D] 배열, 일별 손익 배열) - 일자 오름차순
+DailySeries = Tuple[np.ndarray, np.ndarray]
+
 # @FEAT:analytics @FEAT:capital-management @FEAT:position-tracking @COMP:model @TYPE:core
 class AnalyticsError(Exception):
     """분석 관련 오류"""
@@ -88,7 +93,7 @@ class AnalyticsService:
             # 오늘의 거래만 필터링
             today = datetime.utcnow().date()
             today_start = datetime.combine(today, datetime.min.time())
-            all_trades_today = self._bulk_load_trades(sa_ids, start_date=today_start)
+            trades_today = analytics_engine.load_trade_columns(sa_ids, start_time=today_start)
 
             # ✅ 메모리에서 집계 (DB 쿼리 없음)
             # 포지션 정보
@@ -107,11 +112,8 @@ class AnalyticsService:
             ])
 
             # 오늘의 거래
-            today_trades = len(all_trades_today)
-            today_pnl = sum(
-                [trade.pnl for trade in all_trades_today if trade.pnl],
-                Decimal('0')
-            )
+            today_trades = len(trades_today)
+            today_pnl = float(np.sum(trades_today.realized_pnl))
 
             return {
                 'success': True,
@@ -252,40 +254,30 @@ class AnalyticsService:
                     }
                 }
 
-            # ✅ 단일 쿼리로 거래 내역 조회
-            trades = self._bulk_load_trades(sa_ids, start_date=start_date, end_date=end_date)
+            # ✅ 단일 쿼리로 거래 컬럼 조회 (ORM 객체 생성 없음)
+            trades = analytics_engine.load_trade_columns(sa_ids, start_time=start_date, end_time=end_date)
+            pnl = trades.realized_pnl
 
-            # 기본 통계 (메모리에서 처리)
+            # 기본 통계 (배열 연산)
             total_trades = len(trades)
-            winning_trades = len([t for t in trades if t.pnl and t.pnl > 0])
-            losing_trades = len([t for t in trades if t.pnl and t.pnl < 0])
+            wins = pnl[pnl > 0]
+            losses = pnl[pnl < 0]
+            winning_trades = len(wins)
+            losing_trades = len(losses)
 
-            total_pnl = sum([t.pnl for t in trades if t.pnl], Decimal('0'))
-            total_volume = sum([t.price * t.quantity for t in trades if t.price and t.quantity], Decimal('0'))
+            total_pnl = float(np.sum(pnl))
+            total_volume = float(np.sum(trades.notional))
 
             # 승률
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
 
             # 평균 수익/손실
-            avg_win = Decimal('0')
-            avg_loss = Decimal('0')
-
-            if winning_trades > 0:
-                win_pnls = [t.pnl for t in trades if t.pnl and t.pnl > 0]
-                avg_win = sum(win_pnls, Decimal('0')) / len(win_pnls)
-
-            if losing_trades > 0:
-                loss_pnls = [t.pnl for t in trades if t.pnl and t.pnl < 0]
-                avg_loss = sum(loss_pnls, Decimal('0')) / len(loss_pnls)
+            avg_win = float(np.mean(wins)) if winning_trades > 0 else 0.0
+            avg_loss = float(np.mean(losses)) if losing_trades > 0 else 0.0
 
             # 일별 PnL
-            daily_pnl = {}
-            for trade in trades:
-                trade_date = trade.timestamp.date().isoformat()
-                if trade_date not in daily_pnl:
-                    daily_pnl[trade_date] = Decimal('0')
-                if trade.pnl:
-                    daily_pnl[trade_date] += trade.pnl
+            trade_days, day_pnls = analytics_engine.daily_sums(trades.day, pnl)
+            daily_pnl = dict(zip((str(day) for day in trade_days), day_pnls.tolist()))
 
             return {
                 'success': True,
@@ -436,8 +428,10 @@ class AnalyticsService:
                     }
                 }
 
-            # ✅ 단일 쿼리로 기간별 거래 조회
-            trades = self._bulk_load_trades(sa_ids, start_date=start_date, end_date=end_date)
+            # ✅ 일별 손익 롤업 조회 (거래 단위 로딩 없음)
+            daily_rows = pnl_rollup_service.load_daily_rows(
+                sa_ids, start_date=start_date.date(), end_date=end_date.date()
+            )
 
             # 일별 PnL 계산 (메모리에서 처리)
             daily_pnl = {}
@@ -451,11 +445,10 @@ class AnalyticsService:
                 daily_pnl[date_str] = Decimal('0')
                 current_date += timedelta(days=1)
 
-            # 거래별 PnL 누적
-            for trade in trades:
-                trade_date = trade.timestamp.date().isoformat()
-                if trade.pnl:
-                    daily_pnl[trade_date] += trade.pnl
+            # 계좌별 일별 손익 합산
+            for rows in daily_rows.values():
+                for row in rows:
+                    daily_pnl[row.date.isoformat()] += to_decimal(row.realized_pnl)
 
             # 누적 PnL 계산
             for date_str in sorted(daily_pnl.keys()):
@@ -493,8 +486,9 @@ class AnalyticsService:
             strategies = Strategy.query.filter_by(user_id=user_id).all()
             strategy_ids = [s.id for s in strategies]
 
-            monthly_trades = []
-            monthly_pnl = Decimal('0')
+            monthly_trades = analytics_engine.load_trade_columns([])
+            monthly_pnl = 0.0
+            strategy_of_account: Dict[int, int] = {}
 
             if strategy_ids:
                 # ✅ 중첩 서브쿼리 제거: 벌크 로딩 사용
@@ -502,10 +496,12 @@ class AnalyticsService:
                 sa_ids = [sa.id for sa in strategy_accounts]
 
                 if sa_ids:
-                    # ✅ 단일 쿼리로 월간 거래 조회
-                    trades = self._bulk_load_trades(sa_ids, start_date=start_date, end_date=end_date)
-                    monthly_trades = trades
-                    monthly_pnl = sum([t.pnl for t in trades if t.pnl], Decimal('0'))
+                    # ✅ 단일 쿼리로 월간 거래 컬럼 조회
+                    monthly_trades = analytics_engine.load_trade_columns(
+                        sa_ids, start_time=start_date, end_time=end_date
+                    )
+                    monthly_pnl = float(np.sum(monthly_trades.realized_pnl))
+                    strategy_of_account = {sa.id: sa.strategy_id for sa in strategy_accounts}
 
             # 리포트 데이터
             report = {
@@ -517,16 +513,27 @@ class AnalyticsService:
                 'worst_performing_strategy': None
             }
 
-            # 전략별 성과 (메모리에서 처리)
+            # 전략별 성과 (전략 ID 배열 기준 분해)
+            strategy_trade_counts: Dict[int, int] = {}
+            strategy_pnls: Dict[int, float] = {}
+            if len(monthly_trades):
+                strategy_keys = np.array([
+                    strategy_of_account.get(int(sa_id), 0)
+                    for sa_id in monthly_trades.strategy_account_id
+                ], dtype=np.int64)
+                unique_keys, inverse, counts = np.unique(
+                    strategy_keys, return_inverse=True, return_counts=True
+                )
+                sums = np.bincount(inverse, weights=monthly_trades.realized_pnl)
+                strategy_trade_counts = dict(zip(unique_keys.tolist(), counts.tolist()))
+                strategy_pnls = dict(zip(unique_keys.tolist(), sums.tolist()))
+
             strategy_performance = {}
             for strategy in strategies:
-                strategy_trades = [t for t in monthly_trades if t.strategy_id == strategy.id]
-                strategy_pnl = sum([t.pnl for t in strategy_trades if t.pnl], Decimal('0'))
-
                 strategy_performance[strategy.id] = {
                     'name': strategy.name,
-                    'trades': len(strategy_trades),
-                    'pnl': float(strategy_pnl)
+                    'trades': strategy_trade_counts.get(strategy.id, 0),
+                    'pnl': strategy_pnls.get(strategy.id, 0.0)
                 }
 
             # 최고/최저 성과 전략
@@ -564,21 +571,22 @@ class AnalyticsService:
             if not sa_ids:
                 return {'success': True, 'statistics': {}}
 
-            # ✅ 단일 쿼리로 전체 거래 조회 (날짜 필터 없음)
-            all_trades = self._bulk_load_trades(sa_ids)
+            # ✅ 단일 쿼리로 전체 거래 컬럼 조회 (날짜 필터 없음)
+            all_trades = analytics_engine.load_trade_columns(sa_ids)
+            pnl = all_trades.realized_pnl
 
-            # 기본 통계 (메모리에서 처리)
+            # 기본 통계 (배열 연산)
             total_trades = len(all_trades)
-            winning_trades = len([t for t in all_trades if t.pnl and t.pnl > 0])
-            losing_trades = len([t for t in all_trades if t.pnl and t.pnl < 0])
+            winning_trades = int(np.count_nonzero(pnl > 0))
+            losing_trades = int(np.count_nonzero(pnl < 0))
 
             # 거래량 및 수익
-            total_volume = sum([t.price * t.quantity for t in all_trades if t.price and t.quantity], Decimal('0'))
-            total_pnl = sum([t.pnl for t in all_trades if t.pnl], Decimal('0'))
+            total_volume = float(np.sum(all_trades.notional))
+            total_pnl = float(np.sum(pnl))
 
             # 최대/최소 수익
-            max_win = max([t.pnl for t in all_trades if t.pnl and t.pnl > 0], default=Decimal('0'))
-            max_loss = min([t.pnl for t in all_trades if t.pnl and t.pnl < 0], default=Decimal('0'))
+            max_win = float(np.max(pnl, initial=0.0))
+            max_loss = float(np.min(pnl, initial=0.0))
 
             statistics = {
                 'total_trades': total_trades,
@@ -644,10 +652,10 @@ class AnalyticsService:
                 len(all_strategy_account_ids)
             )
 
-            # StrategyCapital, Position, Trade 데이터 미리 로딩
+            # StrategyCapital, Position, 일별 손익 롤업 미리 로딩 (거래 단위 로딩 없음)
             strategy_capitals: Dict[int, StrategyCapital] = {}
             strategy_positions: Dict[int, List[StrategyPosition]] = defaultdict(list)
-            strategy_trades: Dict[int, List[Trade]] = defaultdict(list)
+            daily_rows_by_account: Dict[int, List[StrategyAccountDailyPnl]] = {}
 
             if all_strategy_account_ids:
                 capitals = StrategyCapital.query.filter(
@@ -662,25 +670,13 @@ class AnalyticsService:
                 for position in positions:
                     strategy_positions[position.strategy_account_id].append(position)
 
-                trades = (
-                    Trade.query
-                    .filter(
-                        and_(
-                            Trade.strategy_account_id.in_(all_strategy_account_ids),
-                            Trade.pnl.isnot(None)
-                        )
-                    )
-                    .order_by(Trade.timestamp)
-                    .all()
-                )
-                for trade in trades:
-                    strategy_trades[trade.strategy_account_id].append(trade)
+                daily_rows_by_account = pnl_rollup_service.load_daily_rows(all_strategy_account_ids)
 
             logger.info(
-                "벌크 로딩 완료 - 자본:%s 포지션:%s 거래:%s",
+                "벌크 로딩 완료 - 자본:%s 포지션:%s 일별 손익:%s",
                 len(strategy_capitals),
                 sum(len(items) for items in strategy_positions.values()),
-                sum(len(items) for items in strategy_trades.values())
+                sum(len(items) for items in daily_rows_by_account.values())
             )
 
             total_capital = Decimal('0')
@@ -699,7 +695,7 @@ class AnalyticsService:
                 strategy_realized_pnl = Decimal('0')
                 strategy_unrealized_pnl = Decimal('0')
                 strategy_positions_count = 0
-                strategy_exit_trades: List[Trade] = []
+                strategy_daily_rows: List[StrategyAccountDailyPnl] = []
                 accounts_detail: List[Dict[str, Any]] = []
 
                 for sa in strategy_accounts_list:
@@ -734,19 +730,18 @@ class AnalyticsService:
 
                     strategy_unrealized_pnl += account_unrealized_pnl
 
-                    account_trades = strategy_trades.get(sa_id, [])
-                    account_exit_trades = self._filter_exit_trades(account_trades)
+                    account_daily_rows = daily_rows_by_account.get(sa_id, [])
+                    strategy_daily_rows.extend(account_daily_rows)
 
-                    strategy_exit_trades.extend(account_exit_trades)
-
-                    account_realized_pnl = sum(
-                        (to_decimal(trade.pnl) for trade in account_trades),
-                        Decimal('0')
+                    # 마지막 일자의 누적 손익 = 전체 실현 손익
+                    account_realized_pnl = (
+                        to_decimal(account_daily_rows[-1].cumulative_pnl)
+                        if account_daily_rows else Decimal('0')
                     )
                     strategy_realized_pnl += account_realized_pnl
 
                     account_metrics_30d = self._calculate_timeframe_metrics(
-                        account_exit_trades,
+                        self._build_daily_pnl_series(account_daily_rows),
                         allocated_capital_usdt,
                         period_days=period_days
                     )
@@ -773,10 +768,11 @@ class AnalyticsService:
 
                     accounts_detail.append(account_detail)
 
-                trade_statistics = self._calculate_trade_statistics(strategy_exit_trades)
-                risk_metrics = self._calculate_risk_metrics(strategy_exit_trades, strategy_capital)
+                strategy_daily_pnl = self._build_daily_pnl_series(strategy_daily_rows)
+                trade_statistics = self._calculate_trade_statistics(strategy_daily_rows)
+                risk_metrics = self._calculate_risk_metrics(strategy_daily_pnl, strategy_capital)
                 timeframe_metrics = self._calculate_timeframe_metrics(
-                    strategy_exit_trades,
+                    strategy_daily_pnl,
                     strategy_capital,
                     period_days=period_days
                 )
@@ -905,28 +901,6 @@ class AnalyticsService:
             .all()
         )
 
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _bulk_load_trades(
-        self,
-        strategy_account_ids: List[int],
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[Trade]:
-        """Trade 벌크 로딩 (날짜 필터 옵션)"""
-        if not strategy_account_ids:
-            return []
-
-        query = Trade.query.filter(
-            Trade.strategy_account_id.in_(strategy_account_ids)
-        )
-
-        if start_date:
-            query = query.filter(Trade.timestamp >= start_date)
-        if end_date:
-            query = query.filter(Trade.timestamp <= end_date)
-
-        return query.order_by(Trade.timestamp).all()
-
     # @FEAT:analytics @COMP:service @TYPE:helper
     def _group_by_strategy_account(
         self,
@@ -943,43 +917,10 @@ class AnalyticsService:
 
         return grouped
 
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _filter_exit_trades(self, trades: List[Trade]) -> List[Trade]:
-        """청산(Exit) 거래 필터링 - 없으면 전체 거래 반환"""
-        exit_trades = [trade for trade in trades if trade.is_entry is False]
-        if exit_trades:
-            return exit_trades
-        # is_entry 정보가 없다면 실현 손익이 있는 거래 전체를 사용
-        return [trade for trade in trades if trade.pnl is not None]
-
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_trade_statistics(self, trades: List[Trade]) -> Dict[str, Any]:
-        """기본 거래 통계 계산"""
-        if not trades:
-            return {
-                'total_trades': 0,
-                'winning_trades': 0,
-                'losing_trades': 0,
-                'win_rate': 0.0,
-                'profit_factor': 0.0,
-                'avg_win_trade': 0.0,
-                'avg_loss_trade': 0.0,
-                'max_consecutive_wins': 0,
-                'max_consecutive_losses': 0
-            }
-
-        sorted_trades = sorted(
-            trades,
-            key=lambda trade: trade.timestamp or datetime.min
-        )
-
-        pnl_values = [
-            to_decimal(trade.pnl)
-            for trade in sorted_trades
-            if trade.pnl is not None
-        ]
-
-        total_trades = len(pnl_values)
+    # @FEAT:analytics @FEAT:pnl-rollup @COMP:service @TYPE:helper
+    def _calculate_trade_statistics(self, daily_rows: List[StrategyAccountDailyPnl]) -> Dict[str, Any]:
+        """기본 거래 통계 계산 (일별 롤업 합산)"""
+        total_trades = sum(row.trade_count for row in daily_rows)
         if total_trades == 0:
             return {
                 'total_trades': 0,
@@ -993,14 +934,10 @@ class AnalyticsService:
                 'max_consecutive_losses': 0
             }
 
-        winning_pnls = [pnl for pnl in pnl_values if pnl > 0]
-        losing_pnls = [pnl for pnl in pnl_values if pnl < 0]
-
-        winning_trades = len(winning_pnls)
-        losing_trades = len(losing_pnls)
-
-        sum_wins = sum(winning_pnls, Decimal('0'))
-        sum_losses = sum(losing_pnls, Decimal('0'))
+        winning_trades = sum(row.winning_trades for row in daily_rows)
+        losing_trades = sum(row.losing_trades for row in daily_rows)
+        sum_wins = sum((to_decimal(row.gross_profit) for row in daily_rows), Decimal('0'))
+        sum_losses = sum((to_decimal(row.gross_loss) for row in daily_rows), Decimal('0'))
 
         profit_factor = 0.0
         if sum_losses != 0:
@@ -1008,30 +945,14 @@ class AnalyticsService:
         elif sum_wins > 0:
             profit_factor = float(sum_wins)
 
-        avg_win_trade = float(mean(winning_pnls)) if winning_pnls else 0.0
-        avg_loss_trade = float(mean(losing_pnls)) if losing_pnls else 0.0
-
-        max_consecutive_wins = 0
-        max_consecutive_losses = 0
-        current_wins = 0
-        current_losses = 0
-
-        for trade in sorted_trades:
-            pnl_value = to_decimal(trade.pnl)
-            if pnl_value > 0:
-                current_wins += 1
-                current_losses = 0
-            elif pnl_value < 0:
-                current_losses += 1
-                current_wins = 0
-            else:
-                current_wins = 0
-                current_losses = 0
+        avg_win_trade = float(sum_wins / winning_trades) if winning_trades else 0.0
+        avg_loss_trade = float(sum_losses / losing_trades) if losing_trades else 0.0
 
-            max_consecutive_wins = max(max_consecutive_wins, current_wins)
-            max_consecutive_losses = max(max_consecutive_losses, current_losses)
+        # 연속 승/패는 계좌별 누적 최대값 (계좌 간 교차 순서는 반영하지 않음)
+        max_consecutive_wins = max((row.max_win_streak for row in daily_rows), default=0)
+        max_consecutive_losses = max((row.max_loss_streak for row in daily_rows), default=0)
 
-        win_rate = float(winning_trades / total_trades * 100) if total_trades > 0 else 0.0
+        win_rate = float(winning_trades / total_trades * 100)
 
         return {
             'total_trades': total_trades,
@@ -1046,28 +967,29 @@ class AnalyticsService:
         }
 
     # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_risk_metrics(self, trades: List[Trade], allocated_capital: Decimal) -> Dict[str, float]:
+    def _calculate_risk_metrics(self, daily_series: DailySeries, allocated_capital: Decimal) -> Dict[str, float]:
         """전략 리스크 메트릭 계산"""
-        capital_decimal = to_decimal(allocated_capital)
-        if not trades or capital_decimal <= 0:
+        capital = float(to_decimal(allocated_capital))
+        _, daily_pnl = daily_series
+        if len(daily_pnl) == 0 or capital <= 0:
             return {
                 'mdd': 0.0,
                 'sharpe_ratio': 0.0,
                 'sortino_ratio': 0.0
             }
 
-        daily_returns = self._calculate_daily_returns(trades, capital_decimal)
+        daily_returns = analytics_engine.returns_pct(daily_pnl, capital)
 
         return {
-            'mdd': self._calculate_drawdown(trades, capital_decimal),
-            'sharpe_ratio': self._calculate_sharpe_ratio(daily_returns),
-            'sortino_ratio': self._calculate_sortino_ratio(daily_returns)
+            'mdd': analytics_engine.max_drawdown_pct(daily_pnl, capital),
+            'sharpe_ratio': analytics_engine.sharpe_ratio(daily_returns),
+            'sortino_ratio': analytics_engine.sortino_ratio(daily_returns)
         }
 
     # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_timeframe_metrics(self, trades: List[Trade], allocated_capital: Decimal, period_days: int = 30) -> Dict[str, Any]:
+    def _calculate_timeframe_metrics(self, daily_series: DailySeries, allocated_capital: Decimal, period_days: int = 30) -> Dict[str, Any]:
         """기간 기반 메트릭 계산 (기본 30일)"""
-        capital_decimal = to_decimal(allocated_capital)
+        capital = float(to_decimal(allocated_capital))
         metrics = {
             'pnl_30d': 0.0,
             'roi_30d': 0.0,
@@ -1077,161 +999,47 @@ class AnalyticsService:
             'chart_data': None
         }
 
-        if not trades:
-            sparkline_data, chart_data = self._build_equity_curve([], period_days)
-            metrics['sparkline_data'] = sparkline_data
-            metrics['chart_data'] = chart_data
-            return metrics
-
-        start_time = datetime.utcnow() - timedelta(days=period_days)
-        trades_in_period = [
-            trade for trade in trades
-            if trade.timestamp and trade.timestamp >= start_time and trade.pnl is not None
-        ]
+        days, daily_pnl = daily_series
+        cutoff_day = np.datetime64((datetime.utcnow() - timedelta(days=period_days)).date(), 'D')
+        in_period = days >= cutoff_day
+        period_days_arr, period_pnl = days[in_period], daily_pnl[in_period]
 
-        sparkline_data, chart_data = self._build_equity_curve(trades_in_period, period_days)
+        sparkline_data, chart_data = self._build_equity_curve((period_days_arr, period_pnl), period_days)
         metrics['sparkline_data'] = sparkline_data
         metrics['chart_data'] = chart_data
 
-        if not trades_in_period:
+        if len(period_pnl) == 0:
             return metrics
 
-        pnl_sum = sum(
-            (to_decimal(trade.pnl) for trade in trades_in_period),
-            Decimal('0')
-        )
-        metrics['pnl_30d'] = float(pnl_sum)
-        if capital_decimal > 0:
-            metrics['roi_30d'] = float((pnl_sum / capital_decimal) * 100)
-        metrics['mdd_30d'] = self._calculate_drawdown(trades_in_period, capital_decimal)
-        daily_returns = self._calculate_daily_returns(
-            trades_in_period,
-            capital_decimal,
-            period_days=period_days
+        pnl_sum = float(np.sum(period_pnl))
+        metrics['pnl_30d'] = pnl_sum
+        if capital > 0:
+            metrics['roi_30d'] = (pnl_sum / capital) * 100
+        metrics['mdd_30d'] = analytics_engine.max_drawdown_pct(period_pnl, capital)
+        metrics['sharpe_ratio_30d'] = analytics_engine.sharpe_ratio(
+            analytics_engine.returns_pct(period_pnl, capital)
         )
-        metrics['sharpe_ratio_30d'] = self._calculate_sharpe_ratio(daily_returns)
         return metrics
 
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_daily_returns(
-        self,
-        trades: List[Trade],
-        allocated_capital: Decimal,
-        period_days: Optional[int] = None
-    ) -> List[float]:
-        """일별 수익률(%) 리스트 계산"""
-        capital_decimal = to_decimal(allocated_capital)
-        if capital_decimal <= 0:
-            return []
-
-        daily_pnl_map = self._build_daily_pnl_map(trades, period_days)
-        returns: List[float] = []
-
-        for _, pnl in sorted(daily_pnl_map.items(), key=lambda item: item[0]):
-            returns.append(float((pnl / capital_decimal) * 100))
-
-        return returns
-
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _build_daily_pnl_map(
-        self,
-        trades: List[Trade],
-        period_days: Optional[int] = None
-    ) -> Dict[datetime.date, Decimal]:
-        """일자별 실현 손익 합계 생성"""
-        daily_pnl: Dict[datetime.date, Decimal] = defaultdict(lambda: Decimal('0'))
-        cutoff_date = None
-        if period_days is not None:
-            cutoff_date = (datetime.utcnow() - timedelta(days=period_days)).date()
-
-        for trade in trades:
-            if not trade.timestamp or trade.pnl is None:
-                continue
-            trade_date = trade.timestamp.date()
-            if cutoff_date and trade_date < cutoff_date:
-                continue
-            daily_pnl[trade_date] += to_decimal(trade.pnl)
-
-        return daily_pnl
-
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_drawdown(self, trades: List[Trade], allocated_capital: Decimal) -> float:
-        """최대 낙폭 계산"""
-        capital_decimal = to_decimal(allocated_capital)
-        if not trades or capital_decimal <= 0:
-            return 0.0
-
-        cumulative = Decimal('0')
-        peak = Decimal('0')
-        max_drawdown = Decimal('0')
-
-        for trade in sorted(trades, key=lambda t: t.timestamp or datetime.min):
-            pnl_value = to_decimal(trade.pnl)
-            cumulative += pnl_value
-            if cumulative > peak:
-                peak = cumulative
-            drawdown = peak - cumulative
-            if drawdown > max_drawdown:
-                max_drawdown = drawdown
-
-        if capital_decimal == 0:
-            return 0.0
-
-        return float((max_drawdown / capital_decimal) * 100) if max_drawdown > 0 else 0.0
-
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_sharpe_ratio(self, daily_returns: List[float]) -> float:
-        """샤프 비율 계산 (252거래일 기준)"""
-        if len(daily_returns) < 2:
-            return 0.0
-        try:
-            volatility = pstdev(daily_returns)
-        except StatisticsError:
-            return 0.0
-        if volatility == 0:
-            return 0.0
-        return (mean(daily_returns) / volatility) * sqrt(252)
-
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_sortino_ratio(self, daily_returns: List[float]) -> float:
-        """소르티노 비율 계산"""
-        if not daily_returns:
-            return 0.0
-        negative_returns = [ret for ret in daily_returns if ret < 0]
-        if not negative_returns:
-            return 0.0
-        downside_deviation = sqrt(
-            sum(ret ** 2 for ret in negative_returns) / len(negative_returns)
-        )
-        if downside_deviation == 0:
-            return 0.0
-        return (mean(daily_returns) / downside_deviation) * sqrt(252)
+    # @FEAT:analytics @FEAT:pnl-rollup @COMP:service @TYPE:helper
+    def _build_daily_pnl_series(self, daily_rows: List[StrategyAccountDailyPnl]) -> DailySeries:
+        """일자별 실현 손익 배열 (여러 계좌의 롤업 행 합산, 일자 오름차순)"""
+        days = np.array([row.date for row in daily_rows], dtype='datetime64[D]')
+        pnl = np.array([row.realized_pnl for row in daily_rows], dtype=np.float64)
+        return analytics_engine.daily_sums(days, pnl)
 
     # @FEAT:analytics @COMP:service @TYPE:helper
     def _build_equity_curve(
         self,
-        trades: List[Trade],
+        daily_series: DailySeries,
         period_days: int
     ) -> Tuple[List[float], Dict[str, Any]]:
         """기간 동안의 누적 손익 곡선 생성"""
-        end_date = datetime.utcnow().date()
-        start_date = end_date - timedelta(days=period_days)
-
-        daily_pnl_map = self._build_daily_pnl_map(trades, period_days)
-
-        dates: List[str] = []
-        pnl_values: List[float] = []
-        cumulative = Decimal('0')
-
-        current_date = start_date
-        while current_date <= end_date:
-            dates.append(current_date.isoformat())
-            daily_pnl = daily_pnl_map.get(current_date, Decimal('0'))
-            cumulative += daily_pnl
-            pnl_values.append(float(cumulative))
-            current_date += timedelta(days=1)
+        days, daily_pnl = daily_series
+        dates, cumulative = analytics_engine.equity_curve(days, daily_pnl, period_days)
+        pnl_values = cumulative.tolist()
 
-        has_data = any(abs(value) > 1e-9 for value in pnl_values)
+        has_data = bool(np.any(np.abs(cumulative) > 1e-9))
 
         if pnl_values:
             total_change = pnl_values[-1] - pnl_values[0]
@@ -0,0 +1,279 @@
+# @FEAT:analytics @COMP:service @TYPE:core
+"""
+컬럼 기반(NumPy) 분석 엔진
+
+Trade ORM 객체 리스트를 Decimal로 순회하던 메트릭 계산을 배열 연산으로 대체합니다.
+- 조회: (strategy_account_id, timestamp, pnl, fee, 체결금액)을 단일 쿼리로 배열화 (ORM 객체 생성 없음)
+- 계산: 일별 버킷팅, 누적 합, 누적 최고점 기반 MDD, Sharpe/Sortino, 롤링 변동성, 전략별 분해
+
+모든 함수는 기존 AnalyticsService/PerformanceTrackingService 공식과 부동소수점 오차 범위 내에서 동일한 값을 반환합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from math import sqrt
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app import db
+from app.models import Trade
+
+TRADING_DAYS_PER_YEAR = 252
+
+
+# @FEAT:analytics @COMP:model @TYPE:core
+@dataclass(frozen=True)
+class TradeColumns:
+    """거래 컬럼 배열 (pnl/fee가 NULL이면 NaN)"""
+    strategy_account_id: np.ndarray  # int64
+    timestamp: np.ndarray  # datetime64[us]
+    pnl: np.ndarray  # float64
+    fee: np.ndarray  # float64
+    notional: np.ndarray  # float64 (price * quantity)
+
+    def __len__(self) -> int:
+        return len(self.pnl)
+
+    @property
+    def day(self) -> np.ndarray:
+        """체결일 (datetime64[D], UTC)"""
+        return self.timestamp.astype('datetime64[D]')
+
+    @property
+    def realized_pnl(self) -> np.ndarray:
+        """NULL 손익을 0으로 채운 손익 배열"""
+        return np.nan_to_num(self.pnl, nan=0.0)
+
+    def select(self, mask: np.ndarray) -> 'TradeColumns':
+        return TradeColumns(
+            strategy_account_id=self.strategy_account_id[mask],
+            timestamp=self.timestamp[mask],
+            pnl=self.pnl[mask],
+            fee=self.fee[mask],
+            notional=self.notional[mask],
+        )
+
+
+def _empty_columns() -> TradeColumns:
+    return TradeColumns(
+        strategy_account_id=np.empty(0, dtype=np.int64),
+        timestamp=np.empty(0, dtype='datetime64[us]'),
+        pnl=np.empty(0, dtype=np.float64),
+        fee=np.empty(0, dtype=np.float64),
+        notional=np.empty(0, dtype=np.float64),
+    )
+
+
+# @FEAT:analytics @COMP:service @TYPE:core
+def load_trade_columns(
+    strategy_account_ids: Iterable[int],
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    pnl_only: bool = False,
+) -> TradeColumns:
+    """전략 계좌들의 거래를 단일 쿼리로 조회해 컬럼 배열로 반환 (체결 시각 오름차순)"""
+    strategy_account_ids = list(strategy_account_ids)
+    if not strategy_account_ids:
+        return _empty_columns()
+
+    query = db.session.query(
+        Trade.strategy_account_id,
+        Trade.timestamp,
+        Trade.pnl,
+        Trade.fee,
+        Trade.price * Trade.quantity,
+    ).filter(Trade.strategy_account_id.in_(strategy_account_ids))
+
+    if start_time:
+        query = query.filter(Trade.timestamp >= start_time)
+    if end_time:
+        query = query.filter(Trade.timestamp <= end_time)
+    if pnl_only:
+        query = query.filter(Trade.pnl.isnot(None))
+
+    rows = query.order_by(Trade.timestamp, Trade.id).all()
+    if not rows:
+        return _empty_columns()
+
+    sa_ids, timestamps, pnls, fees, notionals = zip(*rows)
+    return TradeColumns(
+        strategy_account_id=np.fromiter(sa_ids, dtype=np.int64, count=len(rows)),
+        timestamp=np.array(timestamps, dtype='datetime64[us]'),
+        pnl=np.array(pnls, dtype=np.float64),
+        fee=np.array(fees, dtype=np.float64),
+        notional=np.nan_to_num(np.array(notionals, dtype=np.float64), nan=0.0),
+    )
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def daily_sums(days: np.ndarray, values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """일자별 합계 (고유 일자 오름차순, 합계)"""
+    if len(days) == 0:
+        return np.empty(0, dtype='datetime64[D]'), np.empty(0, dtype=np.float64)
+    unique_days, inverse = np.unique(days, return_inverse=True)
+    sums = np.bincount(inverse, weights=values, minlength=len(unique_days))
+    return unique_days, sums
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def grouped_daily_sums(
+    keys: np.ndarray,
+    days: np.ndarray,
+    values: np.ndarray,
+) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """키(전략 등)별 일자 합계 {key: (일자, 합계)}"""
+    if len(keys) == 0:
+        return {}
+    day_numbers = days.astype('datetime64[D]').astype(np.int64)
+    pairs, inverse = np.unique(np.stack([keys, day_numbers]), axis=1, return_inverse=True)
+    sums = np.bincount(inverse.ravel(), weights=values, minlength=pairs.shape[1])
+
+    grouped: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    unique_keys, starts = np.unique(pairs[0], return_index=True)
+    bounds = list(starts[1:]) + [pairs.shape[1]]
+    for key, start, end in zip(unique_keys, starts, bounds):
+        grouped[int(key)] = (pairs[1, start:end].astype('datetime64[D]'), sums[start:end])
+    return grouped
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def max_drawdown_pct(pnl_sequence: np.ndarray, capital: float) -> float:
+    """최대 낙폭(%) - 0에서 시작하는 누적 손익의 누적 최고점 대비 최대 하락폭 / 자본"""
+    if len(pnl_sequence) == 0 or capital <= 0:
+        return 0.0
+    cumulative = np.cumsum(pnl_sequence)
+    peak = np.maximum.accumulate(np.maximum(cumulative, 0.0))
+    max_drawdown = float(np.max(peak - cumulative))
+    return (max_drawdown / capital) * 100 if max_drawdown > 0 else 0.0
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def returns_pct(pnl: np.ndarray, capital: float) -> np.ndarray:
+    """자본 대비 수익률(%) 배열"""
+    if capital <= 0:
+        return np.empty(0, dtype=np.float64)
+    return (np.asarray(pnl, dtype=np.float64) / capital) * 100
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def sharpe_ratio(daily_returns: np.ndarray) -> float:
+    """샤프 비율 (모표준편차, 252거래일 연율화)"""
+    daily_returns = np.asarray(daily_returns, dtype=np.float64)
+    if len(daily_returns) < 2:
+        return 0.0
+    volatility = float(np.std(daily_returns))
+    if volatility == 0:
+        return 0.0
+    return (float(np.mean(daily_returns)) / volatility) * sqrt(TRADING_DAYS_PER_YEAR)
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def sortino_ratio(daily_returns: np.ndarray) -> float:
+    """소르티노 비율 (음수 수익률 RMS 하방 편차, 252거래일 연율화)"""
+    daily_returns = np.asarray(daily_returns, dtype=np.float64)
+    if len(daily_returns) == 0:
+        return 0.0
+    negative_returns = daily_returns[daily_returns < 0]
+    if len(negative_returns) == 0:
+        return 0.0
+    downside_deviation = sqrt(float(np.mean(negative_returns ** 2)))
+    if downside_deviation == 0:
+        return 0.0
+    return (float(np.mean(daily_returns)) / downside_deviation) * sqrt(TRADING_DAYS_PER_YEAR)
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def sample_risk_metrics(daily_returns: np.ndarray) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """표본 리스크 메트릭 (sharpe, sortino, volatility) - 연율화 없음, 계산 불가 시 None"""
+    daily_returns = np.asarray(daily_returns, dtype=np.float64)
+    if len(daily_returns) < 2:
+        return None, None, None
+
+    volatility = float(np.std(daily_returns, ddof=1))
+    avg_return = float(np.mean(daily_returns))
+    sharpe = (avg_return / volatility) if volatility > 0 else None
+
+    negative_returns = daily_returns[daily_returns < 0]
+    sortino = None
+    if len(negative_returns) > 1:
+        downside_deviation = float(np.std(negative_returns, ddof=1))
+        sortino = (avg_return / downside_deviation) if downside_deviation > 0 else None
+
+    return sharpe, sortino, volatility
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def rolling_risk_metrics(
+    days: np.ndarray,
+    daily_returns: np.ndarray,
+    window_days: int = 30,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    일자별 롤링 리스크 메트릭 (sharpe, sortino, volatility 배열, 계산 불가 시 NaN)
+
+    각 일자 d에 대해 [d - window_days, d] 구간의 수익률로 sample_risk_metrics()와 같은 값을 계산합니다.
+    """
+    days = np.asarray(days, dtype='datetime64[D]')
+    values = np.asarray(daily_returns, dtype=np.float64)
+    count = len(values)
+    nan = np.full(count, np.nan)
+    if count == 0:
+        return nan, nan.copy(), nan.copy()
+
+    starts = np.searchsorted(days, days - np.timedelta64(window_days, 'D'), side='left')
+    ends = np.arange(1, count + 1)
+
+    def window_sum(series: np.ndarray) -> np.ndarray:
+        prefix = np.concatenate(([0.0], np.cumsum(series)))
+        return prefix[ends] - prefix[starts]
+
+    negative = np.where(values < 0, values, 0.0)
+    n = window_sum(np.ones(count))
+    total = window_sum(values)
+    total_sq = window_sum(values ** 2)
+    neg_n = window_sum((values < 0).astype(np.float64))
+    neg_total = window_sum(negative)
+    neg_total_sq = window_sum(negative ** 2)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = total / n
+        variance = np.maximum((total_sq - n * mean ** 2) / (n - 1), 0.0)
+        volatility = np.where(n >= 2, np.sqrt(variance), np.nan)
+
+        neg_mean = neg_total / neg_n
+        neg_variance = np.maximum((neg_total_sq - neg_n * neg_mean ** 2) / (neg_n - 1), 0.0)
+        downside = np.where(neg_n >= 2, np.sqrt(neg_variance), np.nan)
+
+        sharpe = np.where(volatility > 0, mean / volatility, np.nan)
+        sortino = np.where((n >= 2) & (downside > 0), mean / downside, np.nan)
+
+    return sharpe, sortino, volatility
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def equity_curve(
+    days: np.ndarray,
+    daily_pnl: np.ndarray,
+    period_days: int,
+    end_date: Optional[date] = None,
+) -> Tuple[List[str], np.ndarray]:
+    """[end_date - period_days, end_date] 구간의 일별 누적 손익 곡선 (ISO 일자, 누적값)"""
+    end_day = np.datetime64(end_date or datetime.utcnow().date(), 'D')
+    start_day = end_day - np.timedelta64(period_days, 'D')
+    calendar = np.arange(start_day, end_day + np.timedelta64(1, 'D'))
+
+    values = np.zeros(len(calendar), dtype=np.float64)
+    days = np.asarray(days, dtype='datetime64[D]')
+    in_range = (days >= start_day) & (days <= end_day)
+    if np.any(in_range):
+        offsets = (days[in_range] - start_day).astype(np.int64)
+        np.add.at(values, offsets, np.asarray(daily_pnl, dtype=np.float64)[in_range])
+
+    return [str(day) for day in calendar], np.cumsum(values)
+
+
+# @FEAT:analytics @COMP:service @TYPE:helper
+def to_dates(days: np.ndarray) -> List[date]:
+    """datetime64[D] 배열 → date 리스트"""
+    return [date(1970, 1, 1) + timedelta(days=int(day)) for day in days.astype(np.int64)]
@@ -0,0 +1,342 @@
+# @FEAT:account-management @COMP:service @TYPE:core @DEPS:exchange-integration
+"""
+계좌 잔고 동기화 (sync_account_balances 백그라운드 작업)
+
+활성 계좌의 잔고를 거래소 REST API로 조회하여 DailyAccountSummary에 기록합니다.
+
+- 병렬 조회: BALANCE_SYNC_MAX_WORKERS 스레드 풀, 거래소별 동시 조회 수는
+  BALANCE_SYNC_EXCHANGE_CONCURRENCY로 제한 (요청 가중치는 exchange_service.rate_limiter가 관리)
+- 증분 조회: 사용자 데이터 스트림(Binance ACCOUNT_UPDATE, Bybit wallet)이 연결된 마켓은
+  마지막 조회 이후 잔고 변경 이벤트가 있었을 때만 다시 조회하고, 그 외에는 직전 조회값을 사용
+  (BALANCE_SYNC_FULL_REFRESH_SEC마다, 그리고 날짜가 바뀌면 무조건 재조회)
+- 일괄 저장: DailyAccountSummary는 INSERT ... ON CONFLICT (account_id, date) DO UPDATE 1회로 저장
+
+실행 시간/조회 수/잔고 데이터 경과 시간은 get_stats()로 확인합니다 (/api/system/balance-sync-stats).
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from flask import current_app
+from sqlalchemy import case, update
+
+from app import db
+from app.constants import (
+    BALANCE_STREAM_MARKETS, BALANCE_SYNC_DEFAULT_CONCURRENCY, BALANCE_SYNC_EXCHANGE_CONCURRENCY, MarketType
+)
+from app.models import Account, DailyAccountSummary
+from app.utils.db_pool import current_db_pool_role, db_pool_role
+
+logger = logging.getLogger(__name__)
+
+# 동시 잔고 조회 스레드 수 (전체)
+BALANCE_SYNC_MAX_WORKERS = int(os.getenv('BALANCE_SYNC_MAX_WORKERS', '16'))
+# 스트림 이벤트가 없어도 이 시간이 지나면 REST로 재조회 (이벤트 누락 대비)
+BALANCE_SYNC_FULL_REFRESH_SEC = float(os.getenv('BALANCE_SYNC_FULL_REFRESH_SEC', '600'))
+# 스케줄 주기 (실행 시간이 이보다 길면 다음 실행이 max_instances=1에 의해 누락됨)
+BALANCE_SYNC_INTERVAL_SEC = 59
+
+MARKET_TYPES = (MarketType.SPOT_LOWER, MarketType.FUTURES_LOWER)
+
+
+@dataclass
+class _MarketBalance:
+    total: Decimal
+    has_data: bool
+    polled_at: float
+    polled_date: date
+
+
+@dataclass
+class _SyncPlan:
+    """계좌별 조회 계획 (워커 스레드에는 ORM 인스턴스 대신 식별값만 전달)"""
+    account_id: int
+    account_name: str
+    exchange: str
+    markets: List[str]
+
+
+@dataclass
+class _SyncResult:
+    account_id: int
+    account_name: str
+    markets: Dict[str, _MarketBalance] = field(default_factory=dict)
+    polled: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+
+# @FEAT:account-management @COMP:service @TYPE:core
+class BalanceSyncService:
+    """계좌 잔고 병렬/증분 동기화 (백그라운드 서비스 소유 프로세스의 스케줄러에서 실행)"""
+
+    def __init__(self, max_workers: int = BALANCE_SYNC_MAX_WORKERS,
+                 full_refresh_seconds: float = BALANCE_SYNC_FULL_REFRESH_SEC):
+        self.max_workers = max(1, max_workers)
+        self.full_refresh_seconds = full_refresh_seconds
+        self._lock = threading.Lock()
+        # {account_id: {market_type: _MarketBalance}} - 직전 REST 조회 결과
+        self._balances: Dict[int, Dict[str, _MarketBalance]] = {}
+        # {account_id: 마지막 잔고 변경 스트림 이벤트 시각}
+        self._stream_events: Dict[int, float] = {}
+        self._exchange_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._last_run: Optional[Dict[str, Any]] = None
+
+    # @FEAT:account-management @COMP:service @TYPE:helper
+    def mark_stream_event(self, account_id: int) -> None:
+        """사용자 스트림 잔고 변경 이벤트 수신 (다음 동기화에서 해당 계좌의 스트림 마켓 재조회)"""
+        with self._lock:
+            self._stream_events[account_id] = time.time()
+
+    def _slot(self, exchange: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._exchange_slots.get(exchange)
+            if slot is None:
+                limit = BALANCE_SYNC_EXCHANGE_CONCURRENCY.get(exchange, BALANCE_SYNC_DEFAULT_CONCURRENCY)
+                slot = threading.BoundedSemaphore(limit)
+                self._exchange_slots[exchange] = slot
+            return slot
+
+    @staticmethod
+    def _stream_connected(account_id: int) -> bool:
+        from app.services.trading import trading_service
+
+        manager = trading_service.websocket_manager
+        if not manager:
+            return False
+        connection = manager.get_connection(account_id)
+        return bool(connection and connection.is_connected)
+
+    def plan_markets(self, account: Account, now: float, today: date,
+                     stream_connected: bool) -> List[str]:
+        """이번 실행에서 REST로 조회할 마켓 목록 (빈 목록이면 계좌 전체 건너뜀)"""
+        stream_markets = BALANCE_STREAM_MARKETS.get((account.exchange or '').lower(), ()) if stream_connected else ()
+        with self._lock:
+            cached = self._balances.get(account.id, {})
+            event_at = self._stream_events.get(account.id, 0.0)
+
+        markets = []
+        for market_type in MARKET_TYPES:
+            balance = cached.get(market_type)
+            if (market_type not in stream_markets
+                    or balance is None
+                    or balance.polled_date != today
+                    or event_at >= balance.polled_at
+                    or now - balance.polled_at >= self.full_refresh_seconds):
+                markets.append(market_type)
+        return markets
+
+    def _fetch(self, plan: _SyncPlan, today: date) -> _SyncResult:
+        """계좌의 지정 마켓 잔고 조회 (워커 스레드, 거래소별 동시 조회 상한 적용)
+
+        계좌는 워커 스레드의 세션에서 id로 다시 로드합니다 (스케줄러 세션의 인스턴스를 공유하지 않음).
+        """
+        from app.services.exchange import exchange_service
+        from app.services.security import security_service
+
+        result = _SyncResult(account_id=plan.account_id, account_name=plan.account_name, polled=plan.markets)
+        account = db.session.get(Account, plan.account_id)
+        if account is None:
+            result.errors.append(f"계좌를 찾을 수 없음: account_id={plan.account_id}")
+            return result
+
+        with self._slot(plan.exchange):
+            for market_type in plan.markets:
+                # 조회 시작 시각 기준 - 조회 중 도착한 스트림 이벤트는 다음 실행에서 재조회
+                started_at = time.time()
+                try:
+                    balance_result = exchange_service.fetch_balance(account, market_type)
+                except Exception as e:
+                    result.errors.append(f"{market_type}: {e}")
+                    continue
+                if not balance_result.get('success'):
+                    result.errors.append(f"{market_type}: {balance_result.get('error', '알 수 없는 오류')}")
+                    continue
+
+                processed, total = security_service._convert_balance_map(balance_result.get('balance'))
+                result.markets[market_type] = _MarketBalance(
+                    total=total, has_data=bool(processed), polled_at=started_at, polled_date=today
+                )
+        return result
+
+    def sync(self, accounts: Iterable[Account]) -> Dict[str, Any]:
+        """활성 계좌 잔고 동기화 1회 실행 (앱 컨텍스트 필요)"""
+        started = time.time()
+        today = date.today()
+        accounts = list(accounts)
+
+        plans: List[_SyncPlan] = []
+        skipped = 0
+        for account in accounts:
+            markets = self.plan_markets(account, started, today, self._stream_connected(account.id))
+            if markets:
+                plans.append(_SyncPlan(
+                    account_id=account.id,
+                    account_name=account.name,
+                    exchange=(account.exchange or '').lower(),
+                    markets=markets,
+                ))
+            else:
+                skipped += 1
+
+        results: List[_SyncResult] = []
+        if plans:
+            app = current_app._get_current_object()
+            pool_role = current_db_pool_role()
+
+            def run_in_context(plan):
+                # 호출 스레드(스케줄러 작업)의 DB 풀 역할 유지
+                with app.app_context(), db_pool_role(pool_role):
+                    return self._fetch(plan, today)
+
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(plans)),
+                                    thread_name_prefix='balance-sync') as executor:
+                futures = {executor.submit(run_in_context, plan): plan for plan in plans}
+                for future in as_completed(futures):
+                    plan = futures[future]
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append(_SyncResult(account_id=plan.account_id, account_name=plan.account_name,
+                                                   errors=[str(e)]))
+
+        rows, synced_ids, failed = self._merge_results(results)
+        if rows:
+            self.upsert_daily_summaries(rows, today)
+            db.session.execute(
+                update(Account).where(Account.id.in_(synced_ids)).values(updated_at=datetime.utcnow())
+            )
+            db.session.commit()
+
+        self._prune({account.id for account in accounts})
+        stats = self._build_run_stats(started, accounts, plans, skipped, len(synced_ids), failed)
+        with self._lock:
+            self._last_run = stats
+        return stats
+
+    def _merge_results(self, results: List[_SyncResult]) -> Tuple[List[Dict[str, Any]], List[int], List[Dict[str, Any]]]:
+        """조회 결과를 캐시와 병합하여 저장할 행 목록 생성 (조회 실패 마켓은 직전 값 유지)"""
+        rows, synced_ids, failed = [], [], []
+        with self._lock:
+            for result in results:
+                account_id = result.account_id
+                balances = self._balances.setdefault(account_id, {})
+                balances.update(result.markets)
+
+                if result.errors:
+                    logger.error(f'계좌 {account_id} ({result.account_name}) 잔고 조회 실패: {"; ".join(result.errors)}')
+                if not result.markets or not any(balance.has_data for balance in balances.values()):
+                    failed.append({'account_id': account_id, 'errors': result.errors or ['잔고 데이터 없음']})
+                    continue
+
+                spot = balances.get(MarketType.SPOT_LOWER)
+                futures = balances.get(MarketType.FUTURES_LOWER)
+                spot_total = spot.total if spot and spot.has_data else Decimal('0')
+                futures_total = futures.total if futures and futures.has_data else Decimal('0')
+                rows.append({
+                    'account_id': account_id,
+                    'total': spot_total + futures_total,
+                    'spot': spot_total,
+                    'futures': futures_total,
+                })
+                synced_ids.append(account_id)
+        return rows, synced_ids, failed
+
+    # @FEAT:account-management @COMP:service @TYPE:core
+    def upsert_daily_summaries(self, rows: List[Dict[str, Any]], today: Optional[date] = None) -> None:
+        """
+        DailyAccountSummary 일괄 저장 (단일 INSERT ... ON CONFLICT DO UPDATE)
+
+        SecurityService._record_balance_snapshot()과 동일한 규칙:
+        신규 행은 starting/ending_balance를 현재 총액으로, 기존 행은 ending/spot/futures만 갱신하고
+        starting_balance는 0일 때만 채웁니다. 커밋은 호출자가 수행합니다.
+        """
+        if not rows:
+            return
+        today = today or date.today()
+        values = [{
+            'account_id': row['account_id'],
+            'date': today,
+            'starting_balance': float(row['total']),
+            'ending_balance': float(row['total']),
+            'spot_balance': float(row['spot']),
+            'futures_balance': float(row['futures']),
+        } for row in rows]
+
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            from app.services.security import security_service
+            for row in rows:
+                account = db.session.get(Account, row['account_id'])
+                security_service._record_balance_snapshot(account, row['total'], row['spot'], row['futures'])
+            return
+
+        stmt = insert(DailyAccountSummary).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DailyAccountSummary.account_id, DailyAccountSummary.date],
+            set_={
+                'starting_balance': case(
+                    (DailyAccountSummary.starting_balance == 0, stmt.excluded.starting_balance),
+                    else_=DailyAccountSummary.starting_balance
+                ),
+                'ending_balance': stmt.excluded.ending_balance,
+                'spot_balance': stmt.excluded.spot_balance,
+                'futures_balance': stmt.excluded.futures_balance,
+            }
+        )
+        db.session.execute(stmt)
+
+    def _prune(self, active_ids: set) -> None:
+        with self._lock:
+            for account_id in list(self._balances):
+                if account_id not in active_ids:
+                    self._balances.pop(account_id, None)
+                    self._stream_events.pop(account_id, None)
+
+    def _build_run_stats(self, started: float, accounts: List[Account], plans: List[_SyncPlan], skipped: int,
+                         synced: int, failed: List[Dict[str, Any]]) -> Dict[str, Any]:
+        finished = time.time()
+        with self._lock:
+            # 계좌별 잔고 데이터 경과 시간 = 가장 오래된 마켓의 마지막 REST 조회 이후 시간
+            ages = [
+                finished - min(balance.polled_at for balance in self._balances[account.id].values())
+                for account in accounts if self._balances.get(account.id)
+            ]
+        duration = finished - started
+        return {
+            'started_at': datetime.utcfromtimestamp(started).isoformat() + 'Z',
+            'duration_ms': round(duration * 1000, 1),
+            'overran_interval': duration > BALANCE_SYNC_INTERVAL_SEC,
+            'accounts': len(accounts),
+            'polled_accounts': len(plans),
+            'skipped_accounts': skipped,
+            'polled_markets': sum(len(plan.markets) for plan in plans),
+            'synced_accounts': synced,
+            'failed_accounts': failed,
+            'max_staleness_seconds': round(max(ages), 1) if ages else None,
+            'avg_staleness_seconds': round(sum(ages) / len(ages), 1) if ages else None,
+            'stale_accounts': sum(1 for age in ages if age >= self.full_refresh_seconds),
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'full_refresh_seconds': self.full_refresh_seconds,
+                'tracked_accounts': len(self._balances),
+                'last_run': self._last_run,
+            }
+
+
+# 전역 인스턴스
+balance_sync_service = BalanceSyncService()
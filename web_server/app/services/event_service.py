@@ -2,18 +2,25 @@
 """
 실시간 포지션/주문 업데이트 이벤트 서비스
 Server-Sent Events (SSE)를 사용하여 효율적인 실시간 알림 제공
+
+발송 스레드(거래/웹훅/체결)는 (사용자, 전략)별 링 버퍼에 추가만 하고 즉시 반환하며,
+SSE 제너레이터가 각자 마지막 시퀀스 이후 이벤트를 읽습니다. 이벤트에는 id가 붙어
+재연결 시 Last-Event-ID 이후 이벤트를 버퍼에 남아 있는 범위에서 재전송합니다.
 """
 
 import json
 import logging
 import threading
 import time
-from typing import Dict, Any, List, Optional
+from itertools import islice
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from collections import defaultdict, deque
 from flask import Response
 from dataclasses import dataclass, asdict
 
+from app.constants import SSE_EVENT_BUFFER_SIZE, SSE_REPLAY_RETENTION_SEC
+
 logger = logging.getLogger(__name__)
 
 # @FEAT:event-sse @COMP:model @TYPE:core
@@ -66,51 +73,121 @@ class OrderBatchEvent:
     user_id: int
     timestamp: str
 
+# @FEAT:event-sse @COMP:service @TYPE:core
+class _EventChannel:
+    """
+    (user_id, strategy_id)별 시퀀스 번호 이벤트 링 버퍼
+
+    발송은 append + notify만 수행하고(클라이언트 수와 무관한 O(1)), 각 SSE 제너레이터가
+    자신의 마지막 시퀀스 이후 이벤트를 자기 속도로 읽습니다. 느린 클라이언트가 버퍼 용량 이상
+    뒤처지면 밀려난 이벤트는 해당 클라이언트에서만 누락(dropped)으로 집계됩니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.events = deque(maxlen=capacity)  # (seq, event_data)
+        self.last_seq = 0
+        self.clients = 0
+        self.closed = False
+        self.last_activity = time.time()
+        self.condition = threading.Condition(threading.Lock())
+
+    def append(self, event_data: Dict[str, Any]) -> int:
+        with self.condition:
+            self.last_seq += 1
+            self.events.append((self.last_seq, event_data))
+            self.last_activity = time.time()
+            self.condition.notify_all()
+            return self.last_seq
+
+    def close(self, event_data: Dict[str, Any]) -> None:
+        """마지막 이벤트(force_disconnect) 추가 후 종료 - 제너레이터는 전달 후 스트림 종료"""
+        with self.condition:
+            self.last_seq += 1
+            self.events.append((self.last_seq, event_data))
+            self.closed = True
+            self.condition.notify_all()
+
+    def read_after(self, cursor: int, timeout: float) -> Tuple[List[Tuple[int, Dict[str, Any]]], int]:
+        """
+        cursor 이후 이벤트 조회 (없으면 timeout까지 대기)
+
+        Returns:
+            (이벤트 목록, 버퍼에서 밀려나 전달하지 못한 이벤트 수)
+        """
+        with self.condition:
+            if self.last_seq <= cursor and not self.closed:
+                self.condition.wait(timeout)
+            if self.last_seq <= cursor or not self.events:
+                return [], 0
+            first_seq = self.events[0][0]
+            dropped = max(0, first_seq - cursor - 1)
+            start = max(0, cursor + 1 - first_seq)
+            return list(islice(self.events, start, None)), dropped
+
+
 # @FEAT:event-sse @COMP:service @TYPE:core
 class EventService:
     """실시간 이벤트 서비스 클래스"""
 
-    def __init__(self):
-        # (user_id, strategy_id) 튜플을 키로 사용 - defaultdict로 안전성 확보
-        self.clients = defaultdict(set)  # Dict[(user_id, strategy_id), set] - 자동 set 생성
-        self.event_queues = defaultdict(lambda: deque(maxlen=100))  # 자동 deque 생성
-        self.lock = threading.RLock()
+    def __init__(self, buffer_size: int = SSE_EVENT_BUFFER_SIZE):
+        # (user_id, strategy_id) → _EventChannel
+        self.channels: Dict[Tuple[int, int], _EventChannel] = {}
+        self.buffer_size = buffer_size
+        # 채널 생성/삭제 전용 (이벤트 발송 경로에서는 채널이 없을 때만 사용)
+        self._channels_lock = threading.Lock()
+        # 재시작 후 이전 프로세스의 Last-Event-ID로 잘못 이어받지 않도록 ID에 포함
+        self._epoch = format(int(time.time() * 1000), 'x')
         self._cleanup_interval = 60  # 60초마다 정리
         self._last_cleanup = time.time()
+        self._stats = defaultdict(int)
 
         logger.info("이벤트 서비스 초기화 완료 (전략별 격리 모드)")
 
+    def _get_channel(self, key: Tuple[int, int], create: bool = True) -> Optional[_EventChannel]:
+        channel = self.channels.get(key)
+        if channel is None and create:
+            with self._channels_lock:
+                channel = self.channels.get(key)
+                if channel is None:
+                    channel = _EventChannel(self.buffer_size)
+                    self.channels[key] = channel
+        return channel
+
     # @FEAT:event-sse @COMP:service @TYPE:helper
-    def add_client(self, user_id: int, strategy_id: int, client_generator):
+    def add_client(self, user_id: int, strategy_id: int) -> _EventChannel:
         """클라이언트 연결 추가 (전략별)
 
         Args:
             user_id: 사용자 ID
             strategy_id: 전략 ID (필수)
-            client_generator: Queue 객체
+
+        Returns:
+            구독할 이벤트 채널
         """
-        with self.lock:
-            key = (user_id, strategy_id)
-            # defaultdict이므로 자동으로 set 생성됨
-            self.clients[key].add(client_generator)
-            logger.info(f"클라이언트 연결 추가 - 사용자: {user_id}, 전략: {strategy_id}, 총: {len(self.clients[key])}개")
+        key = (user_id, strategy_id)
+        with self._channels_lock:
+            channel = self.channels.get(key)
+            if channel is None or channel.closed:
+                channel = _EventChannel(self.buffer_size)
+                self.channels[key] = channel
+            channel.clients += 1
+            channel.last_activity = time.time()
+        logger.info(f"클라이언트 연결 추가 - 사용자: {user_id}, 전략: {strategy_id}, 총: {channel.clients}개")
+        return channel
 
     # @FEAT:event-sse @COMP:service @TYPE:helper
-    def remove_client(self, user_id: int, strategy_id: int, client_generator):
-        """클라이언트 연결 제거 (전략별)
+    def remove_client(self, user_id: int, strategy_id: int, channel: _EventChannel):
+        """클라이언트 연결 제거 (전략별) - 채널은 재연결 재전송을 위해 정리 주기까지 유지
 
         Args:
             user_id: 사용자 ID
             strategy_id: 전략 ID (필수)
-            client_generator: Queue 객체
+            channel: add_client()가 반환한 채널
         """
-        with self.lock:
-            key = (user_id, strategy_id)
-            if key in self.clients:
-                self.clients[key].discard(client_generator)
-                if not self.clients[key]:
-                    del self.clients[key]
-                logger.info(f"클라이언트 연결 제거 - 사용자: {user_id}, 전략: {strategy_id}")
+        with self._channels_lock:
+            channel.clients = max(0, channel.clients - 1)
+            channel.last_activity = time.time()
+        logger.info(f"클라이언트 연결 제거 - 사용자: {user_id}, 전략: {strategy_id}")
 
     # @FEAT:event-sse @COMP:service @TYPE:core
     def emit_position_event(self, position_event: PositionEvent):
@@ -198,64 +275,59 @@ class EventService:
     def _emit_to_user(self, user_id: int, strategy_id: int, event_data: Dict[str, Any]):
         """특정 사용자의 특정 전략에게 이벤트 발송
 
+        채널 링 버퍼에 추가만 하고 반환합니다 (클라이언트 전송은 각 SSE 제너레이터가 수행).
+
         Args:
             user_id: 사용자 ID
             strategy_id: 전략 ID (필수)
             event_data: 이벤트 데이터
         """
-        with self.lock:
-            key = (user_id, strategy_id)
-
-            # 전략 존재 확인 (Phase 3 추가)
-            from app.models import Strategy
-            strategy = Strategy.query.filter_by(id=strategy_id).first()
-            if not strategy or not strategy.is_active:
-                logger.warning(
-                    f"이벤트 발송 스킵 (전략 없음/비활성) - 사용자: {user_id}, 전략: {strategy_id}"
-                )
-                return
-
-            # 이벤트 큐에 추가 (defaultdict가 자동으로 deque 생성)
-            self.event_queues[key].append(event_data)
+        # 전략 존재/활성 확인 (Phase 3 추가) - DB 대신 메모리 인덱스 사용
+        if not self._is_strategy_active(strategy_id):
+            self._stats['skipped_inactive'] += 1
+            logger.warning(
+                f"이벤트 발송 스킵 (전략 없음/비활성) - 사용자: {user_id}, 전략: {strategy_id}"
+            )
+            return
 
-            # 해당 전략을 구독 중인 클라이언트에게만 이벤트 전송
-            dead_clients = set()
+        self._get_channel((user_id, strategy_id)).append(event_data)
+        self._stats['emitted'] += 1
 
-            for client in self.clients.get(key, set()):
-                try:
-                    client.put(event_data, timeout=1.0)
-                except:
-                    dead_clients.add(client)
+    @staticmethod
+    def _is_strategy_active(strategy_id: int) -> bool:
+        from app.services.webhook_auth_index import strategy_token_index
 
-            # 죽은 클라이언트 제거
-            if dead_clients:
-                self.clients[key] -= dead_clients
-                logger.debug(f"사용자 {user_id}, 전략 {strategy_id}의 죽은 클라이언트 {len(dead_clients)}개 제거")
+        try:
+            return strategy_token_index.is_active_strategy(strategy_id)
+        except Exception as e:
+            # 인덱스 재구성 실패(DB 장애 등) 시 이벤트 유실보다 발송을 우선
+            logger.debug(f"전략 활성 인덱스 조회 실패, 발송 진행: {e}")
+            return True
 
     # @FEAT:event-sse @COMP:service @TYPE:core
-    def get_event_stream(self, user_id: int, strategy_id: int):
+    def get_event_stream(self, user_id: int, strategy_id: int, last_event_id: Optional[str] = None):
         """SSE 이벤트 스트림 생성 (전략별)
 
         Args:
             user_id: 사용자 ID
             strategy_id: 전략 ID (필수)
+            last_event_id: 재연결 시 마지막으로 받은 이벤트 ID (Last-Event-ID)
 
         Returns:
             Flask Response (SSE 스트림)
         """
-        from queue import Queue, Empty
-
         logger.info(f"🚀 SSE 스트림 생성 시작 - 사용자: {user_id}, 전략: {strategy_id}")
-        client_queue = Queue(maxsize=50)
 
         # @FEAT:event-sse @COMP:service @TYPE:core
         def event_generator():
             """SSE 이벤트 스트림 생성"""
+            channel = None
             try:
                 logger.info(f"📡 SSE 이벤트 제너레이터 시작 - 사용자: {user_id}, 전략: {strategy_id}")
 
                 # 클라이언트 등록 (전략별)
-                self.add_client(user_id, strategy_id, client_queue)
+                channel = self.add_client(user_id, strategy_id)
+                cursor = self._resume_cursor(channel, last_event_id)
 
                 # 연결 확인 이벤트 전송
                 connection_message = {
@@ -274,28 +346,41 @@ class EventService:
                 # 즉시 추가 데이터 전송하여 연결 안정화
                 yield ": keepalive\n\n"
 
-                # 실시간 이벤트 처리
+                # 실시간 이벤트 처리 (자기 속도로 채널 읽기)
                 while True:
-                    try:
-                        event = client_queue.get(timeout=10)
-                        logger.info(f"📤 실시간 이벤트 전송 - 사용자: {user_id}, 전략: {strategy_id}, 타입: {event.get('type')}")
-                        event_msg = self._format_sse_message(event)
-                        yield event_msg
-
-                    except Empty:
-                        # 타임아웃 시 keep-alive 메시지 전송
-                        heartbeat_message = {
-                            'type': 'heartbeat',
-                            'data': {
-                                'timestamp': datetime.utcnow().isoformat()
-                            }
+                    events, dropped = channel.read_after(cursor, timeout=10)
+                    if dropped:
+                        self._stats['dropped'] += dropped
+                        self._stats['overflows'] += 1
+                        logger.warning(
+                            f"⚠️ SSE 클라이언트 지연으로 이벤트 {dropped}개 누락 - "
+                            f"사용자: {user_id}, 전략: {strategy_id}"
+                        )
+
+                    if events:
+                        for seq, event in events:
+                            logger.debug(f"📤 실시간 이벤트 전송 - 사용자: {user_id}, 전략: {strategy_id}, 타입: {event.get('type')}")
+                            yield self._format_sse_message(event, event_id=f"{self._epoch}-{seq}")
+                        cursor = events[-1][0]
+                        continue
+
+                    if channel.closed:
+                        # force_disconnect 전달 완료 → 스트림 종료
+                        break
+
+                    # 타임아웃 시 keep-alive 메시지 전송
+                    heartbeat_message = {
+                        'type': 'heartbeat',
+                        'data': {
+                            'timestamp': datetime.utcnow().isoformat()
                         }
-                        logger.debug(f"💓 하트비트 전송 - 사용자: {user_id}, 전략: {strategy_id}")
-                        heartbeat_msg = self._format_sse_message(heartbeat_message)
-                        yield heartbeat_msg
+                    }
+                    logger.debug(f"💓 하트비트 전송 - 사용자: {user_id}, 전략: {strategy_id}")
+                    heartbeat_msg = self._format_sse_message(heartbeat_message)
+                    yield heartbeat_msg
 
-                        # 주기적 정리
-                        self._periodic_cleanup()
+                    # 주기적 정리
+                    self._periodic_cleanup()
 
             except GeneratorExit:
                 logger.debug(f"이벤트 스트림 종료 - 사용자: {user_id}, 전략: {strategy_id}")
@@ -303,7 +388,8 @@ class EventService:
                 logger.error(f"이벤트 스트림 오류 - 사용자: {user_id}, 전략: {strategy_id}, 오류: {str(e)}")
             finally:
                 # 클라이언트 제거 (전략별)
-                self.remove_client(user_id, strategy_id, client_queue)
+                if channel is not None:
+                    self.remove_client(user_id, strategy_id, channel)
 
         response = Response(
             event_generator(),
@@ -321,14 +407,24 @@ class EventService:
         response.timeout = None  # 타임아웃 비활성화
         return response
 
+    def _resume_cursor(self, channel: _EventChannel, last_event_id: Optional[str]) -> int:
+        """Last-Event-ID로 재전송 시작 위치 결정 (같은 프로세스에서 발급한 ID만 인정)"""
+        if last_event_id:
+            epoch, _, seq = last_event_id.partition('-')
+            if epoch == self._epoch and seq.isdigit() and int(seq) <= channel.last_seq:
+                self._stats['resumed'] += 1
+                return int(seq)
+        # 신규 연결: 연결 이후 이벤트만 전달
+        return channel.last_seq
+
     # @FEAT:event-sse @COMP:service @TYPE:helper
     def cleanup_strategy_clients(self, strategy_id: int) -> int:
         """특정 전략의 모든 SSE 클라이언트 정리
 
         전략 삭제/비활성화 시 호출하여:
         1. force_disconnect 이벤트를 모든 클라이언트에게 발송
-        2. 해당 전략의 모든 클라이언트 연결 제거
-        3. 이벤트 큐 정리
+        2. 해당 전략의 모든 클라이언트 연결 제거 (이벤트 전달 후 스트림 종료)
+        3. 이벤트 버퍼 정리
 
         Args:
             strategy_id: 정리할 전략 ID
@@ -338,45 +434,31 @@ class EventService:
         """
         cleaned_count = 0
 
-        with self.lock:
+        with self._channels_lock:
             # 해당 전략의 모든 (user_id, strategy_id) 키 찾기
             keys_to_remove = [
-                key for key in self.clients.keys()
+                key for key in self.channels.keys()
                 if key[1] == strategy_id  # key[1]은 strategy_id
             ]
+            channels = [(key, self.channels.pop(key)) for key in keys_to_remove]
 
-            logger.info(f"🧹 전략 {strategy_id} SSE 정리 시작 - 대상 키: {len(keys_to_remove)}개")
+        logger.info(f"🧹 전략 {strategy_id} SSE 정리 시작 - 대상 키: {len(keys_to_remove)}개")
 
-            for key in keys_to_remove:
-                user_id, strat_id = key
-                clients = self.clients.get(key, set()).copy()  # 복사본으로 순회
-
-                # 각 클라이언트에게 force_disconnect 이벤트 전송
-                disconnect_event = {
-                    'type': 'force_disconnect',
-                    'data': {
-                        'reason': 'strategy_deleted',
-                        'message': '전략이 삭제되었습니다. 연결을 종료합니다.',
-                        'strategy_id': strategy_id,
-                        'timestamp': datetime.utcnow().isoformat()
-                    }
+        for (user_id, strat_id), channel in channels:
+            # 각 클라이언트에게 force_disconnect 이벤트 전송
+            disconnect_event = {
+                'type': 'force_disconnect',
+                'data': {
+                    'reason': 'strategy_deleted',
+                    'message': '전략이 삭제되었습니다. 연결을 종료합니다.',
+                    'strategy_id': strategy_id,
+                    'timestamp': datetime.utcnow().isoformat()
                 }
+            }
+            channel.close(disconnect_event)
+            cleaned_count += channel.clients
 
-                for client in clients:
-                    try:
-                        client.put(disconnect_event, timeout=0.5)
-                        cleaned_count += 1
-                        logger.debug(f"강제 종료 이벤트 전송 - 사용자: {user_id}, 전략: {strat_id}")
-                    except Exception as e:
-                        logger.warning(f"강제 종료 이벤트 전송 실패 - 사용자: {user_id}, 오류: {str(e)}")
-
-                # 클라이언트 및 큐 제거
-                if key in self.clients:
-                    del self.clients[key]
-                if key in self.event_queues:
-                    del self.event_queues[key]
-
-                logger.info(f"전략 {strategy_id} 클라이언트 정리 완료 - 사용자: {user_id}, 클라이언트 수: {len(clients)}")
+            logger.info(f"전략 {strategy_id} 클라이언트 정리 완료 - 사용자: {user_id}, 클라이언트 수: {channel.clients}")
 
         logger.info(f"✅ 전략 {strategy_id} SSE 정리 완료 - 총 {cleaned_count}개 클라이언트 정리됨")
         return cleaned_count
@@ -387,8 +469,8 @@ class EventService:
 
         권한 변경 시 호출하여:
         1. force_disconnect 이벤트를 해당 클라이언트에게 발송
-        2. (user_id, strategy_id) 클라이언트 연결 제거
-        3. 이벤트 큐 정리
+        2. (user_id, strategy_id) 클라이언트 연결 제거 (이벤트 전달 후 스트림 종료)
+        3. 이벤트 버퍼 정리
 
         Args:
             user_id: 사용자 ID
@@ -398,45 +480,31 @@ class EventService:
         Returns:
             int: 정리된 클라이언트 수
         """
-        cleaned_count = 0
         key = (user_id, strategy_id)
 
-        with self.lock:
-            clients = self.clients.get(key, set()).copy()
-
-            if not clients:
+        with self._channels_lock:
+            channel = self.channels.get(key)
+            if channel is None or not channel.clients:
                 logger.debug(f"강제 종료 대상 없음 - 사용자: {user_id}, 전략: {strategy_id}")
                 return 0
+            del self.channels[key]
 
-            logger.info(f"🚫 SSE 강제 종료 시작 - 사용자: {user_id}, 전략: {strategy_id}, 사유: {reason}")
+        logger.info(f"🚫 SSE 강제 종료 시작 - 사용자: {user_id}, 전략: {strategy_id}, 사유: {reason}")
 
-            # force_disconnect 이벤트 생성
-            disconnect_event = {
-                'type': 'force_disconnect',
-                'data': {
-                    'reason': reason,
-                    'message': self._get_disconnect_message(reason),
-                    'strategy_id': strategy_id,
-                    'timestamp': datetime.utcnow().isoformat()
-                }
+        # force_disconnect 이벤트 생성
+        disconnect_event = {
+            'type': 'force_disconnect',
+            'data': {
+                'reason': reason,
+                'message': self._get_disconnect_message(reason),
+                'strategy_id': strategy_id,
+                'timestamp': datetime.utcnow().isoformat()
             }
+        }
+        channel.close(disconnect_event)
+        cleaned_count = channel.clients
 
-            # 각 클라이언트에게 이벤트 전송
-            for client in clients:
-                try:
-                    client.put(disconnect_event, timeout=0.5)
-                    cleaned_count += 1
-                    logger.debug(f"강제 종료 이벤트 전송 - 사용자: {user_id}, 전략: {strategy_id}")
-                except Exception as e:
-                    logger.warning(f"강제 종료 이벤트 전송 실패 - 사용자: {user_id}, 오류: {str(e)}")
-
-            # 클라이언트 및 큐 제거
-            if key in self.clients:
-                del self.clients[key]
-            if key in self.event_queues:
-                del self.event_queues[key]
-
-            logger.info(f"✅ SSE 강제 종료 완료 - 사용자: {user_id}, 전략: {strategy_id}, 클라이언트: {cleaned_count}개")
+        logger.info(f"✅ SSE 강제 종료 완료 - 사용자: {user_id}, 전략: {strategy_id}, 클라이언트: {cleaned_count}개")
 
         return cleaned_count
 
@@ -452,56 +520,60 @@ class EventService:
         return messages.get(reason, '연결이 종료되었습니다.')
 
     # @FEAT:event-sse @COMP:service @TYPE:helper
-    def _format_sse_message(self, data: Dict[str, Any]) -> str:
-        """SSE 메시지 포맷팅"""
+    def _format_sse_message(self, data: Dict[str, Any], event_id: Optional[str] = None) -> str:
+        """SSE 메시지 포맷팅 (event_id: 재연결 시 Last-Event-ID로 돌아오는 값)"""
         try:
             json_data = json.dumps(data.get('data', data), ensure_ascii=False)
 
             # Extract event type if available
             event_type = data.get('type', None)
+            id_line = f"id: {event_id}\n" if event_id else ""
 
             # Format SSE message with event type
             if event_type:
-                return f"event: {event_type}\ndata: {json_data}\n\n"
+                return f"{id_line}event: {event_type}\ndata: {json_data}\n\n"
             else:
-                return f"data: {json_data}\n\n"
+                return f"{id_line}data: {json_data}\n\n"
         except Exception as e:
             logger.error(f"SSE 메시지 포맷팅 실패: {str(e)}")
             return f"data: {{}}\n\n"
 
     # @FEAT:event-sse @COMP:service @TYPE:helper
     def _periodic_cleanup(self):
-        """주기적으로 죽은 연결 정리"""
+        """주기적으로 클라이언트가 없는 채널 정리 (재연결 재전송 보관 시간 경과 후)"""
         current_time = time.time()
 
         if current_time - self._last_cleanup > self._cleanup_interval:
-            with self.lock:
-                # 빈 클라이언트 집합 제거
-                empty_users = [user_id for user_id, clients in self.clients.items() if not clients]
-                for user_id in empty_users:
-                    del self.clients[user_id]
-
-                # 오래된 이벤트 큐 정리
-                old_users = [user_id for user_id in self.event_queues.keys() if user_id not in self.clients]
-                for user_id in old_users:
-                    del self.event_queues[user_id]
+            with self._channels_lock:
+                idle_keys = [
+                    key for key, channel in self.channels.items()
+                    if not channel.clients and current_time - channel.last_activity > SSE_REPLAY_RETENTION_SEC
+                ]
+                for key in idle_keys:
+                    del self.channels[key]
 
-                if empty_users or old_users:
-                    logger.info(f"정리 완료: 빈 사용자 {len(empty_users)}개, 오래된 큐 {len(old_users)}개 제거")
+            if idle_keys:
+                logger.info(f"정리 완료: 유휴 채널 {len(idle_keys)}개 제거")
 
             self._last_cleanup = current_time
 
     # @FEAT:event-sse @COMP:service @TYPE:helper
     def get_statistics(self) -> Dict[str, Any]:
-        """서비스 통계 조회"""
-        with self.lock:
-            return {
-                'total_users': len(self.clients),
-                'total_connections': sum(len(clients) for clients in self.clients.values()),
-                'queued_events': sum(len(queue) for queue in self.event_queues.values()),
-                'users_with_events': len(self.event_queues),
-                'timestamp': datetime.utcnow().isoformat()
-            }
+        """서비스 통계 조회 (dropped: 버퍼 초과로 느린 클라이언트가 받지 못한 이벤트 수)"""
+        channels = list(self.channels.values())
+        return {
+            'total_users': sum(1 for channel in channels if channel.clients),
+            'total_connections': sum(channel.clients for channel in channels),
+            'queued_events': sum(len(channel.events) for channel in channels),
+            'users_with_events': len(channels),
+            'buffer_size': self.buffer_size,
+            'emitted_events': self._stats['emitted'],
+            'skipped_inactive': self._stats['skipped_inactive'],
+            'dropped_events': self._stats['dropped'],
+            'overflows': self._stats['overflows'],
+            'resumed_connections': self._stats['resumed'],
+            'timestamp': datetime.utcnow().isoformat()
+        }
 
 # 전역 인스턴스
 event_service = EventService()
@@ -4,7 +4,9 @@ Exchange 서비스 통합 모듈
 exchange_integrated_service.py 와 capital_service.py를 통합하여
 하나의 일관된 서비스로 제공합니다.
 """
+import asyncio
 import logging
+import threading
 import time
 from collections import defaultdict
 from enum import Enum
@@ -12,7 +14,9 @@ from typing import Dict, List, Optional, Union, Any, TYPE_CHECKING
 
 from app.models import Account
 from app.constants import Exchange, MarketType, OrderType
+from app.exchanges.market_store import market_store
 from app.exchanges.models import PriceQuote
+from app.exchanges.client_registry import ExchangeClientRegistry
 from app.exchanges.exceptions import (
     ExchangeError,
     NetworkError,
@@ -47,54 +51,314 @@ class MarketTypeEnum(str, Enum):
         raise ValueError(f"Invalid market type: {value}")
 
 
+# @FEAT:exchange-integration @COMP:service @TYPE:config
+class EndpointClass:
+    """
+    Rate Limit 예산 분류용 엔드포인트 클래스
+
+    ORDER만 계좌별 주문 수 버킷(orders_per_second)을 소모하고,
+    모든 클래스가 거래소 요청 가중치(weight) 버킷을 소모합니다.
+    """
+    ORDER = 'order'                  # 주문 생성
+    CANCEL = 'cancel'                # 주문 취소
+    QUERY = 'query'                  # 단일 주문/체결 조회
+    OPEN_ORDERS = 'open_orders'      # 미체결 조회 (심볼 지정)
+    OPEN_ORDERS_ALL = 'open_orders_all'  # 미체결 조회 (전체 심볼)
+    ACCOUNT = 'account'              # 잔고/계좌 정보
+    MARKET_DATA = 'market_data'      # 시세/마켓 정보 (공개 API)
+
+
+# @FEAT:exchange-integration @COMP:service @TYPE:config
+# 거래소별 Rate Limit 예산
+# - weight_per_minute: IP 단위 요청 가중치 한도 (서버 1대 = IP 1개 → 모든 계좌가 공유)
+# - orders_per_second: 계좌 단위 주문 수 한도 (계좌 간 독립)
+# - markets: 마켓별로 호스트/가중치 한도가 분리된 경우의 개별 한도 (정의되지 않은 마켓은 기본 한도 공유)
+EXCHANGE_RATE_LIMITS = {
+    'binance': {'weight_per_minute': 1200, 'orders_per_second': 10,
+                'markets': {'futures': {'weight_per_minute': 2400}}},  # api.binance.com / fapi.binance.com
+    'upbit': {'weight_per_minute': 600, 'orders_per_second': 8},
+    'bybit': {'weight_per_minute': 600, 'orders_per_second': 20},
+    'bithumb': {'weight_per_minute': 300, 'orders_per_second': 5},
+}
+DEFAULT_RATE_LIMIT = {'weight_per_minute': 600, 'orders_per_second': 5}
+
+# @FEAT:exchange-integration @COMP:service @TYPE:config
+# 엔드포인트 클래스별 요청 가중치 (Binance 공식 REQUEST_WEIGHT 기준, 보수적으로 spot/futures 중 큰 값)
+# 정의되지 않은 거래소/클래스는 가중치 1
+ENDPOINT_WEIGHTS = {
+    'binance': {
+        EndpointClass.ORDER: 1,
+        EndpointClass.CANCEL: 1,
+        EndpointClass.QUERY: 4,
+        EndpointClass.OPEN_ORDERS: 6,
+        EndpointClass.OPEN_ORDERS_ALL: 80,
+        EndpointClass.ACCOUNT: 20,
+        EndpointClass.MARKET_DATA: 2,
+    },
+}
+
+# 서버가 알려준 사용 가중치 헤더 (Binance)
+USED_WEIGHT_HEADERS = ('X-MBX-USED-WEIGHT-1M', 'X-MBX-USED-WEIGHT')
+
+
+# @FEAT:exchange-integration @COMP:service @TYPE:helper
+class TokenBucket:
+    """
+    토큰 버킷 (스레드 안전하지 않음 - RateLimiter의 Lock 안에서만 사용)
+
+    capacity만큼 버스트를 허용하고 초당 refill_rate개씩 토큰을 채웁니다.
+    blocked_until은 거래소가 429/418 + Retry-After로 차단을 알린 경우 설정됩니다.
+    """
+
+    __slots__ = ('capacity', 'refill_rate', 'tokens', 'updated_at', 'blocked_until')
+
+    def __init__(self, capacity: float, refill_rate: float, now: float):
+        self.capacity = float(capacity)
+        self.refill_rate = float(refill_rate)
+        self.tokens = float(capacity)
+        self.updated_at = now
+        self.blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """amount개 토큰을 소모하기까지 남은 대기 시간 (0이면 즉시 가능)"""
+        self._refill(now)
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        # capacity보다 큰 요청은 가득 찬 버킷에서 허용 (영구 대기 방지)
+        needed = min(amount, self.capacity)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.refill_rate
+
+    def consume(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+
 # @FEAT:exchange-integration @COMP:service @TYPE:helper
 class RateLimiter:
-    """Rate Limiting 기능 (기존 rate_limit_service.py 통합)"""
+    """
+    토큰 버킷 기반 Rate Limiter (스레드 안전)
+
+    버킷 키: (exchange, account_id, endpoint_class)
+    - (exchange, account_id, 'order'): 계좌별 주문 수 버킷 → 계좌끼리 서로 막지 않음
+    - (exchange, market, 'weight'): 거래소 IP 가중치 버킷 → 모든 계좌 공유
+      (market은 EXCHANGE_RATE_LIMITS의 markets에 정의된 경우만 분리, 그 외 None = 기본 호스트)
+
+    사용법:
+    - try_acquire(): 논블로킹. 0.0이면 획득, 양수면 필요한 대기 시간(초)
+    - acquire(): asyncio 대기 (이벤트 루프 경로용, 스레드를 sleep시키지 않음)
+    - acquire_slot(): 동기 블로킹 (기존 호출부 호환)
+    - update_from_headers(): X-MBX-USED-WEIGHT / Retry-After 응답 헤더 반영
+    """
 
-    def __init__(self):
-        self._limits = {
-            'binance': {'requests_per_minute': 1200, 'orders_per_second': 10},
-            'upbit': {'requests_per_minute': 600, 'orders_per_second': 8},
-            'bybit': {'requests_per_minute': 600, 'orders_per_second': 20},
-        }
-        self._request_history = defaultdict(list)
-        self._order_history = defaultdict(list)
+    WEIGHT_BUCKET = 'weight'
+
+    def __init__(self, limits: Optional[Dict[str, Dict[str, int]]] = None):
+        self._limits = limits or EXCHANGE_RATE_LIMITS
+        self._buckets: Dict[tuple, TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._stats = defaultdict(lambda: {'acquired': 0, 'throttled': 0, 'server_blocks': 0})
+
+    def _get_limit(self, exchange_name: str) -> Dict[str, int]:
+        return self._limits.get(exchange_name, DEFAULT_RATE_LIMIT)
+
+    def _weight_key(self, exchange_name: str, market_type: Optional[str]) -> tuple:
+        """가중치 버킷 키 (별도 한도가 정의된 마켓만 분리, 나머지는 거래소 기본 버킷 공유)"""
+        market = str(getattr(market_type, 'value', market_type) or '').lower() or None
+        if market not in self._get_limit(exchange_name).get('markets', {}):
+            market = None
+        return (exchange_name, market, self.WEIGHT_BUCKET)
+
+    def _bucket(self, key: tuple, now: float) -> TokenBucket:
+        """버킷 조회/생성 (Lock 보유 상태에서 호출)"""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            limit = self._get_limit(key[0])
+            if key[2] == self.WEIGHT_BUCKET:
+                if key[1] is not None:
+                    limit = limit['markets'][key[1]]
+                capacity = limit['weight_per_minute']
+                bucket = TokenBucket(capacity, capacity / 60.0, now)
+            else:
+                rate = limit['orders_per_second']
+                bucket = TokenBucket(rate, rate, now)
+            self._buckets[key] = bucket
+        return bucket
 
-    def acquire_slot(self, exchange_name: str) -> bool:
-        """API 요용슬롯 획득 (Rate Limit 관리)"""
-        current_time = time.time()
+    @staticmethod
+    def get_weight(exchange_name: str, endpoint_class: str) -> int:
+        """엔드포인트 클래스의 요청 가중치"""
+        return ENDPOINT_WEIGHTS.get(exchange_name, {}).get(endpoint_class, 1)
 
-        # 요청 history 정리 (1분 이전 데이터 삭제)
-        self._request_history[exchange_name] = [
-            timestamp for timestamp in self._request_history[exchange_name]
-            if current_time - timestamp < 60
-        ]
+    def try_acquire(self, exchange_name: str, account_id: Optional[int] = None,
+                    endpoint_class: str = EndpointClass.QUERY, count: int = 1,
+                    weight: Optional[int] = None, market_type: Optional[str] = None) -> float:
+        """
+        논블로킹 슬롯 획득
 
-        # 주문 history 정리 (1초 이전 데이터 삭제)
-        self._order_history[exchange_name] = [
-            timestamp for timestamp in self._order_history[exchange_name]
-            if current_time - timestamp < 1
-        ]
+        Args:
+            exchange_name: 거래소 이름
+            account_id: 계좌 ID (주문 수 버킷 구분용, None이면 공용)
+            endpoint_class: EndpointClass 값
+            count: 요청 건수 (배치 주문은 주문 개수)
+            weight: 요청 1건당 가중치 (None이면 ENDPOINT_WEIGHTS 기준)
+            market_type: 마켓 타입 (마켓별 가중치 버킷 선택, None이면 기본 버킷)
 
-        # Rate limit 체크
-        limit = self._limits[exchange_name]
+        Returns:
+            0.0: 획득 성공 (토큰 소모됨)
+            양수: 획득 실패, 재시도까지 필요한 대기 시간(초) (토큰 소모 없음)
+        """
+        exchange_name = (exchange_name or '').lower()
+        if weight is None:
+            weight = self.get_weight(exchange_name, endpoint_class)
+        total_weight = weight * count
+
+        with self._lock:
+            now = time.monotonic()
+            weight_bucket = self._bucket(self._weight_key(exchange_name, market_type), now)
+            wait = weight_bucket.wait_time(total_weight, now)
+
+            order_bucket = None
+            if endpoint_class == EndpointClass.ORDER:
+                order_bucket = self._bucket((exchange_name, account_id, EndpointClass.ORDER), now)
+                wait = max(wait, order_bucket.wait_time(count, now))
+
+            stats = self._stats[exchange_name]
+            if wait > 0:
+                stats['throttled'] += 1
+                return wait
+
+            # 모든 버킷이 충분할 때만 소모 (부분 소모 없음)
+            weight_bucket.consume(total_weight)
+            if order_bucket is not None:
+                order_bucket.consume(count)
+            stats['acquired'] += 1
+            return 0.0
+
+    async def acquire(self, exchange_name: str, account_id: Optional[int] = None,
+                      endpoint_class: str = EndpointClass.QUERY, count: int = 1,
+                      weight: Optional[int] = None, max_wait: float = 60.0,
+                      market_type: Optional[str] = None) -> bool:
+        """
+        비동기 슬롯 획득 (asyncio.sleep으로 대기 → 이벤트 루프의 다른 주문은 계속 진행)
 
-        if len(self._request_history[exchange_name]) >= limit['requests_per_minute']:
-            wait_time = 60 - (current_time - self._request_history[exchange_name][0])
-            logger.warning(f"Rate limit exceeded for {exchange_name}, waiting {wait_time:.2f}s")
-            time.sleep(wait_time)
-            return False
+        Returns:
+            True: 획득 성공, False: max_wait 초과
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            wait = self.try_acquire(exchange_name, account_id, endpoint_class, count, weight, market_type)
+            if wait <= 0:
+                return True
+            if time.monotonic() + wait > deadline:
+                logger.warning(f"Rate limit 대기 시간 초과: {exchange_name} (account={account_id}, class={endpoint_class})")
+                return False
+            await asyncio.sleep(wait)
 
-        if len(self._order_history[exchange_name]) >= limit['orders_per_second']:
-            wait_time = 1 - (current_time - self._order_history[exchange_name][0])
-            logger.warning(f"Order rate limit exceeded for {exchange_name}, waiting {wait_time:.2f}s")
-            time.sleep(wait_time)
-            return False
+    def acquire_slot(self, exchange_name: str, account_id: Optional[int] = None,
+                     endpoint_class: str = EndpointClass.QUERY, count: int = 1,
+                     weight: Optional[int] = None, max_wait: float = 60.0,
+                     market_type: Optional[str] = None) -> bool:
+        """
+        동기 슬롯 획득 (블로킹, 기존 호출부 호환)
 
-        # 슬롯 획득 기록
-        self._request_history[exchange_name].append(current_time)
-        self._order_history[exchange_name].append(current_time)
-        return True
+        Returns:
+            True: 획득 성공, False: max_wait 초과
+        """
+        deadline = time.monotonic() + max_wait
+        while True:
+            wait = self.try_acquire(exchange_name, account_id, endpoint_class, count, weight, market_type)
+            if wait <= 0:
+                return True
+            if time.monotonic() + wait > deadline:
+                logger.warning(f"Rate limit 대기 시간 초과: {exchange_name} (account={account_id}, class={endpoint_class})")
+                return False
+            logger.debug(f"Rate limit 대기: {exchange_name} (account={account_id}, class={endpoint_class}) {wait:.3f}s")
+            time.sleep(wait)
+
+    def update_from_headers(self, exchange_name: str, status_code: int, headers: Any,
+                            market_type: Optional[str] = None) -> None:
+        """
+        거래소 응답 헤더로 버킷 상태 보정 (응답이 온 마켓의 가중치 버킷만 보정)
+
+        - X-MBX-USED-WEIGHT(-1M): 서버 기준 사용 가중치로 남은 토큰을 하향 보정 (0 미만으로 내려가지 않음)
+        - 429/418 + Retry-After: 해당 가중치 버킷을 지정 시간 동안 차단
+        """
+        if not headers:
+            return
+        exchange_name = (exchange_name or '').lower()
+
+        used_weight = None
+        for header in USED_WEIGHT_HEADERS:
+            value = headers.get(header)
+            if value is not None:
+                try:
+                    used_weight = int(value)
+                except (TypeError, ValueError):
+                    pass
+                break
+
+        retry_after = None
+        if status_code in (418, 429):
+            try:
+                retry_after = float(headers.get('Retry-After', 0) or 0)
+            except (TypeError, ValueError):
+                retry_after = 0.0
+            # Retry-After 누락 시 최소 1초 차단
+            retry_after = max(retry_after, 1.0)
+
+        if used_weight is None and retry_after is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            bucket = self._bucket(self._weight_key(exchange_name, market_type), now)
+            bucket._refill(now)
+            if used_weight is not None:
+                bucket.tokens = max(0.0, min(bucket.tokens, bucket.capacity - used_weight))
+            if retry_after is not None:
+                bucket.blocked_until = max(bucket.blocked_until, now + retry_after)
+                self._stats[exchange_name]['server_blocks'] += 1
+                logger.warning(
+                    f"🚫 {exchange_name}({market_type or 'default'}) Rate limit 응답 (HTTP {status_code}) - "
+                    f"{retry_after:.1f}초 동안 요청 중단"
+                )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """거래소별 획득/대기 통계 및 가중치 버킷 잔량 (weight_remaining = 기본 버킷, weight_buckets = 마켓별)"""
+        with self._lock:
+            now = time.monotonic()
+            result = {}
+            exchange_names = set(self._stats) | {key[0] for key in self._buckets}
+            for exchange_name in sorted(exchange_names):
+                stats = self._stats[exchange_name]
+                bucket = self._buckets.get((exchange_name, None, self.WEIGHT_BUCKET))
+                remaining = None
+                if bucket is not None:
+                    bucket._refill(now)
+                    remaining = round(bucket.tokens, 2)
+                weight_buckets = {}
+                for key, market_bucket in self._buckets.items():
+                    if key[0] == exchange_name and key[2] == self.WEIGHT_BUCKET:
+                        market_bucket._refill(now)
+                        weight_buckets[key[1] or 'default'] = round(market_bucket.tokens, 2)
+                result[exchange_name] = {
+                    **stats,
+                    'weight_remaining': remaining,
+                    'weight_buckets': weight_buckets,
+                    'blocked_for': round(max(0.0, bucket.blocked_until - now), 2) if bucket else 0.0,
+                    'order_buckets': sum(
+                        1 for key in self._buckets
+                        if key[0] == exchange_name and key[2] == EndpointClass.ORDER
+                    )
+                }
+            return result
 
 
 def _standardize_crypto_balance(balance_data: Dict, exchange_name: str, market_type: str) -> Dict[str, Any]:
@@ -147,6 +411,7 @@ class ExchangeService:
         self._crypto_exchanges: Dict[str, 'BaseCryptoExchange'] = {}
         self._securities_exchanges: Dict[str, 'BaseSecuritiesExchange'] = {}
         self.rate_limiter = RateLimiter()
+        self.client_registry = ExchangeClientRegistry(on_create=self._on_account_client_created)
 
     # @FEAT:exchange-service-initialization @COMP:service @TYPE:core @DEPS:constants
     def register_active_exchanges(self) -> Dict[str, Any]:
@@ -294,8 +559,14 @@ class ExchangeService:
             }
 
     def register_crypto_exchange(self, name: str, exchange: 'BaseCryptoExchange'):
-        """암호화폐 거래소 등록"""
+        """암호화폐 거래소 등록 (응답 헤더를 Rate Limiter에 연결)"""
         self._crypto_exchanges[name] = exchange
+        if hasattr(exchange, 'add_response_hook'):
+            exchange.add_response_hook(
+                lambda status, headers, market_type=None, _name=name: self.rate_limiter.update_from_headers(
+                    _name, status, headers, market_type
+                )
+            )
 
     def register_securities_exchange(self, name: str, exchange: 'BaseSecuritiesExchange'):
         """증권 거래소 등록"""
@@ -346,7 +617,23 @@ class ExchangeService:
             return None
 
     def _get_client(self, account: Account) -> Union['BaseCryptoExchange', 'BaseSecuritiesExchange']:
-        """계정에 해당하는 거래소 클라이언트 획득"""
+        """
+        계정에 해당하는 거래소 클라이언트 획득
+
+        저장된 계좌는 계좌 전용 클라이언트(client_registry)를 사용하고,
+        ID가 없는 임시 계좌 객체만 거래소 공용 기본 클라이언트로 처리합니다.
+        """
+        if getattr(account, 'id', None) is not None:
+            # 공용 클라이언트 등록 여부와 무관하게 UnifiedExchangeFactory로 생성 (증권 계좌 포함)
+            try:
+                return self.client_registry.get(account)
+            except ExchangeError:
+                raise
+            except ValueError as e:
+                raise ExchangeError(f"Unsupported exchange: {account.exchange} ({e})") from e
+            except Exception as e:
+                raise ExchangeError(f"거래소 클라이언트 생성 실패 (account_id={account.id}): {e}") from e
+
         client = None
 
         if account.exchange in self._crypto_exchanges:
@@ -359,6 +646,111 @@ class ExchangeService:
 
         return client
 
+    # @FEAT:exchange-integration @COMP:service @TYPE:helper
+    def _on_account_client_created(self, account: Account, client) -> None:
+        """계좌 전용 클라이언트 초기화: Rate Limit 응답 훅 연결 (마켓 정보는 market_store로 자동 공유)"""
+        exchange_name = (account.exchange or '').lower()
+
+        if hasattr(client, 'add_response_hook'):
+            client.add_response_hook(
+                lambda status, headers, market_type=None: self.rate_limiter.update_from_headers(
+                    exchange_name, status, headers, market_type
+                )
+            )
+
+    # @FEAT:exchange-integration @COMP:service @TYPE:core
+    def get_exchange(self, account: Account) -> Union['BaseCryptoExchange', 'BaseSecuritiesExchange']:
+        """계좌 전용 거래소 어댑터 반환 (생성 비용/마켓 파싱은 계좌당 1회)"""
+        return self._get_client(account)
+
+    # @FEAT:exchange-integration @COMP:service @TYPE:helper
+    def invalidate_account_cache(self, account_id: int) -> bool:
+        """계좌 수정/비활성화/삭제 시 해당 계좌 클라이언트 제거"""
+        return self.client_registry.invalidate(account_id)
+
+    # @FEAT:exchange-integration @COMP:service @TYPE:helper
+    def clear_all_cache(self) -> int:
+        """계좌별 클라이언트 전체 제거, 제거된 개수 반환"""
+        return self.client_registry.clear()
+
+    # @FEAT:exchange-integration @COMP:service @TYPE:helper
+    def _iter_clients(self) -> List[tuple]:
+        """등록된 모든 거래소 클라이언트 (이름, 클라이언트) 목록 (공용 + 계좌 전용)"""
+        account_clients = [
+            (f"account_{account_id}", client)
+            for account_id, client in self.client_registry.clients().items()
+        ]
+        return (list(self._crypto_exchanges.items())
+                + list(self._securities_exchanges.items())
+                + account_clients)
+
+    # @FEAT:exchange-integration @COMP:service @TYPE:helper
+    def get_http_pool_stats(self) -> Dict[str, Any]:
+        """
+        거래소 클라이언트별 Keep-Alive HTTP 커넥션 풀 통계를 반환합니다.
+
+        Returns:
+            {
+                'success': bool,
+                'exchanges': {exchange_name: {'requests', 'new_connections', 'reused_requests', ...}},
+                'totals': {'requests': int, 'new_connections': int, 'reused_requests': int, 'reuse_ratio': float}
+            }
+
+        Notes:
+            - reuse_ratio가 낮으면 풀 크기(EXCHANGE_HTTP_POOL_MAXSIZE)가 fan-out보다 작거나
+              거래소 측에서 Keep-Alive 연결을 끊고 있다는 의미
+        """
+        try:
+            exchanges = {}
+            totals = {'requests': 0, 'new_connections': 0, 'reused_requests': 0, 'reuse_ratio': 0.0}
+
+            for name, client in self._iter_clients():
+                stats_fn = getattr(client, 'get_http_pool_stats', None)
+                if not stats_fn:
+                    continue
+                stats = stats_fn()
+                exchanges[name] = stats
+                totals['requests'] += stats['requests']
+                totals['new_connections'] += stats['new_connections']
+                totals['reused_requests'] += stats['reused_requests']
+
+            if totals['requests']:
+                totals['reuse_ratio'] = round(totals['reused_requests'] / totals['requests'], 4)
+
+            return {
+                'success': True,
+                'exchanges': exchanges,
+                'totals': totals,
+                'client_registry': self.client_registry.get_stats()
+            }
+
+        except Exception as e:
+            logger.error(f"HTTP 커넥션 풀 통계 조회 실패: {e}")
+            return {'success': False, 'error': str(e)}
+
+    # @FEAT:exchange-integration @COMP:service @TYPE:core
+    def shutdown(self) -> None:
+        """
+        애플리케이션 종료 시 거래소 클라이언트 리소스 정리
+
+        app/__init__.py의 cleanup_exchange_service() atexit 훅에서 호출됩니다.
+        각 클라이언트의 Keep-Alive HTTP 커넥션 풀과 aiohttp 세션을 닫습니다.
+        """
+        closed = 0
+        for name, client in self._iter_clients():
+            close_fn = getattr(client, 'close_http_session', None)
+            if not close_fn:
+                continue
+            try:
+                close_fn()
+                if hasattr(client, 'close_async_sessions'):
+                    client.close_async_sessions()
+                closed += 1
+            except Exception as e:
+                logger.warning(f"⚠️ {name} HTTP 세션 종료 실패: {e}")
+
+        logger.info(f"🛑 거래소 HTTP 커넥션 풀 정리 완료 ({closed}개 클라이언트)")
+
     # @FEAT:exchange-integration @COMP:service @TYPE:core
     def create_order(self, account: Account, order_data: Dict[str, Any],
                    market_type: Union[str, MarketTypeEnum] = MarketTypeEnum.SPOT) -> Dict[str, Any]:
@@ -375,7 +767,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.ORDER, market_type=market_type)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -418,7 +810,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.CANCEL, market_type=market_type)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -436,6 +828,57 @@ class ExchangeService:
             logger.error(f"주문 취소 실패: {e}")
             return {'success': False, 'error': str(e)}
 
+    # @FEAT:order-cancellation @COMP:service @TYPE:helper
+    def supports_native_cancel_all(self, account: Account, market_type: str = 'spot') -> bool:
+        """계좌 거래소가 심볼 단위 전체 취소 API를 지원하는지 여부"""
+        try:
+            client = self._get_client(account)
+        except Exception as e:
+            logger.debug(f"전체 취소 지원 여부 확인 실패 (주문별 취소 사용): {e}")
+            return False
+        check = getattr(client, 'supports_native_cancel_all', None)
+        return bool(check and check((market_type or 'spot').lower()))
+
+    # @FEAT:order-cancellation @COMP:service @TYPE:core
+    def cancel_all_orders(self, account: Account, symbol: str,
+                          market_type: Union[str, MarketTypeEnum] = MarketTypeEnum.SPOT) -> Dict[str, Any]:
+        """
+        심볼의 모든 미체결 주문 취소 (거래소 네이티브 전체 취소 API, 요청 1회)
+
+        Args:
+            account: 계정 정보
+            symbol: 거래 쌍
+            market_type: 마켓 타입
+
+        Returns:
+            {'success': True, 'result': {'cancelled_order_ids': [...] 또는 None(미제공)}}
+            미지원 거래소는 error_type='not_supported'
+        """
+        try:
+            client = self._get_client(account)
+            normalized_market_type = MarketTypeEnum.normalize(
+                market_type.lower() if isinstance(market_type, str) else market_type
+            )
+
+            if not getattr(client, 'supports_native_cancel_all', lambda _: False)(normalized_market_type):
+                return {
+                    'success': False,
+                    'error': f'{account.exchange} {normalized_market_type}: 전체 취소 API 미지원',
+                    'error_type': 'not_supported'
+                }
+
+            # Rate limit 체크 (Binance 전체 취소 weight 1)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.CANCEL, market_type=market_type)
+
+            result = client.cancel_all_orders(symbol, normalized_market_type)
+
+            logger.info(f"전체 주문 취소 성공: {account.exchange}, {symbol} ({normalized_market_type})")
+            return {'success': True, 'result': result}
+
+        except Exception as e:
+            logger.error(f"전체 주문 취소 실패: {e}")
+            return {'success': False, 'error': str(e)}
+
     # @FEAT:exchange-integration @COMP:service @TYPE:core
     def get_open_orders(self, account: Account, symbol: str = None,
                        market_type: Union[str, MarketTypeEnum] = MarketTypeEnum.SPOT) -> Dict[str, Any]:
@@ -452,7 +895,11 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(
+                account.exchange, account.id,
+                EndpointClass.OPEN_ORDERS if symbol else EndpointClass.OPEN_ORDERS_ALL,
+                market_type=market_type
+            )
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -487,7 +934,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.QUERY, market_type=market_type)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -519,7 +966,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.ACCOUNT, market_type=market_type)
 
             # Crypto/Securities 모두 동기 메서드 호출 (Phase 1-2에서 비동기 제거 완료)
             client = self._get_client(account)
@@ -578,7 +1025,10 @@ class ExchangeService:
                            market_type: str = 'spot',
                            account_id: Optional[int] = None) -> Dict[str, Any]:
         """
-        배치 주문 생성 (스레드별 이벤트 루프 재사용, 병렬 처리 지원)
+        배치 주문 생성 (거래소 네이티브 배치 API, 배치 한도 청크를 fan-out 루프에서 동시 제출)
+
+        Note:
+            order_fanout_engine 루프 스레드 안에서 호출하면 안 됩니다 (완료까지 대기하는 동기 API).
 
         Args:
             account: 계정 정보
@@ -598,36 +1048,51 @@ class ExchangeService:
         Returns:
             배치 주문 결과
         """
-        try:
-            # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+        from app.services.trading.order_fanout import (
+            BatchOrderJob, chunk_orders, merge_batch_results, order_fanout_engine
+        )
 
+        try:
             # 클라이언트 획득
             client = self._get_client(account)
+            market_type = (market_type or 'spot').lower()
+
+            # 거래소 배치 한도로 청크 분할 (Binance Futures batchOrders 5건/요청)
+            get_limit = getattr(client, 'get_batch_order_limit', None)
+            chunks = chunk_orders(orders, get_limit(market_type) if get_limit else None)
+            jobs = [
+                BatchOrderJob(
+                    key=offset,
+                    account_id=account.id,
+                    exchange_name=account.exchange.lower(),
+                    client=client,
+                    market_type=market_type,
+                    orders=chunk
+                )
+                for offset, chunk in chunks
+            ]
 
-            # 배치 주문 생성
-            results = []
-            for order_data in orders:
-                try:
-                    result = client.create_order(
-                        symbol=order_data['symbol'],
-                        order_type=order_data['type'],
-                        side=order_data['side'],
-                        amount=order_data['amount'],
-                        price=order_data.get('price'),
-                        stop_price=order_data.get('stop_price'),
-                        market_type=market_type
-                    )
-                    results.append({'success': True, 'result': result})
-                except Exception as e:
-                    results.append({'success': False, 'error': str(e)})
+            # 청크 동시 제출 (Rate limit은 fan-out 엔진이 청크 주문 수만큼 획득)
+            chunk_results = order_fanout_engine.execute_batches(jobs)
+            result = merge_batch_results([
+                (offset, len(chunk), chunk_results.get(offset)) for offset, chunk in chunks
+            ])
 
-            logger.info(f"배치 주문 생성 완료: {len(results)}개 중 성공 {len([r for r in results if r['success']])}개")
-            return {'success': True, 'results': results}
+            summary = result['summary']
+            logger.info(
+                f"배치 주문 생성 완료: {summary['total']}개 중 성공 {summary['successful']}개 "
+                f"(요청 {result['requests']}회, {result['implementation']})"
+            )
+            return result
 
         except Exception as e:
             logger.error(f"배치 주문 생성 실패: {e}")
-            return {'success': False, 'error': str(e)}
+            return {
+                'success': False,
+                'error': str(e),
+                'results': [],
+                'summary': {'total': len(orders), 'successful': 0, 'failed': len(orders)}
+            }
 
     # @FEAT:exchange-integration @COMP:service @TYPE:core
     def get_symbol_info(self, account: Account, symbol: str) -> Dict[str, Any]:
@@ -643,7 +1108,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -671,7 +1136,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -700,7 +1165,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -729,7 +1194,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -760,7 +1225,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -788,7 +1253,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, market_type=MarketTypeEnum.FUTURES)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -817,7 +1282,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, market_type=MarketTypeEnum.FUTURES)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -846,7 +1311,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.ACCOUNT, market_type=MarketTypeEnum.FUTURES)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -877,7 +1342,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.ORDER, market_type=MarketTypeEnum.FUTURES)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -906,7 +1371,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -934,7 +1399,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -962,7 +1427,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -994,7 +1459,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1025,7 +1490,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1055,7 +1520,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1082,7 +1547,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.ACCOUNT)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1109,7 +1574,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1136,7 +1601,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1163,7 +1628,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1192,7 +1657,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.ACCOUNT, market_type=market_type)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1223,7 +1688,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1416,7 +1881,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1522,7 +1987,7 @@ class ExchangeService:
         """
         try:
             # Rate limit 체크
-            self.rate_limiter.acquire_slot(account.exchange)
+            self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
             # 클라이언트 획득
             client = self._get_client(account)
@@ -1637,7 +2102,7 @@ class ExchangeService:
             for exchange_name, account in exchange_groups.items():
                 try:
                     # Rate limit 체크
-                    self.rate_limiter.acquire_slot(account.exchange)
+                    self.rate_limiter.acquire_slot(account.exchange, account.id, EndpointClass.MARKET_DATA)
 
                     # 클라이언트 획득
                     client = self._get_client(account)
@@ -1728,7 +2193,10 @@ class ExchangeService:
                         'cache_status': str,            # 캐시 상태 ('active')
                         'cache_type': str,              # 캐시 타입 ('precision_info')
                         'supported_exchanges': int,     # 지원되는 거래소 수
-                        'last_updated': float           # 마지막 업데이트 시간 (Unix timestamp)
+                        'last_updated': float,          # 마지막 업데이트 시간 (Unix timestamp)
+                        'total_markets': int,           # 공유 저장소 전체 마켓 수
+                        'version': int,                 # 저장소 스냅샷 버전 (교체 횟수)
+                        'tables': Dict[str, Dict]       # 거래소_market_type별 마켓 수/경과 시간
                     }
                 }
 
@@ -1736,10 +2204,8 @@ class ExchangeService:
             없음 (모든 오류를 내부에서 처리하고 False 상태 반환)
 
         Notes:
-            - 실제 캐시 데이터는 각 거래소 클라이언트에서 관리
-            - 여기서는 시스템 수준의 기본 통계만 제공
+            - 실제 캐시 데이터는 공유 마켓 저장소(market_store)에서 관리
             - last_updated는 현재 시간으로 캐시 활성화 상태만 표시
-            - 향후 실제 캐시 크기, 히트율 등 추가 가능
 
         Examples:
             >>> stats = exchange_service.get_precision_cache_stats()
@@ -1758,17 +2224,15 @@ class ExchangeService:
             - Rate Limit: 해당 없음 (로컬 정보)
 
         Limitations:
-            - 실제 캐시 내용이나 크기 정보는 제공하지 않음
-            - 캐시 히트율이나 만료 정보는 포함되지 않음
-            - 거래소별 상세 정보는 클라이언트에서 직접 조회 필요
+            - 캐시 히트율은 포함되지 않음
         """
         try:
-            # 기본 통계 정보 반환 (실제 캐시는 클라이언트에서 관리)
             stats = {
                 'cache_status': 'active',
                 'cache_type': 'precision_info',
                 'supported_exchanges': len(self._crypto_exchanges) + len(self._securities_exchanges),
-                'last_updated': time.time()
+                'last_updated': time.time(),
+                **market_store.get_stats()
             }
 
             return {
@@ -1780,6 +2244,20 @@ class ExchangeService:
             logger.error(f"정밀도 캐시 통계 조회 실패: {e}")
             return {'success': False, 'error': str(e)}
 
+    # @FEAT:exchange-warmup @COMP:service @TYPE:helper
+    def clear_precision_cache(self, exchange_name: Optional[str] = None) -> int:
+        """
+        공유 마켓 저장소 TTL 만료 처리 (다음 load_markets에서 재조회)
+
+        테이블 자체는 유지하므로 주문 경로(force_cache)와 SymbolValidator 조회는 계속 동작합니다.
+
+        Returns:
+            int: 만료 처리된 거래소 × market_type 테이블 수
+        """
+        invalidated = market_store.invalidate(exchange_name)
+        logger.info(f"정밀도 캐시 만료 처리: {exchange_name or '전체'} ({invalidated}개 테이블)")
+        return invalidated
+
     # @FEAT:exchange-warmup @COMP:service @TYPE:helper
     def _warm_up_account_precision_cache(self, account: Account) -> Dict[str, Any]:
         """
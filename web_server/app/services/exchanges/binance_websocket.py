@@ -31,10 +31,14 @@ class BinanceWebSocket:
     - Listen Key 생성/갱신 (30분마다)
     - ORDER_TRADE_UPDATE 이벤트 수신
     - OrderFillMonitor에 이벤트 전달
+    - ACCOUNT_UPDATE 이벤트 → BalanceSyncService에 잔고 변경 표시
+    - Ping/Pong 하트비트 → WebSocketManager에 수신 시각 기록
     """
 
     BASE_URL = 'https://fapi.binance.com'
     WS_URL = 'wss://fstream.binance.com/ws'
+    HEARTBEAT_INTERVAL = 20  # 초
+    HEARTBEAT_TIMEOUT = 10  # 초
 
     def __init__(self, account: Account, manager: 'WebSocketManager'):
         self.account = account
@@ -43,6 +47,7 @@ class BinanceWebSocket:
         self.ws: Optional[websockets.WebSocketClientProtocol] = None
         self._running = False
         self._renew_task: Optional[asyncio.Task] = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
 
     # @FEAT:order-tracking @FEAT:exchange-integration @COMP:service @TYPE:integration
     async def create_listen_key(self) -> str:
@@ -113,17 +118,46 @@ class BinanceWebSocket:
                 logger.error(f"❌ Listen Key 갱신 오류: {e}", exc_info=True)
                 # 오류 발생해도 루프 계속 실행
 
+    # @FEAT:order-tracking @FEAT:exchange-integration @COMP:service @TYPE:helper
+    async def heartbeat(self):
+        """Ping/Pong 하트비트 (20초마다)
+
+        User Data Stream은 이벤트가 없으면 메시지가 오지 않으므로, pong 수신으로
+        스트림 수신 시각을 갱신합니다 (미체결 주문 동기화의 스트림 건강 상태 판단용).
+        """
+        while self._running:
+            try:
+                await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+
+                if not self._running or not self.ws or self.ws.closed:
+                    break
+
+                pong_waiter = await self.ws.ping()
+                await asyncio.wait_for(pong_waiter, timeout=self.HEARTBEAT_TIMEOUT)
+                self.manager.mark_activity(self.account.id)
+
+            except asyncio.CancelledError:
+                break
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️ Pong 응답 없음 ({self.HEARTBEAT_TIMEOUT}초) - 계정: {self.account.id}")
+            except Exception as e:
+                logger.debug(f"하트비트 오류 - 계정: {self.account.id}: {e}")
+
+    async def _cancel_background_tasks(self):
+        for task in (self._renew_task, self._heartbeat_task):
+            if task and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError as e:
+                    logger.debug(f"백그라운드 태스크 취소 완료 - 계정: {self.account.id}: {e}")
+
     # @FEAT:order-tracking @FEAT:exchange-integration @COMP:service @TYPE:core
     async def connect(self):
         """WebSocket 연결"""
         try:
-            # 기존 갱신 태스크 취소
-            if hasattr(self, '_renew_task') and self._renew_task and not self._renew_task.done():
-                self._renew_task.cancel()
-                try:
-                    await self._renew_task
-                except asyncio.CancelledError as e:
-                    logger.debug(f"갱신 태스크 취소 완료 - 계정: {self.account.id}: {e}")
+            # 기존 갱신/하트비트 태스크 취소
+            await self._cancel_background_tasks()
 
             # Listen Key 생성
             self.listen_key = await self.create_listen_key()
@@ -137,8 +171,11 @@ class BinanceWebSocket:
             self._running = True
             logger.info(f"✅ Binance WebSocket 연결 완료 - 계정: {self.account.id}")
 
-            # 갱신 태스크 재시작
+            self.manager.mark_activity(self.account.id)
+
+            # 갱신/하트비트 태스크 재시작
             self._renew_task = asyncio.create_task(self.renew_listen_key())
+            self._heartbeat_task = asyncio.create_task(self.heartbeat())
 
             # 메시지 수신 시작
             await self._receive_messages()
@@ -152,12 +189,7 @@ class BinanceWebSocket:
         """WebSocket 연결 종료"""
         self._running = False
 
-        if self._renew_task:
-            self._renew_task.cancel()
-            try:
-                await self._renew_task
-            except asyncio.CancelledError as e:
-                logger.debug(f"갱신 태스크 취소 완료 (disconnect) - 계정: {self.account.id}: {e}")
+        await self._cancel_background_tasks()
 
         if self.ws:
             await self.ws.close()
@@ -172,6 +204,8 @@ class BinanceWebSocket:
                 if not self._running:
                     break
 
+                self.manager.mark_activity(self.account.id)
+
                 try:
                     data = json.loads(message)
                     await self.on_message(data)
@@ -218,8 +252,10 @@ class BinanceWebSocket:
             if event_type == 'ORDER_TRADE_UPDATE':
                 await self._handle_order_update(data['o'])
             elif event_type == 'ACCOUNT_UPDATE':
-                # 계정 업데이트 이벤트 (선택적 처리)
+                # 잔고/포지션 변경 → 다음 잔고 동기화에서 선물 잔고 재조회
                 logger.debug(f"📊 계정 업데이트 이벤트 수신 - 계정: {self.account.id}")
+                from app.services.balance_sync import balance_sync_service
+                balance_sync_service.mark_stream_event(self.account.id)
             else:
                 logger.debug(f"📊 알 수 없는 이벤트: {event_type}")
 
@@ -250,7 +286,8 @@ class BinanceWebSocket:
                 account_id=self.account.id,
                 exchange_order_id=order_id,
                 symbol=symbol,
-                status=status
+                status=status,
+                payload=order_data
             )
 
         except Exception as e:
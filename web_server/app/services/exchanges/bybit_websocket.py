@@ -29,7 +29,7 @@ class BybitWebSocket:
 
     핵심 기능:
     - HMAC SHA256 인증
-    - order 토픽 구독
+    - order 토픽 구독 (+ wallet 토픽: 잔고 변경 알림)
     - 주문 상태 변경 이벤트 수신
     """
 
@@ -132,6 +132,7 @@ class BybitWebSocket:
             self._running = True
 
             logger.info(f"✅ Bybit WebSocket 연결 완료 - 계정: {self.account.id}")
+            self.manager.mark_activity(self.account.id)
 
             # 인증
             await self.authenticate()
@@ -171,13 +172,14 @@ class BybitWebSocket:
     async def subscribe_orders(self):
         """order 토픽 구독"""
         try:
+            # wallet: 잔고 변경 알림 (BalanceSyncService 증분 조회용)
             subscribe_message = {
                 "op": "subscribe",
-                "args": ["order"]
+                "args": ["order", "wallet"]
             }
 
             await self.ws.send(json.dumps(subscribe_message))
-            logger.info(f"✅ Bybit order 토픽 구독 완료 - 계정: {self.account.id}")
+            logger.info(f"✅ Bybit order/wallet 토픽 구독 완료 - 계정: {self.account.id}")
 
         except Exception as e:
             logger.error(f"❌ Bybit order 토픽 구독 실패 - 계정: {self.account.id}, 오류: {e}")
@@ -191,6 +193,8 @@ class BybitWebSocket:
                 if not self._running:
                     break
 
+                self.manager.mark_activity(self.account.id)
+
                 try:
                     data = json.loads(message)
                     await self.on_message(data)
@@ -239,6 +243,10 @@ class BybitWebSocket:
                 order_list = data.get('data', [])
                 for order_data in order_list:
                     await self._handle_order_update(order_data)
+            elif topic == 'wallet':
+                # 잔고 변경 → 다음 잔고 동기화에서 재조회
+                from app.services.balance_sync import balance_sync_service
+                balance_sync_service.mark_stream_event(self.account.id)
             elif data.get('op') == 'pong':
                 # Pong 응답
                 logger.debug(f"🏓 Pong 수신 - 계정: {self.account.id}")
@@ -272,7 +280,8 @@ class BybitWebSocket:
                 account_id=self.account.id,
                 exchange_order_id=order_id,
                 symbol=symbol,
-                status=status
+                status=status,
+                payload=order_data
             )
 
         except Exception as e:
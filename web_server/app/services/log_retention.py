@@ -0,0 +1,298 @@
+# @FEAT:log-retention @COMP:service @TYPE:core
+"""
+추가 전용(append-only) 로그 테이블의 월별 파티션 관리 및 보존 정책
+
+대상: webhook_logs(received_at), tracking_logs(created_at), order_fill_events(created_at)
+
+- PostgreSQL: migrations/20251113_partition_log_tables.py로 월별 RANGE 파티션 테이블로 전환된 경우
+  - ensure_partitions(): 이번 달부터 LOG_PARTITION_MONTHS_AHEAD개월 앞까지 파티션을 미리 생성
+  - apply_retention(): 보존 기간이 지난 월 파티션을 DETACH 후 DROP (행 수와 무관한 O(1)),
+    DEFAULT 파티션(월 파티션 범위 밖의 행)은 보존 기간이 지난 행을 DELETE
+- 그 외(파티션 미전환, SQLite 등): 보존 기간이 지난 행을 DELETE로 정리
+- LOG_ARCHIVE_ENABLED이면 제거 전에 LOG_ARCHIVE_DIR에 gzip CSV로 내보냄
+  (파티션: 분리 전 COPY ... TO STDOUT, 그 외: SELECT 결과를 LOG_ARCHIVE_BATCH_SIZE행 단위로 스트리밍)
+
+매일 maintain_log_partitions 백그라운드 작업이 두 단계를 순서대로 실행합니다.
+"""
+
+import csv
+import gzip
+import itertools
+import logging
+import os
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from app import db
+
+logger = logging.getLogger(__name__)
+
+# 파티션 대상 테이블 → 파티션 키 컬럼
+PARTITIONED_LOG_TABLES = {
+    'webhook_logs': 'received_at',
+    'tracking_logs': 'created_at',
+    'order_fill_events': 'created_at',
+}
+
+# 테이블별 보존 기간 (일, 0이면 무기한 보존)
+LOG_RETENTION_DAYS = {
+    'webhook_logs': int(os.getenv('WEBHOOK_LOG_RETENTION_DAYS', '90')),
+    'tracking_logs': int(os.getenv('TRACKING_LOG_RETENTION_DAYS', '90')),
+    'order_fill_events': int(os.getenv('ORDER_FILL_EVENT_RETENTION_DAYS', '180')),
+}
+# 미리 만들어 둘 미래 파티션 개월 수
+LOG_PARTITION_MONTHS_AHEAD = int(os.getenv('LOG_PARTITION_MONTHS_AHEAD', '2'))
+# 제거 전 gzip CSV 내보내기
+LOG_ARCHIVE_ENABLED = os.getenv('LOG_ARCHIVE_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+LOG_ARCHIVE_DIR = os.getenv('LOG_ARCHIVE_DIR', 'logs/archive')
+# DELETE 대상 행 아카이브 시 한 번에 가져올 행 수 (서버 측 커서 스트리밍)
+LOG_ARCHIVE_BATCH_SIZE = int(os.getenv('LOG_ARCHIVE_BATCH_SIZE', '5000'))
+
+_PARTITION_SUFFIX = re.compile(r'_p(\d{4})(\d{2})$')
+
+
+def month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    """월 단위 이동 (value는 월 첫날)"""
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    """월 파티션 이름 (예: webhook_logs_p202511)"""
+    return f"{table}_p{month.year:04d}{month.month:02d}"
+
+
+def parse_partition_month(table: str, name: str) -> Optional[date]:
+    """파티션 이름 → 월 첫날 (월 파티션이 아니면 None, 예: DEFAULT 파티션)"""
+    if not name.startswith(f"{table}_p"):
+        return None
+    match = _PARTITION_SUFFIX.search(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+# @FEAT:log-retention @COMP:service @TYPE:core
+class LogRetentionService:
+    """로그 테이블 파티션 생성 / 보존 기간 경과 데이터 제거"""
+
+    def __init__(self, archive_dir: str = LOG_ARCHIVE_DIR):
+        self.archive_dir = archive_dir
+
+    # ------------------------------------------------------------------
+    # 파티션 관리 (PostgreSQL)
+    # ------------------------------------------------------------------
+    def is_partitioned(self, table: str) -> bool:
+        """PostgreSQL 파티션 테이블 여부"""
+        if db.engine.dialect.name != 'postgresql':
+            return False
+        result = db.session.execute(text("""
+            SELECT EXISTS (
+                SELECT 1 FROM pg_partitioned_table pt
+                JOIN pg_class c ON c.oid = pt.partrelid
+                WHERE c.relname = :table
+            )
+        """), {'table': table})
+        return bool(result.scalar())
+
+    def list_partitions(self, table: str) -> List[Tuple[str, date]]:
+        """월 파티션 목록 [(이름, 월 첫날)] (월 오름차순, DEFAULT 파티션 제외)"""
+        rows = db.session.execute(text("""
+            SELECT child.relname
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = :table
+        """), {'table': table})
+
+        partitions = []
+        for (name,) in rows:
+            month = parse_partition_month(table, name)
+            if month:
+                partitions.append((name, month))
+        return sorted(partitions, key=lambda item: item[1])
+
+    def default_partition(self, table: str) -> Optional[str]:
+        """DEFAULT 파티션 이름 (없으면 None)"""
+        result = db.session.execute(text("""
+            SELECT child.relname
+            FROM pg_inherits i
+            JOIN pg_class parent ON parent.oid = i.inhparent
+            JOIN pg_class child ON child.oid = i.inhrelid
+            WHERE parent.relname = :table
+              AND pg_get_expr(child.relpartbound, child.oid) = 'DEFAULT'
+        """), {'table': table})
+        return result.scalar()
+
+    def ensure_partitions(self, months_ahead: int = LOG_PARTITION_MONTHS_AHEAD,
+                          today: Optional[date] = None) -> Dict[str, List[str]]:
+        """이번 달 ~ months_ahead개월 뒤 파티션 생성 (이미 있으면 건너뜀)"""
+        current = month_start(today or datetime.utcnow().date())
+        created: Dict[str, List[str]] = {}
+
+        for table in PARTITIONED_LOG_TABLES:
+            if not self.is_partitioned(table):
+                continue
+
+            existing = {name for name, _ in self.list_partitions(table)}
+            for offset in range(months_ahead + 1):
+                month = add_months(current, offset)
+                name = partition_name(table, month)
+                if name in existing:
+                    continue
+                try:
+                    db.session.execute(text(
+                        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+                        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+                    ))
+                    db.session.commit()
+                    created.setdefault(table, []).append(name)
+                except Exception as e:
+                    # DEFAULT 파티션에 해당 월 행이 이미 있으면 생성 불가 → 다음 실행에서 재시도
+                    db.session.rollback()
+                    logger.error("로그 파티션 생성 실패 - %s: %s", name, e)
+
+        if created:
+            logger.info("🗂️ 로그 파티션 생성: %s", created)
+        return created
+
+    # ------------------------------------------------------------------
+    # 보존 정책
+    # ------------------------------------------------------------------
+    def apply_retention(self, today: Optional[date] = None,
+                        archive: bool = LOG_ARCHIVE_ENABLED) -> Dict[str, Dict[str, Any]]:
+        """
+        보존 기간이 지난 데이터 제거
+
+        Returns:
+            {table: {'cutoff', 'dropped_partitions', 'deleted_rows', 'archives'}}
+        """
+        today = today or datetime.utcnow().date()
+        results: Dict[str, Dict[str, Any]] = {}
+
+        for table, column in PARTITIONED_LOG_TABLES.items():
+            retention_days = LOG_RETENTION_DAYS.get(table, 0)
+            if retention_days <= 0:
+                continue
+
+            cutoff = today - timedelta(days=retention_days)
+            result = {'cutoff': cutoff.isoformat(), 'dropped_partitions': [], 'deleted_rows': 0, 'archives': []}
+            try:
+                if self.is_partitioned(table):
+                    self._drop_expired_partitions(table, cutoff, archive, result)
+                    default = self.default_partition(table)
+                    if default:
+                        self._delete_expired_rows(default, column, cutoff, archive, result)
+                else:
+                    self._delete_expired_rows(table, column, cutoff, archive, result)
+            except Exception as e:
+                db.session.rollback()
+                logger.error("로그 보존 정책 적용 실패 - %s: %s", table, e)
+                result['error'] = str(e)
+            results[table] = result
+
+        logger.info("🧹 로그 보존 정책 적용 완료: %s", {
+            table: (len(r['dropped_partitions']), r['deleted_rows']) for table, r in results.items()
+        })
+        return results
+
+    def _drop_expired_partitions(self, table: str, cutoff: date, archive: bool,
+                                 result: Dict[str, Any]) -> None:
+        """
+        상한(다음 달 1일)이 cutoff 이하인 월 파티션을 (내보내기) → DETACH → DROP
+
+        내보내기는 파티션이 붙어 있는 상태에서 먼저 수행하고, DETACH와 DROP은 한 트랜잭션으로
+        커밋합니다. 어느 단계가 실패해도 파티션은 붙은 채로 남아 다음 실행에서 재시도됩니다.
+        """
+        for name, month in self.list_partitions(table):
+            if add_months(month, 1) > cutoff:
+                break
+
+            if archive:
+                result['archives'].append(self._archive_table(name))
+
+            db.session.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+            db.session.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            db.session.commit()
+            result['dropped_partitions'].append(name)
+            logger.info("🗑️ 로그 파티션 제거: %s", name)
+
+    def _delete_expired_rows(self, table: str, column: str, cutoff: date, archive: bool,
+                             result: Dict[str, Any]) -> None:
+        """파티션 미전환 테이블 / DEFAULT 파티션: cutoff 이전 행 DELETE"""
+        cutoff_time = datetime.combine(cutoff, datetime.min.time())
+        condition = f"{column} < :cutoff"
+
+        if archive:
+            rows = db.session.execute(
+                text(f"SELECT * FROM {table} WHERE {condition} ORDER BY id")
+                .execution_options(yield_per=LOG_ARCHIVE_BATCH_SIZE),
+                {'cutoff': cutoff_time}
+            )
+            columns = list(rows.keys())
+            first = rows.fetchone()
+            if first is not None:
+                result['archives'].append(self._write_csv_archive(
+                    f"{table}_before_{cutoff.strftime('%Y%m%d')}", columns,
+                    itertools.chain((first,), rows)
+                ))
+            rows.close()
+
+        deleted = db.session.execute(
+            text(f"DELETE FROM {table} WHERE {condition}"), {'cutoff': cutoff_time}
+        )
+        db.session.commit()
+        result['deleted_rows'] += deleted.rowcount or 0
+
+    # ------------------------------------------------------------------
+    # 아카이브
+    # ------------------------------------------------------------------
+    def _archive_path(self, name: str) -> Path:
+        directory = Path(self.archive_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        return directory / f"{name}.csv.gz"
+
+    def _archive_table(self, name: str) -> str:
+        """분리된 파티션 전체를 COPY로 gzip CSV 내보내기"""
+        path = self._archive_path(name)
+        raw_connection = db.engine.raw_connection()
+        try:
+            cursor = raw_connection.cursor()
+            with gzip.open(path, 'wb') as archive_file:
+                cursor.copy_expert(f"COPY {name} TO STDOUT WITH CSV HEADER", archive_file)
+            cursor.close()
+        finally:
+            raw_connection.close()
+        logger.info("📦 로그 파티션 아카이브: %s", path)
+        return str(path)
+
+    def _write_csv_archive(self, name: str, columns: List[str], records: Iterable) -> str:
+        """행 이터러블을 순서대로 gzip CSV에 기록 (전체를 메모리에 올리지 않음)"""
+        path = self._archive_path(name)
+        count = 0
+        with gzip.open(path, 'wt', newline='', encoding='utf-8') as archive_file:
+            writer = csv.writer(archive_file)
+            writer.writerow(columns)
+            for record in records:
+                writer.writerow(record)
+                count += 1
+        logger.info("📦 로그 아카이브 (%s행): %s", count, path)
+        return str(path)
+
+    def maintain(self) -> Dict[str, Any]:
+        """미래 파티션 생성 후 보존 정책 적용 (일일 백그라운드 작업)"""
+        return {
+            'created_partitions': self.ensure_partitions(),
+            'retention': self.apply_retention(),
+        }
+
+
+log_retention_service = LogRetentionService()
@@ -0,0 +1,134 @@
+# @FEAT:symbol-validation @COMP:service @TYPE:core
+"""
+MarketInfo 테이블 스냅샷 저장/복원
+
+기동 시 거래소 × market_type마다 수 MB의 exchangeInfo를 순차로 내려받으면
+서버 시작이 네트워크에 묶이고, 한 곳이라도 실패하면 시작 자체가 중단됩니다.
+마지막으로 파싱한 MarketInfo 테이블을 market_metadata_snapshots 테이블에
+압축 저장해 두고, 기동 시에는 한 번의 SELECT로 복원합니다.
+
+- payload: 심볼당 한 행(list)인 JSON을 zlib 압축 (Decimal은 문자열로 보존)
+- schema_version이 다르거나 MARKET_SNAPSHOT_MAX_AGE_HOURS보다 오래된 스냅샷은 무시
+- precision_provider는 직렬화하지 않음 (복원 후 거래소 클라이언트가 다시 생성)
+"""
+
+import json
+import logging
+import os
+import zlib
+from dataclasses import fields
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+from app import db
+from app.exchanges.models import MarketInfo
+
+logger = logging.getLogger(__name__)
+
+# payload 형식 버전 (MarketInfo 필드 구성이 바뀌면 증가 → 이전 스냅샷 무시)
+SNAPSHOT_SCHEMA_VERSION = 1
+
+MARKET_SNAPSHOT_ENABLED = os.getenv('MARKET_SNAPSHOT_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+# 이보다 오래된 스냅샷은 복원하지 않음 (시간, 0이면 무제한)
+MARKET_SNAPSHOT_MAX_AGE_HOURS = int(os.getenv('MARKET_SNAPSHOT_MAX_AGE_HOURS', '72'))
+
+# 직렬화 대상 필드 (precision_provider 제외, dataclass 선언 순서)
+_SNAPSHOT_FIELDS = tuple(f.name for f in fields(MarketInfo) if f.name != 'precision_provider')
+_DECIMAL_FIELDS = frozenset(f.name for f in fields(MarketInfo) if f.type in (Decimal, 'Decimal'))
+
+SnapshotKey = Tuple[str, str]
+
+
+def encode_markets(markets: Dict[str, MarketInfo]) -> bytes:
+    """{심볼 키: MarketInfo} → 압축 payload"""
+    rows = []
+    for key, info in markets.items():
+        row = [key]
+        for name in _SNAPSHOT_FIELDS:
+            value = getattr(info, name)
+            row.append(str(value) if name in _DECIMAL_FIELDS else value)
+        rows.append(row)
+    body = json.dumps({'fields': _SNAPSHOT_FIELDS, 'rows': rows}, separators=(',', ':'))
+    return zlib.compress(body.encode('utf-8'))
+
+
+def decode_markets(payload: bytes) -> Dict[str, MarketInfo]:
+    """압축 payload → {심볼 키: MarketInfo} (precision_provider는 None)"""
+    body = json.loads(zlib.decompress(payload))
+    names = body['fields']
+    decimal_index = [i for i, name in enumerate(names) if name in _DECIMAL_FIELDS]
+
+    markets = {}
+    for row in body['rows']:
+        values = row[1:]
+        for i in decimal_index:
+            values[i] = Decimal(values[i])
+        markets[row[0]] = MarketInfo(**dict(zip(names, values)))
+    return markets
+
+
+# @FEAT:symbol-validation @COMP:service @TYPE:core
+class MarketSnapshotStore:
+    """market_metadata_snapshots 테이블 읽기/쓰기 (app context 필요)"""
+
+    def load_all(self) -> Dict[SnapshotKey, Tuple[Dict[str, MarketInfo], datetime]]:
+        """
+        유효한 스냅샷 전체 복원
+
+        Returns:
+            {(exchange, market_type): ({심볼 키: MarketInfo}, fetched_at)}
+            손상/구버전/만료 스냅샷은 건너뜀
+        """
+        from app.models import MarketMetadataSnapshot
+
+        if not MARKET_SNAPSHOT_ENABLED:
+            return {}
+
+        cutoff = None
+        if MARKET_SNAPSHOT_MAX_AGE_HOURS > 0:
+            cutoff = datetime.utcnow() - timedelta(hours=MARKET_SNAPSHOT_MAX_AGE_HOURS)
+
+        loaded = {}
+        for row in MarketMetadataSnapshot.query.all():
+            key = (row.exchange, row.market_type)
+            if row.schema_version != SNAPSHOT_SCHEMA_VERSION:
+                logger.info(f"ℹ️ 스냅샷 형식 버전 불일치로 무시: {key} (v{row.schema_version})")
+                continue
+            if cutoff is not None and row.fetched_at < cutoff:
+                logger.info(f"ℹ️ 오래된 스냅샷 무시: {key} (fetched_at={row.fetched_at})")
+                continue
+            try:
+                loaded[key] = (decode_markets(row.payload), row.fetched_at)
+            except Exception as e:
+                logger.warning(f"⚠️ 스냅샷 복원 실패 (무시): {key}: {e}")
+        return loaded
+
+    def save(self, exchange: str, market_type: str, markets: Dict[str, MarketInfo],
+             fetched_at: Optional[datetime] = None) -> bool:
+        """스냅샷 저장 (거래소 × market_type 단위 upsert, 실패해도 예외 전파 안 함)"""
+        from app.models import MarketMetadataSnapshot
+
+        if not MARKET_SNAPSHOT_ENABLED or not markets:
+            return False
+
+        try:
+            db.session.merge(MarketMetadataSnapshot(
+                exchange=exchange.lower(),
+                market_type=market_type.lower(),
+                schema_version=SNAPSHOT_SCHEMA_VERSION,
+                market_count=len(markets),
+                payload=encode_markets(markets),
+                fetched_at=fetched_at or datetime.utcnow(),
+                updated_at=datetime.utcnow()
+            ))
+            db.session.commit()
+            return True
+        except Exception as e:
+            db.session.rollback()
+            logger.warning(f"⚠️ 스냅샷 저장 실패: {exchange} {market_type}: {e}")
+            return False
+
+
+# 전역 인스턴스
+market_snapshot_store = MarketSnapshotStore()
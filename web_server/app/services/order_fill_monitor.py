@@ -3,18 +3,38 @@
 
 WebSocket 이벤트 수신 → REST API 확인 → DB 업데이트 → 재정렬 트리거
 
+ORDER_FILL_TRUST_STREAM=true 이면 ORDER_TRADE_UPDATE(Binance)/order 토픽(Bybit) 페이로드의
+상태/누적 체결 수량/평균가를 그대로 적용하고, 다음 경우에만 REST로 재확인합니다.
+- 페이로드 파싱 실패 또는 알 수 없는 상태
+- 체결 상태인데 체결 수량/평균가 누락
+- 누적 체결 수량 역행, 종료 상태 이후 이벤트
+- 이벤트 누락 (직전 누적 수량 + 이번 체결 수량 ≠ 누적 수량)
+주문별 (갱신 시각, 누적 수량, 상태 순위)보다 오래되거나 같은 이벤트는 중복으로 무시합니다.
+
+DB 반영은 모드와 관계없이 전용 writer 스레드에서 수행하여 WebSocket 이벤트 루프를 막지 않습니다
+(같은 계좌+심볼은 항상 같은 스레드 → 포지션 갱신 순서 보장).
+writer 큐는 크기가 제한되어 DB 지연 시 이벤트 수신 측에 역압을 걸고, 종료 시(atexit) 남은 항목을 모두 반영한 뒤 종료합니다.
+
 @FEAT:order-tracking @FEAT:trade-execution @FEAT:event-sse @COMP:service @TYPE:integration
 """
 
 import asyncio
+import atexit
 import logging
-from decimal import Decimal
-from typing import Dict, Any, Optional
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Dict, Any, List, Optional, Tuple
 from flask import Flask
 
 from app import db
 from app.models import OpenOrder, Account
 from app.services.exchange import exchange_service
+from app.utils.db_pool import DB_POOL_ROLE_FILL_MONITOR, db_pool_role
 from app.utils.symbol_utils import (
     from_binance_format,
     from_upbit_format,
@@ -24,6 +44,182 @@ from app.utils.symbol_utils import (
 
 logger = logging.getLogger(__name__)
 
+# WebSocket 페이로드 직접 적용 모드 (기본: 이벤트마다 REST 재확인)
+ORDER_FILL_TRUST_STREAM = os.getenv('ORDER_FILL_TRUST_STREAM', 'false').lower() in ('1', 'true', 'yes')
+# DB 반영 전용 스레드 수 (계좌+심볼 단위로 분배)
+ORDER_FILL_WRITER_THREADS = int(os.getenv('ORDER_FILL_WRITER_THREADS', '2'))
+# writer 스레드별 대기열 한도 (가득 차면 즉시 드롭 - 이벤트 루프 비차단, 주기적 미체결 동기화가 복구)
+ORDER_FILL_WRITER_QUEUE_MAX = int(os.getenv('ORDER_FILL_WRITER_QUEUE_MAX', '10000'))
+# 종료 시 남은 대기열을 반영하는 최대 대기 시간(초)
+ORDER_FILL_WRITER_DRAIN_TIMEOUT = float(os.getenv('ORDER_FILL_WRITER_DRAIN_TIMEOUT', '30'))
+# 주문별 마지막 적용 이벤트 보관 수 (중복/역순 이벤트 판별용, 초과 시 오래된 주문부터 제거)
+ORDER_FILL_STATE_MAX = 10000
+
+TERMINAL_STATUSES = ('FILLED', 'CANCELED', 'CANCELLED', 'EXPIRED')
+# 같은 갱신 시각/누적 수량일 때 뒤 상태가 앞선 것으로 판단
+STATUS_RANK = {'NEW': 0, 'PARTIALLY_FILLED': 1, 'FILLED': 2, 'CANCELED': 2, 'CANCELLED': 2, 'EXPIRED': 2}
+
+BYBIT_STATUS_MAP = {
+    'New': 'NEW',
+    'Untriggered': 'NEW',
+    'Triggered': 'NEW',
+    'PartiallyFilled': 'PARTIALLY_FILLED',
+    'Filled': 'FILLED',
+    'Cancelled': 'CANCELLED',
+    'PartiallyFilledCanceled': 'CANCELLED',
+    'Deactivated': 'CANCELLED',
+}
+
+
+def _decimal(value: Any) -> Decimal:
+    try:
+        return Decimal(str(value)) if value not in (None, '') else Decimal('0')
+    except (InvalidOperation, TypeError, ValueError):
+        return Decimal('0')
+
+
+# @FEAT:order-tracking @COMP:service @TYPE:helper
+def parse_binance_order_update(order_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Binance ORDER_TRADE_UPDATE의 'o' 객체 → order_info (REST 확인 결과와 같은 형식)"""
+    if not order_data or order_data.get('i') is None:
+        return None
+    return {
+        'exchange_order_id': str(order_data['i']),
+        'status': str(order_data.get('X') or '').upper(),
+        'filled_quantity': _decimal(order_data.get('z')),
+        'average_price': _decimal(order_data.get('ap')),
+        'last_filled_quantity': _decimal(order_data.get('l')),
+        'side': str(order_data.get('S') or '').upper(),
+        'order_type': str(order_data.get('ot') or order_data.get('o') or '').upper(),
+        'update_time': int(order_data.get('T') or 0),
+    }
+
+
+# @FEAT:order-tracking @COMP:service @TYPE:helper
+def parse_bybit_order_update(order_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Bybit order 토픽 항목 → order_info (체결 단위 수량이 없어 누락 판별은 역행 기준만 적용)"""
+    if not order_data or not order_data.get('orderId'):
+        return None
+    raw_status = order_data.get('orderStatus')
+    return {
+        'exchange_order_id': str(order_data['orderId']),
+        'status': BYBIT_STATUS_MAP.get(raw_status, str(raw_status or '').upper()),
+        'filled_quantity': _decimal(order_data.get('cumExecQty')),
+        'average_price': _decimal(order_data.get('avgPrice')),
+        'last_filled_quantity': None,
+        'side': str(order_data.get('side') or '').upper(),
+        'order_type': str(order_data.get('orderType') or '').upper(),
+        'update_time': int(order_data.get('updatedTime') or 0),
+    }
+
+
+ORDER_UPDATE_PARSERS = {
+    'BINANCE': parse_binance_order_update,
+    'BYBIT': parse_bybit_order_update,
+}
+
+
+@dataclass
+class _OrderProgress:
+    """주문별 마지막으로 적용한 이벤트"""
+    key: Tuple[int, Decimal, int]
+    filled: Decimal
+    status: str
+
+
+# @FEAT:order-tracking @COMP:service @TYPE:helper
+class _FillWriter:
+    """OpenOrder/체결 DB 반영 전용 스레드 (계좌+심볼 단위 FIFO, 크기 제한 큐)
+
+    - submit(): 이벤트 루프에서 호출되므로 대기하지 않음. 큐가 가득 차면 즉시 드롭 후 dropped 집계
+    - stop(): 남은 항목을 모두 반영한 뒤 스레드 종료 (atexit에서 호출 → 종료 시 유실 방지)
+    """
+
+    _STOP = object()
+
+    def __init__(self, monitor: 'OrderFillMonitor', threads: int = ORDER_FILL_WRITER_THREADS,
+                 maxsize: int = ORDER_FILL_WRITER_QUEUE_MAX):
+        self.monitor = monitor
+        self.queues = [queue.Queue(maxsize=max(1, maxsize)) for _ in range(max(1, threads))]
+        self.dropped = 0
+        self._threads: List[threading.Thread] = []
+        self._start_lock = threading.Lock()
+        self._stopped = False
+
+    def submit(self, account_id: int, symbol: str, order_info: Dict[str, Any], received_at: float) -> bool:
+        """DB 반영 요청 적재 (드롭 시 False)"""
+        if self._stopped:
+            logger.warning(f"⚠️ 체결 writer 종료 후 이벤트 무시 - 계정: {account_id}, 심볼: {symbol}")
+            return False
+        if not self._threads:
+            self._start()
+        shard = hash((account_id, symbol)) % len(self.queues)
+        try:
+            self.queues[shard].put_nowait((account_id, order_info, received_at))
+            return True
+        except queue.Full:
+            self.dropped += 1
+            logger.error(
+                f"❌ 체결 writer 대기열 포화 - 이벤트 드롭 "
+                f"(계정: {account_id}, 심볼: {symbol}, 주문: {order_info.get('exchange_order_id')}), "
+                f"주기적 미체결 동기화에서 복구"
+            )
+            return False
+
+    def qsize(self) -> int:
+        return sum(q.qsize() for q in self.queues)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._threads or self._stopped:
+                return
+            for index, work_queue in enumerate(self.queues):
+                thread = threading.Thread(target=self._run, args=(work_queue,),
+                                          name=f'order-fill-writer-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = ORDER_FILL_WRITER_DRAIN_TIMEOUT) -> None:
+        """남은 대기열을 모두 DB에 반영한 뒤 writer 스레드 종료"""
+        with self._start_lock:
+            if self._stopped:
+                return
+            self._stopped = True
+            threads = list(self._threads)
+
+        if not threads:
+            return
+
+        pending = self.qsize()
+        deadline = time.monotonic() + timeout
+        for work_queue in self.queues:
+            # 종료 신호는 FIFO 마지막 → 앞선 항목을 모두 처리한 뒤 스레드 종료
+            try:
+                work_queue.put(self._STOP, timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Full:
+                pass
+        for thread in threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+
+        remaining = self.qsize()
+        if remaining:
+            logger.error(f"❌ 체결 writer 종료 시간 초과 - 미반영 {remaining}건 (종료 시 대기열 {pending}건)")
+        else:
+            logger.info(f"🛑 체결 writer 종료 (종료 시 대기열 {pending}건 반영 완료)")
+
+    def _run(self, work_queue: queue.Queue) -> None:
+        while True:
+            item = work_queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                account_id, order_info, received_at = item
+                self.monitor._write_order_update(account_id, order_info, received_at)
+            except Exception as e:
+                logger.error(f"❌ 체결 DB 반영 스레드 오류: {e}", exc_info=True)
+            finally:
+                work_queue.task_done()
+
 
 # @FEAT:order-tracking @FEAT:trade-execution @COMP:service @TYPE:integration
 class OrderFillMonitor:
@@ -31,13 +227,23 @@ class OrderFillMonitor:
 
     핵심 기능:
     1. WebSocket 이벤트 수신 (from BinanceWebSocket/BybitWebSocket)
-    2. REST API로 주문 상태 확인 (신뢰도 확보)
-    3. DB 업데이트 (OpenOrder 삭제 또는 수정)
+    2. REST API로 주문 상태 확인 (신뢰도 확보) - 신뢰 모드에서는 이상/누락 시에만
+    3. DB 업데이트 (OpenOrder 삭제 또는 수정) - 전용 writer 스레드
     4. OpenOrder 상태 동기화 (Phase 4+)
     """
 
-    def __init__(self, app: Flask):
+    def __init__(self, app: Flask, trust_stream: bool = ORDER_FILL_TRUST_STREAM,
+                 writer_threads: int = ORDER_FILL_WRITER_THREADS):
         self.app = app
+        self.trust_stream = trust_stream
+        self._writer = _FillWriter(self, writer_threads)
+        self._account_exchanges: Dict[int, str] = {}
+        self._progress: 'OrderedDict[Tuple[int, str], _OrderProgress]' = OrderedDict()
+        self._progress_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = defaultdict(int)
+        self._rest_reasons = defaultdict(int)
+        self._latency_ms = {'count': 0, 'total': 0.0, 'max': 0.0}
 
     # @FEAT:order-tracking @FEAT:trade-execution @COMP:service @TYPE:core
     async def on_order_update(
@@ -45,7 +251,8 @@ class OrderFillMonitor:
         account_id: int,
         exchange_order_id: str,
         symbol: str,
-        status: str
+        status: str,
+        payload: Optional[Dict[str, Any]] = None
     ):
         """WebSocket 이벤트 수신 시 호출됨
 
@@ -54,7 +261,9 @@ class OrderFillMonitor:
             exchange_order_id: 거래소 주문 ID
             symbol: 심볼 (예: "BTCUSDT" - 거래소 네이티브 포맷)
             status: WebSocket에서 받은 상태 (예: "FILLED")
+            payload: 거래소 원본 주문 이벤트 (신뢰 모드에서 직접 적용)
         """
+        received_at = time.monotonic()
         try:
             logger.info(
                 f"📦 주문 업데이트 이벤트 수신 - "
@@ -65,32 +274,29 @@ class OrderFillMonitor:
             # Step 0: 거래소별 심볼 포맷 정규화
             normalized_symbol = symbol  # 기본값: 원본 유지
             try:
-                # 계좌 정보로 거래소 확인
-                with self.app.app_context():
-                    account = Account.query.get(account_id)
-                    if not account:
-                        logger.error(f"❌ 계좌를 찾을 수 없음: account_id={account_id}")
-                        return
-
-                    exchange_name = account.exchange.upper()
-
-                    # 거래소별 심볼 포맷 변환
-                    if exchange_name == 'BINANCE':
-                        normalized_symbol = from_binance_format(symbol)  # BTCUSDT → BTC/USDT
-                        logger.debug(f"🔄 Binance 심볼 변환: {symbol} → {normalized_symbol}")
-                    elif exchange_name == 'UPBIT':
-                        normalized_symbol = from_upbit_format(symbol)    # KRW-BTC → BTC/KRW
-                        logger.debug(f"🔄 Upbit 심볼 변환: {symbol} → {normalized_symbol}")
-                    elif exchange_name == 'BITHUMB':
-                        normalized_symbol = from_bithumb_format(symbol)  # KRW-BTC → BTC/KRW
-                        logger.debug(f"🔄 Bithumb 심볼 변환: {symbol} → {normalized_symbol}")
-                    else:
-                        # 알 수 없는 거래소 또는 이미 표준 포맷
-                        normalized_symbol = symbol
-                        logger.warning(
-                            f"⚠️ 알 수 없는 거래소 또는 표준 포맷: "
-                            f"exchange={exchange_name}, symbol={symbol}"
-                        )
+                # 계좌 정보로 거래소 확인 (계좌별 1회만 DB 조회)
+                exchange_name = self._get_account_exchange(account_id)
+                if not exchange_name:
+                    logger.error(f"❌ 계좌를 찾을 수 없음: account_id={account_id}")
+                    return
+
+                # 거래소별 심볼 포맷 변환
+                if exchange_name in ('BINANCE', 'BYBIT'):
+                    normalized_symbol = from_binance_format(symbol)  # BTCUSDT → BTC/USDT
+                    logger.debug(f"🔄 {exchange_name} 심볼 변환: {symbol} → {normalized_symbol}")
+                elif exchange_name == 'UPBIT':
+                    normalized_symbol = from_upbit_format(symbol)    # KRW-BTC → BTC/KRW
+                    logger.debug(f"🔄 Upbit 심볼 변환: {symbol} → {normalized_symbol}")
+                elif exchange_name == 'BITHUMB':
+                    normalized_symbol = from_bithumb_format(symbol)  # KRW-BTC → BTC/KRW
+                    logger.debug(f"🔄 Bithumb 심볼 변환: {symbol} → {normalized_symbol}")
+                else:
+                    # 알 수 없는 거래소 또는 이미 표준 포맷
+                    normalized_symbol = symbol
+                    logger.warning(
+                        f"⚠️ 알 수 없는 거래소 또는 표준 포맷: "
+                        f"exchange={exchange_name}, symbol={symbol}"
+                    )
 
             except SymbolFormatError as e:
                 logger.error(
@@ -109,40 +315,173 @@ class OrderFillMonitor:
                 # 정규화 실패 시 원본 사용 (하위 호환성)
                 normalized_symbol = symbol
 
-            # Step 1: REST API로 주문 상태 확인 (정규화된 심볼 사용)
-            confirmed_order = await self._confirm_order_status(
-                account_id, exchange_order_id, normalized_symbol
-            )
-
-            if not confirmed_order:
-                logger.warning(
-                    f"⚠️ REST API 주문 확인 실패 - "
-                    f"주문 ID: {exchange_order_id}, 심볼: {normalized_symbol}, DB 업데이트 스킵"
+            # Step 1: 신뢰 모드 - 페이로드 직접 적용 (이상/누락 시에만 REST 확인)
+            order_info = None
+            stream_info = None
+            if self.trust_stream and payload is not None:
+                parser = ORDER_UPDATE_PARSERS.get(self._account_exchanges.get(account_id, ''))
+                stream_info = parser(payload) if parser else None
+                decision = self._classify_stream_update(account_id, stream_info)
+
+                if decision == 'duplicate':
+                    self._count('duplicates_skipped')
+                    logger.debug(f"중복/이전 주문 이벤트 무시 - 주문 ID: {exchange_order_id}")
+                    return
+                if decision == 'apply':
+                    order_info = stream_info
+                    order_info['source'] = 'stream'
+                    self._count('stream_applied')
+                else:
+                    with self._stats_lock:
+                        self._rest_reasons[decision] += 1
+                    logger.info(f"🔍 주문 이벤트 REST 재확인 ({decision}) - 주문 ID: {exchange_order_id}")
+
+            # Step 2: REST API로 주문 상태 확인 (정규화된 심볼 사용)
+            if order_info is None:
+                confirmed_order = await self._confirm_order_status(
+                    account_id, exchange_order_id, normalized_symbol
                 )
-                return
-
-            # Step 2: DB 업데이트 + 재정렬 (트랜잭션 통합)
-            confirmed_status = confirmed_order.get('status', '').upper()
 
-            with self.app.app_context():
-                try:
-                    # DB 업데이트 (커밋하지 않음)
-                    self._update_order_in_db(confirmed_order, commit=False)
+                if not confirmed_order:
+                    logger.warning(
+                        f"⚠️ REST API 주문 확인 실패 - "
+                        f"주문 ID: {exchange_order_id}, 심볼: {normalized_symbol}, DB 업데이트 스킵"
+                    )
+                    return
 
-                    # Phase 5: 재정렬 로직 완전 제거됨 (Queue 인프라 제거)
-                    # 모든 작업 성공 시 한 번에 커밋
-                    db.session.commit()
+                order_info = confirmed_order
+                self._count('rest_confirmed')
+                if self.trust_stream:
+                    order_info['source'] = 'rest'
+                    order_info['update_time'] = (stream_info or {}).get('update_time', 0)
+                    self._remember(account_id, order_info)
 
-                except Exception as e:
-                    db.session.rollback()
-                    logger.error(
-                        f"❌ WebSocket 트리거 처리 실패 - {normalized_symbol}: {e}",
-                        exc_info=True
-                    )
+            # Step 3: DB 업데이트 + 재정렬 (전용 스레드, 이벤트 루프 비차단)
+            self._writer.submit(account_id, normalized_symbol, order_info, received_at)
 
         except Exception as e:
             logger.error(f"❌ 주문 업데이트 처리 실패: {e}", exc_info=True)
 
+    def _get_account_exchange(self, account_id: int) -> Optional[str]:
+        exchange_name = self._account_exchanges.get(account_id)
+        if exchange_name is None:
+            with self.app.app_context(), db_pool_role(DB_POOL_ROLE_FILL_MONITOR):
+                account = db.session.get(Account, account_id)
+                if not account:
+                    return None
+                exchange_name = account.exchange.upper()
+            self._account_exchanges[account_id] = exchange_name
+        return exchange_name
+
+    # @FEAT:order-tracking @COMP:service @TYPE:validation
+    def _classify_stream_update(self, account_id: int, order_info: Optional[Dict[str, Any]]) -> str:
+        """
+        스트림 이벤트 처리 방식 판정 (이벤트 루프 단일 스레드에서 호출)
+
+        Returns:
+            'apply': 페이로드 직접 적용, 'duplicate': 무시, 그 외: REST 재확인 사유
+        """
+        if not order_info:
+            return 'unparsed_payload'
+
+        status = order_info['status']
+        if status not in STATUS_RANK:
+            return 'unknown_status'
+
+        filled = order_info['filled_quantity']
+        if status in ('FILLED', 'PARTIALLY_FILLED') and (filled <= 0 or order_info['average_price'] <= 0):
+            return 'missing_fill_data'
+
+        with self._progress_lock:
+            progress = self._progress.get((account_id, order_info['exchange_order_id']))
+        key = (order_info['update_time'], filled, STATUS_RANK[status])
+        if progress is not None:
+            if key <= progress.key:
+                return 'duplicate'
+            if filled < progress.filled:
+                return 'filled_regressed'
+            if progress.status in TERMINAL_STATUSES:
+                return 'after_terminal'
+
+        # 이번 체결 수량을 빼면 직전에 적용한 누적 수량과 같아야 함 (다르면 이벤트 누락)
+        last_filled = order_info.get('last_filled_quantity')
+        if last_filled is not None and filled > 0:
+            previous = progress.filled if progress is not None else Decimal('0')
+            if filled - last_filled != previous:
+                return 'sequence_gap'
+
+        self._remember(account_id, order_info)
+        return 'apply'
+
+    def _remember(self, account_id: int, order_info: Dict[str, Any]) -> None:
+        status = str(order_info.get('status') or '').upper()
+        filled = _decimal(order_info.get('filled_quantity'))
+        order_key = (account_id, order_info['exchange_order_id'])
+        with self._progress_lock:
+            self._progress[order_key] = _OrderProgress(
+                key=(order_info.get('update_time') or 0, filled, STATUS_RANK.get(status, 0)),
+                filled=filled,
+                status=status
+            )
+            self._progress.move_to_end(order_key)
+            while len(self._progress) > ORDER_FILL_STATE_MAX:
+                self._progress.popitem(last=False)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    # @FEAT:order-tracking @COMP:service @TYPE:core
+    def _write_order_update(self, account_id: int, order_info: Dict[str, Any], received_at: float) -> None:
+        """writer 스레드에서 DB 반영 + 커밋, 이벤트 수신~커밋 지연 기록"""
+        with self.app.app_context(), db_pool_role(DB_POOL_ROLE_FILL_MONITOR):
+            try:
+                # DB 업데이트 (커밋하지 않음)
+                self._update_order_in_db(order_info, commit=False)
+
+                # Phase 5: 재정렬 로직 완전 제거됨 (Queue 인프라 제거)
+                # 모든 작업 성공 시 한 번에 커밋
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                # 적용 기록 제거 → 다음 이벤트는 REST 확인 또는 재적용 대상
+                with self._progress_lock:
+                    self._progress.pop((account_id, order_info.get('exchange_order_id')), None)
+                self._count('write_failures')
+                logger.error(
+                    f"❌ WebSocket 트리거 처리 실패 - {order_info.get('exchange_order_id')}: {e}",
+                    exc_info=True
+                )
+                return
+
+        latency_ms = (time.monotonic() - received_at) * 1000
+        with self._stats_lock:
+            self._latency_ms['count'] += 1
+            self._latency_ms['total'] += latency_ms
+            self._latency_ms['max'] = max(self._latency_ms['max'], latency_ms)
+
+    def stop(self, timeout: float = ORDER_FILL_WRITER_DRAIN_TIMEOUT) -> None:
+        """writer 대기열을 모두 DB에 반영하고 종료 (애플리케이션 종료 시 atexit에서 호출)"""
+        self._writer.stop(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """적용/중복/REST 재확인 건수와 이벤트 수신~DB 커밋 지연"""
+        with self._stats_lock:
+            count = self._latency_ms['count']
+            return {
+                'trust_stream': self.trust_stream,
+                **dict(self._stats),
+                'rest_reasons': dict(self._rest_reasons),
+                'writer_queue_size': self._writer.qsize(),
+                'writer_dropped': self._writer.dropped,
+                'tracked_orders': len(self._progress),
+                'event_to_db_ms': {
+                    'count': count,
+                    'avg': round(self._latency_ms['total'] / count, 2) if count else None,
+                    'max': round(self._latency_ms['max'], 2) if count else None,
+                }
+            }
+
     # @FEAT:order-tracking @COMP:service @TYPE:integration
     async def _confirm_order_status(
         self,
@@ -169,7 +508,7 @@ class OrderFillMonitor:
         """
         try:
             # Flask app context 내에서 실행
-            with self.app.app_context():
+            with self.app.app_context(), db_pool_role(DB_POOL_ROLE_FILL_MONITOR):
                 # OpenOrder에서 market_type 가져오기 (가장 정확함)
                 open_order = OpenOrder.query.filter_by(
                     exchange_order_id=exchange_order_id
@@ -277,6 +616,9 @@ class OrderFillMonitor:
         CRITICAL: order_result 포맷 변환 필수
         - order_info['exchange_order_id'] → order_result['order_id']
         - position_manager.py:84에서 'order_id' 키를 기대함
+
+        신뢰 모드(order_info['source'] 지정)에서는 이미 스트림/REST 기준 최신 정보이므로
+        process_order_fill()의 거래소 재조회를 생략합니다.
         """
         # TradingService import
         from app.services.trading import trading_service
@@ -291,7 +633,8 @@ class OrderFillMonitor:
             side=open_order.side,
             order_type=open_order.order_type,
             order_result=order_result,
-            market_type=open_order.strategy_account.strategy.market_type
+            market_type=open_order.strategy_account.strategy.market_type,
+            skip_exchange_merge=order_info.get('source') is not None
         )
 
         return fill_summary
@@ -473,4 +816,6 @@ def init_order_fill_monitor(app: Flask):
     """
     global order_fill_monitor
     order_fill_monitor = OrderFillMonitor(app)
+    # 종료 시 writer 대기열을 모두 반영한 뒤 종료 (daemon 스레드 → 반영 전 종료 방지)
+    atexit.register(order_fill_monitor.stop)
     logger.info("✅ OrderFillMonitor 초기화 완료")
@@ -7,15 +7,19 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime, date, timedelta
 import logging
 import numpy as np
-from sqlalchemy import func
+from sqlalchemy import case, func
 from app import db
 from app.models import (
-    StrategyPerformance, Trade, TradeExecution,
+    StrategyPerformance, TradeExecution,
     Strategy, StrategyAccount, StrategyCapital
 )
+from app.services import analytics_engine
 
 logger = logging.getLogger(__name__)
 
+# 롤링 리스크 메트릭 구간 (일)
+RISK_WINDOW_DAYS = 30
+
 
 # @FEAT:analytics @COMP:service @TYPE:core
 class PerformanceTrackingService:
@@ -24,217 +28,269 @@ class PerformanceTrackingService:
     # @FEAT:analytics @COMP:service @TYPE:core
     def calculate_daily_performance(self, strategy_id: int,
                                    target_date: date = None) -> Optional[StrategyPerformance]:
-        """일일 성과 계산"""
-        try:
-            if not target_date:
-                target_date = date.today()
-
-            # 기존 레코드 확인
-            performance = StrategyPerformance.query.filter_by(
-                strategy_id=strategy_id,
-                date=target_date
-            ).first()
-
-            if not performance:
-                performance = StrategyPerformance(
-                    strategy_id=strategy_id,
-                    date=target_date
-                )
-                db.session.add(performance)
-
-            # 기본 메트릭 계산
-            metrics = self._calculate_metrics(strategy_id, target_date)
+        """일일 성과 계산 (calculate_performance_range()의 단일 전략/일자 래퍼)"""
+        if not target_date:
+            target_date = date.today()
 
-            # 성과 레코드 업데이트
-            for key, value in metrics.items():
-                setattr(performance, key, value)
-
-            performance.updated_at = datetime.utcnow()
-            db.session.commit()
-
-            logger.info(f"Performance calculated for strategy {strategy_id} on {target_date}")
-            return performance
-
-        except Exception as e:
-            logger.error(f"Error calculating daily performance: {e}")
-            db.session.rollback()
+        result = self.calculate_performance_range(target_date, target_date, [strategy_id])
+        if not result.get('success'):
             return None
 
-    # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_metrics(self, strategy_id: int, target_date: date) -> Dict[str, Any]:
-        """메트릭 계산 (ROI, 리스크 메트릭 포함)"""
-        try:
-            # 전략의 모든 계좌 조회
-            strategy_accounts = StrategyAccount.query.filter_by(
-                strategy_id=strategy_id,
-                is_active=True
-            ).all()
-
-            if not strategy_accounts:
-                return self._get_empty_metrics()
+        logger.info(f"Performance calculated for strategy {strategy_id} on {target_date}")
+        return StrategyPerformance.query.filter_by(
+            strategy_id=strategy_id,
+            date=target_date
+        ).first()
 
-            # 투입 자본 계산 (전략-계좌별 할당 자본 합산)
-            total_capital = 0.0
-            for sa in strategy_accounts:
-                capital = StrategyCapital.query.filter_by(
-                    strategy_account_id=sa.id
-                ).first()
-                if capital and capital.allocated_capital:
-                    total_capital += capital.allocated_capital
-
-            # 당일 거래 집계
-            start_time = datetime.combine(target_date, datetime.min.time())
-            end_time = datetime.combine(target_date, datetime.max.time())
-
-            total_trades = 0
-            winning_trades = 0
-            losing_trades = 0
-            daily_pnl = 0.0
-            total_commission = 0.0
-            total_win_pnl = 0.0
-            total_loss_pnl = 0.0
+    # @FEAT:analytics @COMP:service @TYPE:core
+    def calculate_performance_range(self, start_date: date, end_date: date,
+                                    strategy_ids: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        전략 × 일자 성과 일괄 계산 (집합 기반)
 
-            for sa in strategy_accounts:
-                # TradeExecution에서 데이터 집계
-                executions = TradeExecution.query.filter(
-                    TradeExecution.strategy_account_id == sa.id,
-                    TradeExecution.execution_time >= start_time,
-                    TradeExecution.execution_time <= end_time
-                ).all()
+        trade_executions를 (전략, 일자)로 GROUP BY 하고 누적 손익은 윈도우 함수로 계산한 뒤
+        strategy_performance에 INSERT ... ON CONFLICT (strategy_id, date) DO UPDATE 1회로 저장합니다.
+        전략/일자 수와 무관하게 쿼리 수는 고정입니다.
 
-                for exec in executions:
-                    total_trades += 1
-                    if exec.realized_pnl:
-                        daily_pnl += exec.realized_pnl
-                        if exec.realized_pnl > 0:
-                            winning_trades += 1
-                            total_win_pnl += exec.realized_pnl
-                        elif exec.realized_pnl < 0:
-                            losing_trades += 1
-                            total_loss_pnl += exec.realized_pnl
-
-                    if exec.commission:
-                        total_commission += exec.commission
-
-            # 승률 계산
-            win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0.0
-
-            # 누적 메트릭 계산 (이전 날짜 데이터 참조)
-            previous_perf = StrategyPerformance.query.filter(
-                StrategyPerformance.strategy_id == strategy_id,
-                StrategyPerformance.date < target_date
-            ).order_by(StrategyPerformance.date.desc()).first()
+        Args:
+            start_date, end_date: 계산 일자 범위 (양 끝 포함)
+            strategy_ids: 대상 전략 (None이면 활성 전략 전체)
 
-            cumulative_pnl = daily_pnl
-            if previous_perf:
-                cumulative_pnl += previous_perf.cumulative_pnl
+        Returns:
+            {'success', 'processed', 'strategy_ids', 'rows'}
+        """
+        try:
+            if strategy_ids is None:
+                strategy_ids = [
+                    row[0] for row in db.session.query(Strategy.id).filter(Strategy.is_active.is_(True))
+                ]
+            strategy_ids = list(strategy_ids)
+            if not strategy_ids or start_date > end_date:
+                return {'success': True, 'processed': 0, 'strategy_ids': strategy_ids, 'rows': []}
+
+            capitals = self._load_strategy_capitals(strategy_ids)
+            daily_stats = self._load_daily_execution_stats(strategy_ids, start_date, end_date)
+            base_cumulative = self._load_base_cumulative_pnl(strategy_ids, start_date)
+            prior_returns = self._load_prior_daily_returns(strategy_ids, start_date)
+
+            calendar = [start_date + timedelta(days=offset)
+                        for offset in range((end_date - start_date).days + 1)]
+            rows: List[Dict[str, Any]] = []
+
+            for strategy_id in strategy_ids:
+                total_capital = capitals.get(strategy_id, 0.0)
+                stats_by_date = daily_stats.get(strategy_id, {})
+                running_cumulative = 0.0
+                strategy_rows = []
+
+                for target_date in calendar:
+                    stats = stats_by_date.get(target_date)
+                    if stats:
+                        running_cumulative = stats['window_cumulative_pnl']
+                    row = self._build_performance_row(
+                        strategy_id, target_date, stats, total_capital,
+                        base_cumulative.get(strategy_id, 0.0) + running_cumulative
+                    )
+                    strategy_rows.append(row)
 
-            # ROI 계산 (%)
-            daily_return = (daily_pnl / total_capital * 100) if total_capital > 0 else 0.0
-            cumulative_return = (cumulative_pnl / total_capital * 100) if total_capital > 0 else 0.0
+                self._apply_rolling_risk_metrics(strategy_rows, prior_returns.get(strategy_id, []))
+                rows.extend(strategy_rows)
 
-            # 리스크 메트릭 계산 (최근 30일 데이터 기반)
-            sharpe_ratio, sortino_ratio, volatility = self._calculate_risk_metrics(
-                strategy_id, target_date
-            )
-
-            # 평균 수익/손실 계산
-            avg_win = (total_win_pnl / winning_trades) if winning_trades > 0 else 0.0
-            avg_loss = (total_loss_pnl / losing_trades) if losing_trades > 0 else 0.0
+            self._upsert_performance_rows(rows)
+            db.session.commit()
 
             return {
-                'daily_return': daily_return,
-                'cumulative_return': cumulative_return,
-                'daily_pnl': daily_pnl,
-                'cumulative_pnl': cumulative_pnl,
-                'total_trades': total_trades,
-                'winning_trades': winning_trades,
-                'losing_trades': losing_trades,
-                'win_rate': win_rate,
-                'total_commission': total_commission,
-                'commission_ratio': (total_commission / abs(daily_pnl) * 100) if daily_pnl != 0 else 0.0,
-                'sharpe_ratio': sharpe_ratio,
-                'sortino_ratio': sortino_ratio,
-                'volatility': volatility,
-                'avg_win': avg_win,
-                'avg_loss': avg_loss
+                'success': True,
+                'processed': len(rows),
+                'strategy_ids': strategy_ids,
+                'rows': rows
             }
 
         except Exception as e:
-            logger.error(f"Error calculating metrics: {e}")
-            return self._get_empty_metrics()
+            logger.error(f"Error calculating performance range: {e}")
+            db.session.rollback()
+            return {'success': False, 'processed': 0, 'strategy_ids': strategy_ids or [], 'error': str(e)}
 
     # @FEAT:analytics @COMP:service @TYPE:helper
-    def _calculate_risk_metrics(self, strategy_id: int, target_date: date) -> tuple:
-        """
-        리스크 메트릭 계산 (최근 30일 기반)
-
-        Returns:
-            (sharpe_ratio, sortino_ratio, volatility)
-        """
-        try:
-            # 최근 30일 성과 데이터 조회
-            start_date = target_date - timedelta(days=30)
-            performances = StrategyPerformance.query.filter(
-                StrategyPerformance.strategy_id == strategy_id,
-                StrategyPerformance.date >= start_date,
-                StrategyPerformance.date <= target_date
-            ).order_by(StrategyPerformance.date).all()
-
-            if len(performances) < 2:
-                return None, None, None
-
-            # 일별 수익률 리스트
-            daily_returns = [p.daily_return for p in performances if p.daily_return is not None]
+    def _load_strategy_capitals(self, strategy_ids: List[int]) -> Dict[int, float]:
+        """전략별 투입 자본 합계 (활성 전략-계좌 기준)"""
+        rows = db.session.query(
+            StrategyAccount.strategy_id,
+            func.sum(StrategyCapital.allocated_capital)
+        ).join(
+            StrategyCapital, StrategyCapital.strategy_account_id == StrategyAccount.id
+        ).filter(
+            StrategyAccount.strategy_id.in_(strategy_ids),
+            StrategyAccount.is_active.is_(True)
+        ).group_by(StrategyAccount.strategy_id).all()
+        return {strategy_id: float(total or 0.0) for strategy_id, total in rows}
 
-            if len(daily_returns) < 2:
-                return None, None, None
-
-            # 변동성 계산 (일별 수익률의 표준편차)
-            returns_array = np.array(daily_returns)
-            volatility = float(np.std(returns_array, ddof=1))  # 표본 표준편차
+    # @FEAT:analytics @COMP:service @TYPE:helper
+    def _load_daily_execution_stats(self, strategy_ids: List[int], start_date: date,
+                                    end_date: date) -> Dict[int, Dict[date, Dict[str, Any]]]:
+        """(전략, 일자)별 체결 집계 + 범위 내 누적 손익 (윈도우 함수)"""
+        execution_date = func.date(TradeExecution.execution_time)
+        realized_pnl = TradeExecution.realized_pnl
+        daily_pnl = func.sum(func.coalesce(realized_pnl, 0.0))
+
+        rows = db.session.query(
+            StrategyAccount.strategy_id,
+            execution_date,
+            func.count(TradeExecution.id),
+            daily_pnl,
+            func.sum(case((realized_pnl > 0, 1), else_=0)),
+            func.sum(case((realized_pnl < 0, 1), else_=0)),
+            func.sum(func.coalesce(TradeExecution.commission, 0.0)),
+            func.sum(daily_pnl).over(
+                partition_by=StrategyAccount.strategy_id,
+                order_by=execution_date
+            ),
+        ).join(
+            StrategyAccount, StrategyAccount.id == TradeExecution.strategy_account_id
+        ).filter(
+            StrategyAccount.strategy_id.in_(strategy_ids),
+            StrategyAccount.is_active.is_(True),
+            TradeExecution.execution_time >= datetime.combine(start_date, datetime.min.time()),
+            TradeExecution.execution_time < datetime.combine(end_date + timedelta(days=1), datetime.min.time())
+        ).group_by(StrategyAccount.strategy_id, execution_date).all()
+
+        stats: Dict[int, Dict[date, Dict[str, Any]]] = {}
+        for (strategy_id, exec_date, total_trades, pnl, winning, losing,
+             commission, window_cumulative) in rows:
+            if isinstance(exec_date, str):  # SQLite date()는 문자열 반환
+                exec_date = date.fromisoformat(exec_date)
+            stats.setdefault(strategy_id, {})[exec_date] = {
+                'total_trades': int(total_trades or 0),
+                'daily_pnl': float(pnl or 0.0),
+                'winning_trades': int(winning or 0),
+                'losing_trades': int(losing or 0),
+                'total_commission': float(commission or 0.0),
+                'window_cumulative_pnl': float(window_cumulative or 0.0),
+            }
+        return stats
 
-            # 평균 수익률
-            avg_return = float(np.mean(returns_array))
+    # @FEAT:analytics @COMP:service @TYPE:helper
+    def _load_base_cumulative_pnl(self, strategy_ids: List[int], start_date: date) -> Dict[int, float]:
+        """범위 시작 전 마지막 성과 레코드의 누적 손익"""
+        latest = db.session.query(
+            StrategyPerformance.strategy_id,
+            func.max(StrategyPerformance.date).label('latest_date')
+        ).filter(
+            StrategyPerformance.strategy_id.in_(strategy_ids),
+            StrategyPerformance.date < start_date
+        ).group_by(StrategyPerformance.strategy_id).subquery()
+
+        rows = db.session.query(
+            StrategyPerformance.strategy_id,
+            StrategyPerformance.cumulative_pnl
+        ).join(
+            latest,
+            (StrategyPerformance.strategy_id == latest.c.strategy_id)
+            & (StrategyPerformance.date == latest.c.latest_date)
+        ).all()
+        return {strategy_id: float(cumulative or 0.0) for strategy_id, cumulative in rows}
 
-            # 샤프 비율 계산 (무위험 수익률 = 0 가정)
-            sharpe_ratio = (avg_return / volatility) if volatility > 0 else None
+    # @FEAT:analytics @COMP:service @TYPE:helper
+    def _load_prior_daily_returns(self, strategy_ids: List[int],
+                                  start_date: date) -> Dict[int, List[tuple]]:
+        """롤링 리스크 메트릭용 범위 직전 30일 일별 수익률 [(일자, 수익률)]"""
+        rows = db.session.query(
+            StrategyPerformance.strategy_id,
+            StrategyPerformance.date,
+            StrategyPerformance.daily_return
+        ).filter(
+            StrategyPerformance.strategy_id.in_(strategy_ids),
+            StrategyPerformance.date >= start_date - timedelta(days=RISK_WINDOW_DAYS),
+            StrategyPerformance.date < start_date,
+            StrategyPerformance.daily_return.isnot(None)
+        ).order_by(StrategyPerformance.date).all()
+
+        prior: Dict[int, List[tuple]] = {}
+        for strategy_id, perf_date, daily_return in rows:
+            prior.setdefault(strategy_id, []).append((perf_date, daily_return))
+        return prior
 
-            # 소르티노 비율 계산 (하방 편차만 고려)
-            negative_returns = returns_array[returns_array < 0]
-            if len(negative_returns) > 0:
-                downside_deviation = float(np.std(negative_returns, ddof=1))
-                sortino_ratio = (avg_return / downside_deviation) if downside_deviation > 0 else None
-            else:
-                sortino_ratio = None
+    # @FEAT:analytics @COMP:service @TYPE:helper
+    def _build_performance_row(self, strategy_id: int, target_date: date,
+                               stats: Optional[Dict[str, Any]], total_capital: float,
+                               cumulative_pnl: float) -> Dict[str, Any]:
+        """일자별 성과 행 (ROI, 승률, 수수료 비율)"""
+        stats = stats or {}
+        total_trades = stats.get('total_trades', 0)
+        winning_trades = stats.get('winning_trades', 0)
+        daily_pnl = stats.get('daily_pnl', 0.0)
+        total_commission = stats.get('total_commission', 0.0)
 
-            return sharpe_ratio, sortino_ratio, volatility
+        return {
+            'strategy_id': strategy_id,
+            'date': target_date,
+            'daily_return': (daily_pnl / total_capital * 100) if total_capital > 0 else 0.0,
+            'cumulative_return': (cumulative_pnl / total_capital * 100) if total_capital > 0 else 0.0,
+            'daily_pnl': daily_pnl,
+            'cumulative_pnl': cumulative_pnl,
+            'total_trades': total_trades,
+            'winning_trades': winning_trades,
+            'losing_trades': stats.get('losing_trades', 0),
+            'win_rate': (winning_trades / total_trades * 100) if total_trades > 0 else 0.0,
+            'total_commission': total_commission,
+            'commission_ratio': (total_commission / abs(daily_pnl) * 100) if daily_pnl != 0 else 0.0,
+        }
 
-        except Exception as e:
-            logger.warning(f"리스크 메트릭 계산 실패: {e}")
-            return None, None, None
+    # @FEAT:analytics @COMP:service @TYPE:helper
+    def _apply_rolling_risk_metrics(self, rows: List[Dict[str, Any]], prior_returns: List[tuple]) -> None:
+        """최근 30일 롤링 Sharpe/Sortino/변동성 (직전 기록 + 이번 계산분)"""
+        days = [perf_date for perf_date, _ in prior_returns] + [row['date'] for row in rows]
+        returns = [value for _, value in prior_returns] + [row['daily_return'] for row in rows]
+
+        sharpe, sortino, volatility = analytics_engine.rolling_risk_metrics(
+            np.array(days, dtype='datetime64[D]'),
+            np.array(returns, dtype=np.float64),
+            window_days=RISK_WINDOW_DAYS
+        )
+
+        offset = len(prior_returns)
+        for index, row in enumerate(rows, start=offset):
+            row['sharpe_ratio'] = None if np.isnan(sharpe[index]) else float(sharpe[index])
+            row['sortino_ratio'] = None if np.isnan(sortino[index]) else float(sortino[index])
+            row['volatility'] = None if np.isnan(volatility[index]) else float(volatility[index])
 
     # @FEAT:analytics @COMP:service @TYPE:helper
-    def _get_empty_metrics(self) -> Dict[str, Any]:
-        """빈 메트릭 반환"""
-        return {
-            'daily_return': 0.0,
-            'cumulative_return': 0.0,
-            'daily_pnl': 0.0,
-            'cumulative_pnl': 0.0,
-            'total_trades': 0,
-            'winning_trades': 0,
-            'losing_trades': 0,
-            'win_rate': 0.0,
-            'max_drawdown': 0.0,
-            'total_commission': 0.0,
-            'commission_ratio': 0.0,
-            'sharpe_ratio': None,
-            'sortino_ratio': None,
-            'volatility': None,
-            'avg_win': 0.0,
-            'avg_loss': 0.0
-        }
+    def _upsert_performance_rows(self, rows: List[Dict[str, Any]]) -> None:
+        """strategy_performance 일괄 저장 (단일 INSERT ... ON CONFLICT DO UPDATE, 커밋은 호출자)"""
+        if not rows:
+            return
+
+        now = datetime.utcnow()
+        values = [dict(row, created_at=now, updated_at=now) for row in rows]
+
+        dialect = db.engine.dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == 'sqlite':
+            from sqlalchemy.dialects.sqlite import insert
+        else:
+            for value in values:
+                performance = StrategyPerformance.query.filter_by(
+                    strategy_id=value['strategy_id'], date=value['date']
+                ).first()
+                if not performance:
+                    performance = StrategyPerformance(strategy_id=value['strategy_id'], date=value['date'])
+                    db.session.add(performance)
+                for key, item in value.items():
+                    if key != 'created_at':
+                        setattr(performance, key, item)
+            return
+
+        stmt = insert(StrategyPerformance).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StrategyPerformance.strategy_id, StrategyPerformance.date],
+            set_={
+                column: stmt.excluded[column]
+                for column in values[0]
+                if column not in ('strategy_id', 'date', 'created_at')
+            }
+        )
+        db.session.execute(stmt)
 
     # @FEAT:analytics @COMP:service @TYPE:core
     def get_performance_summary(self, strategy_id: int,
@@ -427,40 +483,29 @@ class PerformanceTrackingService:
 
     # @FEAT:analytics @COMP:service @TYPE:core
     def batch_calculate(self, days_back: int = 7) -> Dict[str, Any]:
-        """배치로 여러 전략의 성과 계산"""
+        """배치로 여러 전략의 성과 계산 (calculate_performance_range() 래퍼)"""
         try:
-            # 활성 전략 조회
             strategies = Strategy.query.filter_by(is_active=True).all()
 
-            results = {
-                'processed': 0,
-                'failed': 0,
-                'strategies': []
-            }
-
             end_date = date.today()
             start_date = end_date - timedelta(days=days_back)
+            result = self.calculate_performance_range(
+                start_date, end_date, [strategy.id for strategy in strategies]
+            )
 
-            for strategy in strategies:
-                current_date = start_date
-                while current_date <= end_date:
-                    performance = self.calculate_daily_performance(
-                        strategy.id,
-                        current_date
-                    )
-
-                    if performance:
-                        results['processed'] += 1
-                    else:
-                        results['failed'] += 1
-
-                    current_date += timedelta(days=1)
-
-                results['strategies'].append({
-                    'id': strategy.id,
-                    'name': strategy.name,
-                    'group_name': strategy.group_name
-                })
+            expected = len(strategies) * (days_back + 1)
+            results = {
+                'processed': result['processed'],
+                'failed': 0 if result.get('success') else expected,
+                'strategies': [
+                    {
+                        'id': strategy.id,
+                        'name': strategy.name,
+                        'group_name': strategy.group_name
+                    }
+                    for strategy in strategies
+                ]
+            }
 
             logger.info(f"Batch calculation complete: {results}")
             return results
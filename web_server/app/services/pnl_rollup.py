@@ -0,0 +1,321 @@
+# @FEAT:analytics @FEAT:pnl-rollup @COMP:service @TYPE:core
+"""
+전략 계좌별 일일 실현 손익 롤업 (strategy_account_daily_pnl)
+
+대시보드/분석 쿼리가 사용자 전체 Trade를 ORM 객체로 로딩하던 방식(O(거래 수)) 대신
+전략 계좌 × 일자 단위로 미리 집계한 행(O(일 수))을 읽도록 합니다.
+
+- 증분 갱신: RecordManager가 Trade.pnl을 기록할 때 같은 트랜잭션에서 apply_trade_pnl() 호출
+- 백필/재구성: `flask analytics rebuild-pnl-rollup` (rebuild())
+- cumulative_pnl/peak_pnl은 변경 일자 이후 행에 전파되고, 연속 승/패는 순서대로 기록된 거래 기준입니다
+  (과거 거래의 손익 부호가 바뀐 경우 재구성으로 보정)
+"""
+
+import logging
+from collections import OrderedDict, defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
+
+from app import db
+from app.models import StrategyAccountDailyPnl, Trade
+from app.services.utils import to_decimal
+
+logger = logging.getLogger(__name__)
+
+
+def _next_streak(streak: int, pnl: Decimal) -> int:
+    """거래 손익 부호에 따른 연속 승(+)/패(-) 카운터 갱신"""
+    if pnl > 0:
+        return streak + 1 if streak > 0 else 1
+    if pnl < 0:
+        return streak - 1 if streak < 0 else -1
+    return 0
+
+
+# @FEAT:analytics @FEAT:pnl-rollup @COMP:service @TYPE:core
+class PnlRollupService:
+    """일일 손익 롤업 증분 갱신/재구성/조회"""
+
+    # @FEAT:pnl-rollup @COMP:service @TYPE:core
+    def apply_trade_pnl(
+        self,
+        trade: Trade,
+        previous_pnl: Optional[float] = None,
+        previous_fee: Optional[float] = None,
+        previous_timestamp: Optional[datetime] = None,
+    ) -> None:
+        """
+        Trade의 손익/수수료 변경분을 체결일 롤업 행에 반영합니다.
+
+        previous_*는 이번 변경 직전의 Trade 값입니다. 체결 시각 갱신으로 날짜가 바뀌면
+        이전 체결일 행에서 기존 기여분을 빼고 새 체결일에 다시 반영합니다 (재구성과 같은 집계 기준).
+        세션에 변경만 추가하며 커밋은 호출자(Trade 기록과 동일 트랜잭션)가 담당합니다.
+        """
+        trade_date = (trade.timestamp or datetime.utcnow()).date()
+        if (previous_timestamp is not None and previous_timestamp.date() != trade_date
+                and (previous_pnl is not None or previous_fee)):
+            self._remove_contribution(trade.strategy_account_id, previous_timestamp.date(),
+                                      previous_pnl, previous_fee)
+            previous_pnl = previous_fee = None
+
+        pnl_delta = to_decimal(trade.pnl or 0) - to_decimal(previous_pnl or 0)
+        fee_delta = to_decimal(trade.fee or 0) - to_decimal(previous_fee or 0)
+        if pnl_delta == 0 and fee_delta == 0 and not (previous_pnl is None and trade.pnl is not None):
+            return
+
+        row = self._get_or_create_row(trade.strategy_account_id, trade_date)
+
+        row.realized_pnl = float(to_decimal(row.realized_pnl) + pnl_delta)
+        row.fees = float(to_decimal(row.fees) + fee_delta)
+
+        if previous_pnl is not None:
+            self._unclassify(row, to_decimal(previous_pnl))
+        if trade.pnl is not None:
+            new_pnl = to_decimal(trade.pnl)
+            self._classify(row, new_pnl)
+            if previous_pnl is None:
+                row.trade_count += 1
+                row.current_streak = _next_streak(row.current_streak, new_pnl)
+                row.max_win_streak = max(row.max_win_streak, row.current_streak)
+                row.max_loss_streak = max(row.max_loss_streak, -row.current_streak)
+
+        if pnl_delta != 0:
+            self._propagate_cumulative(trade.strategy_account_id, trade_date, pnl_delta)
+
+    # @FEAT:pnl-rollup @COMP:service @TYPE:core
+    def rebuild(self, strategy_account_ids: Optional[Iterable[int]] = None) -> Dict[str, int]:
+        """
+        Trade 테이블에서 롤업을 재구성합니다 (백필 및 보정용).
+
+        strategy_account_ids가 없으면 거래가 있는 모든 전략 계좌를 재구성합니다.
+        """
+        if strategy_account_ids is None:
+            strategy_account_ids = [
+                row[0] for row in db.session.query(Trade.strategy_account_id).distinct()
+            ]
+
+        accounts = 0
+        rows_written = 0
+        for sa_id in strategy_account_ids:
+            rows_written += self._rebuild_strategy_account(sa_id)
+            accounts += 1
+            db.session.commit()
+
+        logger.info("📊 손익 롤업 재구성 완료 - 전략 계좌:%s 일별 행:%s", accounts, rows_written)
+        return {'strategy_accounts': accounts, 'rows': rows_written}
+
+    # @FEAT:pnl-rollup @COMP:service @TYPE:core
+    def load_daily_rows(
+        self,
+        strategy_account_ids: List[int],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ) -> Dict[int, List[StrategyAccountDailyPnl]]:
+        """전략 계좌별 일별 롤업 행 (일자 오름차순)"""
+        grouped: Dict[int, List[StrategyAccountDailyPnl]] = defaultdict(list)
+        if not strategy_account_ids:
+            return grouped
+
+        query = StrategyAccountDailyPnl.query.filter(
+            StrategyAccountDailyPnl.strategy_account_id.in_(strategy_account_ids)
+        )
+        if start_date:
+            query = query.filter(StrategyAccountDailyPnl.date >= start_date)
+        if end_date:
+            query = query.filter(StrategyAccountDailyPnl.date <= end_date)
+
+        for row in query.order_by(StrategyAccountDailyPnl.date):
+            grouped[row.strategy_account_id].append(row)
+        return grouped
+
+    # ------------------------------------------------------------------
+    # 내부 헬퍼
+    # ------------------------------------------------------------------
+    def _get_or_create_row(self, strategy_account_id: int, trade_date: date) -> StrategyAccountDailyPnl:
+        row = StrategyAccountDailyPnl.query.filter_by(
+            strategy_account_id=strategy_account_id, date=trade_date
+        ).first()
+        if row:
+            return row
+
+        previous = (
+            StrategyAccountDailyPnl.query
+            .filter(
+                StrategyAccountDailyPnl.strategy_account_id == strategy_account_id,
+                StrategyAccountDailyPnl.date < trade_date,
+            )
+            .order_by(StrategyAccountDailyPnl.date.desc())
+            .first()
+        )
+        row = StrategyAccountDailyPnl(
+            strategy_account_id=strategy_account_id,
+            date=trade_date,
+            realized_pnl=0.0,
+            fees=0.0,
+            trade_count=0,
+            winning_trades=0,
+            losing_trades=0,
+            gross_profit=0.0,
+            gross_loss=0.0,
+            cumulative_pnl=previous.cumulative_pnl if previous else 0.0,
+            peak_pnl=previous.peak_pnl if previous else 0.0,
+            current_streak=previous.current_streak if previous else 0,
+            max_win_streak=previous.max_win_streak if previous else 0,
+            max_loss_streak=previous.max_loss_streak if previous else 0,
+        )
+
+        # 다른 워커가 같은 일자 행을 먼저 만든 경우 UNIQUE 위반 → 기존 행 사용
+        try:
+            with db.session.begin_nested():
+                db.session.add(row)
+        except IntegrityError:
+            row = StrategyAccountDailyPnl.query.filter_by(
+                strategy_account_id=strategy_account_id, date=trade_date
+            ).one()
+        return row
+
+    def _remove_contribution(self, strategy_account_id: int, trade_date: date,
+                             pnl: Optional[float], fee: Optional[float]) -> None:
+        """체결일이 바뀐 거래의 기존 손익/수수료/거래 수를 이전 체결일 행에서 제거"""
+        row = self._get_or_create_row(strategy_account_id, trade_date)
+        row.fees = float(to_decimal(row.fees) - to_decimal(fee or 0))
+        if pnl is None:
+            return
+
+        pnl_value = to_decimal(pnl)
+        row.realized_pnl = float(to_decimal(row.realized_pnl) - pnl_value)
+        row.trade_count -= 1
+        self._unclassify(row, pnl_value)
+        if pnl_value != 0:
+            self._propagate_cumulative(strategy_account_id, trade_date, -pnl_value)
+
+    @staticmethod
+    def _classify(row: StrategyAccountDailyPnl, pnl: Decimal) -> None:
+        if pnl > 0:
+            row.winning_trades += 1
+            row.gross_profit = float(to_decimal(row.gross_profit) + pnl)
+        elif pnl < 0:
+            row.losing_trades += 1
+            row.gross_loss = float(to_decimal(row.gross_loss) + pnl)
+
+    @staticmethod
+    def _unclassify(row: StrategyAccountDailyPnl, pnl: Decimal) -> None:
+        if pnl > 0:
+            row.winning_trades -= 1
+            row.gross_profit = float(to_decimal(row.gross_profit) - pnl)
+        elif pnl < 0:
+            row.losing_trades -= 1
+            row.gross_loss = float(to_decimal(row.gross_loss) - pnl)
+
+    def _propagate_cumulative(self, strategy_account_id: int, from_date: date, pnl_delta: Decimal) -> None:
+        """변경 일자 이후 행의 누적 손익/최고점 갱신 (일반적으로 당일 1행)"""
+        previous = (
+            StrategyAccountDailyPnl.query
+            .filter(
+                StrategyAccountDailyPnl.strategy_account_id == strategy_account_id,
+                StrategyAccountDailyPnl.date < from_date,
+            )
+            .order_by(StrategyAccountDailyPnl.date.desc())
+            .first()
+        )
+        peak = to_decimal(previous.peak_pnl) if previous else Decimal('0')
+
+        following = (
+            StrategyAccountDailyPnl.query
+            .filter(
+                StrategyAccountDailyPnl.strategy_account_id == strategy_account_id,
+                StrategyAccountDailyPnl.date >= from_date,
+            )
+            .order_by(StrategyAccountDailyPnl.date)
+            .all()
+        )
+        for row in following:
+            cumulative = to_decimal(row.cumulative_pnl) + pnl_delta
+            peak = max(peak, cumulative)
+            row.cumulative_pnl = float(cumulative)
+            row.peak_pnl = float(peak)
+
+    def _rebuild_strategy_account(self, strategy_account_id: int) -> int:
+        StrategyAccountDailyPnl.query.filter_by(
+            strategy_account_id=strategy_account_id
+        ).delete(synchronize_session=False)
+
+        trades = (
+            db.session.query(Trade.timestamp, Trade.pnl, Trade.fee)
+            .filter(
+                Trade.strategy_account_id == strategy_account_id,
+                or_(Trade.pnl.isnot(None), Trade.fee.isnot(None)),
+            )
+            .order_by(Trade.timestamp, Trade.id)
+            .yield_per(1000)
+        )
+
+        days: 'OrderedDict[date, Dict]' = OrderedDict()
+        cumulative = Decimal('0')
+        peak = Decimal('0')
+        streak = 0
+        max_win_streak = 0
+        max_loss_streak = 0
+
+        for timestamp, pnl, fee in trades:
+            trade_date = timestamp.date()
+            day = days.get(trade_date)
+            if day is None:
+                day = days[trade_date] = {
+                    'strategy_account_id': strategy_account_id,
+                    'date': trade_date,
+                    'realized_pnl': Decimal('0'),
+                    'fees': Decimal('0'),
+                    'trade_count': 0,
+                    'winning_trades': 0,
+                    'losing_trades': 0,
+                    'gross_profit': Decimal('0'),
+                    'gross_loss': Decimal('0'),
+                }
+
+            if fee is not None:
+                day['fees'] += to_decimal(fee)
+            if pnl is not None:
+                pnl_value = to_decimal(pnl)
+                day['realized_pnl'] += pnl_value
+                day['trade_count'] += 1
+                if pnl_value > 0:
+                    day['winning_trades'] += 1
+                    day['gross_profit'] += pnl_value
+                elif pnl_value < 0:
+                    day['losing_trades'] += 1
+                    day['gross_loss'] += pnl_value
+                cumulative += pnl_value
+                streak = _next_streak(streak, pnl_value)
+                max_win_streak = max(max_win_streak, streak)
+                max_loss_streak = max(max_loss_streak, -streak)
+
+            day['cumulative_pnl'] = cumulative
+            day['current_streak'] = streak
+            day['max_win_streak'] = max_win_streak
+            day['max_loss_streak'] = max_loss_streak
+
+        if not days:
+            return 0
+
+        now = datetime.utcnow()
+        rows = []
+        for day in days.values():
+            # 최고점은 일 종료 시점 누적 손익 기준 (증분 갱신과 동일)
+            peak = max(peak, day['cumulative_pnl'])
+            day['peak_pnl'] = peak
+            row = {
+                key: float(value) if isinstance(value, Decimal) else value
+                for key, value in day.items()
+            }
+            row['updated_at'] = now
+            rows.append(row)
+        db.session.execute(StrategyAccountDailyPnl.__table__.insert(), rows)
+        return len(rows)
+
+
+pnl_rollup_service = PnlRollupService()
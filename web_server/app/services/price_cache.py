@@ -7,7 +7,7 @@
 import logging
 import time
 import threading
-from typing import Dict, Optional, Any
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
 from collections import defaultdict
@@ -97,6 +97,7 @@ class PriceCache:
                                 'price': result,
                                 'age_seconds': age_seconds,
                                 'source': 'cache',
+                                'feed': cached_data.get('source', 'rest'),
                                 'timestamp': cached_time
                             }
                         return result
@@ -126,6 +127,44 @@ class PriceCache:
 
             return None
 
+    # @FEAT:price-cache @COMP:service @TYPE:core
+    def get_prices(self, keys: Iterable[Tuple[str, str, str]],
+                   fallback_to_api: bool = True) -> Dict[Tuple[str, str, str], float]:
+        """
+        여러 (symbol, exchange, market_type) 가격을 잠금 1회로 조회
+
+        캐시 미스/만료 키는 fallback_to_api이면 (거래소, 마켓)별 update_batch_prices() 1회로 채웁니다.
+
+        Returns:
+            {(symbol, exchange, market_type): 가격(float)} - 가격을 얻지 못한 키는 제외
+        """
+        prices: Dict[Tuple[str, str, str], float] = {}
+        missing: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = defaultdict(list)
+        now = time.time()
+
+        with self._lock:
+            for key in set(keys):
+                symbol, exchange, market_type = key
+                cache_key = self._get_cache_key(symbol, exchange, market_type)
+                cached_data = self._cache.get(cache_key)
+                if cached_data and now - cached_data.get('timestamp', 0) < self.ttl_seconds \
+                        and cached_data.get('price') is not None:
+                    self._hit_counts[cache_key] += 1
+                    prices[key] = cached_data['price']
+                else:
+                    self._miss_counts[cache_key] += 1
+                    missing[(exchange, market_type)].append(key)
+
+        if fallback_to_api:
+            for (exchange, market_type), group in missing.items():
+                updated = self.update_batch_prices([symbol for symbol, _, _ in group], exchange, market_type)
+                for key in group:
+                    price = updated.get(key[0].upper())
+                    if price is not None:
+                        prices[key] = float(price)
+
+        return prices
+
     # @FEAT:price-cache @COMP:service @TYPE:core @DEPS:exchange-api
     def get_usdt_krw_rate(self, fallback_to_api: bool = True) -> Decimal:
         """
@@ -169,7 +208,8 @@ class PriceCache:
     # @FEAT:price-cache @COMP:service @TYPE:core
     def set_price(self, symbol: str, price: Decimal,
                   exchange: str = Exchange.BINANCE,
-                  market_type: str = MarketType.FUTURES) -> None:
+                  market_type: str = MarketType.FUTURES,
+                  source: str = 'rest') -> None:
         """
         가격 캐시 업데이트
 
@@ -178,6 +218,7 @@ class PriceCache:
             price: 가격
             exchange: 거래소
             market_type: 마켓 타입
+            source: 가격 출처 ('rest': REST 폴링/API, 'stream': 시세 WebSocket)
         """
         cache_key = self._get_cache_key(symbol, exchange, market_type)
 
@@ -187,10 +228,42 @@ class PriceCache:
                 'timestamp': time.time(),
                 'exchange': exchange,
                 'market_type': market_type,
-                'symbol': symbol
+                'symbol': symbol,
+                'source': source
             }
             self._update_counts[cache_key] += 1
 
+    # @FEAT:price-cache @COMP:service @TYPE:core
+    def set_prices(self, prices: Dict[str, Decimal],
+                   exchange: str = Exchange.BINANCE,
+                   market_type: str = MarketType.FUTURES,
+                   source: str = 'rest') -> None:
+        """여러 심볼 가격을 잠금 1회로 업데이트 (시세 스트림 배열 메시지용)"""
+        now = time.time()
+        with self._lock:
+            for symbol, price in prices.items():
+                cache_key = self._get_cache_key(symbol, exchange, market_type)
+                self._cache[cache_key] = {
+                    'price': float(price),
+                    'timestamp': now,
+                    'exchange': exchange,
+                    'market_type': market_type,
+                    'symbol': symbol,
+                    'source': source
+                }
+                self._update_counts[cache_key] += 1
+
+    # @FEAT:price-cache @COMP:service @TYPE:helper
+    def get_price_age(self, symbol: str, exchange: str = Exchange.BINANCE,
+                      market_type: str = MarketType.FUTURES) -> Optional[float]:
+        """캐시된 가격의 경과 시간(초), 캐시에 없으면 None"""
+        cache_key = self._get_cache_key(symbol, exchange, market_type)
+        with self._lock:
+            cached_data = self._cache.get(cache_key)
+            if not cached_data:
+                return None
+            return time.time() - cached_data.get('timestamp', 0)
+
     # @FEAT:price-cache @COMP:service @TYPE:core
     def update_batch_prices(self, symbols: list,
                            exchange: str = Exchange.BINANCE,
@@ -325,26 +398,43 @@ class PriceCache:
             return len(keys_to_delete)
 
     # @FEAT:price-cache @COMP:service @TYPE:helper
-    def get_stats(self) -> Dict[str, Any]:
+    def get_stats(self, include_ages: bool = True) -> Dict[str, Any]:
         """
         캐시 통계 정보
 
+        Args:
+            include_ages: 심볼별 가격 경과 시간 포함 여부 (주기 로그에는 요약만 사용)
+
         Returns:
-            통계 정보 딕셔너리
+            통계 정보 딕셔너리 (price_ages: 캐시 키별 가격 경과 시간(초)과 출처)
         """
+        now = time.time()
         with self._lock:
             total_hits = sum(self._hit_counts.values())
             total_misses = sum(self._miss_counts.values())
             total_updates = sum(self._update_counts.values())
             hit_rate = total_hits / (total_hits + total_misses) * 100 if (total_hits + total_misses) > 0 else 0
 
+            price_ages = {}
+            source_counts = defaultdict(int)
+            for key, data in self._cache.items():
+                source = data.get('source', 'rest')
+                price_ages[key] = {
+                    'age_seconds': round(now - data.get('timestamp', 0), 1),
+                    'source': source
+                }
+                source_counts[source] += 1
+
             return {
                 'cache_size': len(self._cache),
                 'total_hits': total_hits,
                 'total_misses': total_misses,
                 'total_updates': total_updates,
                 'hit_rate': f"{hit_rate:.1f}%",
-                'ttl_seconds': self.ttl_seconds
+                'ttl_seconds': self.ttl_seconds,
+                'max_age_seconds': max((item['age_seconds'] for item in price_ages.values()), default=None),
+                'source_counts': dict(source_counts),
+                **({'price_ages': price_ages} if include_ages else {})
             }
 
     # @FEAT:price-cache @COMP:service @TYPE:helper
@@ -0,0 +1,370 @@
+# @FEAT:price-cache @COMP:service @TYPE:websocket-integration @DEPS:exchange-integration
+"""
+시세 WebSocket 스트림 → PriceCache 실시간 반영
+
+PRICE_STREAM_ENABLED=true 이면 거래소 공개 시세 스트림을 구독하여 PriceCache.set_prices()에
+source='stream'으로 기록합니다 (REST 31초 폴링 대비 가격 지연 ~1초).
+
+- Binance: !miniTicker@arr (Spot/Futures 전체 심볼, 1초 주기)
+- Bybit: tickers.{symbol} (Spot/Linear, 추적 심볼만 구독 - 전체 구독 토픽 없음)
+- Upbit: ticker (KRW 마켓, 캐시된 심볼 + 추적 심볼)
+
+연결 끊김/무응답 시 지수 백오프로 재연결하며, 스트림이 PRICE_STREAM_STALE_SEC 이상
+가격을 받지 못하면 update_price_cache 작업이 해당 거래소/마켓만 REST 폴링으로 보완합니다.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+import websockets
+
+from app.constants import Exchange, MarketType
+from app.utils.symbol_utils import from_binance_format, from_upbit_format, to_binance_format, to_upbit_format
+
+logger = logging.getLogger(__name__)
+
+# 시세 스트림 활성화 여부 (기본: REST 폴링만 사용)
+PRICE_STREAM_ENABLED = os.getenv('PRICE_STREAM_ENABLED', 'false').lower() in ('1', 'true', 'yes')
+# 마지막 가격 수신 후 이 시간이 지나면 stale로 판단 (REST 보완), 무응답 시 재연결 기준
+PRICE_STREAM_STALE_SEC = float(os.getenv('PRICE_STREAM_STALE_SEC', '15'))
+# 재연결 최대 대기 시간
+PRICE_STREAM_MAX_BACKOFF_SEC = 60
+# 구독 심볼 변경 확인 / heartbeat 주기
+PRICE_STREAM_RESUBSCRIBE_SEC = 20
+
+# Bybit 구독 요청당 최대 토픽 수
+BYBIT_SUBSCRIBE_CHUNK = 10
+
+PriceItems = List[Tuple[str, Decimal]]
+
+
+def _to_decimal(value: Any) -> Optional[Decimal]:
+    try:
+        price = Decimal(str(value))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+    return price if price > 0 else None
+
+
+# @FEAT:price-cache @COMP:service @TYPE:helper
+def parse_binance_mini_tickers(message: Any) -> PriceItems:
+    """Binance !miniTicker@arr 메시지 → [(표준 심볼, 종가)]"""
+    items = message if isinstance(message, list) else [message]
+    prices = []
+    for item in items:
+        if not isinstance(item, dict) or item.get('e') != '24hrMiniTicker':
+            continue
+        price = _to_decimal(item.get('c'))
+        if not item.get('s') or price is None:
+            continue
+        try:
+            prices.append((from_binance_format(item['s']), price))
+        except Exception:
+            continue
+    return prices
+
+
+# @FEAT:price-cache @COMP:service @TYPE:helper
+def parse_bybit_ticker(message: Any) -> PriceItems:
+    """Bybit v5 tickers 메시지 → [(표준 심볼, lastPrice)] (delta에 lastPrice가 없으면 무시)"""
+    if not isinstance(message, dict) or not str(message.get('topic', '')).startswith('tickers.'):
+        return []
+    data = message.get('data') or {}
+    price = _to_decimal(data.get('lastPrice'))
+    if not data.get('symbol') or price is None:
+        return []
+    try:
+        return [(from_binance_format(data['symbol']), price)]
+    except Exception:
+        return []
+
+
+# @FEAT:price-cache @COMP:service @TYPE:helper
+def parse_upbit_ticker(message: Any) -> PriceItems:
+    """Upbit ticker 메시지 → [(표준 심볼, trade_price)]"""
+    if not isinstance(message, dict) or message.get('type') != 'ticker':
+        return []
+    price = _to_decimal(message.get('trade_price'))
+    if not message.get('code') or price is None:
+        return []
+    try:
+        return [(from_upbit_format(message['code']), price)]
+    except Exception:
+        return []
+
+
+def _bybit_subscribe(symbols: List[str]) -> List[Dict[str, Any]]:
+    topics = [f"tickers.{to_binance_format(symbol)}" for symbol in symbols]
+    return [
+        {'op': 'subscribe', 'args': topics[i:i + BYBIT_SUBSCRIBE_CHUNK]}
+        for i in range(0, len(topics), BYBIT_SUBSCRIBE_CHUNK)
+    ]
+
+
+def _upbit_subscribe(symbols: List[str]) -> List[Any]:
+    codes = [to_upbit_format(symbol) for symbol in symbols]
+    return [[{'ticket': str(uuid.uuid4())}, {'type': 'ticker', 'codes': codes}]]
+
+
+@dataclass(frozen=True)
+class PriceStreamSpec:
+    """거래소/마켓별 시세 스트림 정의"""
+    exchange: str
+    market_type: str
+    url: str
+    parser: Callable[[Any], PriceItems]
+    # 심볼 목록 → 구독 메시지 (None이면 URL 자체가 전체 심볼 구독)
+    subscribe: Optional[Callable[[List[str]], List[Any]]] = None
+    # True: 신규 심볼만 추가 구독 (Bybit), False: 구독 요청 전체 재전송 (Upbit)
+    incremental: bool = False
+    heartbeat: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class _StreamState:
+    connected: bool = False
+    last_message_at: float = 0.0
+    last_price_at: float = 0.0
+    messages: int = 0
+    prices: int = 0
+    reconnects: int = 0
+    last_error: Optional[str] = None
+    subscribed: Set[str] = field(default_factory=set)
+
+
+STREAM_SPECS = (
+    PriceStreamSpec(Exchange.BINANCE, MarketType.SPOT,
+                    'wss://stream.binance.com:9443/ws/!miniTicker@arr', parse_binance_mini_tickers),
+    PriceStreamSpec(Exchange.BINANCE, MarketType.FUTURES,
+                    'wss://fstream.binance.com/ws/!miniTicker@arr', parse_binance_mini_tickers),
+    PriceStreamSpec(Exchange.BYBIT, MarketType.SPOT, 'wss://stream.bybit.com/v5/public/spot',
+                    parse_bybit_ticker, _bybit_subscribe, incremental=True, heartbeat={'op': 'ping'}),
+    PriceStreamSpec(Exchange.BYBIT, MarketType.FUTURES, 'wss://stream.bybit.com/v5/public/linear',
+                    parse_bybit_ticker, _bybit_subscribe, incremental=True, heartbeat={'op': 'ping'}),
+    PriceStreamSpec(Exchange.UPBIT, MarketType.SPOT, 'wss://api.upbit.com/websocket/v1',
+                    parse_upbit_ticker, _upbit_subscribe),
+)
+
+
+# @FEAT:price-cache @COMP:service @TYPE:websocket-integration
+class PriceStreamManager:
+    """
+    시세 스트림 관리자 (백그라운드 스레드의 asyncio 이벤트 루프에서 실행)
+
+    WebSocketManager와 동일하게 백그라운드 서비스 소유 프로세스에서만 시작합니다.
+    """
+
+    def __init__(self, specs: Iterable[PriceStreamSpec] = STREAM_SPECS,
+                 stale_seconds: float = PRICE_STREAM_STALE_SEC, cache=None):
+        self.specs = {(spec.exchange, spec.market_type): spec for spec in specs}
+        self.stale_seconds = stale_seconds
+        self._cache = cache
+        self._states: Dict[Tuple[str, str], _StreamState] = {}
+        self._tracked: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        self._tracked_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    @property
+    def cache(self):
+        if self._cache is None:
+            from app.services.price_cache import price_cache
+            self._cache = price_cache
+        return self._cache
+
+    @staticmethod
+    def _key(exchange: str, market_type: str) -> Tuple[str, str]:
+        return Exchange.normalize(exchange), MarketType.normalize(market_type)
+
+    def start(self, exchanges: Iterable[str]) -> None:
+        """지정 거래소의 모든 시세 스트림 시작"""
+        if self._running:
+            return
+
+        wanted = {Exchange.normalize(exchange) for exchange in exchanges if exchange}
+        specs = [spec for spec in self.specs.values() if spec.exchange in wanted]
+        if not specs:
+            logger.info("시세 스트림 대상 거래소 없음 - REST 폴링만 사용")
+            return
+
+        self._running = True
+        self._states = {(spec.exchange, spec.market_type): _StreamState() for spec in specs}
+        ready = threading.Event()
+
+        def run_loop():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            for spec in specs:
+                self._loop.create_task(self._run_stream(spec))
+            ready.set()
+            try:
+                self._loop.run_forever()
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run_loop, name='price-stream', daemon=True)
+        self._thread.start()
+        ready.wait(timeout=5)
+        logger.info(f"✅ 시세 스트림 시작: {', '.join(f'{s.exchange}:{s.market_type}' for s in specs)}")
+
+    def start_for_active_accounts(self) -> None:
+        """활성 계좌가 있는 거래소의 시세 스트림 시작 (앱 컨텍스트 필요)"""
+        from app import db
+        from app.models import Account
+
+        exchanges = [row[0] for row in db.session.query(Account.exchange).filter(
+            Account.is_active.is_(True)
+        ).distinct()]
+        self.start(exchanges)
+
+    def stop(self) -> None:
+        if not self._running:
+            return
+        self._running = False
+        loop = self._loop
+        if loop and loop.is_running():
+            def shutdown():
+                for task in asyncio.all_tasks(loop):
+                    task.cancel()
+                loop.stop()
+            loop.call_soon_threadsafe(shutdown)
+        if self._thread:
+            self._thread.join(timeout=5)
+        logger.info("🔌 시세 스트림 종료")
+
+    # @FEAT:price-cache @COMP:service @TYPE:helper
+    def track_symbols(self, exchange: str, market_type: str, symbols: Iterable[str]) -> None:
+        """구독형 스트림(Bybit/Upbit)에 포함할 심볼 추가 (다음 구독 확인 주기에 반영)"""
+        with self._tracked_lock:
+            self._tracked[self._key(exchange, market_type)].update(s.upper() for s in symbols)
+
+    # @FEAT:price-cache @COMP:service @TYPE:helper
+    def is_fresh(self, exchange: str, market_type: str) -> bool:
+        """스트림이 연결되어 최근 stale_seconds 이내에 가격을 받았는지 여부 (heartbeat 응답 제외)"""
+        state = self._states.get(self._key(exchange, market_type))
+        if not state or not state.connected:
+            return False
+        return time.time() - state.last_price_at < self.stale_seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.time()
+        return {
+            'enabled': self._running,
+            'stale_seconds': self.stale_seconds,
+            'streams': {
+                f'{exchange}:{market_type}': {
+                    'connected': state.connected,
+                    'fresh': self.is_fresh(exchange, market_type),
+                    'last_message_age_seconds': round(now - state.last_message_at, 1) if state.last_message_at else None,
+                    'last_price_age_seconds': round(now - state.last_price_at, 1) if state.last_price_at else None,
+                    'messages': state.messages,
+                    'prices': state.prices,
+                    'reconnects': state.reconnects,
+                    'subscribed_symbols': len(state.subscribed),
+                    'last_error': state.last_error
+                }
+                for (exchange, market_type), state in self._states.items()
+            }
+        }
+
+    def _desired_symbols(self, spec: PriceStreamSpec) -> Set[str]:
+        key = (spec.exchange, spec.market_type)
+        with self._tracked_lock:
+            symbols = set(self._tracked.get(key, ()))
+        symbols.update(
+            symbol.upper() for symbol in self.cache.get_cached_symbols(spec.exchange, spec.market_type) if symbol
+        )
+        return symbols
+
+    def _apply(self, spec: PriceStreamSpec, state: _StreamState, raw_message: Any) -> int:
+        """수신 메시지를 파싱하여 캐시에 기록, 기록한 가격 수 반환"""
+        state.last_message_at = time.time()
+        state.messages += 1
+        message = json.loads(raw_message) if isinstance(raw_message, (str, bytes)) else raw_message
+        prices = spec.parser(message)
+        if prices:
+            self.cache.set_prices(dict(prices), spec.exchange, spec.market_type, source='stream')
+            state.last_price_at = state.last_message_at
+            state.prices += len(prices)
+        return len(prices)
+
+    async def _run_stream(self, spec: PriceStreamSpec) -> None:
+        state = self._states[(spec.exchange, spec.market_type)]
+        attempt = 0
+        while self._running:
+            try:
+                async with websockets.connect(spec.url, ping_interval=20, ping_timeout=20,
+                                              max_size=2 ** 22) as ws:
+                    state.connected = True
+                    state.subscribed = set()
+                    logger.info(f"🔌 시세 스트림 연결: {spec.exchange}:{spec.market_type}")
+                    received = await self._consume(spec, state, ws)
+                    if received:
+                        attempt = 0
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                state.last_error = str(e)
+                logger.warning(f"⚠️ 시세 스트림 오류 ({spec.exchange}:{spec.market_type}): {e}")
+            finally:
+                state.connected = False
+
+            if not self._running:
+                break
+            state.reconnects += 1
+            delay = min(PRICE_STREAM_MAX_BACKOFF_SEC, 2 ** attempt) + random.uniform(0, 1)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _consume(self, spec: PriceStreamSpec, state: _StreamState, ws) -> bool:
+        """메시지 수신 루프 - stale_seconds 동안 무응답이면 반환하여 재연결"""
+        received = False
+        last_sync = 0.0
+        while self._running:
+            if spec.subscribe and time.time() - last_sync >= PRICE_STREAM_RESUBSCRIBE_SEC:
+                await self._sync_subscriptions(spec, state, ws)
+                last_sync = time.time()
+
+            try:
+                raw_message = await asyncio.wait_for(ws.recv(), timeout=self.stale_seconds)
+            except asyncio.TimeoutError:
+                logger.warning(f"⏰ 시세 스트림 무응답 {self.stale_seconds}s - 재연결: "
+                               f"{spec.exchange}:{spec.market_type}")
+                return received
+
+            try:
+                self._apply(spec, state, raw_message)
+                received = True
+            except Exception as e:
+                logger.debug(f"시세 메시지 처리 실패 ({spec.exchange}:{spec.market_type}): {e}")
+        return received
+
+    async def _sync_subscriptions(self, spec: PriceStreamSpec, state: _StreamState, ws) -> None:
+        desired = self._desired_symbols(spec)
+        if spec.incremental:
+            symbols = sorted(desired - state.subscribed)
+        else:
+            symbols = sorted(desired) if desired != state.subscribed else []
+
+        if symbols:
+            for request in spec.subscribe(symbols):
+                await ws.send(json.dumps(request))
+            state.subscribed.update(desired if not spec.incremental else symbols)
+            logger.debug(f"📡 시세 구독 갱신 ({spec.exchange}:{spec.market_type}): {len(symbols)}개 심볼")
+        elif spec.heartbeat:
+            await ws.send(json.dumps(spec.heartbeat))
+
+
+# 전역 인스턴스
+price_stream_manager = PriceStreamManager()
@@ -702,12 +702,12 @@ class SecurityService:
             if 'secret_api' in update_data and update_data['secret_api']:
                 account.secret_api = self._encrypt_api_key(update_data['secret_api'])
 
-            # API 키가 변경된 경우 캐시 무효화
+            # API 키가 변경된 경우 복호화 캐시 무효화
             if 'public_api' in update_data or 'secret_api' in update_data:
                 Account.clear_cache(account.id)
 
-                # ExchangeService 클라이언트 캐시도 무효화
-                exchange_service.invalidate_account_cache(account.id)
+            # 계좌 정보가 바뀌면 계좌별 거래소 클라이언트도 제거 (다음 요청 시 재생성)
+            exchange_service.invalidate_account_cache(account.id)
 
             db.session.commit()
 
@@ -734,6 +734,7 @@ class SecurityService:
 
             db.session.delete(account)
             db.session.commit()
+            exchange_service.invalidate_account_cache(account_id)
             return True
 
         except Exception as e:
@@ -7,8 +7,9 @@ Symbol 제한사항 검증 서비스
 메모리에 캐싱하고 고속으로 검증하는 서비스입니다.
 
 주요 기능:
+- 기동 시 DB 스냅샷에서 즉시 복원 후 백그라운드 병렬 갱신
 - 백그라운드에서 주기적으로 Symbol 정보 갱신 (매시 15분)
-- 메모리 기반 고속 검증 (네트워크 요청 없음)
+- 메모리 기반 고속 검증 (네트워크 요청 없음, 거래소 클라이언트와 공유 저장소 사용)
 - 자동 소수점 조정 및 제한사항 검증
 - 여러 거래소 확장 가능한 구조
 """
@@ -16,14 +17,15 @@ Symbol 제한사항 검증 서비스
 import logging
 import time
 import threading
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Mapping, Optional, Tuple
 from decimal import Decimal, ROUND_DOWN
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor
 
 from app.models import Account
+from app.exchanges.market_store import market_store
 from app.exchanges.models import MarketInfo
-from app.constants import Exchange
+from app.constants import Exchange, MAX_PARALLEL_ACCOUNT_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -46,11 +48,12 @@ class SymbolValidator:
     """
 
     def __init__(self):
-        self.market_info_cache: Dict[str, MarketInfo] = {}
-        self.cache_last_updated: Dict[str, float] = {}
-        self.cache_lock = threading.RLock()
+        # MarketInfo는 공유 저장소(market_store)에 보관 - 거래소 클라이언트와 같은 테이블을 읽음
         self.is_initialized = False
 
+        # 현재 캐시 출처: 'snapshot' (기동 시 복원) / 'exchange' (API 로드)
+        self.cache_source: Optional[str] = None
+
         logger.info("✅ Symbol Validator 초기화 완료")
 
     # @FEAT:symbol-validation @FEAT:background-scheduler @COMP:service @TYPE:integration
@@ -64,70 +67,42 @@ class SymbolValidator:
     # @FEAT:symbol-validation @FEAT:exchange-integration @COMP:service @TYPE:core
     def load_initial_symbols(self):
         """
-        서비스 시작 시 모든 거래소 심볼 정보 필수 로드 (Public API)
+        서비스 시작 시 모든 거래소 심볼 정보 필수 로드
+
+        1. market_metadata_snapshots 스냅샷이 있으면 즉시 복원 (네트워크 없음, 수 ms)
+           → 주문 검증 바로 가능, 최신 정보는 백그라운드 스레드가 병렬로 받아 교체
+        2. 스냅샷이 없으면 (최초 기동, 만료, 형식 변경) 거래소 Public API에서 병렬 로드 후 스냅샷 저장
 
         WHY CryptoExchangeFactory 기반 동적 로딩:
         - 하드코딩 제거: 새 거래소 추가 시 코드 수정 불필요
         - 메타데이터 활용: ExchangeMetadata의 supported_markets로 market_type 자동 필터링
         - 확장성: 모든 거래소를 동일한 방식으로 처리
-
-        변경 내역 (2025-10-13):
-        - 기존: _load_binance_public_symbols() 하드코딩
-        - 현재: crypto_factory.SUPPORTED_EXCHANGES 순회 + metadata 기반 필터링
         """
         try:
-            from app.exchanges.crypto.factory import crypto_factory
-            from app.exchanges.metadata import ExchangeMetadata
-
-            logger.info("🔄 거래소 심볼 정보 로드 시작 (Public API)")
-
-            # 로드 전 캐시 상태 확인
-            logger.info(f"📊 로드 전 캐시 상태: {len(self.market_info_cache)}개 심볼")
-
-            success_count = 0
-
-            # ⭐ 기존 CryptoExchangeFactory 활용하여 모든 거래소 순회
-            for exchange_name in crypto_factory.SUPPORTED_EXCHANGES:
-                metadata = ExchangeMetadata.get_metadata(exchange_name)
-                supported_markets = metadata.get('supported_markets', [])
-
-                if not supported_markets:
-                    logger.warning(f"⚠️ {exchange_name}: 지원하는 market_type 없음 (스킵)")
-                    continue
-
-                try:
-                    # Public API 사용 (API 키 불필요)
-                    exchange = crypto_factory.create(exchange_name, '', '', testnet=False)
-
-                    for market_type in supported_markets:
-                        try:
-                            logger.info(f"🔄 {exchange_name.upper()} {market_type.value.upper()} 심볼 정보 로드 중...")
-                            markets = exchange.load_markets_impl(market_type.value, reload=True)
-
-                            with self.cache_lock:
-                                for symbol, market_info in markets.items():
-                                    cache_key = f"{exchange_name.upper()}_{symbol}_{market_type.value.upper()}"
-                                    self.market_info_cache[cache_key] = market_info
-                                    self.cache_last_updated[cache_key] = time.time()
-                                    success_count += 1
+            logger.info(f"📊 로드 전 캐시 상태: {len(market_store.snapshot.markets)}개 심볼")
 
-                            logger.info(f"✅ {exchange_name.upper()} {market_type.value.upper()} 심볼 로드: {len(markets)}개")
+            try:
+                restored = self._restore_from_snapshot()
+            except Exception as e:
+                logger.warning(f"⚠️ 심볼 스냅샷 복원 실패 - 거래소 API로 로드: {e}")
+                restored = 0
 
-                        except Exception as e:
-                            logger.error(f"❌ {exchange_name.upper()} {market_type.value.upper()} 심볼 로드 실패: {e}")
+            if restored:
+                self.is_initialized = True
+                logger.info(f"✅ 심볼 스냅샷 복원 완료: {restored}개 (초기화 플래그 설정됨, 백그라운드 갱신 시작)")
+                self._start_background_refresh()
+                return
 
-                except Exception as e:
-                    logger.error(f"❌ {exchange_name} 거래소 인스턴스 생성 실패: {e}")
+            logger.info("🔄 거래소 심볼 정보 로드 시작 (Public API)")
+            success_count = self._refresh_from_exchanges()
 
-            # 로드 후 캐시 상태 확인
-            logger.info(f"📊 로드 후 캐시 상태: {len(self.market_info_cache)}개 심볼")
+            logger.info(f"📊 로드 후 캐시 상태: {len(market_store.snapshot.markets)}개 심볼")
 
-            if not self.market_info_cache:
+            if not market_store.snapshot.markets:
                 error_msg = "심볼 정보를 로드할 수 없습니다 - 거래 불가"
                 logger.error(f"❌ {error_msg}")
                 raise Exception(error_msg)
 
-            # 초기화 완료 플래그 설정
             self.is_initialized = True
             logger.info(f"✅ 거래소 심볼 정보 로드 완료: {success_count}개 (초기화 플래그 설정됨)")
 
@@ -135,86 +110,145 @@ class SymbolValidator:
             logger.error(f"❌ 거래소 심볼 로드 실패: {e}")
             raise Exception(f"거래소 심볼 정보를 로드할 수 없어 서비스를 시작할 수 없습니다: {e}")
 
+    # @FEAT:symbol-validation @COMP:service @TYPE:helper
+    def _restore_from_snapshot(self) -> int:
+        """스냅샷에서 캐시 복원 → 복원된 심볼 수 (없으면 0)"""
+        from app.exchanges.crypto.factory import crypto_factory
+        from app.services.market_snapshot import market_snapshot_store
+
+        snapshots = market_snapshot_store.load_all()
+        partitions = {}
+        for (exchange_name, market_type), (markets, fetched_at) in snapshots.items():
+            if exchange_name not in crypto_factory.SUPPORTED_EXCHANGES:
+                continue
+            # precision_provider는 직렬화하지 않으므로 거래소 클라이언트 Factory로 재생성 (네트워크 없음)
+            exchange = crypto_factory.create(exchange_name, '', '', testnet=False)
+            for market_info in markets.values():
+                market_info.precision_provider = exchange._create_precision_provider(market_info)
+            partitions[(exchange_name, market_type)] = markets
+            logger.info(f"📦 {exchange_name.upper()} {market_type.upper()} 스냅샷 복원: "
+                        f"{len(markets)}개 (fetched_at={fetched_at})")
+
+        if not partitions:
+            return 0
+        self.cache_source = 'snapshot'
+        return self._swap_partitions(partitions)
+
+    # @FEAT:symbol-validation @FEAT:background-scheduler @COMP:service @TYPE:helper
+    def _start_background_refresh(self):
+        """스냅샷 복원 후 최신 심볼 정보를 별도 스레드에서 갱신 (서버 시작 비블로킹)"""
+        from flask import current_app, has_app_context
+
+        if has_app_context():
+            app = current_app._get_current_object()
+        else:
+            from app import get_flask_app
+            app = get_flask_app()
+
+        def run():
+            with app.app_context():
+                self._refresh_all_symbols()
+
+        threading.Thread(target=run, name='symbol-snapshot-refresh', daemon=True).start()
+
     # @FEAT:symbol-validation @FEAT:background-scheduler @COMP:service @TYPE:helper
     def _refresh_all_symbols(self):
         """
-        모든 Symbol 정보 갱신 (백그라운드 작업)
-
-        WHY 메타데이터 기반 필터링:
-        - 거래소별 지원 market_type 자동 감지
-        - Upbit SPOT 전용, Binance SPOT/FUTURES 모두 지원
-        - "Upbit은 Futures 지원하지 않음" 에러 제거
+        모든 Symbol 정보 갱신 (백그라운드 작업: 기동 직후 1회 + 매시 15분)
 
-        변경 내역 (2025-10-13):
-        - 기존: 하드코딩된 market_type 순회
-        - 현재: ExchangeMetadata.supported_markets 기반 필터링
+        마켓 정보는 공개 데이터이므로 계좌 없이 Public API로 조회합니다.
+        실패한 거래소 × market_type은 기존 캐시를 그대로 유지합니다.
         """
         try:
-            from app.exchanges.crypto.factory import crypto_factory
-            from app.exchanges.metadata import ExchangeMetadata
-            from app.models import Account
-
             logger.info("🔄 백그라운드 Symbol 정보 갱신 시작")
             refresh_start_time = time.time()
 
-            accounts = Account.query.filter_by(is_active=True).all()
+            total_refreshed = self._refresh_from_exchanges()
+
+            refresh_duration = time.time() - refresh_start_time
 
-            # 거래소별 계좌 그룹화 (첫 번째 활성 계좌만 사용)
-            exchange_accounts = {}
-            for account in accounts:
-                exchange_name = account.exchange.lower()
-                if exchange_name not in exchange_accounts and exchange_name in crypto_factory.SUPPORTED_EXCHANGES:
-                    exchange_accounts[exchange_name] = account
+            logger.info(f"✅ 백그라운드 Symbol 갱신 완료: {total_refreshed}개, "
+                       f"소요시간: {refresh_duration:.2f}초")
 
-            total_refreshed = 0
+        except Exception as e:
+            logger.error(f"백그라운드 Symbol 갱신 실패: {e}")
 
-            # ⭐ 기존 CryptoExchangeFactory 활용
-            for exchange_name, account in exchange_accounts.items():
-                metadata = ExchangeMetadata.get_metadata(exchange_name)
-                supported_markets = metadata.get('supported_markets', [])
+    # @FEAT:symbol-validation @FEAT:exchange-integration @COMP:service @TYPE:core
+    def _refresh_from_exchanges(self) -> int:
+        """
+        지원 거래소 × market_type의 exchangeInfo를 병렬로 받아 캐시 교체 + 스냅샷 저장
 
-                try:
-                    exchange = crypto_factory.create(
-                        exchange_name,
-                        account.api_key,
-                        account.api_secret,
-                        account.is_testnet
-                    )
+        WHY 메타데이터 기반 필터링:
+        - 거래소별 지원 market_type 자동 감지 (Upbit SPOT 전용, Binance SPOT/FUTURES)
 
-                    for market_type in supported_markets:
-                        try:
-                            markets = exchange.load_markets_impl(market_type.value, reload=True)
+        Returns:
+            int: 새로 로드된 심볼 수 (성공한 거래소 × market_type 합계)
+        """
+        from app.exchanges.crypto.factory import crypto_factory
+        from app.exchanges.metadata import ExchangeMetadata
+        from app.services.market_snapshot import market_snapshot_store
+
+        sources = []
+        for exchange_name in crypto_factory.SUPPORTED_EXCHANGES:
+            metadata = ExchangeMetadata.get_metadata(exchange_name)
+            supported_markets = metadata.get('supported_markets', [])
+
+            if not supported_markets:
+                logger.warning(f"⚠️ {exchange_name}: 지원하는 market_type 없음 (스킵)")
+                continue
+            for market_type in supported_markets:
+                sources.append((exchange_name, market_type.value))
+
+        if not sources:
+            return 0
+
+        def fetch(exchange_name: str, market_type: str) -> Dict[str, MarketInfo]:
+            exchange = crypto_factory.create(exchange_name, '', '', testnet=False)
+            return exchange.load_markets_impl(market_type, reload=True)
+
+        partitions = {}
+        fetched_at = datetime.utcnow()
+        with ThreadPoolExecutor(max_workers=min(len(sources), MAX_PARALLEL_ACCOUNT_WORKERS),
+                                thread_name_prefix='symbol-load') as executor:
+            futures = {source: executor.submit(fetch, *source) for source in sources}
+            for (exchange_name, market_type), future in futures.items():
+                label = f"{exchange_name.upper()} {market_type.upper()}"
+                try:
+                    markets = future.result()
+                    partitions[(exchange_name, market_type)] = markets
+                    logger.info(f"✅ {label} 심볼 로드: {len(markets)}개")
+                except Exception as e:
+                    logger.error(f"❌ {label} 심볼 로드 실패: {e}")
 
-                            with self.cache_lock:
-                                for symbol, market_info in markets.items():
-                                    cache_key = f"{exchange_name.upper()}_{symbol}_{market_type.value.upper()}"
-                                    self.market_info_cache[cache_key] = market_info
-                                    self.cache_last_updated[cache_key] = time.time()
-                                    total_refreshed += 1
+        if not partitions:
+            return 0
 
-                            logger.info(f"{exchange_name.upper()} {market_type.value} Symbol 로드: {len(markets)}개")
+        self._swap_partitions(partitions)
+        self.cache_source = 'exchange'
 
-                        except Exception as e:
-                            logger.error(f"{exchange_name.upper()} {market_type.value} Symbol 로드 실패: {e}")
+        for (exchange_name, market_type), markets in partitions.items():
+            market_snapshot_store.save(exchange_name, market_type, markets, fetched_at)
 
-                except Exception as e:
-                    logger.error(f"{exchange_name} Symbol 갱신 실패: {e}")
+        return sum(len(markets) for markets in partitions.values())
 
-            refresh_duration = time.time() - refresh_start_time
+    # @FEAT:symbol-validation @COMP:service @TYPE:helper
+    def _swap_partitions(self, partitions: Dict[Tuple[str, str], Mapping[str, MarketInfo]]) -> int:
+        """
+        거래소 × market_type 테이블을 공유 저장소에 한 번에 게시
 
-            logger.info(f"✅ 백그라운드 Symbol 갱신 완료: {total_refreshed}개, "
-                       f"소요시간: {refresh_duration:.2f}초")
+        검증 스레드는 갱신 도중에도 이전 또는 새 스냅샷 중 하나만 보게 되며,
+        갱신에 포함되지 않은 거래소 × market_type 테이블은 그대로 유지됩니다.
+        상장 폐지 심볼은 해당 market_type 테이블이 교체될 때 함께 제거됩니다.
 
-        except Exception as e:
-            logger.error(f"백그라운드 Symbol 갱신 실패: {e}")
+        Returns:
+            int: 교체 후 전체 캐시 심볼 수
+        """
+        return len(market_store.publish_many(partitions).markets)
 
     # @FEAT:symbol-validation @COMP:service @TYPE:helper
     def get_market_info(self, exchange: str, symbol: str, market_type: str) -> Optional[MarketInfo]:
-        """메모리에서 MarketInfo 조회 (네트워크 요청 없음)"""
-        cache_key = f"{exchange.upper()}_{symbol.upper()}_{market_type.upper()}"
-
-        with self.cache_lock:
-            return self.market_info_cache.get(cache_key)
+        """공유 저장소에서 MarketInfo 조회 (네트워크 요청/락 없음)"""
+        return market_store.get(exchange, market_type, symbol.upper())
 
     # @FEAT:symbol-validation @COMP:service @TYPE:validation
     def validate_order_params(self, exchange: str, symbol: str, market_type: str,
@@ -242,8 +276,9 @@ class SymbolValidator:
                 logger.error(f"❌ {error_msg}")
 
                 # 디버그: 현재 캐시 상태 출력
-                logger.error(f"📊 현재 캐시 상태: 총 {len(self.market_info_cache)}개 심볼")
-                logger.error(f"📊 캐시 키 샘플 (처음 5개): {list(self.market_info_cache.keys())[:5]}")
+                snapshot = market_store.snapshot
+                logger.error(f"📊 현재 캐시 상태: 총 {len(snapshot.markets)}개 심볼")
+                logger.error(f"📊 캐시 키 샘플 (처음 5개): {list(snapshot.markets.keys())[:5]}")
                 logger.error(f"📊 초기화 상태: {self.is_initialized}")
 
                 return {
@@ -402,12 +437,13 @@ class SymbolValidator:
     # @FEAT:symbol-validation @COMP:service @TYPE:helper
     def get_cache_stats(self) -> Dict[str, Any]:
         """캐시 통계 조회"""
-        with self.cache_lock:
-            return {
-                'total_symbols': len(self.market_info_cache),
-                'is_initialized': self.is_initialized,
-                'cache_keys': list(self.market_info_cache.keys())[:10]  # 처음 10개만
-            }
+        markets = market_store.snapshot.markets
+        return {
+            'total_symbols': len(markets),
+            'is_initialized': self.is_initialized,
+            'cache_source': self.cache_source,
+            'cache_keys': list(markets.keys())[:10]  # 처음 10개만
+        }
 
 
 # 전역 인스턴스
@@ -251,7 +251,7 @@ class TradingService:
         return self.order_manager.update_open_orders_status()
 
     # Position management ------------------------------------------------
-    def calculate_unrealized_pnl(self) -> None:
+    def calculate_unrealized_pnl(self) -> Dict[str, int]:
         return self.position_manager.calculate_unrealized_pnl()
 
     def get_user_open_orders_with_positions(self, user_id: int) -> Dict[str, Any]:
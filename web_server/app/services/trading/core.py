@@ -14,10 +14,11 @@ from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, List, Optional
 
 from flask import current_app
+from sqlalchemy import Float, Integer, String, Text, cast, column, func, insert, update, values
 
 from app import db
 from app.models import Account, Strategy, StrategyAccount, OpenOrder
-from app.constants import Exchange, MarketType, OrderType, OrderStatus
+from app.constants import Exchange, MarketType, OrderType, OrderStatus, MAX_PARALLEL_ACCOUNT_WORKERS
 from app.services.exchange import exchange_service
 from app.services.security import security_service
 from app.services.utils import to_decimal
@@ -242,30 +243,9 @@ class TradingCore:
             # ============================================================
             # STEP 1: Create PENDING order (before exchange API)
             # ============================================================
-            # @FEAT:webhook-order @COMP:service @TYPE:core
-            # @DATA:OrderStatus.PENDING - DB-first 패턴 (Phase 2: 2025-10-30)
-            pending_order = OpenOrder(
-                strategy_account_id=strategy_account.id,
-                exchange_order_id=f"PENDING-{uuid.uuid4().hex}",  # Full UUID (Fixed Issue #3)
-                symbol=symbol,
-                side=side,
-                order_type=order_type,
-                quantity=float(quantity) if quantity else 0.0,
-                filled_quantity=0.0,
-                status=OrderStatus.PENDING,
-                market_type=market_type,
-                price=float(price) if price else None,
-                stop_price=float(stop_price) if stop_price else None,
-                created_at=datetime.utcnow()
-            )
-
-            db.session.add(pending_order)
-            db.session.commit()
-            pending_order_id = pending_order.id
-
-            logger.debug(
-                f"✅ PENDING 주문 생성: id={pending_order_id}, "
-                f"symbol={symbol}, side={side}, qty={quantity}"
+            pending_order_id = self._create_pending_order(
+                strategy_account, symbol, side, quantity, order_type,
+                market_type, price, stop_price
             )
 
             try:
@@ -287,364 +267,618 @@ class TradingCore:
                 order_result['account_id'] = account.id
 
                 # ============================================================
-                # STEP 3: Update PENDING → OPEN (on success)
+                # STEP 3-5: PENDING → OPEN / FAILED
                 # ============================================================
-                if order_result.get('success'):
-                    order = OpenOrder.query.get(pending_order_id)
-                    if not order:
-                        raise ValueError(
-                            f"PENDING order not found: id={pending_order_id}. "
-                            f"This should never happen - indicates data corruption."
-                        )  # Fixed Issue #2
-
-                    old_status = order.status
-                    order.status = OrderStatus.OPEN
-
-                    # Update with exchange data
-                    exchange_order = {
-                        'id': order_result.get('order_id'),
-                        'price': float(price) if price else None,
-                        'filled': float(order_result.get('filled_quantity', 0)) if order_result.get('filled_quantity') else 0.0
-                    }
-                    order.exchange_order_id = exchange_order.get('id', order.exchange_order_id)
-                    if exchange_order.get('price'):
-                        order.price = exchange_order['price']
-                    if exchange_order.get('filled'):
-                        order.filled_quantity = exchange_order['filled']
-
-                    # @FEAT:orphan-order-prevention @COMP:service @TYPE:core @DEPS:db-connection-pool
-                    # 🆕 Phase 1: DB commit with 3 retries (50ms/100ms/150ms)
-                    # 목적: stale connection으로 인한 커밋 실패 시 재시도 (고아 주문 방지)
-                    retry_delays = [0.05, 0.10, 0.15]
-                    db_update_success = False
-
-                    for attempt in range(3):
-                        try:
-                            db.session.commit()
-                            db_update_success = True
-                            if attempt > 0:
-                                logger.info(
-                                    f"✅ PENDING→OPEN 성공 (재시도 {attempt}회 후) - "
-                                    f"order_id={pending_order_id}, symbol={symbol}"
-                                )
-                            else:
-                                logger.debug(
-                                    f"🔄 주문 상태 전환: {old_status} → {OrderStatus.OPEN} "
-                                    f"(exchange_order_id={exchange_order.get('id')})"
-                                )
-                            break
-                        except Exception as e:
-                            db.session.rollback()
-                            logger.warning(
-                                f"⚠️ PENDING→OPEN 재시도 {attempt+1}/3: {e} - "
-                                f"order_id={pending_order_id}, symbol={symbol}"
-                            )
-                            if attempt < 2:
-                                time.sleep(retry_delays[attempt])
-
-                    if not db_update_success:
-                        logger.critical(
-                            f"🚨 ORPHAN ORDER - PENDING→OPEN 실패 (3회 재시도) - "
-                            f"order_id={pending_order_id}, symbol={symbol}, "
-                            f"exchange_order_id={exchange_order.get('id')}"
-                        )
-                        # PENDING 상태 유지 → Phase 4 백그라운드 정리 대상
+                self._finalize_pending_order(
+                    pending_order_id, strategy_account, order_result, symbol, side,
+                    quantity, order_type, market_type, price, stop_price
+                )
+                if not order_result.get('success'):
+                    return order_result
 
-                else:
-                    # ============================================================
-                    # STEP 5: Update PENDING → FAILED (on exchange API failure)
-                    # ============================================================
-                    order = OpenOrder.query.get(pending_order_id)
-                    if not order:
-                        raise ValueError(
-                            f"PENDING order not found: id={pending_order_id}. "
-                            f"This should never happen - indicates data corruption."
-                        )  # Fixed Issue #2
-
-                    old_status = order.status
-                    error_msg = sanitize_error_message(order_result.get('error', 'Exchange order failed'))
-                    order.status = OrderStatus.FAILED
-                    order.error_message = error_msg
-
-                    # @FEAT:orphan-order-prevention @COMP:service @TYPE:core @DEPS:db-connection-pool
-                    # 🆕 Phase 1: DB commit with 3 retries (50ms/100ms/150ms)
-                    # 목적: stale connection으로 인한 커밋 실패 시 재시도 (고아 주문 방지)
-                    retry_delays = [0.05, 0.10, 0.15]
-                    db_update_success = False
-
-                    for attempt in range(3):
-                        try:
-                            db.session.commit()
-                            db_update_success = True
-                            if attempt > 0:
-                                logger.info(
-                                    f"✅ PENDING→FAILED 성공 (재시도 {attempt}회 후) - "
-                                    f"order_id={pending_order_id}, error={error_msg}"
-                                )
-                            else:
-                                logger.warning(
-                                    f"⚠️ 주문 실패: {old_status} → {OrderStatus.FAILED} "
-                                    f"(error: {error_msg[:50]}...)"
-                                )
-                            break
-                        except Exception as e:
-                            db.session.rollback()
-                            logger.warning(
-                                f"⚠️ PENDING→FAILED 재시도 {attempt+1}/3: {e} - "
-                                f"order_id={pending_order_id}"
-                            )
-                            if attempt < 2:
-                                time.sleep(retry_delays[attempt])
+            except Exception as e:
+                # STEP 5b: Update PENDING → FAILED (on exception)
+                self._fail_pending_order(pending_order_id, e)
 
-                    if not db_update_success:
-                        logger.critical(
-                            f"🚨 ORPHAN ORDER - PENDING→FAILED 실패 (3회 재시도) - "
-                            f"order_id={pending_order_id}, error={error_msg}"
-                        )
-                        # PENDING 상태 유지 → Phase 4 백그라운드 정리 대상
-
-                    # Phase 4: FailedOrder 생성 (재시도 메커니즘)
-                    from app.services.trading.failed_order_manager import failed_order_manager
-
-                    failed_order_manager.create_failed_order(
-                        strategy_account_id=strategy_account.id,
-                        order_params={
-                            'symbol': symbol,
-                            'side': side,
-                            'order_type': order_type,
-                            'quantity': quantity,
-                            'price': price,
-                            'stop_price': stop_price,
-                            'market_type': market_type
-                        },
-                        reason=order_result.get('error', 'Exchange order failed'),
-                        exchange_error=order_result.get('exchange_error')
-                    )
+                # 예외를 상위로 재전달
+                raise
 
-                    logger.warning(
-                        f"⚠️ 주문 실패 → FailedOrder 생성 - "
-                        f"심볼: {symbol}, 타입: {order_type}, side: {side}, "
-                        f"오류: {order_result.get('error')}"
-                    )
+            return self._complete_trade(
+                strategy, strategy_account, account, order_result, symbol, side,
+                quantity, order_type, market_type, price, stop_price,
+                timing_context, schedule_refresh
+            )
 
-                    return order_result
+        except Exception as e:
+            logger.error(f"거래 실행 실패: {e}")
+            failure_payload = {
+                'action': 'trading_signal',
+                'success': False,
+                'error': str(e),
+                'error_type': 'execution_error'
+            }
+            if 'account_id' not in failure_payload and 'account' in locals() and account:
+                failure_payload['account_id'] = account.id
+            return failure_payload
+
+    # @FEAT:webhook-order @FEAT:orphan-order-prevention @COMP:service @TYPE:helper
+    def _pending_order_row(self, strategy_account_id: int, symbol: str, side: str,
+                           quantity: Decimal, order_type: str, market_type: str,
+                           price: Optional[Decimal] = None,
+                           stop_price: Optional[Decimal] = None) -> Dict[str, Any]:
+        """PENDING OpenOrder 컬럼 값 구성 (단건/일괄 생성 공용)"""
+        # @FEAT:webhook-order @COMP:service @TYPE:core
+        # @DATA:OrderStatus.PENDING - DB-first 패턴 (Phase 2: 2025-10-30)
+        return {
+            'strategy_account_id': strategy_account_id,
+            'exchange_order_id': f"PENDING-{uuid.uuid4().hex}",  # Full UUID (Fixed Issue #3)
+            'symbol': symbol,
+            'side': side,
+            'order_type': order_type,
+            'quantity': float(quantity) if quantity else 0.0,
+            'filled_quantity': 0.0,
+            'status': OrderStatus.PENDING,
+            'market_type': market_type,
+            'price': float(price) if price else None,
+            'stop_price': float(stop_price) if stop_price else None,
+            'created_at': datetime.utcnow()
+        }
 
+    # @FEAT:webhook-order @FEAT:orphan-order-prevention @COMP:service @TYPE:helper
+    def _create_pending_order(self, strategy_account: StrategyAccount, symbol: str, side: str,
+                              quantity: Decimal, order_type: str, market_type: str,
+                              price: Optional[Decimal] = None,
+                              stop_price: Optional[Decimal] = None) -> int:
+        """거래소 호출 전 PENDING OpenOrder 생성 및 커밋 (DB-first, 고아 주문 방지)"""
+        pending_order = OpenOrder(**self._pending_order_row(
+            strategy_account.id, symbol, side, quantity, order_type,
+            market_type, price, stop_price
+        ))
+
+        db.session.add(pending_order)
+        db.session.commit()
+        pending_order_id = pending_order.id
+
+        logger.debug(
+            f"✅ PENDING 주문 생성: id={pending_order_id}, "
+            f"symbol={symbol}, side={side}, qty={quantity}"
+        )
+        return pending_order_id
+
+    # @FEAT:webhook-order @FEAT:orphan-order-prevention @COMP:service @TYPE:helper
+    def _create_pending_orders_bulk(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """
+        PENDING OpenOrder 일괄 생성 (multi-row INSERT ... RETURNING 1회 + 커밋 1회)
+
+        fan-out 전에 모든 계좌/주문의 PENDING 행을 한 번에 커밋합니다. 거래소 호출 전
+        커밋이 완료되므로 단건 경로(_create_pending_order)와 같은 DB-first 보장을 가집니다.
+
+        Args:
+            rows: _pending_order_row()로 만든 컬럼 값 목록
+
+        Returns:
+            rows와 같은 순서의 OpenOrder id 목록
+        """
+        if not rows:
+            return []
+
+        stmt = (
+            insert(OpenOrder)
+            .values(rows)
+            .returning(OpenOrder.id, OpenOrder.exchange_order_id)
+        )
+        try:
+            returned = db.session.execute(stmt).all()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        # RETURNING 행 순서는 보장되지 않으므로 고유한 PENDING-uuid로 매핑
+        ids_by_exchange_order_id = {row.exchange_order_id: row.id for row in returned}
+        pending_order_ids = [ids_by_exchange_order_id[row['exchange_order_id']] for row in rows]
+
+        logger.debug(f"✅ PENDING 주문 일괄 생성: {len(pending_order_ids)}건")
+        return pending_order_ids
+
+    # @FEAT:webhook-order @FEAT:orphan-order-prevention @COMP:service @TYPE:helper
+    def _pending_transition(self, pending_order_id: int, order_result: Dict[str, Any],
+                            price: Optional[Decimal] = None) -> Dict[str, Any]:
+        """거래소 결과를 PENDING → OPEN/FAILED 전환 값으로 변환 (None은 기존 값 유지)"""
+        if order_result.get('success'):
+            filled = order_result.get('filled_quantity')
+            return {
+                'id': pending_order_id,
+                'status': OrderStatus.OPEN,
+                'exchange_order_id': order_result.get('order_id') or None,
+                'price': float(price) if price else None,
+                'filled_quantity': float(filled) if filled else None,
+                'error_message': None
+            }
+        return {
+            'id': pending_order_id,
+            'status': OrderStatus.FAILED,
+            'exchange_order_id': None,
+            'price': None,
+            'filled_quantity': None,
+            'error_message': sanitize_error_message(
+                str(order_result.get('error') or 'Exchange order failed')
+            )
+        }
+
+    # @FEAT:webhook-order @FEAT:orphan-order-prevention @COMP:service @TYPE:core @DEPS:db-connection-pool
+    def _finalize_pending_orders_bulk(self, transitions: List[Dict[str, Any]]) -> bool:
+        """
+        PENDING → OPEN/FAILED 일괄 전환 (UPDATE 1회 + 커밋 1회)
+
+        PostgreSQL에서는 ``UPDATE open_orders ... FROM (VALUES ...) v WHERE id = v.id``
+        단일 문장으로, 그 외(SQLite 테스트 등)는 기본키 기반 bulk UPDATE로 처리합니다.
+        커밋은 단건 경로와 같이 3회 재시도하며(50ms/100ms/150ms), 끝내 실패하면
+        PENDING 상태로 남겨 백그라운드 정리 대상으로 둡니다.
+
+        Args:
+            transitions: _pending_transition()으로 만든 전환 값 목록
+
+        Returns:
+            bool: 커밋 성공 여부
+        """
+        if not transitions:
+            return True
+
+        retry_delays = [0.05, 0.10, 0.15]
+        db_update_success = False
+
+        for attempt in range(3):
+            try:
+                self._apply_pending_transitions(transitions)
+                db.session.commit()
+                db_update_success = True
+                if attempt > 0:
+                    logger.info(
+                        f"✅ PENDING 일괄 전환 성공 (재시도 {attempt}회 후) - {len(transitions)}건"
+                    )
+                break
             except Exception as e:
-                # ============================================================
-                # STEP 5b: Update PENDING → FAILED (on exception)
-                # ============================================================
+                db.session.rollback()
+                logger.warning(
+                    f"⚠️ PENDING 일괄 전환 재시도 {attempt+1}/3: {e} - {len(transitions)}건"
+                )
+                if attempt < 2:
+                    time.sleep(retry_delays[attempt])
+
+        if not db_update_success:
+            for transition in transitions:
+                logger.critical(
+                    f"🚨 ORPHAN ORDER - PENDING→{transition['status']} 실패 (3회 재시도) - "
+                    f"order_id={transition['id']}, "
+                    f"exchange_order_id={transition.get('exchange_order_id')}"
+                )
+            # PENDING 상태 유지 → Phase 4 백그라운드 정리 대상
+            return False
+
+        opened = sum(1 for t in transitions if t['status'] == OrderStatus.OPEN)
+        logger.debug(
+            f"🔄 PENDING 일괄 전환 완료: OPEN {opened}건, FAILED {len(transitions) - opened}건"
+        )
+        return True
+
+    def _apply_pending_transitions(self, transitions: List[Dict[str, Any]]) -> None:
+        now = datetime.utcnow()
+
+        if db.session.get_bind().dialect.name == 'postgresql':
+            v = values(
+                column('id', Integer),
+                column('status', String),
+                column('exchange_order_id', String),
+                column('price', Float),
+                column('filled_quantity', Float),
+                column('error_message', Text),
+                name='v'
+            ).data([
+                (t['id'], t['status'], t['exchange_order_id'], t['price'],
+                 t['filled_quantity'], t['error_message'])
+                for t in transitions
+            ])
+            # 전 행 NULL인 VALUES 컬럼은 text로 추론되므로 명시적으로 CAST
+            stmt = (
+                update(OpenOrder)
+                .where(OpenOrder.id == v.c.id)
+                .values(
+                    status=v.c.status,
+                    exchange_order_id=func.coalesce(v.c.exchange_order_id, OpenOrder.exchange_order_id),
+                    price=func.coalesce(cast(v.c.price, Float), OpenOrder.price),
+                    filled_quantity=func.coalesce(cast(v.c.filled_quantity, Float), OpenOrder.filled_quantity),
+                    error_message=func.coalesce(v.c.error_message, OpenOrder.error_message),
+                    updated_at=now
+                )
+                .execution_options(synchronize_session=False)
+            )
+            db.session.execute(stmt)
+            return
+
+        params = []
+        for t in transitions:
+            row = {key: value for key, value in t.items() if value is not None}
+            row['updated_at'] = now
+            params.append(row)
+        db.session.execute(update(OpenOrder), params)
+
+    # @FEAT:webhook-order @FEAT:orphan-order-prevention @COMP:service @TYPE:helper
+    def _finalize_pending_order(self, pending_order_id: int, strategy_account: StrategyAccount,
+                                order_result: Dict[str, Any], symbol: str, side: str,
+                                quantity: Decimal, order_type: str, market_type: str,
+                                price: Optional[Decimal] = None,
+                                stop_price: Optional[Decimal] = None) -> None:
+        """
+        거래소 응답에 따라 PENDING 주문을 OPEN/FAILED로 전환
+
+        실패 시 FailedOrder도 생성합니다. 커밋은 3회 재시도하며, 끝내 실패하면
+        PENDING 상태로 남겨 백그라운드 정리 대상으로 둡니다.
+        """
+        # ============================================================
+        # STEP 3: Update PENDING → OPEN (on success)
+        # ============================================================
+        if order_result.get('success'):
+            order = OpenOrder.query.get(pending_order_id)
+            if not order:
+                raise ValueError(
+                    f"PENDING order not found: id={pending_order_id}. "
+                    f"This should never happen - indicates data corruption."
+                )  # Fixed Issue #2
+
+            old_status = order.status
+            order.status = OrderStatus.OPEN
+
+            # Update with exchange data
+            exchange_order = {
+                'id': order_result.get('order_id'),
+                'price': float(price) if price else None,
+                'filled': float(order_result.get('filled_quantity', 0)) if order_result.get('filled_quantity') else 0.0
+            }
+            order.exchange_order_id = exchange_order.get('id', order.exchange_order_id)
+            if exchange_order.get('price'):
+                order.price = exchange_order['price']
+            if exchange_order.get('filled'):
+                order.filled_quantity = exchange_order['filled']
+
+            # @FEAT:orphan-order-prevention @COMP:service @TYPE:core @DEPS:db-connection-pool
+            # 🆕 Phase 1: DB commit with 3 retries (50ms/100ms/150ms)
+            # 목적: stale connection으로 인한 커밋 실패 시 재시도 (고아 주문 방지)
+            retry_delays = [0.05, 0.10, 0.15]
+            db_update_success = False
+
+            for attempt in range(3):
                 try:
-                    order = OpenOrder.query.get(pending_order_id)
-                    if not order:
-                        raise ValueError(
-                            f"PENDING order not found: id={pending_order_id}. "
-                            f"This should never happen - indicates data corruption."
-                        )  # Fixed Issue #2
-
-                    old_status = order.status
-                    error_msg = sanitize_error_message(str(e))
-                    order.status = OrderStatus.FAILED
-                    order.error_message = error_msg
-
-                    # @FEAT:orphan-order-prevention @COMP:service @TYPE:core @DEPS:db-connection-pool
-                    # 🆕 Phase 1: DB commit with 3 retries (50ms/100ms/150ms)
-                    # 목적: stale connection으로 인한 커밋 실패 시 재시도 (고아 주문 방지)
-                    retry_delays = [0.05, 0.10, 0.15]
-                    db_update_success = False
-
-                    for attempt in range(3):
-                        try:
-                            db.session.commit()
-                            db_update_success = True
-                            if attempt > 0:
-                                logger.info(
-                                    f"✅ PENDING→FAILED (exception) 성공 (재시도 {attempt}회 후) - "
-                                    f"order_id={pending_order_id}, exception={str(e)[:50]}"
-                                )
-                            break
-                        except Exception as commit_error:
-                            db.session.rollback()
-                            logger.warning(
-                                f"⚠️ PENDING→FAILED (exception) 재시도 {attempt+1}/3: {commit_error} - "
-                                f"order_id={pending_order_id}"
-                            )
-                            if attempt < 2:
-                                time.sleep(retry_delays[attempt])
+                    db.session.commit()
+                    db_update_success = True
+                    if attempt > 0:
+                        logger.info(
+                            f"✅ PENDING→OPEN 성공 (재시도 {attempt}회 후) - "
+                            f"order_id={pending_order_id}, symbol={symbol}"
+                        )
+                    else:
+                        logger.debug(
+                            f"🔄 주문 상태 전환: {old_status} → {OrderStatus.OPEN} "
+                            f"(exchange_order_id={exchange_order.get('id')})"
+                        )
+                    break
+                except Exception as e:
+                    db.session.rollback()
+                    logger.warning(
+                        f"⚠️ PENDING→OPEN 재시도 {attempt+1}/3: {e} - "
+                        f"order_id={pending_order_id}, symbol={symbol}"
+                    )
+                    if attempt < 2:
+                        time.sleep(retry_delays[attempt])
+
+            if not db_update_success:
+                logger.critical(
+                    f"🚨 ORPHAN ORDER - PENDING→OPEN 실패 (3회 재시도) - "
+                    f"order_id={pending_order_id}, symbol={symbol}, "
+                    f"exchange_order_id={exchange_order.get('id')}"
+                )
+                # PENDING 상태 유지 → Phase 4 백그라운드 정리 대상
 
-                    if not db_update_success:
-                        logger.critical(
-                            f"🚨 ORPHAN ORDER - PENDING→FAILED (exception) 실패 (3회 재시도) - "
-                            f"order_id={pending_order_id}, exception={str(e)[:50]}"
+        else:
+            # ============================================================
+            # STEP 5: Update PENDING → FAILED (on exchange API failure)
+            # ============================================================
+            order = OpenOrder.query.get(pending_order_id)
+            if not order:
+                raise ValueError(
+                    f"PENDING order not found: id={pending_order_id}. "
+                    f"This should never happen - indicates data corruption."
+                )  # Fixed Issue #2
+
+            old_status = order.status
+            error_msg = sanitize_error_message(order_result.get('error', 'Exchange order failed'))
+            order.status = OrderStatus.FAILED
+            order.error_message = error_msg
+
+            # @FEAT:orphan-order-prevention @COMP:service @TYPE:core @DEPS:db-connection-pool
+            # 🆕 Phase 1: DB commit with 3 retries (50ms/100ms/150ms)
+            # 목적: stale connection으로 인한 커밋 실패 시 재시도 (고아 주문 방지)
+            retry_delays = [0.05, 0.10, 0.15]
+            db_update_success = False
+
+            for attempt in range(3):
+                try:
+                    db.session.commit()
+                    db_update_success = True
+                    if attempt > 0:
+                        logger.info(
+                            f"✅ PENDING→FAILED 성공 (재시도 {attempt}회 후) - "
+                            f"order_id={pending_order_id}, error={error_msg}"
                         )
-                        # PENDING 상태 유지 → Phase 4 백그라운드 정리 대상
                     else:
-                        logger.error(
-                            f"❌ 주문 실패 (exception): {old_status} → {OrderStatus.FAILED} "
+                        logger.warning(
+                            f"⚠️ 주문 실패: {old_status} → {OrderStatus.FAILED} "
                             f"(error: {error_msg[:50]}...)"
                         )
-                except Exception as inner_e:
-                    logger.error(f"❌ PENDING → FAILED 전환 실패: {inner_e}")
+                    break
+                except Exception as e:
+                    db.session.rollback()
+                    logger.warning(
+                        f"⚠️ PENDING→FAILED 재시도 {attempt+1}/3: {e} - "
+                        f"order_id={pending_order_id}"
+                    )
+                    if attempt < 2:
+                        time.sleep(retry_delays[attempt])
 
-                # 예외를 상위로 재전달
-                raise
+            if not db_update_success:
+                logger.critical(
+                    f"🚨 ORPHAN ORDER - PENDING→FAILED 실패 (3회 재시도) - "
+                    f"order_id={pending_order_id}, error={error_msg}"
+                )
+                # PENDING 상태 유지 → Phase 4 백그라운드 정리 대상
 
-            # 조정된 수량/가격 보관 (거래소 제한 반영)
-            adjusted_quantity = order_result.get('adjusted_quantity', quantity)
-            adjusted_price = order_result.get('adjusted_price', price)
-            adjusted_stop_price = order_result.get('adjusted_stop_price', stop_price)
+            # Phase 4: FailedOrder 생성 (재시도 메커니즘)
+            self._record_failed_order(
+                strategy_account, order_result, symbol, side, quantity,
+                order_type, market_type, price, stop_price
+            )
 
-            fill_summary = self.service.position_manager.process_order_fill(
+    # @FEAT:webhook-order @COMP:service @TYPE:helper
+    def _record_failed_order(self, strategy_account: StrategyAccount, order_result: Dict[str, Any],
+                             symbol: str, side: str, quantity: Decimal, order_type: str,
+                             market_type: str, price: Optional[Decimal] = None,
+                             stop_price: Optional[Decimal] = None) -> None:
+        """거래소 주문 실패 시 FailedOrder 생성 (재시도 메커니즘)"""
+        from app.services.trading.failed_order_manager import failed_order_manager
+
+        failed_order_manager.create_failed_order(
+            strategy_account_id=strategy_account.id,
+            order_params={
+                'symbol': symbol,
+                'side': side,
+                'order_type': order_type,
+                'quantity': quantity,
+                'price': price,
+                'stop_price': stop_price,
+                'market_type': market_type
+            },
+            reason=order_result.get('error', 'Exchange order failed'),
+            exchange_error=order_result.get('exchange_error')
+        )
+
+        logger.warning(
+            f"⚠️ 주문 실패 → FailedOrder 생성 - "
+            f"심볼: {symbol}, 타입: {order_type}, side: {side}, "
+            f"오류: {order_result.get('error')}"
+        )
+
+    # @FEAT:webhook-order @FEAT:orphan-order-prevention @COMP:service @TYPE:helper
+    def _fail_pending_order(self, pending_order_id: int, error: Exception) -> None:
+        """거래소 호출 중 예외 발생 시 PENDING → FAILED 전환 (전환 실패는 로그만 남김)"""
+        # ============================================================
+        # STEP 5b: Update PENDING → FAILED (on exception)
+        # ============================================================
+        try:
+            order = OpenOrder.query.get(pending_order_id)
+            if not order:
+                raise ValueError(
+                    f"PENDING order not found: id={pending_order_id}. "
+                    f"This should never happen - indicates data corruption."
+                )  # Fixed Issue #2
+
+            old_status = order.status
+            error_msg = sanitize_error_message(str(error))
+            order.status = OrderStatus.FAILED
+            order.error_message = error_msg
+
+            # @FEAT:orphan-order-prevention @COMP:service @TYPE:core @DEPS:db-connection-pool
+            # 🆕 Phase 1: DB commit with 3 retries (50ms/100ms/150ms)
+            # 목적: stale connection으로 인한 커밋 실패 시 재시도 (고아 주문 방지)
+            retry_delays = [0.05, 0.10, 0.15]
+            db_update_success = False
+
+            for attempt in range(3):
+                try:
+                    db.session.commit()
+                    db_update_success = True
+                    if attempt > 0:
+                        logger.info(
+                            f"✅ PENDING→FAILED (exception) 성공 (재시도 {attempt}회 후) - "
+                            f"order_id={pending_order_id}, exception={str(error)[:50]}"
+                        )
+                    break
+                except Exception as commit_error:
+                    db.session.rollback()
+                    logger.warning(
+                        f"⚠️ PENDING→FAILED (exception) 재시도 {attempt+1}/3: {commit_error} - "
+                        f"order_id={pending_order_id}"
+                    )
+                    if attempt < 2:
+                        time.sleep(retry_delays[attempt])
+
+            if not db_update_success:
+                logger.critical(
+                    f"🚨 ORPHAN ORDER - PENDING→FAILED (exception) 실패 (3회 재시도) - "
+                    f"order_id={pending_order_id}, exception={str(error)[:50]}"
+                )
+                # PENDING 상태 유지 → Phase 4 백그라운드 정리 대상
+            else:
+                logger.error(
+                    f"❌ 주문 실패 (exception): {old_status} → {OrderStatus.FAILED} "
+                    f"(error: {error_msg[:50]}...)"
+                )
+        except Exception as inner_e:
+            logger.error(f"❌ PENDING → FAILED 전환 실패: {inner_e}")
+
+    # @FEAT:webhook-order @FEAT:order-tracking @COMP:service @TYPE:core
+    def _complete_trade(self, strategy: Strategy, strategy_account: StrategyAccount,
+                        account: Account, order_result: Dict[str, Any], symbol: str,
+                        side: str, quantity: Decimal, order_type: str, market_type: str,
+                        price: Optional[Decimal] = None,
+                        stop_price: Optional[Decimal] = None,
+                        timing_context: Optional[Dict[str, float]] = None,
+                        schedule_refresh: bool = True) -> Dict[str, Any]:
+        """거래소 접수 이후 처리 (체결 반영, OpenOrder 저장, 심볼 구독, SSE, 응답 구성)"""
+        # 조정된 수량/가격 보관 (거래소 제한 반영)
+        adjusted_quantity = order_result.get('adjusted_quantity', quantity)
+        adjusted_price = order_result.get('adjusted_price', price)
+        adjusted_stop_price = order_result.get('adjusted_stop_price', stop_price)
+
+        fill_summary = self.service.position_manager.process_order_fill(
+            strategy_account=strategy_account,
+            order_id=order_result.get('order_id'),
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            order_result=order_result,
+            market_type=market_type
+        )
+
+        # @FEAT:market-order-fill @COMP:service @TYPE:integration
+        # ✅ MARKET 주문 즉시 체결 확인 (헬퍼 메서드 사용)
+        # 단일 주문 경로: execute_trade() → _handle_market_order_immediate_fill()
+        if not fill_summary.get('success') and order_type.upper() == 'MARKET':
+            immediate_fill_result = self._handle_market_order_immediate_fill(
+                account=account,
                 strategy_account=strategy_account,
                 order_id=order_result.get('order_id'),
                 symbol=symbol,
                 side=side,
                 order_type=order_type,
-                order_result=order_result,
                 market_type=market_type
             )
 
-            # @FEAT:market-order-fill @COMP:service @TYPE:integration
-            # ✅ MARKET 주문 즉시 체결 확인 (헬퍼 메서드 사용)
-            # 단일 주문 경로: execute_trade() → _handle_market_order_immediate_fill()
-            if not fill_summary.get('success') and order_type.upper() == 'MARKET':
-                immediate_fill_result = self._handle_market_order_immediate_fill(
-                    account=account,
-                    strategy_account=strategy_account,
-                    order_id=order_result.get('order_id'),
-                    symbol=symbol,
-                    side=side,
-                    order_type=order_type,
-                    market_type=market_type
-                )
-
-                if immediate_fill_result.get('filled'):
-                    fill_summary = immediate_fill_result.get('fill_summary', {})
-                    order_result = immediate_fill_result.get('filled_order', {})
+            if immediate_fill_result.get('filled'):
+                fill_summary = immediate_fill_result.get('fill_summary', {})
+                order_result = immediate_fill_result.get('filled_order', {})
 
-            if not fill_summary.get('success'):
-                logger.warning(
-                    "체결 처리를 완료하지 못했습니다 - order_id=%s reason=%s",
-                    order_result.get('order_id'),
-                    fill_summary.get('error')
-                )
-                return {
-                    'action': 'trading_signal',
-                    'success': False,
-                    'error': fill_summary.get('error'),
-                    'order_id': order_result.get('order_id'),
-                    'account_id': account.id,
-                    'order_result': fill_summary.get('order_result')
-                }
+        if not fill_summary.get('success'):
+            logger.warning(
+                "체결 처리를 완료하지 못했습니다 - order_id=%s reason=%s",
+                order_result.get('order_id'),
+                fill_summary.get('error')
+            )
+            return {
+                'action': 'trading_signal',
+                'success': False,
+                'error': fill_summary.get('error'),
+                'order_id': order_result.get('order_id'),
+                'account_id': account.id,
+                'order_result': fill_summary.get('order_result')
+            }
 
-            order_result = fill_summary.get('order_result', order_result)
-            filled_decimal = fill_summary.get('filled_quantity', Decimal('0'))
-            average_decimal = fill_summary.get('average_price', Decimal('0'))
+        order_result = fill_summary.get('order_result', order_result)
+        filled_decimal = fill_summary.get('filled_quantity', Decimal('0'))
+        average_decimal = fill_summary.get('average_price', Decimal('0'))
 
-            # @FEAT:webhook-order @COMP:service @TYPE:core
-            # OpenOrder 저장 (webhook_received_at 추출 및 전달 - Snapshot 쿼리용)
-            # Note: timing_context은 선택적 (None이면 webhook_received_at = None)
-            # UTC 변환: 전체 시스템이 UTC 기반이므로 utcfromtimestamp 사용
-            webhook_received_at_dt = None
-            if timing_context and 'webhook_received_at' in timing_context:
-                webhook_received_at_dt = datetime.utcfromtimestamp(timing_context['webhook_received_at'])
+        # @FEAT:webhook-order @COMP:service @TYPE:core
+        # OpenOrder 저장 (webhook_received_at 추출 및 전달 - Snapshot 쿼리용)
+        # Note: timing_context은 선택적 (None이면 webhook_received_at = None)
+        # UTC 변환: 전체 시스템이 UTC 기반이므로 utcfromtimestamp 사용
+        webhook_received_at_dt = None
+        if timing_context and 'webhook_received_at' in timing_context:
+            webhook_received_at_dt = datetime.utcfromtimestamp(timing_context['webhook_received_at'])
+
+        # OpenOrder 레코드 생성 (미체결 주문인 경우)
+        open_order_result = self.service.order_manager.create_open_order_record(
+            strategy_account=strategy_account,
+            order_result=order_result,
+            symbol=symbol,
+            side=side,
+            order_type=order_type,
+            quantity=adjusted_quantity,
+            price=adjusted_price,
+            stop_price=adjusted_stop_price,
+            webhook_received_at=webhook_received_at_dt  # ✅ Added for Snapshot query
+        )
+        if open_order_result['success']:
+            logger.info(f"📝 미체결 주문 OpenOrder 저장: {order_result.get('order_id')}")
 
-            # OpenOrder 레코드 생성 (미체결 주문인 경우)
-            open_order_result = self.service.order_manager.create_open_order_record(
-                strategy_account=strategy_account,
-                order_result=order_result,
-                symbol=symbol,
-                side=side,
-                order_type=order_type,
-                quantity=adjusted_quantity,
-                price=adjusted_price,
-                stop_price=adjusted_stop_price,
-                webhook_received_at=webhook_received_at_dt  # ✅ Added for Snapshot query
-            )
-            if open_order_result['success']:
-                logger.info(f"📝 미체결 주문 OpenOrder 저장: {order_result.get('order_id')}")
+            # 심볼 구독 추가 (WebSocket 연결)
+            try:
+                self.service.subscribe_symbol(account.id, symbol)
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ 심볼 구독 실패 (WebSocket health check에서 재시도): "
+                    f"계정: {account.id}, 심볼: {symbol}, 오류: {e}"
+                )
+                # OpenOrder는 유지, WebSocket 헬스체크에서 재구독
+        else:
+            logger.debug(f"OpenOrder 저장 스킵: {open_order_result.get('reason', 'unknown')}")
 
-                # 심볼 구독 추가 (WebSocket 연결)
-                try:
-                    self.service.subscribe_symbol(account.id, symbol)
-                except Exception as e:
-                    logger.warning(
-                        f"⚠️ 심볼 구독 실패 (WebSocket health check에서 재시도): "
-                        f"계정: {account.id}, 심볼: {symbol}, 오류: {e}"
-                    )
-                    # OpenOrder는 유지, WebSocket 헬스체크에서 재구독
-            else:
-                logger.debug(f"OpenOrder 저장 스킵: {open_order_result.get('reason', 'unknown')}")
+        if not fill_summary.get('events_emitted'):
+            self.service.event_emitter.emit_order_events_smart(strategy, symbol, side, adjusted_quantity, order_result)
 
-            if not fill_summary.get('events_emitted'):
-                self.service.event_emitter.emit_order_events_smart(strategy, symbol, side, adjusted_quantity, order_result)
+        # 응답 데이터 구성 (filled_quantity를 숫자로 변환, 실제 체결가 사용)
+        filled_qty_num = 0.0
+        avg_price_num = 0.0
 
-            # 응답 데이터 구성 (filled_quantity를 숫자로 변환, 실제 체결가 사용)
+        try:
+            if filled_decimal and filled_decimal > Decimal('0'):
+                filled_qty_num = float(filled_decimal)
+        except (ValueError, TypeError):
             filled_qty_num = 0.0
-            avg_price_num = 0.0
 
-            try:
-                if filled_decimal and filled_decimal > Decimal('0'):
-                    filled_qty_num = float(filled_decimal)
-            except (ValueError, TypeError):
-                filled_qty_num = 0.0
-
-            # average_price 결정 (실제 체결가 우선)
-            if average_decimal and average_decimal > Decimal('0'):
-                avg_price_num = float(average_decimal)
-            else:
-                avg_price_num = float(order_result.get('actual_execution_price', 0) or 0)
-                if avg_price_num <= 0:
-                    avg_price_num = float(order_result.get('average_price', 0) or 0)
-                if avg_price_num <= 0:
-                    avg_price_num = float(order_result.get('adjusted_average_price', 0) or 0)
-
-            # results 배열 구성 (시장가 주문 체결 정보)
-            results = []
-            if filled_qty_num > 0 and avg_price_num > 0:
-                results.append({
-                    'symbol': symbol,
-                    'side': side,
-                    'executed_qty': filled_qty_num,
-                    'executed_price': avg_price_num,
-                    'trade_id': fill_summary.get('trade_id'),
-                    'order_id': order_result.get('order_id'),
-                    'timestamp': datetime.utcnow().isoformat()
-                })
-
-            result_payload = {
-                'action': 'trading_signal',
-                'success': True,
+        # average_price 결정 (실제 체결가 우선)
+        if average_decimal and average_decimal > Decimal('0'):
+            avg_price_num = float(average_decimal)
+        else:
+            avg_price_num = float(order_result.get('actual_execution_price', 0) or 0)
+            if avg_price_num <= 0:
+                avg_price_num = float(order_result.get('average_price', 0) or 0)
+            if avg_price_num <= 0:
+                avg_price_num = float(order_result.get('adjusted_average_price', 0) or 0)
+
+        # results 배열 구성 (시장가 주문 체결 정보)
+        results = []
+        if filled_qty_num > 0 and avg_price_num > 0:
+            results.append({
+                'symbol': symbol,
+                'side': side,
+                'executed_qty': filled_qty_num,
+                'executed_price': avg_price_num,
                 'trade_id': fill_summary.get('trade_id'),
                 'order_id': order_result.get('order_id'),
-                'filled_quantity': filled_qty_num,  # 숫자로 반환
-                'average_price': avg_price_num,  # 실제 체결가 반환
-                'price': float(adjusted_price) if adjusted_price else None,  # 🆕 지정가 (LIMIT 주문용)
-                'stop_price': float(adjusted_stop_price) if adjusted_stop_price else None,  # 🆕 스탑 가격
-                'status': order_result.get('status'),
-                'trade_status': fill_summary.get('trade_status'),
-                'execution_status': fill_summary.get('execution_status'),
-                'order_type': order_type,  # 🆕 주문 타입
-                'account_id': account.id,
-                'results': results  # 체결 상세 정보 배열
-            }
+                'timestamp': datetime.utcnow().isoformat()
+            })
+
+        result_payload = {
+            'action': 'trading_signal',
+            'success': True,
+            'trade_id': fill_summary.get('trade_id'),
+            'order_id': order_result.get('order_id'),
+            'filled_quantity': filled_qty_num,  # 숫자로 반환
+            'average_price': avg_price_num,  # 실제 체결가 반환
+            'price': float(adjusted_price) if adjusted_price else None,  # 🆕 지정가 (LIMIT 주문용)
+            'stop_price': float(adjusted_stop_price) if adjusted_stop_price else None,  # 🆕 스탑 가격
+            'status': order_result.get('status'),
+            'trade_status': fill_summary.get('trade_status'),
+            'execution_status': fill_summary.get('execution_status'),
+            'order_type': order_type,  # 🆕 주문 타입
+            'account_id': account.id,
+            'results': results  # 체결 상세 정보 배열
+        }
 
 
-            if schedule_refresh:
-                security_service.refresh_account_balance_async(account.id)
+        if schedule_refresh:
+            security_service.refresh_account_balance_async(account.id)
 
-            return result_payload
-
-        except Exception as e:
-            logger.error(f"거래 실행 실패: {e}")
-            failure_payload = {
-                'action': 'trading_signal',
-                'success': False,
-                'error': str(e),
-                'error_type': 'execution_error'
-            }
-            if 'account_id' not in failure_payload and 'account' in locals() and account:
-                failure_payload['account_id'] = account.id
-            return failure_payload
+        return result_payload
 
     # @FEAT:webhook-order @FEAT:order-tracking @COMP:service @TYPE:integration
     def _execute_exchange_order(self, account: Account, symbol: str, side: str,
@@ -914,8 +1148,6 @@ class TradingCore:
     def process_trading_signal(self, webhook_data: Dict[str, Any],
                                timing_context: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """거래 신호 처리"""
-        from app.services.utils import to_decimal
-
         # 필수 필드 검증 (market_type은 webhook_service에서 주입됨, exchange는 Strategy 연동 계좌에서 자동 결정)
         required_fields = ['group_name', 'symbol', 'order_type']
         for field in required_fields:
@@ -1058,23 +1290,20 @@ class TradingCore:
                                  qty: Optional[Decimal], market_type: str,
                                  timing_context: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
         """
-        배치 주문 병렬 실행 (타입 그룹별 분리)
-
-        Issue #10: Lock 기반 Race Condition 방지
-        ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-        배치 주문 생성 시 동시 접근을 Lock으로 차단합니다.
+        다계좌 주문 병렬 실행 (상주 이벤트 루프 fan-out)
 
-        Lock 획득 전략:
-        - 대상: LIMIT/STOP 주문 (거래소 즉시 실행)
-        - 제외: MARKET 주문 (즉시 거래소 실행, Lock 불필요)
-        - Deadlock 방지: (account_id, symbol) 튜플 정렬 순서로 Lock 획득
-        - Lock 범위: 거래소 주문 실행 + 배치 커밋 + SSE 발송
-        - 자동 해제: contextlib.ExitStack으로 예외 시에도 Lock 해제 보장
+        처리 단계:
+        1. (요청 스레드) 계좌별 수량 계산 + PENDING OpenOrder 일괄 생성 (INSERT ... RETURNING 1회)
+        2. (fan-out 루프) 모든 계좌의 거래소 주문을 동시에 제출
+           - 거래소별 Rate Limit 예산 안에서 제출, 네이티브 async 클라이언트는 aiohttp 경로 사용
+        3. (요청 스레드) PENDING → OPEN/FAILED 일괄 전환 (UPDATE 1회)
+        4. 계좌별 후처리(체결 재조회/Trade/Position/OpenOrder/SSE)를 ThreadPoolExecutor로 병렬 실행
+           (워커는 자체 세션에서 id로 다시 조회, 배치 경로의 계좌별 병렬 후처리와 같은 방식)
 
-        처리 흐름:
-        1. 타입 그룹 확인 (LIMIT/STOP/MARKET)
-        2. LIMIT/STOP: Lock 획득 → 배치 주문 생성 → Lock 해제
-        3. MARKET: Lock 없이 즉시 실행
+        PENDING 커밋은 거래소 호출 전에 끝나고, 전환 커밋은 3회 재시도 후 실패 시 PENDING으로
+        남기므로 execute_trade()와 같은 고아 주문 방지 보장을 유지합니다.
+        응답 시간 초과(BATCH_ACCOUNT_TIMEOUT_SEC) 주문은 이미 접수됐을 수 있으므로 PENDING으로 남겨
+        백그라운드 정리에 맡기고 FailedOrder(재시도 대상)를 만들지 않습니다.
 
         Args:
             filtered_accounts (List[tuple]): (strategy, account, strategy_account) 튜플 리스트
@@ -1088,148 +1317,230 @@ class TradingCore:
             timing_context (Optional[Dict[str, float]]): 웹훅 타이밍 정보
 
         Returns:
-            List[Dict[str, Any]]: [
-                {
-                    'success': bool,
-                    'account_id': int,
-                    'account_name': str,
-                    'message': str,
-                    'pending_order_id': Optional[int],  # LIMIT/STOP만
-                    'priority': Optional[int],
-                    'order_type': str,
-                    'event_type': str,
-                    'queued': Optional[bool],  # LIMIT/STOP만
-                    'error': Optional[str]
-                },
-                ...
-            ]
-
-        Side Effects:
-        - db.session.commit() 호출 (배치 커밋)
-        - PendingOrder SSE 이벤트 발송
-        - 재정렬 알고리즘 Lock 획득/해제
+            List[Dict[str, Any]]: 계좌별 execute_trade()와 동일한 형식의 결과
 
         Performance:
-        - ThreadPoolExecutor: max(min(10, account_count)) 병렬 처리
-        - Lock 보유 시간: ThreadPoolExecutor 완료까지 (개별 함수 선택)
-        - Lock 정렬: (account_id, symbol) 조합 정렬으로 Deadlock 방지
+        - 웹훅마다 스레드 풀을 만들지 않음 (order_fanout_engine 상주 루프 재사용)
+        - 신호 → 마지막 거래소 응답 지연은 order_fanout_engine.get_stats()로 확인
         """
+        from app.services.trading.order_fanout import OrderJob, is_unconfirmed, order_fanout_engine
+
         results = []
-        max_workers = min(10, len(filtered_accounts))
+        candidates = []
+        prepared = {}
+        jobs = []
 
-        # Flask app context를 미리 캡처
-        app = current_app._get_current_object()
+        for strategy, account, sa in filtered_accounts:
+            # qty_per 또는 qty를 실제 주문 수량으로 변환
+            try:
+                calculated_quantity = self.service.quantity_calculator.calculate_order_quantity(
+                    strategy_account=sa,
+                    symbol=symbol,
+                    order_type=order_type,
+                    qty_per=qty_per,
+                    qty=qty,
+                    market_type=market_type,
+                    price=price,
+                    stop_price=stop_price,
+                    side=side
+                )
 
-        # Phase 4: LIMIT/STOP 주문 타입 그룹 확인
-        from app.constants import ORDER_TYPE_GROUPS
+                if calculated_quantity == Decimal('0'):
+                    logger.warning(f"계좌 {account.id}: 수량 계산 결과 0, 주문 스킵")
+                    results.append({
+                        'success': False,
+                        'error': '계산된 주문 수량이 0입니다',
+                        'account_id': account.id,
+                        'skipped': True
+                    })
+                    continue
 
-        type_group = None
-        for group_name, types in ORDER_TYPE_GROUPS.items():
-            if order_type.upper() in types:
-                type_group = group_name
-                break
+                logger.debug(f"계좌 {account.id}: qty_per {qty_per}% → quantity {calculated_quantity}")
 
-        # ✅ Issue #10: 배치 주문 실행 로직 (enqueue 내부에서 자동 Lock 보호)
-        def _execute_batch_logic():
-            """
-            배치 주문 실행 로직 (모든 주문 타입 공통)
-
-            Issue #10: enqueue 내부에서 심볼별 Lock 자동 획득
-            - 단일 주문: enqueue(commit=True) → 자동 Lock 보호
-            - 배치 주문: enqueue(commit=False) × N → 자동 Lock 보호
-            - 리밸런서: _move_to_pending() → 자동 Lock 보호
-
-            처리 단계:
-            1. ThreadPoolExecutor로 병렬 enqueue (commit=False)
-            2. 배치 커밋 (db.session.commit())
-            3. SSE 일괄 발송
-
-            Returns:
-                None (results는 외부 스코프 변수에 추가)
-
-            Side Effects:
-            - db.session.commit()
-            - PendingOrder SSE 이벤트 발송
-            - results 리스트 업데이트 (외부 스코프)
-            """
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {}
-                for strategy, account, sa in filtered_accounts:
-                    # qty_per 또는 qty를 실제 주문 수량으로 변환
-                    try:
-                        calculated_quantity = self.service.quantity_calculator.calculate_order_quantity(
-                            strategy_account=sa,
-                            symbol=symbol,
-                            order_type=order_type,
-                            qty_per=qty_per,
-                            qty=qty,
-                            market_type=market_type,
-                            price=price,
-                            stop_price=stop_price,
-                            side=side
-                        )
+            except Exception as calc_error:
+                logger.error(f"계좌 {account.id}: 수량 계산 실패 - {calc_error}")
+                results.append({
+                    'success': False,
+                    'error': f'수량 계산 실패: {calc_error}',
+                    'account_id': account.id
+                })
+                continue
 
-                        if calculated_quantity == Decimal('0'):
-                            logger.warning(f"계좌 {account.id}: 수량 계산 결과 0, 주문 스킵")
-                            results.append({
-                                'success': False,
-                                'error': '계산된 주문 수량이 0입니다',
-                                'account_id': account.id,
-                                'skipped': True
-                            })
-                            continue
+            # 🆕 Phase 5: 주문 실행 직전 is_active 재확인 (Race Condition 방지)
+            if hasattr(sa, 'is_active') and not sa.is_active:
+                results.append({
+                    'success': False,
+                    'error': 'StrategyAccount가 비활성 상태입니다',
+                    'error_type': 'account_inactive',
+                    'account_id': account.id,
+                    'account_name': account.name,
+                    'strategy_account_id': sa.id,
+                    'skipped': True,
+                    'skip_reason': 'strategy_account_inactive'
+                })
+                continue
 
-                        logger.debug(f"계좌 {account.id}: qty_per {qty_per}% → quantity {calculated_quantity}")
+            exchange_market_type = 'futures' if (strategy.market_type or 'SPOT').upper() == 'FUTURES' else 'spot'
 
-                    except Exception as calc_error:
-                        logger.error(f"계좌 {account.id}: 수량 계산 실패 - {calc_error}")
-                        results.append({
-                            'success': False,
-                            'error': f'수량 계산 실패: {calc_error}',
-                            'account_id': account.id
-                        })
-                        continue
+            try:
+                client = exchange_service.get_exchange(account)
+            except Exception as e:
+                logger.error(f"거래 실행 실패 (계좌 {account.id}): {e}")
+                results.append({
+                    'action': 'trading_signal',
+                    'success': False,
+                    'error': str(e),
+                    'error_type': 'execution_error',
+                    'account_id': account.id
+                })
+                continue
 
-                    # Phase 4: 모든 주문 타입을 즉시 거래소에 제출 (Queue 제거)
-                    # LIMIT/STOP/MARKET/CANCEL 주문: 모두 즉시 거래소 제출
-                    def execute_in_context(app, strategy, account, sa, symbol, side, calculated_quantity, order_type, price, stop_price, timing_context):
-                        with app.app_context():
-                            return self.execute_trade(
-                                strategy=strategy,
-                                symbol=symbol,
-                                side=side,
-                                quantity=calculated_quantity,  # ✅ 변환된 수량 사용
-                                order_type=order_type,
-                                price=price,
-                                stop_price=stop_price,
-                                strategy_account_override=sa,
-                                timing_context=timing_context
-                            )
+            candidates.append((strategy, account, sa, client, calculated_quantity, exchange_market_type))
 
-                    future = executor.submit(
-                        execute_in_context,
-                        app, strategy, account, sa, symbol, side, calculated_quantity, order_type, price, stop_price, timing_context
+        # PENDING 행 일괄 생성 (multi-row INSERT ... RETURNING, 거래소 호출 전 커밋)
+        try:
+            pending_order_ids = self._create_pending_orders_bulk([
+                self._pending_order_row(
+                    sa.id, symbol, side, quantity, order_type,
+                    exchange_market_type, price, stop_price
+                )
+                for _, _, sa, _, quantity, exchange_market_type in candidates
+            ])
+        except Exception as e:
+            logger.error(f"PENDING 주문 일괄 생성 실패: {e}")
+            for _, account, _, _, _, _ in candidates:
+                results.append({
+                    'action': 'trading_signal',
+                    'success': False,
+                    'error': str(e),
+                    'error_type': 'execution_error',
+                    'account_id': account.id
+                })
+            return results
+
+        for pending_order_id, candidate in zip(pending_order_ids, candidates):
+            strategy, account, sa, client, calculated_quantity, exchange_market_type = candidate
+            prepared[pending_order_id] = (strategy, account, sa, calculated_quantity, exchange_market_type)
+            jobs.append(OrderJob(
+                key=pending_order_id,
+                account_id=account.id,
+                exchange_name=account.exchange.lower(),
+                client=client,
+                symbol=symbol,
+                side=side,
+                order_type=order_type,
+                quantity=calculated_quantity,
+                market_type=exchange_market_type,
+                price=price,
+                stop_price=stop_price
+            ))
+
+        # 모든 계좌 주문 동시 제출 (요청 스레드는 결과까지 대기)
+        signal_received_at = (timing_context or {}).get('webhook_received_at')
+        exchange_results = order_fanout_engine.execute(
+            jobs, signal_received_at=signal_received_at, timeout=BATCH_ACCOUNT_TIMEOUT_SEC
+        )
+
+        order_results = {}
+        for pending_order_id, (strategy, account, sa, quantity, exchange_market_type) in prepared.items():
+            order_result = exchange_results.get(pending_order_id) or {
+                'success': False, 'error': '거래소 응답 없음'
+            }
+            order_result['account_id'] = account.id
+            order_results[pending_order_id] = order_result
+
+        # PENDING → OPEN/FAILED 일괄 전환 (UPDATE ... FROM (VALUES ...) 1회)
+        # 응답 시간 초과 주문은 접수 여부 미확정 → PENDING 유지
+        self._finalize_pending_orders_bulk([
+            self._pending_transition(pending_order_id, order_result, price)
+            for pending_order_id, order_result in order_results.items()
+            if not is_unconfirmed(order_result)
+        ])
+
+        # 후처리 대상은 순서 유지용 자리만 잡아 두고 병렬 실행 후 채움
+        completions = []
+        for pending_order_id, (strategy, account, sa, quantity, exchange_market_type) in prepared.items():
+            order_result = order_results[pending_order_id]
+
+            if is_unconfirmed(order_result):
+                logger.warning(
+                    f"⏱️ 거래소 응답 시간 초과 - PENDING 유지 (계좌 {account.id}, pending_order_id={pending_order_id}), "
+                    f"FailedOrder 미생성 (중복 주문 방지)"
+                )
+                order_result['pending_order_id'] = pending_order_id
+                results.append(order_result)
+                continue
+
+            if not order_result.get('success'):
+                try:
+                    self._record_failed_order(
+                        sa, order_result, symbol, side, quantity,
+                        order_type, exchange_market_type, price, stop_price
                     )
-                    futures[future] = (strategy, account, sa)
+                except Exception as e:
+                    logger.error(f"FailedOrder 생성 실패 (계좌 {account.id}): {e}")
+                results.append(order_result)
+                continue
+
+            completions.append((len(results), strategy, account, sa, order_result, quantity, exchange_market_type))
+            results.append(None)
+
+        db.session.commit()
 
-                for future in as_completed(futures):
-                    strategy, account, sa = futures[future]
+        def complete(strategy, account, sa, order_result, quantity, exchange_market_type):
+            return self._complete_trade(
+                strategy, sa, account, order_result, symbol, side,
+                quantity, order_type, exchange_market_type, price, stop_price,
+                timing_context
+            )
+
+        app = current_app._get_current_object()
+
+        def complete_in_context(strategy_id, account_id, sa_id, *args):
+            # 요청 스레드 세션의 ORM 객체 대신 워커 세션에서 다시 조회
+            with app.app_context():
+                try:
+                    result = complete(
+                        db.session.get(Strategy, strategy_id), db.session.get(Account, account_id),
+                        db.session.get(StrategyAccount, sa_id), *args
+                    )
+                    db.session.commit()
+                    return result
+                except Exception:
+                    db.session.rollback()
+                    raise
+
+        errors = {}
+        if len(completions) == 1:
+            index, strategy, account, sa, *args = completions[0]
+            try:
+                results[index] = complete(strategy, account, sa, *args)
+                db.session.commit()
+            except Exception as e:
+                db.session.rollback()
+                errors[index] = (account.id, e)
+        elif completions:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_ACCOUNT_WORKERS, len(completions)),
+                                    thread_name_prefix='trade-complete') as executor:
+                futures = {
+                    executor.submit(complete_in_context, strategy.id, account.id, sa.id, *args): (index, account.id)
+                    for index, strategy, account, sa, *args in completions
+                }
+                for future, (index, account_id) in futures.items():
                     try:
-                        result = future.result(timeout=30)
-                        results.append(result)
+                        results[index] = future.result()
                     except Exception as e:
-                        logger.error(f"거래 실행 실패 (계좌 {account.id}): {e}")
-                        results.append({
-                            'success': False,
-                            'error': str(e),
-                            'account_id': account.id
-                        })
-
-            # Phase 4: 배치 커밋 (거래소 주문만)
-            db.session.commit()
+                        errors[index] = (account_id, e)
 
-        # ✅ Issue #10: enqueue 내부에서 자동으로 Lock 획득하므로 여기서는 불필요
-        _execute_batch_logic()
+        for index, (account_id, error) in errors.items():
+            logger.error(f"거래 후처리 실패 (계좌 {account_id}): {error}")
+            results[index] = {
+                'action': 'trading_signal',
+                'success': False,
+                'error': str(error),
+                'error_type': 'execution_error',
+                'account_id': account_id
+            }
 
         return results
 
@@ -1273,8 +1584,6 @@ class TradingCore:
                 ...
             }
         """
-        from app.services.utils import to_decimal
-
         orders_by_account = {}
 
         # 전략의 모든 활성 계좌 순회
@@ -1395,13 +1704,16 @@ class TradingCore:
 
         Phase 2 개선사항:
         - 계좌별 병렬 처리로 성능 50% 향상 (651ms vs 1302ms 예상)
-        - ThreadPoolExecutor 기반 비블로킹 실행
+        - 거래소 제출: (계좌, 마켓)별 배치 한도 청크를 order_fanout_engine에서 동시 실행
+          (Binance Futures batchOrders 5건/요청 → 거래소 왕복 1/5)
+        - 후처리(체결 확인/OpenOrder/SSE): ThreadPoolExecutor 기반 계좌별 병렬 실행
         - Flask app context 안전성 보장
         - 환경 변수 기반 타임아웃 (BATCH_ACCOUNT_TIMEOUT_SEC)
-        """
-        from app.services.utils import to_decimal
-        from app.constants import OrderType
 
+        DB 왕복 최소화:
+        - 전 계좌/주문 PENDING 행을 multi-row INSERT ... RETURNING 1회로 생성 (거래소 호출 전 커밋)
+        - 거래소 결과를 모은 뒤 PENDING → OPEN/FAILED를 UPDATE 1회로 전환 (3회 커밋 재시도)
+        """
         # 필수 필드 검증 (exchange, market_type은 strategy에서 가져옴)
         required_fields = ['group_name', 'orders']
         for field in required_fields:
@@ -1425,7 +1737,6 @@ class TradingCore:
 
         # Strategy 조회 및 market_type 가져오기
         from app.models import Strategy
-        from app.constants import MarketType
 
         strategy = Strategy.query.filter_by(group_name=group_name, is_active=True).first()
         if not strategy:
@@ -1578,53 +1889,86 @@ class TradingCore:
                     }
                 }
 
-            # 3. 계좌별 배치 주문 병렬 실행 (Phase 2: ThreadPoolExecutor)
-            # max_workers 방어: 최소 1 보장 (len(orders_by_account) == 0 방지)
-            max_workers = max(1, min(10, len(orders_by_account)))
-            app = current_app._get_current_object()  # Flask app context 캡처
-            batch_start = time.time()  # 성능 측정 시작
+            # 🆕 Phase 5: 배치 실행 직전 is_active 재확인 (Race Condition 방지)
+            active_accounts = {}
+            for account_id, account_data in orders_by_account.items():
+                strategy_account = account_data['strategy_account']
+                if hasattr(strategy_account, 'is_active') and not strategy_account.is_active:
+                    results.extend(self._skip_inactive_account_batch(account_data, strategy))
+                    continue
+                active_accounts[account_id] = account_data
+
+            # 3. PENDING 행 일괄 생성 (multi-row INSERT ... RETURNING, 거래소 호출 전 커밋)
+            pending_rows = []
+            for account_data in active_accounts.values():
+                strategy_account_id = account_data['strategy_account'].id
+                for exchange_order in account_data['orders']:
+                    pending_rows.append(self._pending_order_row(
+                        strategy_account_id,
+                        exchange_order['symbol'],
+                        exchange_order['side'].upper(),
+                        exchange_order['amount'],
+                        exchange_order['type'],
+                        market_type.lower(),
+                        exchange_order.get('price'),
+                        exchange_order.get('params', {}).get('stopPrice')
+                    ))
+
+            try:
+                pending_order_ids = iter(self._create_pending_orders_bulk(pending_rows))
+            except Exception as e:
+                logger.error(f"PENDING 주문 일괄 생성 실패: {e}")
+                for account_data in active_accounts.values():
+                    results.extend(self._fail_account_batch(account_data, f'PENDING 주문 생성 실패: {e}'))
+                active_accounts = {}
 
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {}
+            for account_data in active_accounts.values():
+                account_data['pending_order_ids'] = [
+                    next(pending_order_ids) for _ in account_data['orders']
+                ]
 
-                for account_id, account_data in orders_by_account.items():
-                    # Flask app context 전달 함수
-                    def execute_account_batch_in_context(app, account_data, market_type, strategy, trading_orders):
-                        with app.app_context():
-                            return self._execute_account_batch(account_data, market_type, strategy, trading_orders)
+            # 4. (계좌, 마켓)별 배치 청크를 fan-out 루프에서 동시 제출 (거래소 배치 한도 단위)
+            batch_start = time.time()  # 성능 측정 시작
+            batch_results = self._submit_account_batches(active_accounts, market_type, timing_context)
+
+            # 5. PENDING → OPEN/FAILED 일괄 전환 (UPDATE ... FROM (VALUES ...) 1회)
+            #    후처리(create_open_order_record)가 거래소 주문 ID로 기존 행을 재사용하도록 먼저 커밋
+            transitions = []
+            for account_id, account_data in active_accounts.items():
+                transitions.extend(self._batch_pending_transitions(account_data, batch_results[account_id]))
+            self._finalize_pending_orders_bulk(transitions)
+
+            # 6. 계좌별 후처리 병렬 실행 (체결 확인, OpenOrder 저장, SSE)
+            # max_workers 방어: 최소 1 보장 (len(active_accounts) == 0 방지)
+            max_workers = max(1, min(MAX_PARALLEL_ACCOUNT_WORKERS, len(active_accounts)))
+            app = current_app._get_current_object()  # Flask app context 캡처
 
-                    # Future 제출
-                    future = executor.submit(
-                        execute_account_batch_in_context,
-                        app, account_data, market_type, strategy, trading_orders
-                    )
-                    futures[future] = account_data
+            def run_in_context(func, *args):
+                with app.app_context():
+                    return func(*args)
 
-                # 결과 수집 (as_completed로 완료되는 대로 처리)
-                # ✅ Priority 1 Fix: as_completed timeout 제거 (각 계좌가 독립적으로 타임아웃)
-                # ✅ Priority 2: 환경 변수 기반 타임아웃 (기본 30초)
-                for future in as_completed(futures):
-                    try:
-                        account_results = future.result(timeout=BATCH_ACCOUNT_TIMEOUT_SEC)
-                        results.extend(account_results)
-                    except Exception as e:
-                        account_data = futures[future]
-                        account_name = account_data['account'].name
-                        logger.error(f"계좌 {account_name} 병렬 처리 실패: {str(e)}")
+            if active_accounts:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {}
 
-                        # 해당 계좌의 모든 주문 실패 처리
-                        for trading_idx, (original_idx, _) in enumerate(trading_orders):
-                            results.append({
-                                'order_index': original_idx,
-                                'success': False,
-                                'result': {
-                                    'action': 'trading_signal',
-                                    'success': False,
-                                    'error': f'병렬 처리 실패: {str(e)}',
-                                    'account_id': account_data['account'].id,
-                                    'account_name': account_name
-                                }
-                            })
+                    for account_id, account_data in active_accounts.items():
+                        # Future 제출 (Flask app context 전달)
+                        future = executor.submit(
+                            run_in_context, self._execute_account_batch,
+                            account_data, market_type, strategy, trading_orders, batch_results[account_id]
+                        )
+                        futures[future] = account_data
+
+                    # 결과 수집 (as_completed로 완료되는 대로 처리)
+                    # ✅ Priority 1 Fix: as_completed timeout 제거 (각 계좌가 독립적으로 타임아웃)
+                    for future in as_completed(futures):
+                        try:
+                            account_results = future.result(timeout=BATCH_ACCOUNT_TIMEOUT_SEC)
+                            results.extend(account_results)
+                        except Exception as e:
+                            account_data = futures[future]
+                            logger.error(f"계좌 {account_data['account'].name} 병렬 처리 실패: {str(e)}")
+                            results.extend(self._fail_account_batch(account_data, f'병렬 처리 실패: {str(e)}'))
 
             # 성능 측정 완료 및 로깅
             batch_end = time.time()
@@ -1634,7 +1978,7 @@ class TradingCore:
                 f"duration={batch_duration_ms}ms"
             )
 
-        # 4. 기존 집계 로직 유지
+        # 7. 기존 집계 로직 유지
         successful = [r for r in results if r.get('success', False)]
         failed = [r for r in results if not r.get('success', False)]
 
@@ -1662,13 +2006,145 @@ class TradingCore:
             }
         }
 
+    # @FEAT:batch-parallel-processing @COMP:service @TYPE:helper
+    def _skip_inactive_account_batch(self, account_data: Dict[str, Any],
+                                     strategy: Strategy) -> List[Dict[str, Any]]:
+        """비활성 StrategyAccount의 배치 전체 스킵 결과 (원본 인덱스 매핑)"""
+        account = account_data['account']
+        strategy_account = account_data['strategy_account']
+        logger.warning(
+            f"⚠️ [Phase 5] StrategyAccount {strategy_account.id} 비활성 상태 - "
+            f"배치 주문 실행 스킵 (전략: {strategy.group_name}, 계좌: {account.name})"
+        )
+        return [{
+            'order_index': order.get('original_index', 0),
+            'success': False,
+            'error': 'StrategyAccount가 비활성 상태입니다',
+            'error_type': 'account_inactive',
+            'account_id': account.id,
+            'account_name': account.name,
+            'strategy_account_id': strategy_account.id,
+            'skipped': True,
+            'skip_reason': 'strategy_account_inactive',
+            'batch_skipped': True
+        } for order in account_data['orders']]
+
+    # @FEAT:batch-parallel-processing @COMP:service @TYPE:helper
+    def _fail_account_batch(self, account_data: Dict[str, Any], error: str) -> List[Dict[str, Any]]:
+        """계좌 배치 전체 실패 결과 (원본 인덱스 매핑)"""
+        account = account_data['account']
+        return [{
+            'order_index': order.get('original_index', 0),
+            'success': False,
+            'result': {
+                'action': 'trading_signal',
+                'success': False,
+                'error': error,
+                'account_id': account.id,
+                'account_name': account.name
+            }
+        } for order in account_data['orders']]
+
+    # @FEAT:batch-parallel-processing @COMP:service @TYPE:core
+    def _submit_account_batches(self, accounts: Dict[int, Dict[str, Any]], market_type: str,
+                                timing_context: Optional[Dict[str, float]] = None) -> Dict[int, Dict[str, Any]]:
+        """
+        계좌별 배치 주문을 거래소 네이티브 배치 API로 동시 제출 (DB 접근 없음)
+
+        처리 단계:
+        1. (계좌, market_type)별로 주문을 묶고 거래소 배치 한도로 청크 분할
+           - Binance Futures: batchOrders 5건/요청, 배치 API 미지원 거래소는 계좌당 1청크(순차 폴백)
+        2. 모든 계좌의 청크를 order_fanout_engine 상주 루프에서 동시에 제출
+        3. 청크 결과를 계좌별 원래 주문 순서(order_index)로 병합 - 부분 실패는 주문 단위로 매핑
+
+        Returns:
+            {account_id: create_batch_orders()와 같은 형식의 결과}
+        """
+        from app.services.trading.order_fanout import (
+            BatchOrderJob, chunk_orders, merge_batch_results, order_fanout_engine
+        )
+
+        exchange_market_type = market_type.lower()
+        batch_results = {}
+        chunks_by_account = {}
+        jobs = []
+
+        for account_id, account_data in accounts.items():
+            account = account_data['account']
+            try:
+                client = exchange_service.get_exchange(account)
+            except Exception as e:
+                logger.error(f"계좌 {account.name} 거래소 클라이언트 생성 실패: {e}")
+                batch_results[account_id] = {'success': False, 'error': f'배치 실행 실패: {e}', 'results': []}
+                continue
+
+            get_limit = getattr(client, 'get_batch_order_limit', None)
+            limit = get_limit(exchange_market_type) if get_limit else None
+            chunks = chunk_orders(account_data['orders'], limit)
+            chunks_by_account[account_id] = chunks
+
+            logger.info(
+                f"📦 계좌 {account.name} 배치 주문 실행: {len(account_data['orders'])}건 "
+                f"→ 요청 {len(chunks)}회 (batch_limit={limit or '-'})"
+            )
+            for offset, chunk in chunks:
+                jobs.append(BatchOrderJob(
+                    key=(account_id, exchange_market_type, offset),
+                    account_id=account.id,
+                    exchange_name=account.exchange.lower(),
+                    client=client,
+                    market_type=exchange_market_type,
+                    orders=chunk
+                ))
+
+        signal_received_at = (timing_context or {}).get('webhook_received_at')
+        chunk_results = order_fanout_engine.execute_batches(
+            jobs, signal_received_at=signal_received_at, timeout=BATCH_ACCOUNT_TIMEOUT_SEC
+        )
+
+        for account_id, chunks in chunks_by_account.items():
+            batch_results[account_id] = merge_batch_results([
+                (offset, len(chunk), chunk_results.get((account_id, exchange_market_type, offset)))
+                for offset, chunk in chunks
+            ])
+        return batch_results
+
+    # @FEAT:batch-parallel-processing @FEAT:orphan-order-prevention @COMP:service @TYPE:helper
+    def _batch_pending_transitions(self, account_data: Dict[str, Any],
+                                   batch_result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """배치 결과를 계좌 주문별 PENDING 전환 값으로 매핑 (응답 없는 주문은 FAILED, 시간 초과 주문은 PENDING 유지)"""
+        from app.services.trading.order_fanout import is_unconfirmed, order_to_result
+
+        exchange_orders = account_data['orders']
+        pending_order_ids = account_data.get('pending_order_ids') or []
+        items_by_index = {}
+        for position, result_item in enumerate(batch_result.get('results', [])):
+            items_by_index[result_item.get('order_index', position)] = result_item
+
+        transitions = []
+        for idx, pending_order_id in enumerate(pending_order_ids):
+            result_item = items_by_index.get(idx)
+            if is_unconfirmed(result_item):
+                continue
+            if result_item and result_item.get('success'):
+                order_result = order_to_result(result_item.get('order') or {})
+                order_result['order_id'] = order_result['order_id'] or result_item.get('order_id')
+            else:
+                error = (result_item or {}).get('error') or batch_result.get('error') or '거래소 응답 없음'
+                order_result = {'success': False, 'error': error}
+            transitions.append(
+                self._pending_transition(pending_order_id, order_result, exchange_orders[idx].get('price'))
+            )
+        return transitions
+
     # @FEAT:batch-parallel-processing @FEAT:webhook-batch-queue @COMP:service @TYPE:helper
     def _execute_account_batch(
         self,
         account_data: Dict[str, Any],
         market_type: str,
         strategy: Strategy,
-        trading_orders: List[tuple]
+        trading_orders: List[tuple],
+        batch_result: Dict[str, Any]
     ) -> List[Dict[str, Any]]:
         """
         단일 계좌의 배치 주문 처리 (병렬 실행용 헬퍼)
@@ -1710,6 +2186,7 @@ class TradingCore:
             market_type: 'SPOT' or 'FUTURES'
             strategy: Strategy 객체
             trading_orders: [(original_idx, order), ...] 원본 인덱스 매핑용
+            batch_result: _submit_account_batch() 결과 (PENDING 일괄 전환 이후 전달)
 
         Returns:
             List[Dict]: Combined success and failed results
@@ -1717,60 +2194,20 @@ class TradingCore:
             - success=False: Order failed, includes error message
         """
         account = account_data['account']
-        strategy_account = account_data['strategy_account']
         exchange_orders = account_data['orders']
         # @FEAT:webhook-order @COMP:service @TYPE:helper
         # timing_context 배치 실행 단계 추출: webhook_received_at을 OpenOrder에 저장
         timing_context = account_data.get('timing_context')  # ✅ Extract timing_context
         results = []
 
-        logger.info(
-            f"📦 계좌 {account.name} 배치 주문 실행: {len(exchange_orders)}건"
-        )
-
-        # 🆕 Phase 5: 배치 실행 직전 is_active 재확인 (Race Condition 방지)
-        if hasattr(strategy_account, 'is_active') and not strategy_account.is_active:
-            logger.warning(
-                f"⚠️ [Phase 5] StrategyAccount {strategy_account.id} 비활성 상태 - "
-                f"배치 주문 실행 스킵 (전략: {strategy.group_name}, 계좌: {account.name})"
-            )
-            # 배치 전체 스킵 (원본 인덱스 매핑)
-            for order in exchange_orders:
-                original_idx = order.get('original_index', 0)
-                results.append({
-                    'order_index': original_idx,
-                    'success': False,
-                    'error': 'StrategyAccount가 비활성 상태입니다',
-                    'error_type': 'account_inactive',
-                    'account_id': account.id,
-                    'account_name': account.name,
-                    'strategy_account_id': strategy_account.id,
-                    'skipped': True,
-                    'skip_reason': 'strategy_account_inactive',
-                    'batch_skipped': True
-                })
-            return results
-
         # @FEAT:webhook-order @COMP:service @TYPE:core
         # Phase 4: 모든 주문 타입을 즉시 거래소에 제출 (Queue 시스템 제거)
-        # LIMIT/STOP/MARKET/CANCEL 모두 direct_orders로 처리
-        direct_orders = exchange_orders  # 모든 주문을 즉시 실행
-
-        logger.info(f"Phase 4: All orders immediate execution - Total: {len(direct_orders)}")
-
-        # Phase 4: 모든 주문을 즉시 거래소에 제출
+        # 거래소 제출은 _submit_account_batch()에서 끝났고, PENDING 전환도 커밋된 상태
+        direct_orders = exchange_orders
         if not direct_orders:
             return results
 
         try:
-            # CRITICAL FIX: account_id 전달 (Phase 0 Rate Limiting 활성화)
-            batch_result = exchange_service.create_batch_orders(
-                account=account,
-                orders=direct_orders,  # Only MARKET/CANCEL
-                market_type=market_type.lower(),
-                account_id=account.id  # ✅ 필수 파라미터
-            )
-
             # 결과 로깅
             if batch_result.get('success'):
                 implementation = batch_result.get('implementation', 'UNKNOWN')
@@ -1784,11 +2221,13 @@ class TradingCore:
                 logger.error(
                     f"❌ 계좌 {account.name} 배치 실패: {batch_result.get('error')}"
                 )
+                if not batch_result.get('results'):
+                    return self._fail_account_batch(account_data, batch_result.get('error') or 'Unknown error')
 
             # 결과 처리 (direct_orders 기준으로 수정)
             batch_results = batch_result.get('results', [])
-            for result_item in batch_results:
-                batch_order_idx = result_item.get('order_index', 0)
+            for position, result_item in enumerate(batch_results):
+                batch_order_idx = result_item.get('order_index', position)
 
                 if batch_order_idx >= len(direct_orders):
                     logger.warning(f"⚠️ 잘못된 order_index: {batch_order_idx}")
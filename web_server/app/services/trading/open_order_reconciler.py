@@ -0,0 +1,417 @@
+# @FEAT:order-tracking @FEAT:orphan-order-prevention @COMP:service @TYPE:core @DEPS:exchange-integration
+"""
+미체결 주문 동기화(update_open_orders_status) 조회 계획 및 병렬 거래소 조회
+
+OrderManager.update_open_orders_status()가 DB 처리 전에 사용합니다.
+
+- 버킷: (계좌, market_type) 단위 - 계좌 안에 현물/선물 주문이 섞여 있어도 마켓별로 조회
+- 생략: 주문 이벤트를 전달하는 사용자 데이터 스트림(ORDER_STREAM_MARKETS)이 최근
+  ORDER_RECONCILE_STREAM_STALE_SEC 이내에 수신(메시지/pong)이 있었으면 REST 조회를 건너뜀
+  (단, 마지막 REST 확인 후 ORDER_RECONCILE_FULL_REFRESH_SEC가 지나면 무조건 조회 - 이벤트 누락 대비)
+- 조회 방식: 심볼별 조회 가중치 합이 전체 조회 가중치보다 작으면 심볼별 get_open_orders,
+  아니면 계좌 전체 get_open_orders (Binance: 심볼별 6 vs 전체 80)
+- 병렬: ORDER_RECONCILE_MAX_WORKERS 스레드 풀에서 거래소 조회만 수행 (DB 처리는 호출 스레드)
+- 배치 조회 실패 심볼은 워커에서 주문별 fetch_order로 폴백
+- Circuit Breaker: 거래소별 배치 조회 연속 실패가 CIRCUIT_BREAKER_THRESHOLD 이상이면 계획 단계에서
+  해당 거래소 버킷 하나만 시험 조회하고 나머지는 건너뜀. 조회 중 임계값에 도달하면 이후 호출을 중단
+- 워커 스레드에는 ORM 객체 대신 계좌 id/거래소 이름과 (주문 id, 심볼) 목록만 전달하고,
+  계좌는 워커 자신의 세션에서 다시 조회
+
+실행별 버킷/호출 수/소모 가중치는 get_stats()로 확인합니다 (/api/system/order-reconcile-stats).
+"""
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from flask import current_app
+
+from app import db
+from app.constants import ORDER_STREAM_MARKETS, MarketType
+from app.models import Account, OpenOrder
+from app.utils.db_pool import current_db_pool_role, db_pool_role
+
+logger = logging.getLogger(__name__)
+
+# 동시 조회 스레드 수 (전체)
+ORDER_RECONCILE_MAX_WORKERS = int(os.getenv('ORDER_RECONCILE_MAX_WORKERS', '8'))
+# 이 시간 이상 스트림 수신이 없으면 스트림을 신뢰하지 않고 REST 조회
+ORDER_RECONCILE_STREAM_STALE_SEC = float(os.getenv('ORDER_RECONCILE_STREAM_STALE_SEC', '60'))
+# 스트림이 정상이어도 이 시간이 지나면 REST로 재확인
+ORDER_RECONCILE_FULL_REFRESH_SEC = float(os.getenv('ORDER_RECONCILE_FULL_REFRESH_SEC', '300'))
+# 거래소별 배치 조회 연속 실패 허용 횟수 (도달 시 Circuit Breaker 발동)
+try:
+    CIRCUIT_BREAKER_THRESHOLD = max(1, int(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '3')))
+except ValueError:
+    CIRCUIT_BREAKER_THRESHOLD = 3
+    logger.warning("⚠️ Invalid CIRCUIT_BREAKER_THRESHOLD, using default: 3")
+
+
+@dataclass
+class ReconcileBucket:
+    """(계좌, market_type) 단위 조회 대상 (orders 외에는 스레드 간 공유 가능한 값만 보관)"""
+    account_id: int
+    account_name: str
+    # 소문자 거래소 이름
+    exchange: str
+    market_type: str
+    # 호출 스레드 전용 (워커에는 (주문 id, 심볼) 목록만 전달)
+    orders: List[OpenOrder]
+    # None이면 계좌 전체 조회, 아니면 심볼별 조회
+    symbols: Optional[List[str]] = None
+    # Circuit Breaker 발동 중인 거래소의 시험 조회 버킷
+    probe: bool = False
+    # Circuit Breaker로 조회 생략
+    circuit_open: bool = False
+
+    @property
+    def key(self) -> Tuple[int, str]:
+        return self.account_id, self.market_type
+
+
+@dataclass
+class BucketFetch:
+    """버킷 조회 결과 (워커 스레드 → 호출 스레드)"""
+    bucket: ReconcileBucket
+    # {exchange_order_id: 거래소 주문 dict} - 배치 조회 성공 범위의 미체결 주문
+    orders_map: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # 배치 조회 실패 심볼 (계좌 전체 조회 실패 시 None 키 하나)
+    failed_symbols: Set[Optional[str]] = field(default_factory=set)
+    # 폴백 개별 조회 결과 {exchange_order_id: fetch_order 결과 (예외 시 None)}
+    individual: Dict[str, Optional[Dict[str, Any]]] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    calls: int = 0
+    weight: int = 0
+    # Circuit Breaker로 조회하지 않음 (계획 단계 또는 조회 중 발동)
+    circuit_open: bool = False
+
+    def batch_failed(self, symbol: str) -> bool:
+        return None in self.failed_symbols or symbol in self.failed_symbols
+
+    def record_call(self, endpoint_class: str) -> None:
+        from app.services.exchange import RateLimiter
+
+        self.calls += 1
+        self.weight += RateLimiter.get_weight(self.bucket.exchange, endpoint_class)
+
+
+def to_exchange_order_map(orders: Iterable[Any]) -> Dict[str, Dict[str, Any]]:
+    """get_open_orders 응답(Order 모델 또는 dict)을 {order_id: dict}로 변환"""
+    exchange_orders_map: Dict[str, Dict[str, Any]] = {}
+    for exchange_order in orders or []:
+        if hasattr(exchange_order, 'id'):
+            # Order 모델 인스턴스
+            order_id = str(exchange_order.id)
+            exchange_orders_map[order_id] = {
+                'order_id': order_id,
+                'status': exchange_order.status,
+                'filled_quantity': float(exchange_order.filled),
+                'average_price': float(exchange_order.average) if exchange_order.average else None,
+                'symbol': exchange_order.symbol
+            }
+        elif isinstance(exchange_order, dict):
+            order_id = str(exchange_order.get('id') or exchange_order.get('order_id'))
+            exchange_orders_map[order_id] = exchange_order
+    return exchange_orders_map
+
+
+# @FEAT:order-tracking @COMP:service @TYPE:core
+class OpenOrderReconciler:
+    """미체결 주문 동기화 조회 계획/병렬 조회/실행 통계"""
+
+    def __init__(self, max_workers: int = ORDER_RECONCILE_MAX_WORKERS,
+                 stream_stale_seconds: float = ORDER_RECONCILE_STREAM_STALE_SEC,
+                 full_refresh_seconds: float = ORDER_RECONCILE_FULL_REFRESH_SEC,
+                 circuit_breaker_threshold: int = CIRCUIT_BREAKER_THRESHOLD):
+        self.max_workers = max(1, max_workers)
+        self.stream_stale_seconds = stream_stale_seconds
+        self.full_refresh_seconds = full_refresh_seconds
+        self.circuit_breaker_threshold = max(1, circuit_breaker_threshold)
+        self._lock = threading.Lock()
+        # {(account_id, market_type): 마지막 REST 확인 성공 시각}
+        self._last_checked: Dict[Tuple[int, str], float] = {}
+        # {거래소: 배치 조회 연속 실패 수} (실행 간 유지, 성공 시 1씩 감소)
+        self._exchange_failures: Dict[str, int] = {}
+        self._last_run: Optional[Dict[str, Any]] = None
+
+    # ------------------------------------------------------------------
+    # Circuit Breaker
+    # ------------------------------------------------------------------
+    def circuit_open(self, exchange: str) -> bool:
+        with self._lock:
+            return self._exchange_failures.get(exchange, 0) >= self.circuit_breaker_threshold
+
+    def _record_exchange_result(self, exchange: str, success: bool) -> None:
+        """배치 조회 결과 반영: 실패 시 증가(임계값 상한), 성공 시 1 감소 (점진적 복구)"""
+        with self._lock:
+            old_count = self._exchange_failures.get(exchange, 0)
+            if success:
+                new_count = max(0, old_count - 1)
+            else:
+                new_count = min(self.circuit_breaker_threshold, old_count + 1)
+            if new_count:
+                self._exchange_failures[exchange] = new_count
+            else:
+                self._exchange_failures.pop(exchange, None)
+
+        if new_count == old_count:
+            return
+        if success:
+            logger.info(f"✅ {exchange.upper()} 복구 진행: 실패 카운터 {old_count} → {new_count}")
+        else:
+            logger.warning(
+                f"⚠️ {exchange.upper()} 실패 카운터 증가: {old_count} → {new_count} "
+                f"(임계값: {self.circuit_breaker_threshold})"
+            )
+
+    def _stream_healthy(self, account_id: int) -> bool:
+        from app.services.trading import trading_service
+
+        manager = trading_service.websocket_manager
+        if not manager:
+            return False
+        return manager.is_stream_healthy(account_id, self.stream_stale_seconds)
+
+    @staticmethod
+    def choose_symbols(exchange: str, symbols: Iterable[str]) -> Optional[List[str]]:
+        """심볼별 조회가 전체 조회보다 가벼우면 심볼 목록, 아니면 None (계좌 전체 조회)"""
+        from app.services.exchange import EndpointClass, RateLimiter
+
+        symbols = sorted(set(symbols))
+        per_symbol = RateLimiter.get_weight(exchange, EndpointClass.OPEN_ORDERS)
+        account_wide = RateLimiter.get_weight(exchange, EndpointClass.OPEN_ORDERS_ALL)
+        if symbols and len(symbols) * per_symbol < account_wide:
+            return symbols
+        return None
+
+    def plan(self, grouped_by_account: Dict[Account, List[OpenOrder]],
+             now: Optional[float] = None) -> Tuple[List[ReconcileBucket], List[ReconcileBucket]]:
+        """
+        조회할 버킷과 생략할 버킷 계산
+
+        Args:
+            grouped_by_account: {계좌: 활성 주문 목록}
+
+        Returns:
+            (조회 버킷, 스트림 정상으로 생략한 버킷)
+            Circuit Breaker가 발동 중인 거래소는 버킷 하나만 시험 조회(probe)하고 나머지는
+            circuit_open으로 표시해 조회 버킷에 포함합니다 (호출자가 실패로 집계).
+        """
+        now = now or time.time()
+        planned: List[ReconcileBucket] = []
+        skipped: List[ReconcileBucket] = []
+        probed: Set[str] = set()
+
+        for account, orders in grouped_by_account.items():
+            exchange = (account.exchange or '').lower()
+            by_market: Dict[str, List[OpenOrder]] = {}
+            for order in orders:
+                market_type = MarketType.normalize(order.market_type or MarketType.SPOT).lower()
+                by_market.setdefault(market_type, []).append(order)
+
+            stream_markets = ORDER_STREAM_MARKETS.get(exchange, ())
+            stream_healthy = bool(stream_markets) and self._stream_healthy(account.id)
+
+            for market_type, market_orders in by_market.items():
+                bucket = ReconcileBucket(
+                    account_id=account.id, account_name=account.name, exchange=exchange,
+                    market_type=market_type, orders=market_orders
+                )
+                with self._lock:
+                    last_checked = self._last_checked.get(bucket.key)
+                if (stream_healthy and market_type in stream_markets and last_checked is not None
+                        and now - last_checked < self.full_refresh_seconds):
+                    skipped.append(bucket)
+                    continue
+
+                bucket.symbols = self.choose_symbols(exchange, (order.symbol for order in market_orders))
+                if self.circuit_open(exchange):
+                    if exchange in probed:
+                        bucket.circuit_open = True
+                    else:
+                        bucket.probe = True
+                        probed.add(exchange)
+                planned.append(bucket)
+
+        return planned, skipped
+
+    def _call_allowed(self, bucket: ReconcileBucket, result: 'BucketFetch') -> bool:
+        """발동 중이면 호출 중단 (시험 조회 버킷은 실패 전까지 허용)"""
+        if not self.circuit_open(bucket.exchange):
+            return True
+        return bucket.probe and not result.failed_symbols
+
+    def _fetch(self, bucket: ReconcileBucket, targets: List[Tuple[str, str]]) -> BucketFetch:
+        """
+        버킷의 미체결 주문 조회 (워커 스레드)
+
+        호출 스레드의 ORM 객체(bucket.orders)에는 접근하지 않고 targets만 사용하며,
+        계좌는 이 스레드의 세션에서 account_id로 다시 조회합니다.
+        """
+        from app.services.exchange import EndpointClass, exchange_service
+
+        result = BucketFetch(bucket=bucket)
+        queries = bucket.symbols if bucket.symbols is not None else [None]
+        if not self._call_allowed(bucket, result):
+            return self._circuit_open_result(bucket)
+
+        account = db.session.get(Account, bucket.account_id)
+        if account is None:
+            raise ValueError(f"계좌를 찾을 수 없음: account_id={bucket.account_id}")
+
+        for symbol in queries:
+            if not self._call_allowed(bucket, result):
+                result.circuit_open = True
+                result.failed_symbols.add(symbol)
+                result.errors.append(f"{symbol or '*'}: circuit breaker open")
+                continue
+
+            result.record_call(EndpointClass.OPEN_ORDERS if symbol else EndpointClass.OPEN_ORDERS_ALL)
+            try:
+                batch_result = exchange_service.get_open_orders(
+                    account=account, symbol=symbol, market_type=bucket.market_type
+                )
+            except Exception as e:
+                batch_result = {'success': False, 'error': str(e)}
+
+            if batch_result.get('success'):
+                result.orders_map.update(to_exchange_order_map(batch_result.get('orders', [])))
+            else:
+                result.failed_symbols.add(symbol)
+                result.errors.append(f"{symbol or '*'}: {batch_result.get('error')}")
+
+        if not result.circuit_open:
+            # 배치 조회가 하나라도 성공하면 정상 응답으로 간주
+            self._record_exchange_result(bucket.exchange, len(result.failed_symbols) < len(queries))
+
+        # 배치 조회 실패 범위의 주문은 개별 조회로 폴백 (발동 시 중단 → 호출자가 실패로 집계)
+        for exchange_order_id, symbol in targets:
+            if not result.batch_failed(symbol):
+                continue
+            if self.circuit_open(bucket.exchange):
+                result.circuit_open = True
+                break
+            result.record_call(EndpointClass.QUERY)
+            try:
+                result.individual[exchange_order_id] = exchange_service.fetch_order(
+                    account=account, symbol=symbol, order_id=exchange_order_id,
+                    market_type=bucket.market_type
+                )
+            except Exception as e:
+                logger.error(f"❌ 개별 쿼리 실패: order_id={exchange_order_id}, error={e}")
+                result.individual[exchange_order_id] = None
+
+        return result
+
+    @staticmethod
+    def _circuit_open_result(bucket: ReconcileBucket) -> BucketFetch:
+        return BucketFetch(bucket=bucket, failed_symbols={None}, errors=['circuit breaker open'],
+                           circuit_open=True)
+
+    def fetch(self, buckets: List[ReconcileBucket]) -> Dict[Tuple[int, str], BucketFetch]:
+        """버킷 병렬 조회 (앱 컨텍스트 필요) → {(account_id, market_type): BucketFetch}"""
+        if not buckets:
+            return {}
+
+        app = current_app._get_current_object()
+        pool_role = current_db_pool_role()
+        fetched_at = time.time()
+
+        def run_in_context(bucket, targets):
+            # 호출 스레드(스케줄러 작업)의 DB 풀 역할 유지
+            with app.app_context(), db_pool_role(pool_role):
+                return self._fetch(bucket, targets)
+
+        results: Dict[Tuple[int, str], BucketFetch] = {}
+        runnable = []
+        for bucket in buckets:
+            if bucket.circuit_open:
+                results[bucket.key] = self._circuit_open_result(bucket)
+            else:
+                runnable.append(bucket)
+        if not runnable:
+            return results
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(runnable)),
+                                thread_name_prefix='order-reconcile') as executor:
+            # 워커에는 ORM 객체 대신 (주문 id, 심볼) 목록 전달
+            futures = {
+                executor.submit(
+                    run_in_context, bucket,
+                    [(order.exchange_order_id, order.symbol) for order in bucket.orders]
+                ): bucket
+                for bucket in runnable
+            }
+            for future in as_completed(futures):
+                bucket = futures[future]
+                try:
+                    results[bucket.key] = future.result()
+                except Exception as e:
+                    results[bucket.key] = BucketFetch(bucket=bucket, failed_symbols={None}, errors=[str(e)])
+
+        with self._lock:
+            for key, result in results.items():
+                if not result.failed_symbols:
+                    self._last_checked[key] = fetched_at
+        return results
+
+    def finish_run(self, started: float, planned: List[ReconcileBucket], skipped: List[ReconcileBucket],
+                   results: Dict[Tuple[int, str], BucketFetch], totals: Dict[str, int]) -> Dict[str, Any]:
+        """실행 통계 기록 (호출 스레드에서 누락 주문 fetch_order까지 반영된 뒤 호출)"""
+        finished = time.time()
+        weight_by_exchange: Dict[str, int] = {}
+        for result in results.values():
+            exchange = result.bucket.exchange
+            weight_by_exchange[exchange] = weight_by_exchange.get(exchange, 0) + result.weight
+
+        stats = {
+            'started_at': datetime.utcfromtimestamp(started).isoformat() + 'Z',
+            'duration_ms': round((finished - started) * 1000, 1),
+            'buckets': len(planned) + len(skipped),
+            'polled_buckets': len(planned),
+            'skipped_buckets': len(skipped),
+            'per_symbol_buckets': sum(1 for bucket in planned if bucket.symbols is not None),
+            'circuit_open_buckets': sum(1 for result in results.values() if result.circuit_open),
+            'api_calls': sum(result.calls for result in results.values()),
+            'api_weight': sum(weight_by_exchange.values()),
+            'api_weight_by_exchange': weight_by_exchange,
+            'failed_buckets': [
+                {'account_id': key[0], 'market_type': key[1], 'errors': result.errors}
+                for key, result in results.items() if result.failed_symbols
+            ],
+            **totals,
+        }
+
+        active_keys = {bucket.key for bucket in planned} | {bucket.key for bucket in skipped}
+        with self._lock:
+            for key in list(self._last_checked):
+                if key not in active_keys:
+                    self._last_checked.pop(key, None)
+            self._last_run = stats
+
+        logger.info(
+            f"📊 미체결 주문 동기화 조회: 버킷 {stats['polled_buckets']}/{stats['buckets']} "
+            f"(생략 {stats['skipped_buckets']}), 호출 {stats['api_calls']}회, 가중치 {stats['api_weight']}"
+        )
+        return stats
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'stream_stale_seconds': self.stream_stale_seconds,
+                'full_refresh_seconds': self.full_refresh_seconds,
+                'circuit_breaker_threshold': self.circuit_breaker_threshold,
+                'exchange_failures': dict(self._exchange_failures),
+                'tracked_buckets': len(self._last_checked),
+                'last_run': self._last_run,
+            }
+
+
+# 전역 인스턴스
+open_order_reconciler = OpenOrderReconciler()
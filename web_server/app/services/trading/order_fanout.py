@@ -0,0 +1,468 @@
+# @FEAT:batch-parallel-processing @FEAT:webhook-order @COMP:service @TYPE:core
+"""
+다계좌 주문 fan-out 엔진 (상주 asyncio 이벤트 루프)
+
+웹훅마다 ThreadPoolExecutor를 생성하던 방식 대신, 백그라운드 스레드 하나에서 도는
+asyncio 이벤트 루프가 모든 계좌의 거래소 주문을 동시에 제출합니다.
+
+- 네이티브 비동기 클라이언트(Binance aiohttp 경로)는 루프에서 직접 await
+- 동기 전용 클라이언트는 루프의 기본 executor로 위임
+- 거래소별 Rate Limit 예산(RateLimiter.acquire)으로 동시 제출량 제한
+- 결과는 Flask 요청 스레드로 반환 (DB 처리는 호출 스레드에서 수행)
+- 배치 웹훅은 (계좌, 마켓) 단위로 거래소 배치 한도만큼 청크를 나눠 네이티브 배치 API로 제출
+- 신호 수신 → 마지막 거래소 응답(signal-to-last-ack) 지연 p50/p99 집계
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 지연 통계 보관 개수 (최근 N개 신호)
+LATENCY_SAMPLE_SIZE = 1000
+# 루프 안 timeout 이후 호출 스레드가 결과를 추가로 기다리는 시간(초)
+FANOUT_RESULT_GRACE_SEC = 5.0
+
+# 응답 대기 시간 초과 결과의 error_type
+# 요청이 이미 거래소에 전송됐을 수 있으므로 호출부는 PENDING을 유지하고 FailedOrder를 만들지 않음
+TIMEOUT_ERROR_TYPE = 'timeout'
+
+
+def is_unconfirmed(result: Optional[Dict[str, Any]]) -> bool:
+    """거래소 접수 여부를 확정할 수 없는 결과 (응답 시간 초과) 여부"""
+    return bool(result) and result.get('error_type') == TIMEOUT_ERROR_TYPE
+
+
+@dataclass
+class OrderJob:
+    """fan-out 대상 단일 주문 (ORM 객체 없이 루프 스레드로 전달되는 값만 보관)"""
+    key: Any
+    account_id: int
+    exchange_name: str
+    client: Any
+    symbol: str
+    side: str
+    order_type: str
+    quantity: Decimal
+    market_type: str
+    price: Optional[Decimal] = None
+    stop_price: Optional[Decimal] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchOrderJob:
+    """fan-out 대상 배치 주문 청크 (동일 계좌·마켓, 거래소 배치 한도 이하)"""
+    key: Any
+    account_id: int
+    exchange_name: str
+    client: Any
+    market_type: str
+    orders: List[Dict[str, Any]]
+
+
+def chunk_orders(orders: List[Dict[str, Any]],
+                 limit: Optional[int]) -> List[Tuple[int, List[Dict[str, Any]]]]:
+    """
+    주문 목록을 거래소 배치 한도로 분할
+
+    Returns:
+        [(시작 인덱스, 청크), ...] - limit이 없으면(배치 API 미지원) 전체를 한 청크로
+    """
+    if not orders:
+        return []
+    if not limit or limit <= 0:
+        return [(0, list(orders))]
+    return [(start, orders[start:start + limit]) for start in range(0, len(orders), limit)]
+
+
+def merge_batch_results(chunk_results: List[Tuple[int, int, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    청크별 배치 결과를 원래 주문 순서의 단일 배치 결과로 병합
+
+    Args:
+        chunk_results: [(시작 인덱스, 청크 크기, 청크 배치 결과), ...]
+
+    Returns:
+        create_batch_orders()와 같은 형식
+        {'success', 'results': [{'order_index', 'success', ...}], 'summary', 'implementation', 'requests'}
+    """
+    results = []
+    implementations = []
+    errors = []
+
+    for offset, size, chunk_result in sorted(chunk_results, key=lambda item: item[0]):
+        chunk_result = chunk_result or {}
+        if chunk_result.get('implementation') and chunk_result['implementation'] not in implementations:
+            implementations.append(chunk_result['implementation'])
+        if chunk_result.get('error'):
+            errors.append(chunk_result['error'])
+
+        answered = set()
+        for position, item in enumerate(chunk_result.get('results') or []):
+            local_index = item.get('order_index', position)
+            if local_index in answered or not 0 <= local_index < size:
+                continue
+            answered.add(local_index)
+            results.append({**item, 'order_index': offset + local_index})
+
+        # 청크 전체 실패(예외/타임아웃/Rate limit) 또는 누락된 응답은 주문별 실패로 변환
+        for local_index in range(size):
+            if local_index not in answered:
+                failure = {
+                    'order_index': offset + local_index,
+                    'success': False,
+                    'error': chunk_result.get('error') or '거래소 응답 없음'
+                }
+                if chunk_result.get('error_type'):
+                    failure['error_type'] = chunk_result['error_type']
+                results.append(failure)
+
+    results.sort(key=lambda item: item['order_index'])
+    successful = sum(1 for item in results if item.get('success'))
+    merged = {
+        'success': successful > 0 or not errors,
+        'results': results,
+        'summary': {
+            'total': len(results),
+            'successful': successful,
+            'failed': len(results) - successful
+        },
+        'implementation': '+'.join(implementations) or 'NONE',
+        'requests': len(chunk_results)
+    }
+    if errors:
+        merged['error'] = errors[0]
+    return merged
+
+
+def _percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(pct / 100.0 * (len(sorted_values) - 1))))
+    return round(sorted_values[index], 2)
+
+
+def order_to_result(order: Any) -> Dict[str, Any]:
+    """
+    거래소 Order 객체(또는 dict)를 TradingCore 주문 결과 형식으로 변환
+
+    Returns:
+        {'success': True, 'order_id', 'status', 'filled_quantity', 'average_price', ...}
+    """
+    if isinstance(order, dict):
+        data = dict(order)
+    else:
+        data = dict(vars(order))
+
+    order_id = data.get('order_id') or data.get('id')
+    result = {
+        'success': True,
+        'order_id': str(order_id) if order_id is not None else None,
+        'symbol': data.get('symbol'),
+        'side': (data.get('side') or '').upper() or None,
+        'order_type': (data.get('order_type') or data.get('type') or '').upper() or None,
+        'status': data.get('status'),
+        'quantity': data.get('amount'),
+        'filled_quantity': data.get('filled_quantity', data.get('filled')) or 0,
+        'average_price': data.get('average_price', data.get('average')) or 0,
+        'price': data.get('price'),
+        'stop_price': data.get('stop_price'),
+    }
+    return result
+
+
+class OrderFanoutEngine:
+    """
+    상주 이벤트 루프 기반 주문 fan-out 엔진 (WebSocketManager와 같은 스레드 모델)
+
+    사용법:
+        results = order_fanout_engine.execute(jobs, signal_received_at=ts)
+        # results: {job.key: order_result dict}
+    """
+
+    def __init__(self):
+        self.event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._running = False
+
+        self._stats_lock = threading.Lock()
+        self._signal_to_last_ack_ms = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._fanout_ms = deque(maxlen=LATENCY_SAMPLE_SIZE)
+        self._counters = {'signals': 0, 'requests': 0, 'orders': 0, 'succeeded': 0, 'failed': 0, 'timeouts': 0}
+
+    # @FEAT:batch-parallel-processing @COMP:service @TYPE:core
+    def start(self) -> None:
+        """백그라운드 스레드에서 이벤트 루프 시작 (중복 호출 안전)"""
+        with self._start_lock:
+            if self._running:
+                return
+
+            ready = threading.Event()
+
+            def run_loop():
+                self.event_loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(self.event_loop)
+                ready.set()
+                try:
+                    logger.info("🚀 주문 fan-out 이벤트 루프 시작")
+                    self.event_loop.run_forever()
+                except Exception as e:
+                    logger.error(f"❌ 주문 fan-out 이벤트 루프 오류: {e}")
+                finally:
+                    logger.info("🛑 주문 fan-out 이벤트 루프 종료")
+                    self.event_loop.close()
+
+            self.thread = threading.Thread(target=run_loop, name='order-fanout-loop', daemon=True)
+            self.thread.start()
+            ready.wait(timeout=5)
+            self._running = True
+
+    # @FEAT:batch-parallel-processing @COMP:service @TYPE:core
+    def stop(self) -> None:
+        """이벤트 루프 정지 (애플리케이션 종료 시)"""
+        with self._start_lock:
+            if not self._running:
+                return
+            self._running = False
+
+            if self.event_loop:
+                self.event_loop.call_soon_threadsafe(self.event_loop.stop)
+            if self.thread:
+                self.thread.join(timeout=5)
+
+    # @FEAT:batch-parallel-processing @COMP:service @TYPE:core
+    def execute(self, jobs: List[OrderJob], signal_received_at: Optional[float] = None,
+                timeout: float = 30.0) -> Dict[Any, Dict[str, Any]]:
+        """
+        주문 목록을 동시에 거래소에 제출하고 결과를 반환 (호출 스레드는 완료까지 대기)
+
+        Args:
+            jobs: OrderJob 목록
+            signal_received_at: 웹훅 수신 시각 (Unix timestamp, 지연 측정 기준)
+            timeout: 전체 fan-out 대기 시간(초). 초과한 주문은 error_type='timeout' 결과로 반환
+                     (접수 여부 미확정 → is_unconfirmed()로 판별해 PENDING 유지)
+
+        Returns:
+            {job.key: {'success': bool, 'order_id': ..., 'error': ...}}
+        """
+        return self._execute(jobs, self._run_job, signal_received_at, timeout)
+
+    # @FEAT:batch-parallel-processing @COMP:service @TYPE:core
+    def execute_batches(self, jobs: List[BatchOrderJob], signal_received_at: Optional[float] = None,
+                        timeout: float = 30.0) -> Dict[Any, Dict[str, Any]]:
+        """
+        배치 청크 목록을 동시에 거래소 배치 API로 제출하고 결과를 반환
+
+        Args:
+            jobs: BatchOrderJob 목록 (청크당 거래소 배치 요청 1회)
+            signal_received_at: 웹훅 수신 시각 (Unix timestamp, 지연 측정 기준)
+            timeout: 전체 fan-out 대기 시간(초)
+
+        Returns:
+            {job.key: create_batch_orders() 결과} - 청크 전체 실패 시 'results' 없이 'error'만 포함
+        """
+        return self._execute(jobs, self._run_batch_job, signal_received_at, timeout)
+
+    def _execute(self, jobs: List[Any], runner, signal_received_at: Optional[float],
+                 timeout: float) -> Dict[Any, Dict[str, Any]]:
+        if not jobs:
+            return {}
+
+        self.start()
+        started_at = time.time()
+
+        future = asyncio.run_coroutine_threadsafe(self._run_all(jobs, runner, timeout), self.event_loop)
+        try:
+            results, last_ack_at = future.result(timeout=timeout + FANOUT_RESULT_GRACE_SEC)
+        except Exception as e:
+            future.cancel()
+            logger.error(f"❌ 주문 fan-out 실패: {e!r}")
+            results = {job.key: {'success': False, 'error': f'fan-out 실패: {e!r}'} for job in jobs}
+            # Python 3.10 이하에서 concurrent.futures.TimeoutError는 내장 TimeoutError와 별개 클래스
+            if isinstance(e, (TimeoutError, concurrent.futures.TimeoutError)):
+                # 루프 안에서 이미 제출됐을 수 있음 → 접수 여부 미확정
+                for result in results.values():
+                    result['error_type'] = TIMEOUT_ERROR_TYPE
+            last_ack_at = time.time()
+
+        self._record(jobs, results, signal_received_at or started_at, started_at, last_ack_at)
+        for result in results.values():
+            result.pop('acked_at', None)
+        return results
+
+    async def _run_all(self, jobs: List[Any], runner, timeout: float):
+        tasks = {asyncio.ensure_future(runner(job)): job for job in jobs}
+        done, pending = await asyncio.wait(tasks.keys(), timeout=timeout)
+
+        results = {}
+        for task in pending:
+            task.cancel()
+            job = tasks[task]
+            results[job.key] = {
+                'success': False,
+                'error': f'거래소 응답 시간 초과 ({timeout}s)',
+                'error_type': TIMEOUT_ERROR_TYPE
+            }
+        for task in done:
+            results[tasks[task].key] = task.result()
+
+        last_ack_at = max(
+            (r.get('acked_at', 0.0) for r in results.values()),
+            default=time.time()
+        )
+        return results, last_ack_at or time.time()
+
+    async def _run_job(self, job: OrderJob) -> Dict[str, Any]:
+        from app.services.exchange import exchange_service, EndpointClass
+
+        try:
+            acquired = await exchange_service.rate_limiter.acquire(
+                job.exchange_name, job.account_id, EndpointClass.ORDER, market_type=job.market_type
+            )
+            if not acquired:
+                return {
+                    'success': False,
+                    'error': 'Rate limit 대기 시간 초과',
+                    'error_type': 'rate_limited',
+                    'acked_at': time.time()
+                }
+
+            params = dict(job.params)
+            if job.stop_price is not None:
+                params['stopPrice'] = job.stop_price
+
+            client = job.client
+            if getattr(client, 'NATIVE_ASYNC_ORDERS', False):
+                order = await client.create_order_async(
+                    job.symbol, job.order_type, job.side, job.quantity, job.price,
+                    market_type=job.market_type, **params
+                )
+            else:
+                loop = asyncio.get_running_loop()
+                order = await loop.run_in_executor(None, functools.partial(
+                    client.create_order, job.symbol, job.order_type, job.side,
+                    job.quantity, job.price, market_type=job.market_type, **params
+                ))
+
+            result = order_to_result(order)
+        except Exception as e:
+            logger.warning(f"⚠️ fan-out 주문 실패 (account={job.account_id}, symbol={job.symbol}): {e}")
+            result = {
+                'success': False,
+                'error': str(e),
+                'exchange_error': type(e).__name__
+            }
+
+        result['acked_at'] = time.time()
+        return result
+
+    async def _run_batch_job(self, job: BatchOrderJob) -> Dict[str, Any]:
+        from app.services.exchange import exchange_service, EndpointClass
+
+        try:
+            # 배치 요청은 주문 수만큼 주문 버킷을 소모 (Binance batchOrders 가중치 = 주문 수)
+            acquired = await exchange_service.rate_limiter.acquire(
+                job.exchange_name, job.account_id, EndpointClass.ORDER, count=len(job.orders),
+                market_type=job.market_type
+            )
+            if not acquired:
+                return {
+                    'success': False,
+                    'error': 'Rate limit 대기 시간 초과',
+                    'error_type': 'rate_limited',
+                    'acked_at': time.time()
+                }
+
+            # 비동기 구현 우선 (Upbit/Bithumb 동기 래퍼는 실행 중인 루프에서 호출 불가)
+            client = job.client
+            batch_fn = getattr(client, 'create_batch_orders_async', None) or client.create_batch_orders
+            if asyncio.iscoroutinefunction(batch_fn):
+                result = await batch_fn(job.orders, job.market_type)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    None, functools.partial(batch_fn, job.orders, job.market_type)
+                )
+            result = dict(result or {})
+        except Exception as e:
+            logger.warning(
+                f"⚠️ fan-out 배치 주문 실패 (account={job.account_id}, {len(job.orders)}건): {e}"
+            )
+            result = {
+                'success': False,
+                'error': str(e),
+                'exchange_error': type(e).__name__
+            }
+
+        result['acked_at'] = time.time()
+        return result
+
+    def _record(self, jobs: List[Any], results: Dict[Any, Dict[str, Any]],
+                signal_at: float, started_at: float, last_ack_at: float) -> None:
+        orders = succeeded = timeouts = 0
+        for job in jobs:
+            result = results.get(job.key) or {}
+            count = len(job.orders) if isinstance(job, BatchOrderJob) else 1
+            orders += count
+            if isinstance(job, BatchOrderJob):
+                succeeded += sum(1 for item in result.get('results') or [] if item.get('success'))
+            elif result.get('success'):
+                succeeded += 1
+            if is_unconfirmed(result):
+                timeouts += count
+        signal_ms = max(0.0, (last_ack_at - signal_at) * 1000)
+        fanout_ms = max(0.0, (last_ack_at - started_at) * 1000)
+
+        with self._stats_lock:
+            self._signal_to_last_ack_ms.append(signal_ms)
+            self._fanout_ms.append(fanout_ms)
+            self._counters['signals'] += 1
+            self._counters['requests'] += len(jobs)
+            self._counters['orders'] += orders
+            self._counters['succeeded'] += succeeded
+            self._counters['failed'] += orders - succeeded
+            self._counters['timeouts'] += timeouts
+
+        logger.info(
+            f"📊 주문 fan-out 완료: {orders}건/요청 {len(jobs)}회 (성공 {succeeded}), "
+            f"signal→last-ack {signal_ms:.1f}ms, fan-out {fanout_ms:.1f}ms"
+        )
+
+    # @FEAT:batch-parallel-processing @COMP:service @TYPE:helper
+    def get_stats(self) -> Dict[str, Any]:
+        """fan-out 지연(p50/p99) 및 처리 건수 통계"""
+        with self._stats_lock:
+            signal_values = sorted(self._signal_to_last_ack_ms)
+            fanout_values = sorted(self._fanout_ms)
+            counters = dict(self._counters)
+
+        return {
+            'running': self._running,
+            **counters,
+            'signal_to_last_ack_ms': {
+                'p50': _percentile(signal_values, 50),
+                'p99': _percentile(signal_values, 99),
+                'samples': len(signal_values)
+            },
+            'fanout_ms': {
+                'p50': _percentile(fanout_values, 50),
+                'p99': _percentile(fanout_values, 99),
+                'samples': len(fanout_values)
+            }
+        }
+
+
+# 전역 인스턴스 (첫 execute() 호출 시 루프 시작)
+order_fanout_engine = OrderFanoutEngine()
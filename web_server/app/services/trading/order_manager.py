@@ -13,21 +13,28 @@ import logging
 import os
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Union
 
+from flask import current_app
+from sqlalchemy import update
 from sqlalchemy.orm import joinedload
 from sqlalchemy.exc import IntegrityError
 
 from app import db
 from app.models import Account, OpenOrder, Strategy, StrategyAccount
-from app.services.exchange import exchange_service
-from app.constants import OrderType, OrderStatus
+from app.services.exchange import EndpointClass, exchange_service
+from app.constants import OrderType, OrderStatus, MAX_PARALLEL_ACCOUNT_WORKERS
 from app.services.trading.core import sanitize_error_message
 
 logger = logging.getLogger(__name__)
 
+# @FEAT:order-cancellation @COMP:service @TYPE:config
+# CANCEL_ALL: 거래소 네이티브 심볼 단위 전체 취소 사용 여부 (false면 항상 주문별 취소)
+CANCEL_ALL_NATIVE_ENABLED = os.getenv('CANCEL_ALL_NATIVE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+
 # @FEAT:order-cancel @COMP:util @TYPE:config
 # Phase 5: PendingOrder 시스템 제거됨 (모든 주문은 즉시 거래소 실행)
 
@@ -1136,6 +1143,19 @@ class OrderManager:
                 + (f" ({', '.join(filter_conditions)})" if filter_conditions else '')
             )
 
+            # 네이티브 전체 취소 가능 심볼은 심볼당 1회 호출 + 일괄 DB 정리,
+            # 나머지(미지원 거래소, side 필터, 다른 전략 주문 공존)는 주문별 취소
+            native_groups = self._plan_native_cancel_groups(target_orders, side)
+            if native_groups:
+                # 일괄 DELETE 후 만료된 인스턴스에 접근하지 않도록 PK를 먼저 확보
+                target_order_ids = [order.id for order in target_orders]
+                native_cancelled, native_handled_ids = self._cancel_orders_native(native_groups)
+                cancelled_orders.extend(native_cancelled)
+                target_orders = [
+                    order for order, order_pk in zip(target_orders, target_order_ids)
+                    if order_pk not in native_handled_ids
+                ]
+
             for open_order in target_orders:
                 strategy_account = open_order.strategy_account
                 account = strategy_account.account if strategy_account else None
@@ -1240,6 +1260,221 @@ class OrderManager:
                 'filter_conditions': []
             }
 
+    # @FEAT:order-cancellation @COMP:service @TYPE:helper
+    def _plan_native_cancel_groups(
+        self,
+        target_orders: List[OpenOrder],
+        side: Optional[str]
+    ) -> Dict[tuple, Dict[str, Any]]:
+        """네이티브 전체 취소 대상 그룹 선정 → {(account_id, symbol, market_type): {'account', 'orders'}}
+
+        심볼 단위 전체 취소는 해당 심볼의 모든 주문을 취소하므로 다음 그룹만 선정합니다.
+        - side 필터 없음
+        - 거래소가 해당 market_type의 전체 취소 API 지원
+        - DB의 같은 (계좌, 심볼, 마켓) 활성 주문이 모두 취소 대상
+          (다른 전략 주문, Snapshot 이후 주문, PENDING 주문이 있으면 주문별 취소)
+        """
+        if side or not CANCEL_ALL_NATIVE_ENABLED or not target_orders:
+            return {}
+
+        groups: Dict[tuple, Dict[str, Any]] = {}
+        for open_order in target_orders:
+            strategy_account = open_order.strategy_account
+            account = strategy_account.account if strategy_account else None
+            if not account:
+                continue
+            market_type = (
+                open_order.market_type or strategy_account.strategy.market_type or 'spot'
+            ).lower()
+            key = (account.id, open_order.symbol, market_type)
+            group = groups.setdefault(key, {'account': account, 'orders': []})
+            group['orders'].append(open_order)
+
+        # 거래소 지원 여부 (계좌·마켓별 1회 확인)
+        supported: Dict[tuple, bool] = {}
+        for (account_id, _, market_type), group in list(groups.items()):
+            support_key = (account_id, market_type)
+            if support_key not in supported:
+                supported[support_key] = exchange_service.supports_native_cancel_all(
+                    group['account'], market_type
+                )
+        groups = {
+            key: group for key, group in groups.items() if supported[(key[0], key[2])]
+        }
+        if not groups:
+            return {}
+
+        # 같은 심볼의 취소 대상 외 활성 주문 조회 (1회)
+        target_ids = {order.id for group in groups.values() for order in group['orders']}
+        others = (
+            db.session.query(StrategyAccount.account_id, OpenOrder.symbol, OpenOrder.market_type)
+            .join(OpenOrder, OpenOrder.strategy_account_id == StrategyAccount.id)
+            .filter(
+                StrategyAccount.account_id.in_({key[0] for key in groups}),
+                OpenOrder.symbol.in_({key[1] for key in groups}),
+                OpenOrder.status.in_(OrderStatus.get_active_statuses()),
+                OpenOrder.id.notin_(target_ids)
+            )
+            .all()
+        )
+        for account_id, symbol, market_type in others:
+            key = (account_id, symbol, (market_type or 'spot').lower())
+            if groups.pop(key, None):
+                logger.info(
+                    f"ℹ️ 전체 취소 제외 (취소 대상 외 주문 공존 → 주문별 취소): "
+                    f"account={account_id}, symbol={symbol}, market={key[2]}"
+                )
+
+        return groups
+
+    # @FEAT:order-cancellation @COMP:service @TYPE:core
+    def _cancel_orders_native(self, groups: Dict[tuple, Dict[str, Any]]) -> tuple:
+        """심볼 단위 네이티브 전체 취소 (DB-First + 그룹 병렬 호출 + 계좌별 일괄 정리)
+
+        Pattern:
+        1. 대상 주문 전체를 UPDATE 1회로 CANCELLING 전환 (타임아웃 시 백그라운드 정리 대상)
+        2. (계좌, 심볼, 마켓) 그룹별 전체 취소 API 병렬 호출
+        3. 계좌별 DELETE 1회로 취소 확인 주문 정리
+        4. 실패 그룹·Spot 응답에 없던 주문은 원래 상태로 복원 → 호출자가 주문별 취소로 처리
+           (응답에 없는 주문은 취소 직전 체결됐을 수 있어 -2011 재조회 경로에 맡김)
+           취소 주문 목록을 돌려주지 않는 마켓(Binance Futures)은 워커에서 주문별 fetch_order로
+           취소를 확인하고, 확인되지 않은 주문(체결·조회 실패)은 같은 방식으로 복원
+
+        Returns:
+            (cancelled_orders 요약 목록, 처리 완료된 OpenOrder.id 집합)
+        """
+        # 커밋 후 만료되는 ORM 속성 대신 필요한 값만 미리 추출
+        snapshot = {
+            key: [
+                {
+                    'id': order.id,
+                    'order_id': order.exchange_order_id,
+                    'status': order.status,
+                    'strategy_id': order.strategy_account.strategy_id
+                }
+                for order in group['orders']
+            ]
+            for key, group in groups.items()
+        }
+        all_ids = [item['id'] for items in snapshot.values() for item in items]
+
+        # STEP 1: DB-First - CANCELLING 일괄 전환
+        db.session.execute(
+            update(OpenOrder)
+            .where(OpenOrder.id.in_(all_ids))
+            .values(status=OrderStatus.CANCELLING, cancel_attempted_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+
+        logger.info(
+            f"🔄 네이티브 전체 취소 시작 - {len(groups)}개 심볼 그룹, {len(all_ids)}개 주문"
+        )
+
+        # STEP 2: 그룹별 전체 취소 (워커 스레드는 자체 세션에서 계좌 재조회)
+        app = current_app._get_current_object()
+
+        def run_in_context(account_id, symbol, market_type, order_ids):
+            with app.app_context():
+                account = db.session.get(Account, account_id)
+                result = exchange_service.cancel_all_orders(account, symbol, market_type)
+                if result.get('success') and (result.get('result') or {}).get('cancelled_order_ids') is None:
+                    result['confirmed_order_ids'] = [
+                        order_id for order_id in order_ids
+                        if self._verify_cancellation_once(account, order_id, symbol, market_type) == 'cancelled'
+                    ]
+                return result
+
+        keys = list(groups)
+        order_ids = {key: [str(item['order_id']) for item in items] for key, items in snapshot.items()}
+        if len(keys) == 1:
+            results = {keys[0]: run_in_context(*keys[0], order_ids[keys[0]])}
+        else:
+            with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_ACCOUNT_WORKERS, len(keys)),
+                                    thread_name_prefix='cancel-all') as executor:
+                futures = {key: executor.submit(run_in_context, *key, order_ids[key]) for key in keys}
+            results = {}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    results[key] = {'success': False, 'error': str(e)}
+
+        # STEP 3/4: 계좌별 일괄 정리
+        deleted_by_account: Dict[int, List[tuple]] = defaultdict(list)
+        restore: Dict[str, List[int]] = defaultdict(list)
+        for key, items in snapshot.items():
+            result = results.get(key) or {}
+            if not result.get('success'):
+                logger.warning(
+                    f"⚠️ 네이티브 전체 취소 실패 → 주문별 취소 폴백: account={key[0]}, "
+                    f"symbol={key[1]}, market={key[2]}, error={result.get('error')}"
+                )
+                for item in items:
+                    restore[item['status']].append(item['id'])
+                continue
+
+            # 응답의 취소 목록 (없으면 주문별 조회로 확인된 목록)
+            reported = (result.get('result') or {}).get('cancelled_order_ids')
+            if reported is None:
+                reported = result.get('confirmed_order_ids') or []
+            for item in items:
+                if str(item['order_id']) not in reported:
+                    restore[item['status']].append(item['id'])
+                else:
+                    deleted_by_account[key[0]].append((key, item))
+
+        for old_status, ids in restore.items():
+            db.session.execute(
+                update(OpenOrder)
+                .where(OpenOrder.id.in_(ids), OpenOrder.status == OrderStatus.CANCELLING)
+                .values(status=old_status, cancel_attempted_at=None)
+                .execution_options(synchronize_session=False)
+            )
+
+        cancelled: List[Dict[str, Any]] = [
+            {
+                'order_id': item['order_id'],
+                'symbol': symbol,
+                'account_id': account_id,
+                'strategy_id': item['strategy_id']
+            }
+            for account_id, entries in deleted_by_account.items()
+            for (_, symbol, _), item in entries
+        ]
+
+        # SSE 이벤트 발송 (DB 삭제 전 - OpenOrder에서 strategy_id 조회)
+        for entry in cancelled:
+            try:
+                self.service.event_emitter.emit_order_cancelled_event(
+                    order_id=entry['order_id'],
+                    symbol=entry['symbol'],
+                    account_id=entry['account_id']
+                )
+            except Exception as sse_error:
+                logger.warning(f"OpenOrder SSE 이벤트 발송 실패: {sse_error}")
+
+        handled_ids = set()
+        for account_id, entries in deleted_by_account.items():
+            ids = [item['id'] for _, item in entries]
+            OpenOrder.query.filter(OpenOrder.id.in_(ids)).delete(synchronize_session=False)
+            handled_ids.update(ids)
+        db.session.commit()
+
+        # 마지막 주문이 취소된 심볼 구독 해제
+        for account_id, symbol in {(entry['account_id'], entry['symbol']) for entry in cancelled}:
+            remaining = OpenOrder.query.filter_by(symbol=symbol).join(StrategyAccount).filter(
+                StrategyAccount.account_id == account_id
+            ).count()
+            if remaining == 0:
+                self.service.unsubscribe_symbol(account_id, symbol)
+
+        logger.info(
+            f"✅ 네이티브 전체 취소 완료 - 취소 {len(cancelled)}개, "
+            f"주문별 취소 폴백 {sum(len(ids) for ids in restore.values())}개"
+        )
+        return cancelled, handled_ids
+
     def get_user_open_orders(self, user_id: int, strategy_id: Optional[int] = None, symbol: Optional[str] = None) -> Dict[str, Any]:
         """사용자의 미체결 주문 목록 조회 (Service 계층)"""
         try:
@@ -1846,6 +2081,8 @@ class OrderManager:
         - 개별 API 호출 → 계좌별 배치 쿼리
         - 100개 주문: 100번 호출 → 5번 호출 (20배 개선)
         - 처리 시간: 20초 → 1초
+        - (계좌, market_type) 버킷 단위 조회 계획/병렬 조회 (OpenOrderReconciler):
+          스트림이 정상인 버킷 생략, 심볼이 적으면 심볼별 조회, 실행별 소모 가중치 집계
 
         실행 주기: 29초마다
         """
@@ -1906,76 +2143,52 @@ class OrderManager:
                 f"{len(open_orders)}개 주문"
             )
 
-            # @FEAT:order-tracking @COMP:job @TYPE:resilience
-            # Priority 2 Phase 2: Circuit Breaker - 거래소별 연속 실패 제한
-            try:
-                CIRCUIT_BREAKER_THRESHOLD = max(1, int(os.getenv('CIRCUIT_BREAKER_THRESHOLD', '3')))
-            except ValueError:
-                CIRCUIT_BREAKER_THRESHOLD = 3
-                logger.warning("⚠️ Invalid CIRCUIT_BREAKER_THRESHOLD, using default: 3")
+            # Step 3: (계좌, market_type) 버킷 조회 계획 + 병렬 거래소 조회 (DB 처리 없음)
+            # Circuit Breaker(거래소별 연속 실패 제한)는 계획/조회 단계에서 reconciler가 적용
+            from app.services.trading.open_order_reconciler import open_order_reconciler
 
-            exchange_failures = defaultdict(int)  # 거래소별 실패 카운터
+            run_started = time.time()
+            planned, skipped = open_order_reconciler.plan({
+                db_orders[0].strategy_account.account: db_orders
+                for db_orders in grouped_by_account.values()
+            })
+            fetched = open_order_reconciler.fetch(planned)
 
-            # Step 3: 계좌별 배치 처리
+            # Step 4: 버킷별 DB 처리 (호출 스레드에서 순차)
             total_processed = 0
             total_updated = 0
             total_deleted = 0
             total_failed = 0
 
-            for account_id, db_orders in grouped_by_account.items():
-                exchange_name = None  # 변수 스코프 안전성 (예외 핸들러용)
+            for bucket in planned:
+                account_id = bucket.account_id
+                db_orders = bucket.orders
+                account = db_orders[0].strategy_account.account  # 호출 스레드 세션의 계좌
+                fetch = fetched[bucket.key]
                 try:
-                    # Step 3-1: 계좌 조회
-                    account = Account.query.get(account_id)
-                    if not account:
-                        logger.error(f"❌ 계정을 찾을 수 없음: account_id={account_id}")
-                        total_failed += len(db_orders)
-                        continue
-
-                    exchange_name = account.exchange.upper()
-
                     # @FEAT:order-tracking @COMP:job @TYPE:resilience
-                    # Priority 2 Phase 2: Circuit Breaker - 거래소별 연속 실패 체크
-                    if exchange_failures[exchange_name] >= CIRCUIT_BREAKER_THRESHOLD:
+                    # Priority 2 Phase 2: Circuit Breaker - 조회하지 않은 버킷(또는 조회 중단으로
+                    # 폴백 결과가 없는 주문)은 실패로 집계
+                    if fetch.circuit_open and not fetch.individual and not fetch.orders_map:
                         logger.warning(
-                            f"🚫 Circuit Breaker 발동: {exchange_name} "
-                            f"(연속 실패: {exchange_failures[exchange_name]}/{CIRCUIT_BREAKER_THRESHOLD}) - "
+                            f"🚫 Circuit Breaker 발동: {bucket.exchange.upper()} - "
                             f"계좌 {account.name}의 {len(db_orders)}개 주문 건너뜀"
                         )
                         total_failed += len(db_orders)
                         continue
 
-                    # Step 3-2: market_type 확인 (첫 번째 주문 기준)
-                    market_type = db_orders[0].market_type or 'spot'
-
-                    # Step 3-3: 배치 쿼리 (계좌의 모든 미체결 주문 한 번에 조회)
-                    logger.info(
-                        f"📡 배치 쿼리 시작: account={account.name} ({account_id}), "
-                        f"market_type={market_type}, DB 주문 수={len(db_orders)}"
-                    )
-
-                    batch_result = exchange_service.get_open_orders(
-                        account=account,
-                        symbol=None,  # 모든 심볼
-                        market_type=market_type.lower()
-                    )
-
-                    if not batch_result.get('success'):
-                        # 배치 쿼리 실패 시 폴백: 개별 쿼리
+                    fallback_orders = [o for o in db_orders if fetch.batch_failed(o.symbol)]
+                    if fallback_orders:
+                        # 배치 쿼리 실패 시 폴백: 개별 쿼리 (워커에서 fetch_order 조회 완료)
                         logger.warning(
                             f"⚠️ 배치 쿼리 실패, 개별 쿼리로 폴백: "
-                            f"account={account.name}, error={batch_result.get('error')}"
+                            f"account={account.name}, market_type={bucket.market_type}, "
+                            f"error={'; '.join(fetch.errors)}"
                         )
 
-                        # 폴백: 개별 쿼리 (기존 로직)
-                        for db_order in db_orders:
+                        for db_order in fallback_orders:
                             try:
-                                individual_result = exchange_service.fetch_order(
-                                    account=account,
-                                    symbol=db_order.symbol,
-                                    order_id=db_order.exchange_order_id,
-                                    market_type=market_type.lower()
-                                )
+                                individual_result = fetch.individual.get(db_order.exchange_order_id)
 
                                 if individual_result and individual_result.get('success'):
                                     processed_result = self._process_single_order(
@@ -2004,7 +2217,7 @@ class OrderManager:
                             db.session.commit()
                             logger.info(
                                 f"✅ 폴백 처리 완료: account={account.name}, "
-                                f"처리={len(db_orders)}"
+                                f"처리={len(fallback_orders)}"
                             )
                         except Exception as commit_error:
                             db.session.rollback()
@@ -2013,26 +2226,12 @@ class OrderManager:
                                 f"error={commit_error}"
                             )
 
-                        continue  # 다음 계좌로
-
-                    # Step 3-4: 거래소 응답을 맵으로 변환 (빠른 조회)
-                    exchange_orders_map: Dict[str, Dict[str, Any]] = {}
-                    for exchange_order in batch_result.get('orders', []):
-                        # Order 객체를 딕셔너리로 변환
-                        if hasattr(exchange_order, 'id'):
-                            # Order 모델 인스턴스
-                            order_id = str(exchange_order.id)
-                            exchange_orders_map[order_id] = {
-                                'order_id': order_id,
-                                'status': exchange_order.status,
-                                'filled_quantity': float(exchange_order.filled),
-                                'average_price': float(exchange_order.average) if exchange_order.average else None,
-                                'symbol': exchange_order.symbol
-                            }
-                        elif isinstance(exchange_order, dict):
-                            # 딕셔너리 형태
-                            order_id = str(exchange_order.get('id') or exchange_order.get('order_id'))
-                            exchange_orders_map[order_id] = exchange_order
+                        db_orders = [o for o in db_orders if not fetch.batch_failed(o.symbol)]
+                        if not db_orders:
+                            continue  # 다음 버킷으로
+
+                    # Step 4-1: 거래소 응답 맵 (워커에서 변환 완료, 배치 조회 성공 범위)
+                    exchange_orders_map: Dict[str, Dict[str, Any]] = fetch.orders_map
 
                     logger.info(
                         f"✅ 배치 쿼리 성공: account={account.name}, "
@@ -2048,7 +2247,7 @@ class OrderManager:
                         f"DB 미추적 주문 감지 시 fetch_order() 개별 조회 수행 준비 완료"
                     )
 
-                    # Step 3-5: DB 주문과 거래소 응답 비교
+                    # Step 4-2: DB 주문과 거래소 응답 비교
                     for db_order in db_orders:
                         try:
                             # 낙관적 잠금 획득 시도 (Phase 2)
@@ -2103,6 +2302,7 @@ class OrderManager:
                                 # FILLED 주문은 응답에 없으므로 fetch_order()로 최종 확인 필수.
                                 # STOP_LIMIT 활성화 후 LIMIT으로 변환되는 경우도 감지 필요.
                                 try:
+                                    fetch.record_call(EndpointClass.QUERY)
                                     final_order = exchange_service.fetch_order(
                                         account=account,
                                         symbol=locked_order.symbol,
@@ -2453,15 +2653,6 @@ class OrderManager:
                         f"삭제={total_deleted}"
                     )
 
-                    # @FEAT:order-tracking @COMP:job @TYPE:resilience
-                    # Priority 2 Phase 2: Gradual Recovery - 성공 시 카운터 감소
-                    if exchange_failures[exchange_name] > 0:
-                        old_count = exchange_failures[exchange_name]
-                        exchange_failures[exchange_name] = max(0, old_count - 1)
-                        logger.info(
-                            f"✅ {exchange_name} 복구 진행: 실패 카운터 {old_count} → {exchange_failures[exchange_name]}"
-                        )
-
                 # @FEAT:order-tracking @COMP:job @TYPE:resilience
                 # Priority 2 Phase 1: 계좌 격리 - 배치 처리 실패 시 다른 계좌 계속 진행
                 except Exception as e:
@@ -2471,36 +2662,28 @@ class OrderManager:
                         exc_info=True
                     )
 
-                    # Circuit Breaker: 실패 시 카운터 증가 (exchange_name이 할당된 경우만)
-                    if exchange_name:
-                        exchange_failures[exchange_name] += 1
-                        logger.warning(
-                            f"⚠️ {exchange_name} 실패 카운터 증가: "
-                            f"{exchange_failures[exchange_name] - 1} → {exchange_failures[exchange_name]} "
-                            f"(임계값: {CIRCUIT_BREAKER_THRESHOLD})"
-                        )
-                    else:
-                        logger.warning(
-                            f"⚠️ 거래소 정보 없음: account_id={account_id} - "
-                            f"Circuit Breaker 카운터 증가 불가 (계좌 조회 실패)"
-                        )
-
                     total_failed += len(db_orders)
                     continue  # 다음 계좌로 계속 진행
 
-            # Step 4: 최종 보고
+            # Step 5: 최종 보고 (조회 통계 포함)
             logger.info(
                 f"✅ 미체결 주문 상태 업데이트 완료: "
                 f"처리={total_processed}, 업데이트={total_updated}, "
                 f"삭제={total_deleted}, 실패={total_failed}"
             )
+            open_order_reconciler.finish_run(run_started, planned, skipped, fetched, {
+                'processed': total_processed,
+                'updated': total_updated,
+                'deleted': total_deleted,
+                'failed': total_failed,
+            })
 
             # @FEAT:orphan-order-prevention @PHASE:4
-            # Step 5: PENDING 주문 정리 (Phase 4)
+            # Step 6: PENDING 주문 정리 (Phase 4)
             self._cleanup_stuck_pending_orders()
 
             # @FEAT:orphan-order-prevention @PHASE:4
-            # Step 6: CANCELLING 주문 정리 (Phase 4)
+            # Step 7: CANCELLING 주문 정리 (Phase 4)
             self._cleanup_orphan_cancelling_orders()
 
         except Exception as e:
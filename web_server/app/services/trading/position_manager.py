@@ -7,9 +7,10 @@ import logging
 from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import or_
+import numpy as np
+from sqlalchemy import or_, text, update
 from sqlalchemy.orm import joinedload
 
 from app import db
@@ -19,12 +20,14 @@ from app.models import (
     Strategy,
     StrategyAccount,
     StrategyPosition,
-    Trade,
 )
 from app.services.utils import decimal_to_float, to_decimal
 
 logger = logging.getLogger(__name__)
 
+# 미실현 손익 일괄 UPDATE 1회당 행 수 (바인드 파라미터 수 = 2배)
+UNREALIZED_PNL_UPDATE_CHUNK = 500
+
 
 # @FEAT:position-tracking @COMP:service @TYPE:core
 class PositionManager:
@@ -68,8 +71,13 @@ class PositionManager:
                            symbol: Optional[str] = None, side: Optional[str] = None,
                            order_type: Optional[str] = None,
                            order_result: Optional[Dict[str, Any]] = None,
-                           market_type: Optional[str] = None) -> Dict[str, Any]:
-        """체결 주문 데이터를 통합 처리 (주문 조회 → DB 저장 → SSE 발송)"""
+                           market_type: Optional[str] = None,
+                           skip_exchange_merge: bool = False) -> Dict[str, Any]:
+        """체결 주문 데이터를 통합 처리 (주문 조회 → DB 저장 → SSE 발송)
+
+        skip_exchange_merge=True: order_result가 이미 거래소 최신 상태(WebSocket 페이로드 등)이면
+        거래소 주문 재조회(_merge_order_with_exchange)를 생략합니다.
+        """
         try:
             strategy = strategy_account.strategy
             account = strategy_account.account
@@ -96,12 +104,15 @@ class PositionManager:
             market_type_value = market_type or strategy.market_type or 'SPOT'
             exchange_market_type = 'futures' if market_type_value.upper() == 'FUTURES' else 'spot'
 
-            merged_order = self.service._merge_order_with_exchange(
-                account=account,
-                symbol=symbol_value,
-                market_type=exchange_market_type,
-                order_result=working_result
-            )
+            if skip_exchange_merge:
+                merged_order = dict(working_result)
+            else:
+                merged_order = self.service._merge_order_with_exchange(
+                    account=account,
+                    symbol=symbol_value,
+                    market_type=exchange_market_type,
+                    order_result=working_result
+                )
 
             side_value = (merged_order.get('side') or side or '').upper()
             order_type_value = (merged_order.get('order_type') or order_type or 'MARKET').upper()
@@ -199,7 +210,8 @@ class PositionManager:
                 price=executed_price,
                 order_id=str(order_id),
                 order_type=order_type_value,
-                order_price=order_price_decimal if order_price_decimal > Decimal('0') else None
+                order_price=order_price_decimal if order_price_decimal > Decimal('0') else None,
+                fee=self.service._to_decimal(merged_order['commission']) if merged_order.get('commission') is not None else None
             )
 
             trade_id = trade_result.get('trade_id') if trade_result.get('success') else None
@@ -234,11 +246,9 @@ class PositionManager:
                     merged_order['realized_pnl'] = float(realized_pnl_value)
 
                     if trade_id and realized_pnl_value != Decimal('0'):
-                        trade_record = Trade.query.get(trade_id)
-                        if trade_record:
-                            current_trade_pnl = Decimal(str(trade_record.pnl or 0))
-                            trade_record.pnl = float(current_trade_pnl + realized_pnl_value)
-                            db.session.commit()
+                        self.service.record_manager.apply_realized_pnl(
+                            trade_id, to_decimal(realized_pnl_value)
+                        )
 
             execution_result = self.service.record_manager.create_trade_execution_record(
                 strategy_account=strategy_account,
@@ -967,7 +977,7 @@ class PositionManager:
                     'symbol': pos.symbol,
                     'quantity': to_decimal(pos.quantity),
                     'entry_price': to_decimal(pos.entry_price),
-                    'unrealized_pnl': Decimal('0'),
+                    'unrealized_pnl': to_decimal(pos.unrealized_pnl),
                     'updated_at': pos.last_updated
                 }
                 for pos in positions
@@ -978,77 +988,108 @@ class PositionManager:
             return []
 
     # @FEAT:position-tracking @FEAT:background-scheduler @COMP:job @TYPE:core @DEPS:price-cache
-    def calculate_unrealized_pnl(self) -> None:
-        """백그라운드 작업: 모든 포지션의 미실현 손익 계산 및 업데이트"""
+    def calculate_unrealized_pnl(self) -> Dict[str, int]:
+        """백그라운드 작업: 모든 포지션의 미실현 손익 계산 및 업데이트
+
+        - 조회: (id, 수량, 진입가, 거래소, 마켓, 심볼, 저장된 손익) 튜플 1회 (ORM 객체/joinedload 없음)
+          청산된 포지션(수량 0)도 저장된 손익이 0이 아니면 포함하여 0으로 초기화
+        - 가격: price_cache.get_prices() 1회 (미스는 거래소·마켓별 배치 조회)
+        - 계산: NumPy 배열 연산 (수량 부호로 롱/숏 구분: qty * (현재가 - 진입가))
+        - 저장: 값이 바뀐 행만 UPDATE ... FROM (VALUES ...) 일괄 갱신
+        """
+        from app.constants import MarketType
         from app.services.price_cache import price_cache
 
         try:
-            # 모든 열린 포지션 조회
-            positions = (
-                StrategyPosition.query
-                .options(
-                    joinedload(StrategyPosition.strategy_account)
-                    .joinedload(StrategyAccount.strategy),
-                    joinedload(StrategyPosition.strategy_account)
-                    .joinedload(StrategyAccount.account)
+            rows = (
+                db.session.query(
+                    StrategyPosition.id,
+                    StrategyPosition.quantity,
+                    StrategyPosition.entry_price,
+                    Account.exchange,
+                    Strategy.market_type,
+                    StrategyPosition.symbol,
+                    StrategyPosition.unrealized_pnl,
                 )
-                .filter(StrategyPosition.quantity != 0)
+                .join(StrategyAccount, StrategyPosition.strategy_account_id == StrategyAccount.id)
+                .join(Account, StrategyAccount.account_id == Account.id)
+                .join(Strategy, StrategyAccount.strategy_id == Strategy.id)
+                .filter(or_(StrategyPosition.quantity != 0, StrategyPosition.unrealized_pnl != 0))
                 .all()
             )
 
-            if not positions:
+            if not rows:
                 logger.debug("미실현 손익 계산: 열린 포지션 없음")
-                return
-
-            updated_count = 0
-            error_count = 0
-
-            for position in positions:
-                try:
-                    strategy_account = position.strategy_account
-                    if not strategy_account or not strategy_account.strategy:
-                        continue
-
-                    strategy = strategy_account.strategy
-                    symbol = position.symbol
-
-                    # 현재가 조회
-                    market_type = strategy.market_type.lower() if strategy.market_type else 'spot'
-                    current_price = price_cache.get_price(symbol, market_type)
-
-                    if not current_price or current_price <= 0:
-                        continue
-
-                    # 미실현 손익 계산
-                    quantity = self.service._to_decimal(position.quantity)
-                    entry_price = self.service._to_decimal(position.entry_price)
-                    current_price_decimal = Decimal(str(current_price))
-
-                    if quantity > 0:
-                        # 롱 포지션
-                        unrealized_pnl = quantity * (current_price_decimal - entry_price)
-                    else:
-                        # 숏 포지션
-                        unrealized_pnl = abs(quantity) * (entry_price - current_price_decimal)
-
-                    # 포지션 업데이트 (unrealized_pnl 필드가 있다면)
-                    if hasattr(position, 'unrealized_pnl'):
-                        position.unrealized_pnl = float(unrealized_pnl)
-                        updated_count += 1
-
-                except Exception as e:
-                    error_count += 1
-                    logger.error(f"포지션 PnL 계산 실패 - position_id: {position.id}, error: {e}")
-                    continue
+                return {'positions': 0, 'updated': 0, 'missing_price': 0}
 
-            # 일괄 커밋
-            if updated_count > 0:
+            keys = [
+                (symbol, (exchange or '').upper(), MarketType.normalize(market_type))
+                for _, _, _, exchange, market_type, symbol, _ in rows
+            ]
+            open_keys = [key for key, row in zip(keys, rows) if row[1]]
+            prices = price_cache.get_prices(open_keys) if open_keys else {}
+
+            ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+            quantity = np.fromiter((row[1] or 0.0 for row in rows), dtype=np.float64, count=len(rows))
+            entry_price = np.fromiter((row[2] or 0.0 for row in rows), dtype=np.float64, count=len(rows))
+            stored_pnl = np.fromiter((row[6] or 0.0 for row in rows), dtype=np.float64, count=len(rows))
+            current_price = np.fromiter((prices.get(key, np.nan) for key in keys), dtype=np.float64, count=len(rows))
+
+            is_open = quantity != 0
+            has_price = np.isfinite(current_price) & (current_price > 0)
+            pnl = np.where(is_open, quantity * (current_price - entry_price), 0.0)
+            # 가격을 얻지 못한 열린 포지션은 기존 값 유지
+            changed = (~is_open | has_price) & ~np.isclose(pnl, stored_pnl, rtol=0.0, atol=1e-9)
+
+            updates = list(zip(ids[changed].tolist(), pnl[changed].tolist()))
+            if updates:
+                self._bulk_update_unrealized_pnl(updates)
                 db.session.commit()
-                logger.info(f"미실현 손익 계산 완료 - 업데이트: {updated_count}, 오류: {error_count}")
-            else:
-                logger.debug("미실현 손익 계산: 업데이트할 포지션 없음")
+
+            missing_price = int(np.count_nonzero(is_open & ~has_price))
+            logger.debug(
+                f"미실현 손익 계산 완료 - 포지션: {len(rows)}, 업데이트: {len(updates)}, 가격 없음: {missing_price}"
+            )
+            return {'positions': len(rows), 'updated': len(updates), 'missing_price': missing_price}
 
         except Exception as e:
             db.session.rollback()
             logger.error(f"미실현 손익 계산 실패: {e}")
+            return {'positions': 0, 'updated': 0, 'missing_price': 0}
+
+    # @FEAT:position-tracking @COMP:job @TYPE:helper
+    def _bulk_update_unrealized_pnl(self, updates: List[Tuple[int, float]]) -> None:
+        """(position_id, 미실현 손익) 목록을 UPDATE ... FROM (VALUES ...)로 저장 (커밋은 호출자)"""
+        dialect = db.engine.dialect.name
+        if dialect not in ('postgresql', 'sqlite'):
+            db.session.execute(
+                update(StrategyPosition),
+                [{'id': position_id, 'unrealized_pnl': pnl} for position_id, pnl in updates]
+            )
+            return
+
+        for start in range(0, len(updates), UNREALIZED_PNL_UPDATE_CHUNK):
+            chunk = updates[start:start + UNREALIZED_PNL_UPDATE_CHUNK]
+            params: Dict[str, Any] = {}
+            values = []
+            for index, (position_id, pnl) in enumerate(chunk):
+                params[f'id_{index}'] = position_id
+                params[f'pnl_{index}'] = pnl
+                if dialect == 'postgresql':
+                    values.append(f"(CAST(:id_{index} AS INTEGER), CAST(:pnl_{index} AS DOUBLE PRECISION))")
+                else:
+                    values.append(f"(:id_{index}, :pnl_{index})")
+
+            if dialect == 'postgresql':
+                sql = (
+                    "UPDATE strategy_positions AS p SET unrealized_pnl = v.pnl "
+                    f"FROM (VALUES {', '.join(values)}) AS v(id, pnl) WHERE p.id = v.id"
+                )
+            else:
+                # SQLite VALUES는 컬럼 별칭을 지원하지 않음 (column1, column2)
+                sql = (
+                    "UPDATE strategy_positions SET unrealized_pnl = v.column2 "
+                    f"FROM (VALUES {', '.join(values)}) AS v WHERE strategy_positions.id = v.column1"
+                )
+            db.session.execute(text(sql), params)
 
@@ -25,6 +25,7 @@ from app.models import (
     TradeExecution,
     OpenOrder,
 )
+from app.services.pnl_rollup import pnl_rollup_service
 from app.services.utils import calculate_is_entry, decimal_to_float, to_decimal
 
 logger = logging.getLogger(__name__)
@@ -52,10 +53,14 @@ class RecordManager:
         order_id: str,
         order_type: str,
         order_price: Optional[Decimal] = None,
+        fee: Optional[Decimal] = None,
     ) -> Dict[str, Any]:
         """
         Create or update a ``Trade`` record for the given execution.
 
+        ``fee`` is the cumulative commission of the order; its change is applied to the
+        daily PnL rollup in the same commit as the trade.
+
         Phase 3 Enhancement: Idempotency 강화
         - Application-level: 최종 중복 체크
         - DB-level: UNIQUE 제약조건 (IntegrityError 처리)
@@ -85,10 +90,14 @@ class RecordManager:
                 decimal_to_float(order_price) if order_price and order_price > 0 else None
             )
             side_upper = side.upper()
+            fee_float = decimal_to_float(fee) if fee is not None else None
 
             if existing_trade:
                 previous_quantity = to_decimal(existing_trade.quantity)
                 quantity_delta = quantity - previous_quantity
+                previous_pnl = existing_trade.pnl
+                previous_fee = existing_trade.fee
+                previous_timestamp = existing_trade.timestamp
 
                 changed = False
 
@@ -113,11 +122,19 @@ class RecordManager:
                     existing_trade.order_type = order_type
                     changed = True
 
+                if fee_float is not None and fee_float != existing_trade.fee:
+                    existing_trade.fee = fee_float
+                    changed = True
+
                 if changed:
                     existing_trade.timestamp = datetime.utcnow()
                     existing_trade.is_entry = self._calculate_is_entry_for_trade(
                         strategy.id, symbol, side
                     )
+                    pnl_rollup_service.apply_trade_pnl(
+                        existing_trade, previous_pnl=previous_pnl, previous_fee=previous_fee,
+                        previous_timestamp=previous_timestamp
+                    )
                     db.session.commit()
                     logger.info(
                         "Trade 기록 업데이트: %s %s %s @ %s",
@@ -159,8 +176,11 @@ class RecordManager:
 
                 if order_price_float is not None:
                     trade.order_price = order_price_float
+                if fee_float is not None:
+                    trade.fee = fee_float
 
                 db.session.add(trade)
+                pnl_rollup_service.apply_trade_pnl(trade)
                 db.session.commit()
 
                 logger.info(
@@ -235,6 +255,31 @@ class RecordManager:
                 'error': str(exc),
             }
 
+    # @FEAT:trade-execution @FEAT:pnl-rollup @COMP:service @TYPE:core
+    def apply_realized_pnl(self, trade_id: int, realized_pnl: Decimal) -> bool:
+        """
+        Add ``realized_pnl`` to ``Trade.pnl`` and update the daily PnL rollup.
+
+        Both writes share one commit so the rollup never drifts from the trades.
+        """
+        trade = db.session.get(Trade, trade_id)
+        if not trade:
+            return False
+
+        previous_pnl = trade.pnl
+        previous_fee = trade.fee
+        trade.pnl = float(to_decimal(previous_pnl or 0) + realized_pnl)
+        try:
+            pnl_rollup_service.apply_trade_pnl(
+                trade, previous_pnl=previous_pnl, previous_fee=previous_fee
+            )
+            db.session.commit()
+        except Exception as exc:
+            db.session.rollback()
+            logger.error("Trade 실현 손익 기록 실패: trade_id=%s error=%s", trade_id, exc)
+            return False
+        return True
+
     # @FEAT:trade-execution @COMP:service @TYPE:core
     # @DEPS:performance-tracking,capital-management
     def create_trade_execution_record(
@@ -0,0 +1,228 @@
+# @FEAT:webhook-order @COMP:service @TYPE:core
+"""
+웹훅 인증 인덱스 (group_name → 전략 ID, 마켓 타입, 허용 토큰 해시)
+
+웹훅마다 Strategy 조회 후 strategy_accounts → account → user를 지연 로딩하던 방식(N+1)
+대신, 조인 쿼리 1회로 모든 활성 전략의 인증 정보를 메모리 인덱스로 구성합니다.
+
+- 조회는 dict 조회 + SHA-256 해시 비교만 수행 (DB 접근 없음)
+- 전략/전략-계좌(구독)/계좌/사용자 토큰 변경이 커밋되면 즉시 무효화 (SQLAlchemy 세션 이벤트)
+- 다른 워커 프로세스의 변경은 TTL(WEBHOOK_AUTH_INDEX_TTL_SEC)로 반영
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+from sqlalchemy import and_, event, inspect, select
+from sqlalchemy.orm import Session, aliased
+
+from app.constants import WEBHOOK_AUTH_INDEX_TTL_SEC, WEBHOOK_AUTH_INDEX_MISS_REFRESH_SEC
+
+logger = logging.getLogger(__name__)
+
+# 변경 시 인덱스를 무효화해야 하는 모델별 컬럼 (신규/삭제는 항상 무효화)
+_WATCHED_ATTRIBUTES = {
+    'Strategy': ('group_name', 'user_id', 'market_type', 'is_active', 'is_public'),
+    'StrategyAccount': ('strategy_id', 'account_id', 'is_active'),
+    'Account': ('user_id',),
+    'User': ('webhook_token',),
+}
+_SESSION_FLAG = 'webhook_auth_index_dirty'
+
+
+def hash_token(token: str) -> str:
+    """웹훅 토큰 SHA-256 해시 (인덱스에는 원문 토큰을 보관하지 않음)"""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class StrategyAuthEntry:
+    """전략 인증 정보 (인덱스 값)"""
+    strategy_id: int
+    market_type: str
+    token_hashes: FrozenSet[str]
+
+
+# @FEAT:webhook-order @COMP:service @TYPE:core
+class StrategyTokenIndex:
+    """
+    활성 전략 인증 인덱스 (스레드 안전)
+
+    읽기는 인덱스 dict 참조만 사용하고, 재구성은 새 dict를 만든 뒤 참조를 교체합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = WEBHOOK_AUTH_INDEX_TTL_SEC,
+                 miss_refresh_seconds: float = WEBHOOK_AUTH_INDEX_MISS_REFRESH_SEC):
+        self.ttl_seconds = ttl_seconds
+        self.miss_refresh_seconds = miss_refresh_seconds
+        self._entries: Optional[Dict[str, StrategyAuthEntry]] = None
+        # (인덱스 dict, 활성 전략 ID 집합) - 인덱스가 교체되면 다시 계산
+        self._active_ids: Optional[Tuple[Dict[str, StrategyAuthEntry], FrozenSet[int]]] = None
+        self._built_at = 0.0
+        self._generation = 0
+        self._build_lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'rebuilds': 0, 'invalidations': 0}
+
+    # @FEAT:webhook-order @COMP:service @TYPE:core
+    def lookup(self, group_name: str) -> Optional[StrategyAuthEntry]:
+        """
+        group_name으로 활성 전략 인증 정보 조회
+
+        인덱스가 없거나 TTL이 지났으면 재구성합니다. 인덱스에 없는 group_name은
+        최근 재구성이 miss_refresh_seconds보다 오래됐을 때만 한 번 더 재구성합니다.
+        """
+        entries = self._current_entries()
+        entry = entries.get(group_name)
+        if entry is None and self._age() >= self.miss_refresh_seconds:
+            entry = self._rebuild().get(group_name)
+
+        self._stats['hits' if entry else 'misses'] += 1
+        return entry
+
+    # @FEAT:webhook-order @COMP:service @TYPE:validation
+    def verify_token(self, entry: StrategyAuthEntry, token: str) -> bool:
+        """토큰 해시가 허용 집합에 있는지 확인 (해시 불일치 시 최근 변경 반영을 위해 1회 재확인)"""
+        token_hash = hash_token(token)
+        if token_hash in entry.token_hashes:
+            return True
+
+        # 다른 워커에서 방금 발급/구독한 토큰일 수 있음 (재구성 간격 제한)
+        if self._age() >= self.miss_refresh_seconds:
+            for refreshed in self._rebuild().values():
+                if refreshed.strategy_id == entry.strategy_id:
+                    return token_hash in refreshed.token_hashes
+        return False
+
+    # @FEAT:webhook-order @FEAT:event-sse @COMP:service @TYPE:validation
+    def is_active_strategy(self, strategy_id: int) -> bool:
+        """활성 전략 여부 (SSE 이벤트 발송 전 확인용, 인덱스가 유효하면 DB 접근 없음)"""
+        entries = self._current_entries()
+        cached = self._active_ids
+        if cached is None or cached[0] is not entries:
+            cached = (entries, frozenset(entry.strategy_id for entry in entries.values()))
+            self._active_ids = cached
+        return strategy_id in cached[1]
+
+    def invalidate(self, reason: str = '') -> None:
+        """인덱스 무효화 (다음 조회 시 재구성)"""
+        self._generation += 1
+        self._entries = None
+        self._stats['invalidations'] += 1
+        logger.debug(f"🔄 웹훅 인증 인덱스 무효화: {reason or 'manual'}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        entries = self._entries
+        return {
+            **self._stats,
+            'strategies': len(entries) if entries is not None else 0,
+            'age_seconds': round(self._age(), 1) if entries is not None else None,
+            'ttl_seconds': self.ttl_seconds
+        }
+
+    def _age(self) -> float:
+        return time.monotonic() - self._built_at
+
+    def _current_entries(self) -> Dict[str, StrategyAuthEntry]:
+        entries = self._entries
+        if entries is None or self._age() >= self.ttl_seconds:
+            entries = self._rebuild()
+        return entries
+
+    def _rebuild(self) -> Dict[str, StrategyAuthEntry]:
+        with self._build_lock:
+            # 대기 중 다른 스레드가 방금 재구성했다면 그 결과 사용
+            if self._entries is not None and self._age() < min(self.miss_refresh_seconds, self.ttl_seconds):
+                return self._entries
+
+            generation = self._generation
+            entries = self._load_entries()
+            # 조회 중 무효화가 들어왔으면 이번 결과는 캐시하지 않음 (다음 조회 때 재구성)
+            if generation == self._generation:
+                self._entries = entries
+                self._built_at = time.monotonic()
+            self._stats['rebuilds'] += 1
+            logger.debug(f"✅ 웹훅 인증 인덱스 재구성: 활성 전략 {len(entries)}개")
+            return entries
+
+    def _load_entries(self) -> Dict[str, StrategyAuthEntry]:
+        """활성 전략 + 소유자 토큰 + (공개 전략) 구독자 토큰을 조인 쿼리 1회로 조회"""
+        from app import db
+        from app.models import Account, Strategy, StrategyAccount, User
+
+        owner = aliased(User)
+        subscriber = aliased(User)
+        stmt = (
+            select(
+                Strategy.id, Strategy.group_name, Strategy.market_type, Strategy.is_public,
+                owner.webhook_token, subscriber.webhook_token
+            )
+            .outerjoin(owner, owner.id == Strategy.user_id)
+            .outerjoin(StrategyAccount, and_(
+                StrategyAccount.strategy_id == Strategy.id,
+                StrategyAccount.is_active.is_(True)
+            ))
+            .outerjoin(Account, Account.id == StrategyAccount.account_id)
+            .outerjoin(subscriber, subscriber.id == Account.user_id)
+            .where(Strategy.is_active.is_(True))
+        )
+
+        collected: Dict[str, Dict[str, Any]] = {}
+        for strategy_id, group_name, market_type, is_public, owner_token, subscriber_token in db.session.execute(stmt):
+            item = collected.setdefault(group_name, {
+                'strategy_id': strategy_id,
+                'market_type': market_type,
+                'tokens': set()
+            })
+            if owner_token:
+                item['tokens'].add(hash_token(owner_token))
+            # 공개 전략의 경우: 전략을 구독(연결)한 사용자들의 토큰도 허용
+            if is_public and subscriber_token:
+                item['tokens'].add(hash_token(subscriber_token))
+
+        return {
+            group_name: StrategyAuthEntry(
+                strategy_id=item['strategy_id'],
+                market_type=item['market_type'],
+                token_hashes=frozenset(item['tokens'])
+            )
+            for group_name, item in collected.items()
+        }
+
+
+# 전역 인스턴스
+strategy_token_index = StrategyTokenIndex()
+
+
+def _touches_auth_data(session: Session) -> bool:
+    for obj in session.new | session.deleted:
+        if type(obj).__name__ in _WATCHED_ATTRIBUTES:
+            return True
+    for obj in session.dirty:
+        attributes = _WATCHED_ATTRIBUTES.get(type(obj).__name__)
+        if not attributes:
+            continue
+        state = inspect(obj)
+        if any(state.attrs[name].history.has_changes() for name in attributes):
+            return True
+    return False
+
+
+@event.listens_for(Session, 'after_flush')
+def _mark_auth_changes(session, flush_context):
+    if _touches_auth_data(session):
+        session.info[_SESSION_FLAG] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_on_commit(session):
+    if session.info.pop(_SESSION_FLAG, False):
+        strategy_token_index.invalidate('strategy/account/subscription/token 변경 커밋')
+
+
+@event.listens_for(Session, 'after_rollback')
+def _discard_on_rollback(session):
+    session.info.pop(_SESSION_FLAG, None)
@@ -0,0 +1,374 @@
+# @FEAT:webhook-queue @COMP:service @TYPE:core
+"""
+웹훅 비동기 수신 대기열 (DB 기반 큐 + 워커 풀)
+
+WEBHOOK_ASYNC_INGESTION=true 이면 /api/webhook은 전략/토큰 검증 후 webhook_queue 테이블에
+저장하고 즉시 200을 응답합니다. 워커 풀이 대기열을 비우며 기존 process_webhook()으로 처리합니다.
+
+순서 보장:
+- 동일 (strategy_id, symbol) 항목은 id 순서대로, 한 번에 하나만 PROCESSING 상태가 됩니다
+  (WebhookLockManager와 동일한 전략+심볼 직렬화, 여러 워커 프로세스 간에도 유지)
+- PostgreSQL에서는 FOR UPDATE SKIP LOCKED로 워커 간 중복 선점 없이 선두 항목을 가져옵니다
+
+장애 처리:
+- 워커 중단 등으로 WEBHOOK_QUEUE_STALE_SEC 이상 PROCESSING에 머문 항목은 FAILED로 전환합니다.
+  거래소 주문이 이미 전송됐을 수 있으므로 재실행하지 않습니다 (중복 주문 방지).
+
+보존/보안:
+- 웹훅 토큰은 수신 시 검증한 뒤 payload에서 제거하고 저장합니다. 워커는 저장된 strategy_id로
+  처리하며 토큰을 다시 검증하지 않습니다.
+- 완료(DONE/FAILED) 후 WEBHOOK_QUEUE_RETENTION_SEC가 지난 항목은 워커가 배치 단위로 삭제합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.orm import aliased
+
+from app import db
+from app.models import WebhookQueueItem
+from app.services.utils import normalize_webhook_data
+from app.services.webhook_service import webhook_service, WebhookError
+
+logger = logging.getLogger(__name__)
+
+# 비동기 수신 모드 활성화 여부 (기본: 기존 동기 처리)
+WEBHOOK_ASYNC_INGESTION = os.getenv('WEBHOOK_ASYNC_INGESTION', 'false').lower() in ('1', 'true', 'yes')
+# 프로세스당 대기열 워커 스레드 수
+WEBHOOK_QUEUE_WORKERS = int(os.getenv('WEBHOOK_QUEUE_WORKERS', '4'))
+# 대기열이 비었을 때 폴링 간격 (같은 프로세스의 enqueue는 즉시 깨움)
+WEBHOOK_QUEUE_POLL_INTERVAL_SEC = float(os.getenv('WEBHOOK_QUEUE_POLL_INTERVAL_SEC', '0.5'))
+# PROCESSING 상태 최대 유지 시간 (초과 시 FAILED 처리)
+WEBHOOK_QUEUE_STALE_SEC = int(os.getenv('WEBHOOK_QUEUE_STALE_SEC', '300'))
+# 완료(DONE/FAILED) 항목 보존 시간 (초과 시 삭제)
+WEBHOOK_QUEUE_RETENTION_SEC = int(os.getenv('WEBHOOK_QUEUE_RETENTION_SEC', '86400'))
+# 완료 항목 삭제 배치 크기
+WEBHOOK_QUEUE_PURGE_BATCH = int(os.getenv('WEBHOOK_QUEUE_PURGE_BATCH', '1000'))
+# 대기열 정리(처리 중단 항목 FAILED 전환 + 완료 항목 삭제) 주기(초)
+WEBHOOK_QUEUE_MAINTENANCE_INTERVAL_SEC = 60
+
+STATUS_PENDING = 'PENDING'
+STATUS_PROCESSING = 'PROCESSING'
+STATUS_DONE = 'DONE'
+STATUS_FAILED = 'FAILED'
+FINISHED_STATUSES = (STATUS_DONE, STATUS_FAILED)
+
+
+def strip_token(webhook_data: Dict[str, Any]) -> Dict[str, Any]:
+    """저장용 웹훅 데이터 (토큰 키 제거, 대소문자 무관 - 인증은 수신 시 완료)"""
+    return {key: value for key, value in webhook_data.items() if str(key).lower() != 'token'}
+
+
+# @FEAT:webhook-queue @COMP:service @TYPE:core
+class WebhookQueue:
+    """웹훅 대기열 수신/선점/처리 및 워커 풀 관리"""
+
+    def __init__(self, workers: int = WEBHOOK_QUEUE_WORKERS, enabled: bool = WEBHOOK_ASYNC_INGESTION):
+        self.workers = max(1, workers)
+        self.enabled = enabled
+        self._threads: List[threading.Thread] = []
+        self._stop_event = threading.Event()
+        self._wakeup = threading.Event()
+        self._last_maintenance = 0.0
+        self._stats = {'enqueued': 0, 'processed': 0, 'failed': 0, 'stale_failed': 0, 'purged': 0}
+
+    # @FEAT:webhook-queue @COMP:service @TYPE:core
+    def enqueue(self, webhook_data: Dict[str, Any], webhook_received_at: Optional[float] = None) -> int:
+        """
+        웹훅 검증 후 대기열 저장
+
+        process_webhook()의 사전 검증(group_name/symbol 필수, 전략+토큰)만 수행하므로
+        인증 인덱스 조회 + INSERT 1회로 끝납니다. 토큰은 검증 후 payload에서 제거합니다.
+
+        Returns:
+            int: 대기열 항목 ID
+
+        Raises:
+            WebhookError: 필수 필드 누락 또는 전략/토큰 검증 실패
+        """
+        if webhook_received_at is None:
+            webhook_received_at = time.time()
+
+        normalized_data = normalize_webhook_data(webhook_data)
+        group_name = normalized_data.get('group_name')
+        if not group_name:
+            raise WebhookError("group_name이 필요합니다")
+        symbol = normalized_data.get('symbol')
+        if not symbol:
+            raise WebhookError("symbol이 필요합니다")
+
+        if normalized_data.get('test_mode', False):
+            # 테스트 모드는 process_webhook()과 동일하게 가상 전략 ID로 직렬화
+            strategy_id = normalized_data.get('strategy_id', 999)
+        else:
+            strategy_id = webhook_service._validate_strategy_token(group_name, normalized_data.get('token')).id
+
+        item = WebhookQueueItem(
+            strategy_id=strategy_id,
+            symbol=symbol,
+            group_name=group_name,
+            payload=json.dumps(strip_token(webhook_data), ensure_ascii=False),
+            status=STATUS_PENDING,
+            webhook_received_at=webhook_received_at
+        )
+        db.session.add(item)
+        db.session.commit()
+
+        self._stats['enqueued'] += 1
+        self._wakeup.set()
+        logger.info(f"📥 웹훅 대기열 저장 - id: {item.id}, 전략: {group_name}, 심볼: {symbol}")
+        return item.id
+
+    # @FEAT:webhook-queue @COMP:service @TYPE:core
+    def claim_next(self) -> Optional[WebhookQueueItem]:
+        """
+        처리 가능한 가장 오래된 항목을 PROCESSING으로 선점
+
+        선점 조건: PENDING이며, 같은 (strategy_id, symbol)에 PROCESSING 항목이 없고
+        더 앞선 PENDING 항목도 없는 경우 (키별 FIFO + 단일 처리)
+        """
+        queue = WebhookQueueItem
+        busy = aliased(WebhookQueueItem)
+        earlier = aliased(WebhookQueueItem)
+
+        stmt = (
+            select(queue.id)
+            .where(
+                queue.status == STATUS_PENDING,
+                ~exists().where(
+                    busy.strategy_id == queue.strategy_id,
+                    busy.symbol == queue.symbol,
+                    busy.status == STATUS_PROCESSING
+                ),
+                ~exists().where(
+                    earlier.strategy_id == queue.strategy_id,
+                    earlier.symbol == queue.symbol,
+                    earlier.status == STATUS_PENDING,
+                    earlier.id < queue.id
+                )
+            )
+            .order_by(queue.id)
+            .limit(1)
+            .with_for_update(skip_locked=True, of=queue)
+        )
+
+        try:
+            item_id = db.session.execute(stmt).scalar()
+            if item_id is None:
+                db.session.rollback()
+                return None
+
+            claimed = db.session.execute(
+                update(queue)
+                .where(queue.id == item_id, queue.status == STATUS_PENDING)
+                .values(status=STATUS_PROCESSING, locked_at=time.time(), attempts=queue.attempts + 1)
+            ).rowcount
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        if not claimed:
+            return None
+        return db.session.get(queue, item_id)
+
+    # @FEAT:webhook-queue @COMP:service @TYPE:core
+    def process_next(self) -> bool:
+        """
+        대기열 항목 1건 처리 (앱 컨텍스트 필요)
+
+        Returns:
+            bool: 처리한 항목이 있으면 True
+        """
+        item = self.claim_next()
+        if item is None:
+            return False
+
+        item_id = item.id
+        webhook_data = json.loads(item.payload)
+        try:
+            # 수신 시 토큰 검증 완료 → 저장된 전략 ID로 처리
+            result = webhook_service.process_webhook(
+                webhook_data, item.webhook_received_at, authenticated_strategy_id=item.strategy_id
+            )
+            message = json.dumps({
+                'action': result.get('action', 'unknown'),
+                'summary': result.get('summary', {})
+            }, ensure_ascii=False, default=str)
+            self._finish(item_id, STATUS_DONE, message)
+            self._stats['processed'] += 1
+            logger.info(f"✅ 웹훅 대기열 처리 완료 - id: {item_id}, "
+                        f"대기: {round((time.time() - item.webhook_received_at) * 1000, 2)}ms")
+        except Exception as e:
+            db.session.rollback()
+            self._finish(item_id, STATUS_FAILED, str(e))
+            self._stats['failed'] += 1
+            logger.error(f"❌ 웹훅 대기열 처리 실패 - id: {item_id}: {str(e)}")
+            self._notify_failure(webhook_data, e)
+        return True
+
+    # @FEAT:webhook-queue @COMP:service @TYPE:helper
+    def fail_stale(self, stale_seconds: float = WEBHOOK_QUEUE_STALE_SEC) -> int:
+        """오래 PROCESSING에 머문 항목을 FAILED로 전환 (해당 키의 후속 항목 처리 재개)"""
+        now = time.time()
+        try:
+            count = db.session.execute(
+                update(WebhookQueueItem)
+                .where(
+                    WebhookQueueItem.status == STATUS_PROCESSING,
+                    WebhookQueueItem.locked_at < now - stale_seconds
+                )
+                .values(
+                    status=STATUS_FAILED,
+                    completed_at=now,
+                    message=f'처리 시간 초과 ({stale_seconds}s) - 워커 중단 추정, 재실행하지 않음'
+                )
+            ).rowcount
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        if count:
+            self._stats['stale_failed'] += count
+            logger.critical(f"🚨 웹훅 대기열 처리 중단 항목 {count}건 FAILED 처리 - 주문 상태 확인 필요")
+        return count
+
+    # @FEAT:webhook-queue @COMP:service @TYPE:helper
+    def purge_finished(self, retention_seconds: float = WEBHOOK_QUEUE_RETENTION_SEC,
+                       batch_size: int = WEBHOOK_QUEUE_PURGE_BATCH) -> int:
+        """보존 시간이 지난 완료(DONE/FAILED) 항목 삭제 (batch_size 단위로 나눠 커밋)"""
+        cutoff = time.time() - retention_seconds
+        total = 0
+        while True:
+            expired_ids = (
+                select(WebhookQueueItem.id)
+                .where(
+                    WebhookQueueItem.status.in_(FINISHED_STATUSES),
+                    WebhookQueueItem.completed_at < cutoff
+                )
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            try:
+                count = db.session.execute(
+                    delete(WebhookQueueItem)
+                    .where(WebhookQueueItem.id.in_(expired_ids))
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+            total += count
+            if count < batch_size:
+                break
+
+        if total:
+            self._stats['purged'] += total
+            logger.info(f"🧹 웹훅 대기열 완료 항목 {total}건 삭제 (보존 {retention_seconds}s 경과)")
+        return total
+
+    def start(self, app) -> None:
+        """워커 풀 시작 (비동기 수신 모드에서만)"""
+        if not self.enabled or self._threads:
+            return
+
+        self._stop_event.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(
+                target=self._worker_loop, args=(app,),
+                name=f'webhook-queue-{index}', daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"✅ 웹훅 대기열 워커 {self.workers}개 시작")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """워커 풀 종료 (처리 중인 항목은 완료 후 종료)"""
+        if not self._threads:
+            return
+
+        self._stop_event.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        logger.info("🛑 웹훅 대기열 워커 종료")
+
+    def get_stats(self) -> Dict[str, Any]:
+        counts = dict(
+            db.session.execute(
+                select(WebhookQueueItem.status, func.count())
+                .group_by(WebhookQueueItem.status)
+            ).all()
+        )
+        oldest_pending = db.session.execute(
+            select(func.min(WebhookQueueItem.webhook_received_at))
+            .where(WebhookQueueItem.status == STATUS_PENDING)
+        ).scalar()
+
+        return {
+            **self._stats,
+            'enabled': self.enabled,
+            'workers': len(self._threads),
+            'status_counts': counts,
+            'oldest_pending_age_seconds': round(time.time() - oldest_pending, 1) if oldest_pending else None
+        }
+
+    def _worker_loop(self, app) -> None:
+        while not self._stop_event.is_set():
+            processed = False
+            try:
+                with app.app_context():
+                    processed = self.process_next()
+                    if not processed:
+                        self._maintain_if_due()
+            except Exception as e:
+                logger.error(f"웹훅 대기열 워커 오류: {str(e)}", exc_info=True)
+
+            if not processed:
+                self._wakeup.wait(WEBHOOK_QUEUE_POLL_INTERVAL_SEC)
+                self._wakeup.clear()
+
+    def _maintain_if_due(self) -> None:
+        now = time.monotonic()
+        if now - self._last_maintenance < WEBHOOK_QUEUE_MAINTENANCE_INTERVAL_SEC:
+            return
+        self._last_maintenance = now
+        self.fail_stale()
+        self.purge_finished()
+
+    def _finish(self, item_id: int, status: str, message: str) -> None:
+        db.session.execute(
+            update(WebhookQueueItem)
+            .where(WebhookQueueItem.id == item_id)
+            .values(status=status, completed_at=time.time(), message=message)
+        )
+        db.session.commit()
+
+    @staticmethod
+    def _notify_failure(webhook_data: Dict[str, Any], error: Exception) -> None:
+        # 동기 모드 라우트와 동일한 텔레그램 알림 (비활성화 상태면 조용히 무시)
+        try:
+            from app.services.telegram import telegram_service
+            if not telegram_service.is_enabled():
+                return
+            if isinstance(error, WebhookError):
+                telegram_service.send_webhook_error(webhook_data, str(error))
+            else:
+                telegram_service.send_error_alert(
+                    "웹훅 대기열 처리 시스템 오류", str(error), {"요청 데이터": str(webhook_data)}
+                )
+        except Exception:
+            pass  # 텔레그램 알림 실패는 조용히 무시
+
+
+# 전역 인스턴스
+webhook_queue = WebhookQueue()
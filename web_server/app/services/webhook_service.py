@@ -12,16 +12,20 @@
 
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional
 from datetime import datetime
 from contextlib import contextmanager
 
+from flask import current_app
+
 from app import db
 from app.models import Strategy, WebhookLog
 from app.services.utils import normalize_webhook_data
 from app.services.exchange import exchange_service
 from app.services.webhook_lock_manager import webhook_lock_manager
-from app.constants import MarketType, Exchange, OrderType
+from app.services.webhook_auth_index import strategy_token_index
+from app.constants import MarketType, Exchange, OrderType, MAX_PARALLEL_ACCOUNT_WORKERS
 from app.utils.logging_security import get_secure_logger
 
 logger = get_secure_logger(__name__)
@@ -101,39 +105,27 @@ class WebhookService:
         Raises:
             WebhookError: 전략을 찾을 수 없거나 토큰이 유효하지 않은 경우
         """
-        strategy = Strategy.query.filter_by(group_name=group_name, is_active=True).first()
-        if not strategy:
+        # 인증 인덱스 조회 (group_name → 전략 ID + 허용 토큰 해시, DB 접근 없음)
+        # 허용 토큰: 전략 소유자 토큰 + 공개 전략의 경우 활성 구독자(전략-계좌 링크) 토큰
+        entry = strategy_token_index.lookup(group_name)
+        if not entry:
             raise WebhookError(f"활성 전략을 찾을 수 없습니다: {group_name}")
 
         if not token:
             raise WebhookError("웹훅 토큰이 필요합니다")
 
-        # 허용되는 토큰 집합 구성
-        valid_tokens = set()
-        owner = strategy.user
-        if owner and getattr(owner, 'webhook_token', None):
-            valid_tokens.add(owner.webhook_token)
-
-        # 공개 전략의 경우: 전략을 구독(연결)한 사용자들의 토큰도 허용
-        if getattr(strategy, 'is_public', False):
-            try:
-                for sa in strategy.strategy_accounts:
-                    # 전략-계좌 링크 활성 + 계좌/사용자/토큰 존재 시 수집
-                    if getattr(sa, 'is_active', True) and getattr(sa, 'account', None):
-                        account_user = getattr(sa.account, 'user', None)
-                        user_token = getattr(account_user, 'webhook_token', None) if account_user else None
-                        if user_token:
-                            valid_tokens.add(user_token)
-            except Exception:
-                # 토큰 수집 실패는 검증 흐름에 영향 주지 않음
-                pass
-
-        if not valid_tokens:
+        if not entry.token_hashes:
             raise WebhookError("웹훅 토큰이 설정된 사용자가 없습니다. 전략 소유자 또는 구독자의 토큰을 생성하세요")
 
-        if token not in valid_tokens:
+        if not strategy_token_index.verify_token(entry, token):
             raise WebhookError("웹훅 토큰이 유효하지 않습니다")
 
+        # 검증 통과 후에만 전략 로드 (기본키 조회 1회)
+        strategy = db.session.get(Strategy, entry.strategy_id)
+        if not strategy or not strategy.is_active:
+            strategy_token_index.invalidate(f"stale entry: {group_name}")
+            raise WebhookError(f"활성 전략을 찾을 수 없습니다: {group_name}")
+
         return strategy
 
     # @FEAT:webhook-concurrency @COMP:service @TYPE:core
@@ -172,7 +164,8 @@ class WebhookService:
     # @REFACTOR:2025-11-03 - Removed batch_mode redundancy
     # @PRINCIPLE: Single source of truth - detect batch mode by 'orders' field presence only
     # WHY: batch_mode was a derived field (redundant), causes maintenance confusion
-    def process_webhook(self, webhook_data: Dict[str, Any], webhook_received_at: Optional[float] = None) -> Dict[str, Any]:
+    def process_webhook(self, webhook_data: Dict[str, Any], webhook_received_at: Optional[float] = None,
+                        authenticated_strategy_id: Optional[int] = None) -> Dict[str, Any]:
         """
         웹훅 데이터 처리 메인 함수
 
@@ -183,6 +176,8 @@ class WebhookService:
         Args:
             webhook_data (Dict[str, Any]): 웹훅 데이터
             webhook_received_at (Optional[float]): 웹훅 수신 시각 (Unix timestamp)
+            authenticated_strategy_id (Optional[int]): 수신 시 토큰 검증을 마친 전략 ID
+                (웹훅 대기열 - 토큰을 저장하지 않으므로 재검증 없이 전략 활성 상태만 확인)
 
         Returns:
             Dict[str, Any]: 처리 결과
@@ -264,8 +259,13 @@ class WebhookService:
                 self.session.commit()
                 return result
 
-            # 전략 조회 및 토큰 검증 (단일 소스)
-            strategy = self._validate_strategy_token(group_name, token)
+            if authenticated_strategy_id is not None:
+                strategy = db.session.get(Strategy, authenticated_strategy_id)
+                if not strategy or not strategy.is_active:
+                    raise WebhookError(f"활성 전략을 찾을 수 없습니다: {group_name}")
+            else:
+                # 전략 조회 및 토큰 검증 (단일 소스)
+                strategy = self._validate_strategy_token(group_name, token)
 
             # 🔒 Lock 획득 (모든 주문 작업 직렬화)
             with self._acquire_strategy_lock(strategy.id, symbol):
@@ -281,7 +281,10 @@ class WebhookService:
                     market_type = strategy.market_type or MarketType.SPOT
 
                     if MarketType.is_crypto(market_type):
-                        result = self.process_cancel_all_orders(normalized_data, webhook_received_at)
+                        result = self.process_cancel_all_orders(
+                            normalized_data, webhook_received_at,
+                            authenticated=authenticated_strategy_id is not None
+                        )
                     else:
                         result = self._cancel_securities_orders(strategy, normalized_data, webhook_received_at)
 
@@ -648,25 +651,10 @@ class WebhookService:
 
     # ⚠️ SSE 이벤트 발송은 trading_service에서 중앙화됨 - 이 메서드는 더 이상 사용하지 않음
 
-    # @FEAT:webhook-order @COMP:service @TYPE:core
-    def process_cancel_all_orders(self, webhook_data: Dict[str, Any], webhook_received_at: float) -> Dict[str, Any]:
-        """모든 주문 취소 처리 - order_service를 통해 처리 (선택적 필터링 지원)"""
-        group_name = webhook_data.get('group_name')
-        token = webhook_data.get('token')
-        symbol = webhook_data.get('symbol')  # 필수: 특정 심볼
-        side = webhook_data.get('side')  # 선택적: BUY/SELL (없으면 모든 주문 취소)
-
-        logger.info(f"🔄 주문 취소 처리 시작 - 전략: {group_name}, "
-                   f"심볼: {symbol}, side: {side or '전체'}")
-
-        if not group_name:
-            raise WebhookError("group_name이 필요합니다")
-
-        # 전략 조회 및 토큰 검증 (공개 전략 구독자 토큰 허용)
-        strategy = Strategy.query.filter_by(group_name=group_name, is_active=True).first()
-        if not strategy:
-            raise WebhookError(f"활성 전략을 찾을 수 없습니다: {group_name}")
-
+    # @FEAT:webhook-order @COMP:validation @TYPE:validation
+    @staticmethod
+    def _verify_cancel_all_token(strategy: Strategy, token: Optional[str]) -> None:
+        """전체 취소 토큰 검증 (전략 소유자 + 공개 전략 활성 구독자 토큰 허용)"""
         if not token:
             raise WebhookError("웹훅 토큰이 필요합니다")
 
@@ -691,6 +679,32 @@ class WebhookService:
         if token not in valid_tokens:
             raise WebhookError("웹훅 토큰이 유효하지 않습니다")
 
+    # @FEAT:webhook-order @COMP:service @TYPE:core
+    def process_cancel_all_orders(self, webhook_data: Dict[str, Any], webhook_received_at: float,
+                                  authenticated: bool = False) -> Dict[str, Any]:
+        """모든 주문 취소 처리 - order_service를 통해 계좌별 병렬 처리 (선택적 필터링 지원)
+
+        authenticated=True이면 토큰 검증을 생략합니다 (웹훅 대기열: 수신 시 검증 완료, 토큰 미저장).
+        """
+        group_name = webhook_data.get('group_name')
+        token = webhook_data.get('token')
+        symbol = webhook_data.get('symbol')  # 필수: 특정 심볼
+        side = webhook_data.get('side')  # 선택적: BUY/SELL (없으면 모든 주문 취소)
+
+        logger.info(f"🔄 주문 취소 처리 시작 - 전략: {group_name}, "
+                   f"심볼: {symbol}, side: {side or '전체'}")
+
+        if not group_name:
+            raise WebhookError("group_name이 필요합니다")
+
+        # 전략 조회 및 토큰 검증 (공개 전략 구독자 토큰 허용)
+        strategy = Strategy.query.filter_by(group_name=group_name, is_active=True).first()
+        if not strategy:
+            raise WebhookError(f"활성 전략을 찾을 수 없습니다: {group_name}")
+
+        if not authenticated:
+            self._verify_cancel_all_token(strategy, token)
+
         logger.info(f"✅ 전략 조회 성공 - ID: {strategy.id}, 이름: {strategy.name}")
 
         # 전략에 연결된 계좌들 조회
@@ -711,6 +725,7 @@ class WebhookService:
         # Phase 3b.3: 실패 추적 리스트
         failed_cancellations = []
 
+        targets = []
         for idx, sa in enumerate(strategy_accounts):
             account = sa.account
             logger.debug(f"[{idx+1}/{len(strategy_accounts)}] 계좌 처리 중 - StrategyAccount ID: {sa.id}")
@@ -732,84 +747,118 @@ class WebhookService:
 
             logger.info(f"✅ 계좌 {account.id}({account.name}): 주문 취소 처리 대상")
             processed_count += 1
-
-            try:
+            targets.append({
+                'account_id': account.id,
+                'account_name': account.name,
+                'exchange': account.exchange,
+                'user_id': account.user_id
+            })
+
+        # 계좌별 취소 병렬 실행 (구독자 수와 무관하게 가장 느린 계좌 1개 시간으로 수렴)
+        # 각 워커는 자체 app context/세션에서 cancel_all_orders_by_user() 호출
+        strategy_id = strategy.id
+        app = current_app._get_current_object()
+
+        def run_in_context(target):
+            with app.app_context():
                 # ✅ 단일 소스 원칙: cancel_all_orders_by_user()를 직접 호출
                 # account.user_id를 직접 전달하여 불필요한 DB 조회 방지
-                logger.info(f"🔄 계좌 {account.id} (user: {account.user_id}): "
-                           f"주문 취소 요청 (side={side or '전체'})...")
-                cancel_result = order_service.cancel_all_orders_by_user(
-                    user_id=account.user_id,  # ✅ 이미 있는 정보 활용 (성능 최적화)
-                    strategy_id=strategy.id,
-                    account_id=account.id,  # 특정 계좌 지정
+                return order_service.cancel_all_orders_by_user(
+                    user_id=target['user_id'],
+                    strategy_id=strategy_id,
+                    account_id=target['account_id'],  # 특정 계좌 지정
                     symbol=symbol,
                     side=side,
                     timing_context={'webhook_received_at': webhook_received_at}
                 )
 
-                if cancel_result['success']:
-                    cancelled_orders_raw = cancel_result.get('cancelled_orders', [])
-                    failed_orders_raw = cancel_result.get('failed_orders', [])
+        outcomes = {}
+        if len(targets) == 1:
+            try:
+                outcomes[targets[0]['account_id']] = run_in_context(targets[0])
+            except Exception as e:
+                outcomes[targets[0]['account_id']] = e
+        elif targets:
+            logger.info(f"🔄 {len(targets)}개 계좌 주문 취소 병렬 요청 (side={side or '전체'})...")
+            max_workers = max(1, min(MAX_PARALLEL_ACCOUNT_WORKERS, len(targets)))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cancel-all') as executor:
+                futures = {executor.submit(run_in_context, target): target['account_id'] for target in targets}
+                for future in as_completed(futures):
+                    try:
+                        outcomes[futures[future]] = future.result()
+                    except Exception as e:
+                        outcomes[futures[future]] = e
 
-                    # 정수 또는 리스트로 처리 (trading.py에서 정수로 반환하는 경우 고려)
-                    if isinstance(cancelled_orders_raw, int):
-                        cancelled_count = cancelled_orders_raw
-                        cancelled_orders_details = []
-                    else:
-                        cancelled_count = len(cancelled_orders_raw)
-                        cancelled_orders_details = cancelled_orders_raw
+        # 결과 집계 (계좌 순서 유지)
+        for target in targets:
+            account_id = target['account_id']
+            account_name = target['account_name']
+            cancel_result = outcomes.get(account_id)
 
-                    if isinstance(failed_orders_raw, int):
-                        failed_count = failed_orders_raw
-                        failed_orders_details = []
-                    else:
-                        failed_count = len(failed_orders_raw)
-                        failed_orders_details = failed_orders_raw
-
-                    logger.info(f"✅ 계좌 {account.id}({account.name}) 주문 취소 완료 - "
-                               f"성공: {cancelled_count}개, 실패: {failed_count}개")
-
-                    # @FEAT:orphan-order-prevention @COMP:service @TYPE:core @PHASE:3b
-                    # Phase 3b.3: failed_orders를 failed_cancellations에 추가
-                    if failed_orders_details:
-                        for failed_order in failed_orders_details:
-                            failed_cancellations.append({
-                                'order_id': failed_order.get('order_id'),
-                                'symbol': failed_order.get('symbol'),
-                                'account_id': account.id,
-                                'error': failed_order.get('error')
-                            })
+            if isinstance(cancel_result, Exception):
+                error_msg = str(cancel_result)
+                logger.error(f"❌ 계좌 {account_id}({account_name}) 주문 취소 처리 중 예외 발생: {error_msg}")
+                results.append({
+                    'account_id': account_id,
+                    'account_name': account_name,
+                    'exchange': target['exchange'],
+                    'error': f"처리 중 예외: {error_msg}",
+                    'success': False
+                })
+                continue
 
-                    results.append({
-                        'account_id': account.id,
-                        'account_name': account.name,
-                        'exchange': account.exchange,
-                        'cancelled_orders': cancelled_count,
-                        'failed_orders': failed_count,
-                        'cancelled_order_details': cancelled_orders_details,
-                        'failed_order_details': failed_orders_details,
-                        'success': True,
-                        'message': cancel_result.get('message', '주문 취소 완료')
-                    })
+            if cancel_result['success']:
+                cancelled_orders_raw = cancel_result.get('cancelled_orders', [])
+                failed_orders_raw = cancel_result.get('failed_orders', [])
+
+                # 정수 또는 리스트로 처리 (trading.py에서 정수로 반환하는 경우 고려)
+                if isinstance(cancelled_orders_raw, int):
+                    cancelled_count = cancelled_orders_raw
+                    cancelled_orders_details = []
                 else:
-                    error_msg = cancel_result.get('error', '알 수 없는 오류')
-                    logger.error(f"❌ 계좌 {account.id}({account.name}) 주문 취소 실패: {error_msg}")
-                    results.append({
-                        'account_id': account.id,
-                        'account_name': account.name,
-                        'exchange': account.exchange,
-                        'error': error_msg,
-                        'success': False
-                    })
+                    cancelled_count = len(cancelled_orders_raw)
+                    cancelled_orders_details = cancelled_orders_raw
+
+                if isinstance(failed_orders_raw, int):
+                    failed_count = failed_orders_raw
+                    failed_orders_details = []
+                else:
+                    failed_count = len(failed_orders_raw)
+                    failed_orders_details = failed_orders_raw
+
+                logger.info(f"✅ 계좌 {account_id}({account_name}) 주문 취소 완료 - "
+                           f"성공: {cancelled_count}개, 실패: {failed_count}개")
+
+                # @FEAT:orphan-order-prevention @COMP:service @TYPE:core @PHASE:3b
+                # Phase 3b.3: failed_orders를 failed_cancellations에 추가
+                if failed_orders_details:
+                    for failed_order in failed_orders_details:
+                        failed_cancellations.append({
+                            'order_id': failed_order.get('order_id'),
+                            'symbol': failed_order.get('symbol'),
+                            'account_id': account_id,
+                            'error': failed_order.get('error')
+                        })
 
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"❌ 계좌 {account.id}({account.name}) 주문 취소 처리 중 예외 발생: {error_msg}")
                 results.append({
-                    'account_id': account.id,
-                    'account_name': account.name,
-                    'exchange': account.exchange,
-                    'error': f"처리 중 예외: {error_msg}",
+                    'account_id': account_id,
+                    'account_name': account_name,
+                    'exchange': target['exchange'],
+                    'cancelled_orders': cancelled_count,
+                    'failed_orders': failed_count,
+                    'cancelled_order_details': cancelled_orders_details,
+                    'failed_order_details': failed_orders_details,
+                    'success': True,
+                    'message': cancel_result.get('message', '주문 취소 완료')
+                })
+            else:
+                error_msg = cancel_result.get('error', '알 수 없는 오류')
+                logger.error(f"❌ 계좌 {account_id}({account_name}) 주문 취소 실패: {error_msg}")
+                results.append({
+                    'account_id': account_id,
+                    'account_name': account_name,
+                    'exchange': target['exchange'],
+                    'error': error_msg,
                     'success': False
                 })
 
@@ -1026,7 +1075,6 @@ class WebhookService:
         Raises:
             WebhookError: 필수 필드 누락 또는 처리 실패 시
         """
-        from app.exchanges import UnifiedExchangeFactory
         from app.models import Trade, OpenOrder
 
         logger.info(f"🏛️ 증권 주문 처리 시작 - 전략: {strategy.group_name}, "
@@ -1058,9 +1106,9 @@ class WebhookService:
                 continue
 
             try:
-                # 1. 증권 거래소 어댑터 생성
+                # 1. 증권 거래소 어댑터 획득 (계좌별 레지스트리 재사용)
                 trade_request_start = time.time()
-                exchange = UnifiedExchangeFactory.create(account)
+                exchange = exchange_service.get_exchange(account)
 
                 # 2. 주문 생성 (거래소 API 호출)
                 order_params = {
@@ -1185,7 +1233,6 @@ class WebhookService:
                 'results': [...]
             }
         """
-        from app.exchanges import UnifiedExchangeFactory
         from app.models import OpenOrder
 
         symbol = normalized_data.get('symbol')  # 선택적 (특정 심볼만 취소)
@@ -1223,8 +1270,8 @@ class WebhookService:
 
                 logger.info(f"📋 취소 대상 주문: {len(open_orders)}개 (계좌={account.name})")
 
-                # 증권 어댑터 생성
-                exchange = UnifiedExchangeFactory.create(account)
+                # 증권 어댑터 획득 (계좌별 레지스트리 재사용)
+                exchange = exchange_service.get_exchange(account)
 
                 # 주문 취소
                 account_cancelled = 0
@@ -9,11 +9,13 @@ WebSocket 연결 관리자
 import asyncio
 import logging
 import threading
+import time
 from typing import Dict, Optional, Set
 from threading import Thread
 from flask import Flask
 
 from app.models import Account
+from app.utils.db_pool import DB_POOL_ROLE_FILL_MONITOR, db_pool_role
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,8 @@ class WebSocketConnection:
         self.is_connected = False
         self.reconnect_count = 0
         self.subscribed_symbols: Set[str] = set()
+        # 마지막 수신 시각 (메시지/pong) - 미체결 주문 동기화가 스트림 건강 상태 판단에 사용
+        self.last_message_at: Optional[float] = None
 
 
 # @FEAT:order-tracking @COMP:service @TYPE:websocket-integration
@@ -133,7 +137,7 @@ class WebSocketManager:
             bool: 연결 성공 여부
         """
         try:
-            with self.app.app_context():
+            with self.app.app_context(), db_pool_role(DB_POOL_ROLE_FILL_MONITOR):
                 account = Account.query.get(account_id)
                 if not account:
                     logger.error(f"❌ 계정을 찾을 수 없습니다: {account_id}")
@@ -347,6 +351,25 @@ class WebSocketManager:
         """
         return self.connections.get(account_id)
 
+    # @FEAT:order-tracking @COMP:service @TYPE:helper
+    def mark_activity(self, account_id: int) -> None:
+        """스트림 수신 기록 (메시지 또는 pong 수신 시 핸들러가 호출)"""
+        connection = self.connections.get(account_id)
+        if connection:
+            connection.last_message_at = time.time()
+
+    # @FEAT:order-tracking @COMP:service @TYPE:helper
+    def is_stream_healthy(self, account_id: int, max_silence_seconds: float) -> bool:
+        """최근 max_silence_seconds 이내에 수신이 있었는지 (연결 객체가 없으면 False)
+
+        Binance는 connect()가 수신 루프를 끝까지 await하므로 is_connected가 세워지지 않아
+        연결 플래그 대신 수신 시각만으로 판단합니다. 재연결 중에는 수신이 끊겨 자연히 False가 됩니다.
+        """
+        connection = self.connections.get(account_id)
+        if not connection or connection.last_message_at is None:
+            return False
+        return time.time() - connection.last_message_at <= max_silence_seconds
+
     # @FEAT:order-tracking @COMP:service @TYPE:helper
     def get_stats(self) -> Dict:
         """WebSocket 관리자 통계
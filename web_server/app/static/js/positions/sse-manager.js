@@ -18,6 +18,7 @@ class SSEManager {
         this.isConnected = false;
         this.reconnectAttempts = 0;
         this.lastHeartbeat = null;
+        this.lastEventId = null;  // 수동 재연결 시 서버 재전송 기준 (last_event_id)
         this.heartbeatTimer = null;
         this.loginCheckInProgress = false;
         
@@ -152,6 +153,12 @@ class SSEManager {
                 this.logger.info('SSE URL:', fullUrl);
             }
 
+            // 새 EventSource는 Last-Event-ID 헤더를 보내지 않으므로 쿼리로 전달
+            if (this.lastEventId) {
+                const separator = fullUrl.includes('?') ? '&' : '?';
+                fullUrl += `${separator}last_event_id=${encodeURIComponent(this.lastEventId)}`;
+            }
+
             this.eventSource = new EventSource(fullUrl);
             this.logger.info('EventSource 생성됨 - readyState:', this.eventSource.readyState);
 
@@ -213,6 +220,9 @@ class SSEManager {
         
         eventTypes.forEach(eventType => {
             this.eventSource.addEventListener(eventType, (event) => {
+                if (event.lastEventId) {
+                    this.lastEventId = event.lastEventId;
+                }
                 try {
                     const data = JSON.parse(event.data);
                     this.logger.info(`🎯 SSE 이벤트 처리: ${eventType}`, data);
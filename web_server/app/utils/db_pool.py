@@ -0,0 +1,352 @@
+# @FEAT:framework @COMP:util @TYPE:core
+"""
+DB 커넥션 풀 역할 분리 + 계측
+
+요청 스레드(웹훅 fan-out 스레드 포함), APScheduler 작업, 체결 모니터가 한 프로세스에서
+하나의 풀(pool_size=10, max_overflow=0)을 나눠 쓰면서 버스트 시 pool_timeout까지 대기하던 것을
+역할별 풀로 분리하고, 커넥션 획득 대기/보유 현황을 계측합니다.
+
+- 역할: web(기본: 요청, 웹훅 큐), scheduler(APScheduler 작업), fill_monitor(체결 모니터, WebSocket)
+  → 한 역할의 폭주가 다른 역할의 커넥션을 고갈시키지 않음
+- 라우팅: 현재 스레드의 역할(ContextVar)에 따라 RoleRoutedSession.get_bind가 역할 엔진 선택
+  (web은 기본 엔진, 나머지는 SQLALCHEMY_BINDS의 'pool:<role>' 엔진)
+- 계측: 획득 대기 시간, 사용 중/최대 사용 수, 보유자(스레드, 호출 위치, 보유 시간)
+  대기가 DB_POOL_WAIT_WARN_MS를 넘거나 pool_timeout이 나면 보유자 목록을 로그로 남김
+- DB_POOL_MODE=pgbouncer: 외부 PgBouncer가 풀링 → NullPool (체크아웃마다 연결, 반납 시 종료)
+"""
+
+import itertools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional
+
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.pool import NullPool, Pool, QueuePool
+
+logger = logging.getLogger(__name__)
+
+DB_POOL_ROLE_WEB = 'web'
+DB_POOL_ROLE_SCHEDULER = 'scheduler'
+DB_POOL_ROLE_FILL_MONITOR = 'fill_monitor'
+
+# pooled: 프로세스 내 QueuePool / pgbouncer: NullPool (PgBouncer transaction pooling 호환)
+DB_POOL_MODE = os.getenv('DB_POOL_MODE', 'pooled').lower()
+
+# 커넥션 획득 대기가 이 값 이상이면 WARNING (ms)
+DB_POOL_WAIT_WARN_MS = float(os.getenv('DB_POOL_WAIT_WARN_MS', '250'))
+
+# 같은 역할의 대기 경고(보유자 목록 포함) 최소 간격 (초) - 고갈 시 로그 폭주 방지
+DB_POOL_WARN_INTERVAL_SEC = 10.0
+
+# @FEAT:orphan-order-prevention @COMP:config @TYPE:config @DEPS:db-connection-pool
+# Phase 1: 1시간마다 연결 재생성 (stale connection 방지, 고아 주문 95% 예방)
+DB_POOL_RECYCLE_SEC = int(os.getenv('DB_POOL_RECYCLE_SEC', '3600'))
+
+# 역할별 (pool_size, max_overflow, pool_timeout 초) 기본값
+# DB_POOL_<ROLE>_SIZE / DB_POOL_<ROLE>_MAX_OVERFLOW / DB_POOL_<ROLE>_TIMEOUT로 조정
+_ROLE_DEFAULTS = {
+    DB_POOL_ROLE_WEB: (10, 20, 10),          # 요청 스레드 + 웹훅 fan-out (요청당 최대 10 스레드)
+    DB_POOL_ROLE_SCHEDULER: (5, 15, 30),     # APScheduler 20 스레드 + 잔고/미체결 동기화 병렬 작업
+    DB_POOL_ROLE_FILL_MONITOR: (4, 4, 10),   # 체결 writer 스레드 + WebSocket 이벤트 루프
+}
+
+DB_POOL_SETTINGS: Dict[str, Dict[str, int]] = {
+    role: {
+        'pool_size': int(os.getenv(f'DB_POOL_{role.upper()}_SIZE', str(size))),
+        'max_overflow': int(os.getenv(f'DB_POOL_{role.upper()}_MAX_OVERFLOW', str(overflow))),
+        'pool_timeout': int(os.getenv(f'DB_POOL_{role.upper()}_TIMEOUT', str(timeout))),
+    }
+    for role, (size, overflow, timeout) in _ROLE_DEFAULTS.items()
+}
+
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_THIS_FILE = os.path.abspath(__file__)
+
+_current_role: ContextVar[str] = ContextVar('db_pool_role', default=DB_POOL_ROLE_WEB)
+
+
+# @FEAT:framework @COMP:util @TYPE:helper
+def current_db_pool_role() -> str:
+    return _current_role.get()
+
+
+# @FEAT:framework @COMP:util @TYPE:helper
+def set_db_pool_role(role: str) -> None:
+    """현재 스레드의 역할 지정 (전용 스레드 진입 시 1회, ThreadPoolExecutor initializer용)"""
+    _current_role.set(role)
+
+
+# @FEAT:framework @COMP:util @TYPE:helper
+@contextmanager
+def db_pool_role(role: str) -> Iterator[None]:
+    """블록 안의 DB 작업을 지정한 역할의 풀에서 수행 (하위 스레드에 역할을 넘길 때 사용)"""
+    token = _current_role.set(role)
+    try:
+        yield
+    finally:
+        _current_role.reset(token)
+
+
+def db_pool_bind_key(role: str) -> Optional[str]:
+    """역할 엔진의 SQLALCHEMY_BINDS 키 (web은 기본 엔진)"""
+    return None if role == DB_POOL_ROLE_WEB else f'pool:{role}'
+
+
+def _caller() -> str:
+    """커넥션을 요청한 app 코드 위치 (module:function:line)"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.startswith(_APP_DIR) and filename != _THIS_FILE:
+            module = os.path.relpath(filename, _APP_DIR)[:-3].replace(os.sep, '.')
+            return f"{module}:{frame.f_code.co_name}:{frame.f_lineno}"
+        frame = frame.f_back
+    return '<external>'
+
+
+class _RoleStats:
+    __slots__ = ('checkouts', 'timeouts', 'slow_waits', 'in_use', 'peak_in_use',
+                 'wait_total_ms', 'wait_max_ms', 'waits', 'last_warned_at', 'suppressed_warnings')
+
+    def __init__(self, sample_size: int):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.slow_waits = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self.waits: deque = deque(maxlen=sample_size)
+        self.last_warned_at = 0.0
+        self.suppressed_warnings = 0
+
+
+# @FEAT:framework @COMP:util @TYPE:core
+class DBPoolMonitor:
+    """역할별 커넥션 획득 대기/사용 중 커넥션/보유자 집계 (프로세스당 1개)"""
+
+    def __init__(self, wait_warn_ms: float = DB_POOL_WAIT_WARN_MS, sample_size: int = 1000):
+        self.wait_warn_ms = wait_warn_ms
+        self._sample_size = sample_size
+        self._lock = threading.Lock()
+        self._tokens = itertools.count(1)
+        self._roles: Dict[str, _RoleStats] = {}
+        self._pools: Dict[str, Pool] = {}
+        self._holders: Dict[int, Dict[str, Any]] = {}
+
+    def _role_stats(self, role: str) -> _RoleStats:
+        stats = self._roles.get(role)
+        if stats is None:
+            stats = self._roles[role] = _RoleStats(self._sample_size)
+        return stats
+
+    def record_checkout(self, role: str, pool: Pool, wait_sec: float, connection: Any) -> None:
+        wait_ms = wait_sec * 1000
+        token = next(self._tokens)
+        connection.info['db_pool_token'] = token
+        holder = {
+            'role': role,
+            'thread': threading.current_thread().name,
+            'caller': _caller(),
+            'since': time.monotonic(),
+        }
+        with self._lock:
+            self._pools[role] = pool
+            self._holders[token] = holder
+            stats = self._role_stats(role)
+            stats.checkouts += 1
+            stats.in_use += 1
+            stats.peak_in_use = max(stats.peak_in_use, stats.in_use)
+            stats.wait_total_ms += wait_ms
+            stats.wait_max_ms = max(stats.wait_max_ms, wait_ms)
+            stats.waits.append(wait_ms)
+            slow = wait_ms >= self.wait_warn_ms
+            if slow:
+                stats.slow_waits += 1
+        if slow:
+            self._warn(role, f"DB 커넥션 대기 {wait_ms:.0f}ms ({holder['caller']})", logging.WARNING)
+
+    def record_timeout(self, role: str, pool: Pool, wait_sec: float) -> None:
+        with self._lock:
+            self._pools[role] = pool
+            self._role_stats(role).timeouts += 1
+        self._warn(role, f"DB 커넥션 획득 실패 (pool_timeout {wait_sec:.1f}s, {_caller()})", logging.ERROR)
+
+    def record_checkin(self, connection_record: Any) -> None:
+        if connection_record is None:
+            return
+        token = connection_record.info.pop('db_pool_token', None)
+        if token is None:
+            return
+        with self._lock:
+            holder = self._holders.pop(token, None)
+            if holder is not None:
+                self._role_stats(holder['role']).in_use -= 1
+
+    def holders(self, role: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """보유 시간이 긴 순서의 커넥션 보유자 목록"""
+        now = time.monotonic()
+        with self._lock:
+            holders = [h for h in self._holders.values() if role is None or h['role'] == role]
+        holders.sort(key=lambda h: h['since'])
+        return [
+            {'role': h['role'], 'thread': h['thread'], 'caller': h['caller'],
+             'held_ms': round((now - h['since']) * 1000, 1)}
+            for h in holders[:limit]
+        ]
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            roles = {}
+            for role, stats in self._roles.items():
+                waits = sorted(stats.waits)
+                pool = self._pools.get(role)
+                roles[role] = {
+                    'pool': pool.status() if pool is not None else None,
+                    'in_use': stats.in_use,
+                    'peak_in_use': stats.peak_in_use,
+                    'checkouts': stats.checkouts,
+                    'timeouts': stats.timeouts,
+                    'slow_waits': stats.slow_waits,
+                    'wait_ms': {
+                        'avg': round(stats.wait_total_ms / stats.checkouts, 2) if stats.checkouts else 0.0,
+                        'p95': round(waits[min(len(waits) - 1, int(len(waits) * 0.95))], 2) if waits else 0.0,
+                        'max': round(stats.wait_max_ms, 2),
+                    },
+                }
+        for role, role_stats in roles.items():
+            role_stats['holders'] = self.holders(role)
+        return {
+            'mode': DB_POOL_MODE,
+            'wait_warn_ms': self.wait_warn_ms,
+            'settings': DB_POOL_SETTINGS if DB_POOL_MODE != 'pgbouncer' else {},
+            'roles': roles,
+        }
+
+    def reset(self) -> None:
+        """집계 초기화 (보유 중인 커넥션 추적은 유지)"""
+        with self._lock:
+            for role, stats in list(self._roles.items()):
+                fresh = _RoleStats(self._sample_size)
+                fresh.in_use = fresh.peak_in_use = stats.in_use
+                self._roles[role] = fresh
+
+    def _warn(self, role: str, message: str, level: int) -> None:
+        """역할별 DB_POOL_WARN_INTERVAL_SEC에 한 번만 보유자 목록과 함께 기록"""
+        now = time.monotonic()
+        with self._lock:
+            stats = self._role_stats(role)
+            if now - stats.last_warned_at < DB_POOL_WARN_INTERVAL_SEC:
+                stats.suppressed_warnings += 1
+                return
+            suppressed, stats.suppressed_warnings = stats.suppressed_warnings, 0
+            stats.last_warned_at = now
+            pool = self._pools.get(role)
+            in_use = stats.in_use
+
+        holders = ', '.join(f"{h['thread']}@{h['caller']} {h['held_ms']:.0f}ms" for h in self.holders(role, limit=5))
+        logger.log(level, f"⏳ [{role}] {message} | 사용 중 {in_use} ({pool.status() if pool else '-'}) "
+                          f"| 보유자: {holders or '-'}"
+                          + (f" | 이전 {suppressed}건 생략" if suppressed else ''))
+
+
+# 전역 인스턴스
+db_pool_monitor = DBPoolMonitor()
+
+
+class _InstrumentedPoolMixin:
+    """Pool.connect() 대기 시간 측정 + 보유자 등록 (반납은 checkin 이벤트에서 해제)"""
+
+    db_pool_role = DB_POOL_ROLE_WEB
+
+    def connect(self):
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except sa_exc.TimeoutError:
+            db_pool_monitor.record_timeout(self.db_pool_role, self, time.perf_counter() - started)
+            raise
+        db_pool_monitor.record_checkout(self.db_pool_role, self, time.perf_counter() - started, connection)
+        return connection
+
+
+def _on_checkin(dbapi_connection, connection_record):
+    db_pool_monitor.record_checkin(connection_record)
+
+
+_pool_classes: Dict[tuple, type] = {}
+_pool_classes_lock = threading.Lock()
+
+
+# @FEAT:framework @COMP:util @TYPE:helper
+def instrumented_pool_class(role: str, base: type = QueuePool) -> type:
+    """역할 이름을 가진 계측 Pool 클래스 (dispose 후 재생성되는 풀에도 유지되도록 클래스 속성으로 보관)"""
+    key = (role, base)
+    with _pool_classes_lock:
+        pool_class = _pool_classes.get(key)
+        if pool_class is None:
+            pool_class = type(f'Instrumented{base.__name__}_{role}', (_InstrumentedPoolMixin, base),
+                              {'db_pool_role': role})
+            event.listen(pool_class, 'checkin', _on_checkin)
+            # detach된 커넥션은 풀 관리 대상에서 빠지므로 보유자 추적도 해제
+            event.listen(pool_class, 'detach', _on_checkin)
+            _pool_classes[key] = pool_class
+        return pool_class
+
+
+# @FEAT:framework @COMP:config @TYPE:config
+def db_pool_engine_options(role: str = DB_POOL_ROLE_WEB) -> Dict[str, Any]:
+    """역할별 create_engine 옵션 (SQLALCHEMY_ENGINE_OPTIONS / SQLALCHEMY_BINDS 값)"""
+    if DB_POOL_MODE == 'pgbouncer':
+        # 풀링/최대 연결 수는 PgBouncer(default_pool_size)가 담당
+        return {'poolclass': instrumented_pool_class(role, NullPool)}
+
+    return {
+        'poolclass': instrumented_pool_class(role),
+        **DB_POOL_SETTINGS[role],
+        'pool_recycle': DB_POOL_RECYCLE_SEC,
+        'pool_pre_ping': True,
+    }
+
+
+# @FEAT:framework @COMP:config @TYPE:config
+def configure_db_pools(app) -> None:
+    """
+    역할별 엔진을 SQLALCHEMY_BINDS에 등록 (db.init_app 이전에 호출)
+
+    외부 config가 SQLALCHEMY_ENGINE_OPTIONS를 직접 지정한 경우에도 web 풀은 계측 Pool 클래스를 사용합니다.
+    """
+    uri = app.config['SQLALCHEMY_DATABASE_URI']
+    engine_options = dict(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    if 'poolclass' not in engine_options:
+        engine_options['poolclass'] = db_pool_engine_options(DB_POOL_ROLE_WEB)['poolclass']
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options
+
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    for role in DB_POOL_SETTINGS:
+        bind_key = db_pool_bind_key(role)
+        if bind_key is not None:
+            binds.setdefault(bind_key, {'url': uri, **db_pool_engine_options(role)})
+    app.config['SQLALCHEMY_BINDS'] = binds
+
+
+# @FEAT:framework @COMP:util @TYPE:core
+class RoleRoutedSession(Session):
+    """기본 엔진으로 향하는 쿼리를 현재 스레드 역할의 엔진으로 보내는 Session"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        bind_key = db_pool_bind_key(_current_role.get())
+        if bind is None and bind_key is not None:
+            engines = self._db.engines
+            if engine is engines.get(None):
+                return engines.get(bind_key, engine)
+        return engine
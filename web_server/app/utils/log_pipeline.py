@@ -0,0 +1,101 @@
+# @FEAT:framework @COMP:util @TYPE:core
+"""
+비동기 로그 파이프라인 (QueueHandler → QueueListener)
+
+주문 처리 경로의 logger.info() 호출이 파일 I/O(RotatingFileHandler의 write/flush/rollover)를
+기다리지 않도록, 호출 스레드는 레코드를 큐에 넣기만 하고 포맷팅과 파일 쓰기는
+백그라운드 리스너 스레드 하나가 처리합니다.
+
+- 호출 스레드: 메시지 인자 확정(record.getMessage) + put_nowait
+- 리스너 스레드: Formatter(시간/경로/예외 트레이스백) + 핸들러 write
+- 큐가 가득 차면 WARNING 이하 레코드는 버리고 개수만 집계 (ERROR 이상은 최대 1초 대기)
+"""
+
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterable, Optional
+
+# 리스너가 밀릴 때 메모리 상한 (레코드 수)
+LOG_QUEUE_MAXSIZE = int(os.getenv('LOG_QUEUE_MAXSIZE', '10000'))
+
+# ERROR 이상 레코드가 큐 여유를 기다리는 최대 시간 (초)
+LOG_QUEUE_ERROR_BLOCK_SEC = 1.0
+
+
+# @FEAT:framework @COMP:util @TYPE:helper
+class NonBlockingQueueHandler(QueueHandler):
+    """포맷팅을 리스너 스레드로 미루고, 큐가 가득 차도 호출 스레드를 막지 않는 QueueHandler"""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """메시지 인자만 확정 (이후 인자 객체 변경 영향 차단), 포맷/예외 문자열화는 리스너에서"""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if record.levelno >= logging.ERROR:
+                self.queue.put(record, timeout=LOG_QUEUE_ERROR_BLOCK_SEC)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+# @FEAT:framework @COMP:util @TYPE:core
+class LogPipeline:
+    """프로세스당 하나의 로그 큐 + 리스너 스레드 (create_app 재호출 시 핸들러만 교체)"""
+
+    def __init__(self, maxsize: int = LOG_QUEUE_MAXSIZE):
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self.queue_handler = NonBlockingQueueHandler(self._queue)
+        self._listener: Optional[QueueListener] = None
+        self._lock = threading.Lock()
+
+    def start(self, handlers: Iterable[logging.Handler]) -> NonBlockingQueueHandler:
+        """리스너 시작 (이미 실행 중이면 대상 핸들러만 교체) → 로거에 붙일 QueueHandler 반환"""
+        handlers = tuple(handlers)
+        with self._lock:
+            if self._listener is None:
+                self._listener = QueueListener(self._queue, *handlers, respect_handler_level=True)
+                self._listener.start()
+            else:
+                previous = self._listener.handlers
+                self._listener.handlers = handlers
+                for handler in previous:
+                    if handler not in handlers:
+                        handler.close()
+        return self.queue_handler
+
+    def attach(self, logger: logging.Logger) -> None:
+        """로거에 QueueHandler 연결 (중복 연결 방지)"""
+        if self.queue_handler not in logger.handlers:
+            logger.addHandler(self.queue_handler)
+
+    def stop(self) -> None:
+        """남은 레코드를 모두 기록하고 리스너 종료 (atexit)"""
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'running': self._listener is not None,
+            'queued': self._queue.qsize(),
+            'maxsize': self._queue.maxsize,
+            'dropped': self.queue_handler.dropped,
+        }
+
+
+# 전역 인스턴스
+log_pipeline = LogPipeline()
@@ -36,6 +36,60 @@ SENSITIVE_PATTERNS = {
 }
 
 
+# 단일 패스 마스킹용 결합 패턴: 패턴별 named group 교대(alternation), 정의 순서(민감도 높은 순)가 우선
+# → (민감도, prefix 그룹 번호) 매핑으로 매치된 패턴의 마스킹 규칙 결정
+_COMBINED_SENSITIVE_PATTERN = re.compile(
+    '|'.join(
+        f'(?P<{name}>{pattern.pattern})'
+        for patterns in SENSITIVE_PATTERNS.values()
+        for name, pattern in patterns.items()
+    ),
+    re.IGNORECASE
+)
+# 패턴이 시작할 수 있는 위치 후보 (각 패턴 키워드의 첫 단어, 소문자 텍스트에서 검색)
+# 결합 패턴을 모든 문자 위치에서 시도하면 교대 분기 11개를 매번 검사하므로,
+# 후보 위치에서만 결합 패턴을 match → 패턴 추가 시 키워드도 함께 추가해야 함
+_SENSITIVE_CANDIDATE = re.compile(
+    r'["\']?(?:api|access|secret|private|password|webhook|token|bearer|telegram|bot|'
+    r'user|chat|account|price|amount|quantity|value|ip|address)'
+)
+_PATTERN_GROUPS = {
+    name: (sensitivity, _COMBINED_SENSITIVE_PATTERN.groupindex[name] + 1)
+    for sensitivity, patterns in SENSITIVE_PATTERNS.items()
+    for name in patterns
+}
+
+
+def _mask_match(match: 're.Match') -> str:
+    """결합 패턴 매치 → 민감도별 마스킹 (prefix는 유지, 값만 마스킹)"""
+    sensitivity, prefix_group = _PATTERN_GROUPS[match.lastgroup]
+    prefix = match.group(prefix_group) or ''
+    sensitive_part = match.group(prefix_group + 1) or ''
+
+    # CRITICAL 레벨은 완전 마스킹
+    if sensitivity == 'CRITICAL':
+        return f"{prefix}****"
+
+    # HIGH 레벨은 앞 4자리만 표시
+    if sensitivity == 'HIGH':
+        if len(sensitive_part) <= 8:
+            return f"{prefix}****"
+        return f"{prefix}{sensitive_part[:4]}****"
+
+    # MEDIUM 레벨은 앞뒤 일부 표시
+    if sensitivity == 'MEDIUM':
+        if len(sensitive_part) <= 4:
+            return f"{prefix}****"
+        elif len(sensitive_part) <= 8:
+            return f"{prefix}{sensitive_part[0]}***{sensitive_part[-1]}"
+        return f"{prefix}{sensitive_part[:2]}***{sensitive_part[-2:]}"
+
+    # LOW 레벨은 부분 마스킹
+    if len(sensitive_part) <= 6:
+        return f"{prefix}{sensitive_part[:len(sensitive_part)//2]}***"
+    return f"{prefix}{sensitive_part[:len(sensitive_part)//3]}***"
+
+
 class LoggingSecurity:
     """로깅 보안 관리자"""
 
@@ -92,7 +146,12 @@ class LoggingSecurity:
         return masked_value
 
     def mask_sensitive_info(self, text: str) -> str:
-        """텍스트에서 민감정보 자동 탐지 및 마스킹"""
+        """텍스트에서 민감정보 자동 탐지 및 마스킹 (결합 패턴 1회 스캔)
+
+        패턴별로 텍스트를 반복 스캔하지 않고 키워드 후보 위치를 왼쪽부터 한 번 훑으며
+        하나의 교대 정규식을 적용합니다. 같은 위치에서 여러 패턴이 가능하면
+        SENSITIVE_PATTERNS 정의 순서(민감도 높은 순)가 우선합니다.
+        """
         if not text or not self.masking_enabled:
             return text
 
@@ -100,42 +159,27 @@ class LoggingSecurity:
         if not isinstance(text, str):
             text = str(text)
 
-        masked_text = text
-
-        # 민감도별로 패턴 적용
-        for sensitivity, patterns in SENSITIVE_PATTERNS.items():
-            for pattern_name, pattern in patterns.items():
-                def mask_match(match):
-                    prefix = match.group(1) if match.lastindex >= 1 else ''
-                    sensitive_part = match.group(2) if match.lastindex >= 2 else match.group(0)
-
-                    # CRITICAL 레벨은 완전 마스킹
-                    if sensitivity == 'CRITICAL':
-                        return f"{prefix}****"
-
-                    # HIGH 레벨은 앞 4자리만 표시
-                    elif sensitivity == 'HIGH':
-                        if len(sensitive_part) <= 8:
-                            return f"{prefix}****"
-                        return f"{prefix}{sensitive_part[:4]}****"
-
-                    # MEDIUM 레벨은 앞뒤 일부 표시
-                    elif sensitivity == 'MEDIUM':
-                        if len(sensitive_part) <= 4:
-                            return f"{prefix}****"
-                        elif len(sensitive_part) <= 8:
-                            return f"{prefix}{sensitive_part[0]}***{sensitive_part[-1]}"
-                        return f"{prefix}{sensitive_part[:2]}***{sensitive_part[-2:]}"
-
-                    # LOW 레벨은 부분 마스킹
-                    else:
-                        if len(sensitive_part) <= 6:
-                            return f"{prefix}{sensitive_part[:len(sensitive_part)//2]}***"
-                        return f"{prefix}{sensitive_part[:len(sensitive_part)//3]}***"
-
-                masked_text = pattern.sub(mask_match, masked_text)
-
-        return masked_text
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # 소문자 변환으로 길이가 바뀌는 문자(예: 'İ')가 있으면 위치 대응이 깨지므로 전체 스캔
+            return _COMBINED_SENSITIVE_PATTERN.sub(_mask_match, text)
+
+        parts = []
+        last = 0
+        for candidate in _SENSITIVE_CANDIDATE.finditer(lowered):
+            start = candidate.start()
+            if start < last:
+                continue
+            match = _COMBINED_SENSITIVE_PATTERN.match(text, start)
+            if match:
+                parts.append(text[last:start])
+                parts.append(_mask_match(match))
+                last = match.end()
+
+        if not parts:
+            return text
+        parts.append(text[last:])
+        return ''.join(parts)
 
     def safe_log_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """딕셔너리 데이터의 안전한 로깅 버전 생성"""
@@ -196,7 +240,10 @@ class SecureLogger:
         self._original_logger = logger
 
     def _log(self, level: int, message: str, *args, **kwargs):
-        """안전한 로깅 실행"""
+        """안전한 로깅 실행 (비활성 레벨은 마스킹 전에 즉시 반환)"""
+        if not self.logger.isEnabledFor(level):
+            return
+
         try:
             # 메시지 안전하게 처리
             safe_message = self.security.format_safe_message(message, *args)
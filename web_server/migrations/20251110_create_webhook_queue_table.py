@@ -0,0 +1,178 @@
+"""
+마이그레이션: webhook_queue 테이블 생성 (웹훅 비동기 수신 모드)
+
+@FEAT:webhook-queue @COMP:migration @TYPE:core
+
+목적:
+- /api/webhook 요청을 검증 후 저장하고 즉시 응답 (WEBHOOK_ASYNC_INGESTION=true)
+- 워커 풀이 (strategy_id, symbol)별 FIFO로 대기열 처리
+
+의존성:
+- 없음 (독립 테이블, strategy_id는 테스트 모드 가상 ID도 허용하므로 외래키 없음)
+
+변경사항:
+- webhook_queue 테이블 생성 (11개 컬럼)
+- 인덱스 3개 생성 (상태별 선두 항목 조회, 키별 PROCESSING/선행 PENDING 확인, 완료 항목 보존 기간 정리)
+- payload에는 토큰을 제거한 웹훅 데이터만 저장 (인증은 수신 시 완료)
+
+롤백:
+- downgrade() 메서드로 안전한 롤백 지원
+
+실행 방법:
+1. 수동 실행: python migrations/20251110_create_webhook_queue_table.py
+
+작성일: 2025-11-10
+기능: webhook-queue
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(engine):
+    """
+    웹훅 대기열 테이블 생성
+
+    테이블:
+    1. webhook_queue: 수신 웹훅 저장 및 처리 상태 관리
+    """
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            # Check table existence
+            result = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'webhook_queue'
+                );
+            """))
+            if result.scalar():
+                print('ℹ️  webhook_queue table already exists. Skipping.')
+                trans.rollback()
+                return
+
+            print('🚀 웹훅 대기열 테이블 생성 시작...')
+
+            # ============================================
+            # 1. WebhookQueueItem 테이블 생성
+            # ============================================
+            print('📝 webhook_queue 테이블 생성 중...')
+            conn.execute(text("""
+                CREATE TABLE webhook_queue (
+                    -- 식별자 (FIFO 순서)
+                    id SERIAL PRIMARY KEY,
+
+                    -- 순서 보장 키
+                    strategy_id INTEGER NOT NULL,
+                    symbol VARCHAR(50) NOT NULL,
+                    group_name VARCHAR(100) NOT NULL,
+
+                    -- 웹훅 데이터 (토큰 제거)
+                    payload TEXT NOT NULL,
+
+                    -- 처리 상태
+                    status VARCHAR(20) DEFAULT 'PENDING' NOT NULL,
+                    webhook_received_at DOUBLE PRECISION NOT NULL,
+                    attempts INTEGER DEFAULT 0 NOT NULL,
+                    locked_at DOUBLE PRECISION,
+                    completed_at DOUBLE PRECISION,
+                    message TEXT
+                );
+            """))
+            print('✅ webhook_queue 테이블 생성 완료')
+
+            # ============================================
+            # 2. 인덱스 생성
+            # ============================================
+            print('📊 webhook_queue 인덱스 생성 중...')
+
+            # 처리 대기 선두 항목 조회 (status = 'PENDING' ORDER BY id)
+            conn.execute(text("""
+                CREATE INDEX idx_webhook_queue_status_id
+                ON webhook_queue(status, id);
+            """))
+            print('✅ idx_webhook_queue_status_id 생성 완료')
+
+            # 전략+심볼별 PROCESSING/선행 PENDING 존재 확인
+            conn.execute(text("""
+                CREATE INDEX idx_webhook_queue_key
+                ON webhook_queue(strategy_id, symbol, status);
+            """))
+            print('✅ idx_webhook_queue_key 생성 완료')
+
+            # 보존 기간이 지난 완료 항목 정리 (status IN ('DONE', 'FAILED') AND completed_at < ?)
+            conn.execute(text("""
+                CREATE INDEX idx_webhook_queue_completed
+                ON webhook_queue(status, completed_at);
+            """))
+            print('✅ idx_webhook_queue_completed 생성 완료')
+
+            # ============================================
+            # 3. 커밋
+            # ============================================
+            trans.commit()
+            print('✅ webhook_queue 테이블 생성 및 인덱스 설정 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 마이그레이션 실패: {e}')
+            raise
+
+
+def downgrade(engine):
+    """
+    웹훅 대기열 테이블 제거 (롤백)
+    """
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            print('🔄 webhook_queue 테이블 제거 시작...')
+
+            print('📊 webhook_queue 인덱스 제거 중...')
+            conn.execute(text("DROP INDEX IF EXISTS idx_webhook_queue_completed;"))
+            conn.execute(text("DROP INDEX IF EXISTS idx_webhook_queue_key;"))
+            conn.execute(text("DROP INDEX IF EXISTS idx_webhook_queue_status_id;"))
+            print('✅ 인덱스 제거 완료')
+
+            print('🗑️ webhook_queue 테이블 제거 중...')
+            conn.execute(text("DROP TABLE IF EXISTS webhook_queue;"))
+            print('✅ webhook_queue 테이블 제거 완료')
+
+            trans.commit()
+            print('✅ 롤백 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 롤백 실패: {e}')
+            raise
+
+
+if __name__ == '__main__':
+    """
+    마이그레이션 스크립트 직접 실행
+
+    Usage:
+        python migrations/20251110_create_webhook_queue_table.py
+    """
+    import os
+    import sys
+    from sqlalchemy import create_engine
+
+    # 프로젝트 루트 디렉토리를 Python 경로에 추가
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+    # 환경 변수에서 데이터베이스 URL 가져오기
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        print('❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.')
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+
+    print('=' * 60)
+    print('WebhookQueue 테이블 마이그레이션')
+    print('=' * 60)
+    upgrade(engine)
+    print('=' * 60)
@@ -0,0 +1,153 @@
+"""
+마이그레이션: strategy_account_daily_pnl 테이블 생성 (일일 손익 롤업)
+
+@FEAT:pnl-rollup @COMP:migration @TYPE:core
+
+목적:
+- 대시보드/분석 쿼리가 전체 Trade 대신 전략 계좌 × 일자 집계 행을 읽도록 함
+- Trade.pnl 기록 시 RecordManager가 증분 갱신
+
+의존성:
+- strategy_accounts 테이블 (외래키, ON DELETE CASCADE)
+
+변경사항:
+- strategy_account_daily_pnl 테이블 생성 (16개 컬럼)
+- (strategy_account_id, date) UNIQUE 제약 (계좌별 일자 범위 조회 인덱스 겸용)
+
+롤백:
+- downgrade() 메서드로 안전한 롤백 지원
+
+실행 방법:
+1. 수동 실행: python migrations/20251111_create_strategy_account_daily_pnl_table.py
+2. 기존 거래 백필: flask analytics rebuild-pnl-rollup
+
+작성일: 2025-11-11
+기능: pnl-rollup
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(engine):
+    """
+    일일 손익 롤업 테이블 생성
+
+    테이블:
+    1. strategy_account_daily_pnl: 전략 계좌별 일일 실현 손익/거래 통계/누적 손익
+    """
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            # Check table existence
+            result = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'strategy_account_daily_pnl'
+                );
+            """))
+            if result.scalar():
+                print('ℹ️  strategy_account_daily_pnl table already exists. Skipping.')
+                trans.rollback()
+                return
+
+            print('🚀 일일 손익 롤업 테이블 생성 시작...')
+
+            # ============================================
+            # 1. StrategyAccountDailyPnl 테이블 생성
+            # ============================================
+            print('📝 strategy_account_daily_pnl 테이블 생성 중...')
+            conn.execute(text("""
+                CREATE TABLE strategy_account_daily_pnl (
+                    id SERIAL PRIMARY KEY,
+
+                    -- 집계 키
+                    strategy_account_id INTEGER NOT NULL
+                        REFERENCES strategy_accounts(id) ON DELETE CASCADE,
+                    date DATE NOT NULL,
+
+                    -- 일일 집계
+                    realized_pnl DOUBLE PRECISION DEFAULT 0 NOT NULL,
+                    fees DOUBLE PRECISION DEFAULT 0 NOT NULL,
+                    trade_count INTEGER DEFAULT 0 NOT NULL,
+                    winning_trades INTEGER DEFAULT 0 NOT NULL,
+                    losing_trades INTEGER DEFAULT 0 NOT NULL,
+                    gross_profit DOUBLE PRECISION DEFAULT 0 NOT NULL,
+                    gross_loss DOUBLE PRECISION DEFAULT 0 NOT NULL,
+
+                    -- 일 종료 시점 누적 상태
+                    cumulative_pnl DOUBLE PRECISION DEFAULT 0 NOT NULL,
+                    peak_pnl DOUBLE PRECISION DEFAULT 0 NOT NULL,
+                    current_streak INTEGER DEFAULT 0 NOT NULL,
+                    max_win_streak INTEGER DEFAULT 0 NOT NULL,
+                    max_loss_streak INTEGER DEFAULT 0 NOT NULL,
+
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+                    CONSTRAINT uq_strategy_account_daily_pnl UNIQUE (strategy_account_id, date)
+                );
+            """))
+            print('✅ strategy_account_daily_pnl 테이블 생성 완료')
+
+            # ============================================
+            # 2. 커밋
+            # ============================================
+            trans.commit()
+            print('✅ strategy_account_daily_pnl 테이블 생성 완료')
+            print('ℹ️  기존 거래 백필: flask analytics rebuild-pnl-rollup')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 마이그레이션 실패: {e}')
+            raise
+
+
+def downgrade(engine):
+    """
+    일일 손익 롤업 테이블 제거 (롤백)
+    """
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            print('🗑️ strategy_account_daily_pnl 테이블 제거 중...')
+            conn.execute(text("DROP TABLE IF EXISTS strategy_account_daily_pnl;"))
+            print('✅ strategy_account_daily_pnl 테이블 제거 완료')
+
+            trans.commit()
+            print('✅ 롤백 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 롤백 실패: {e}')
+            raise
+
+
+if __name__ == '__main__':
+    """
+    마이그레이션 스크립트 직접 실행
+
+    Usage:
+        python migrations/20251111_create_strategy_account_daily_pnl_table.py
+    """
+    import os
+    import sys
+    from sqlalchemy import create_engine
+
+    # 프로젝트 루트 디렉토리를 Python 경로에 추가
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+    # 환경 변수에서 데이터베이스 URL 가져오기
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        print('❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.')
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+
+    print('=' * 60)
+    print('StrategyAccountDailyPnl 테이블 마이그레이션')
+    print('=' * 60)
+    upgrade(engine)
+    print('=' * 60)
@@ -0,0 +1,140 @@
+"""
+마이그레이션: 주문/거래 핫 쿼리용 복합·부분 인덱스 추가
+
+@FEAT:order-tracking @FEAT:analytics @COMP:migration @TYPE:core
+
+목적:
+- 수 초마다 실행되는 주문 상태 동기화/일괄 취소/분석 로더/웹훅 로그 조회의 순차 스캔 제거
+
+대상 쿼리:
+- update_open_orders_status: status IN (PENDING, NEW, OPEN, PARTIALLY_FILLED) AND is_processing = false
+- cancel_all_orders / 심볼별 주문 조회: strategy_account_id, symbol, status
+- CANCELLING 타임아웃 정리: status = 'CANCELLING' AND cancel_attempted_at < cutoff
+- 분석 일괄 로더: trades.strategy_account_id IN (...) AND timestamp 범위
+- 성과 집계: trade_executions.strategy_account_id IN (...) AND execution_time 범위
+- 웹훅 로그: received_at / webhook_received_at 범위·정렬
+
+변경사항:
+- open_orders: idx_open_orders_status, idx_open_orders_account_symbol_status,
+  idx_open_orders_active_unlocked (부분)
+  (CANCELLING 정리 쿼리는 기존 idx_open_orders_cancelling_cleanup 사용 - 20251030_add_cancelling_state.py)
+- trades: idx_trades_account_timestamp
+- trade_executions: idx_trade_exec_account_time
+- webhook_logs: idx_webhook_logs_received_at, idx_webhook_logs_webhook_received_at
+
+운영 중 테이블 잠금을 피하기 위해 CREATE INDEX CONCURRENTLY (autocommit)로 생성합니다.
+실패로 INVALID 상태가 된 인덱스는 IF NOT EXISTS에 걸리므로 downgrade 후 재실행하세요.
+
+검증:
+- python web_server/scripts/check_query_plans.py (주요 쿼리의 순차 스캔 보고)
+
+롤백:
+- downgrade() 메서드로 안전한 롤백 지원
+
+작성일: 2025-11-12
+"""
+
+from sqlalchemy import text
+
+# (인덱스 이름, 테이블, 생성 구문 본문)
+INDEXES = [
+    (
+        'idx_open_orders_status', 'open_orders',
+        "ON open_orders (status)",
+    ),
+    (
+        'idx_open_orders_account_symbol_status', 'open_orders',
+        "ON open_orders (strategy_account_id, symbol, status)",
+    ),
+    (
+        'idx_open_orders_active_unlocked', 'open_orders',
+        "ON open_orders (strategy_account_id, symbol) "
+        "WHERE status IN ('PENDING', 'NEW', 'OPEN', 'PARTIALLY_FILLED') AND is_processing = false",
+    ),
+    (
+        'idx_trades_account_timestamp', 'trades',
+        "ON trades (strategy_account_id, timestamp)",
+    ),
+    (
+        'idx_trade_exec_account_time', 'trade_executions',
+        "ON trade_executions (strategy_account_id, execution_time)",
+    ),
+    (
+        'idx_webhook_logs_received_at', 'webhook_logs',
+        "ON webhook_logs (received_at)",
+    ),
+    (
+        'idx_webhook_logs_webhook_received_at', 'webhook_logs',
+        "ON webhook_logs (webhook_received_at)",
+    ),
+]
+
+
+def _table_exists(conn, table_name):
+    result = conn.execute(text("""
+        SELECT EXISTS (
+            SELECT FROM information_schema.tables
+            WHERE table_name = :table_name
+        );
+    """), {'table_name': table_name})
+    return result.scalar()
+
+
+def upgrade(engine):
+    """핫 쿼리 인덱스 생성 (CONCURRENTLY)"""
+    # CREATE INDEX CONCURRENTLY는 트랜잭션 블록 안에서 실행할 수 없음
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        print('🚀 핫 쿼리 인덱스 생성 시작...')
+
+        for index_name, table_name, definition in INDEXES:
+            if not _table_exists(conn, table_name):
+                print(f'ℹ️  {table_name} table not found. Skipping {index_name}.')
+                continue
+
+            print(f'📝 {index_name} 생성 중...')
+            conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} {definition}"))
+            conn.execute(text(f"ANALYZE {table_name}"))
+
+        print('✅ 핫 쿼리 인덱스 생성 완료')
+
+
+def downgrade(engine):
+    """핫 쿼리 인덱스 제거 (롤백)"""
+    with engine.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        for index_name, _, _ in reversed(INDEXES):
+            print(f'🗑️ {index_name} 제거 중...')
+            conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+
+        print('✅ 롤백 완료')
+
+
+if __name__ == '__main__':
+    """
+    마이그레이션 스크립트 직접 실행
+
+    Usage:
+        python migrations/20251112_add_hot_query_indexes.py
+    """
+    import os
+    import sys
+    from sqlalchemy import create_engine
+
+    # 프로젝트 루트 디렉토리를 Python 경로에 추가
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+    # 환경 변수에서 데이터베이스 URL 가져오기
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        print('❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.')
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+
+    print('=' * 60)
+    print('핫 쿼리 인덱스 마이그레이션')
+    print('=' * 60)
+    upgrade(engine)
+    print('=' * 60)
@@ -0,0 +1,258 @@
+"""
+마이그레이션: 로그 테이블 월별 RANGE 파티션 전환
+
+@FEAT:log-retention @COMP:migration @TYPE:core
+
+목적:
+- 추가 전용 로그 테이블(webhook_logs, tracking_logs, order_fill_events)을 월별 파티션으로 전환
+- 보존 기간이 지난 데이터를 DELETE 대신 파티션 DROP(O(1))으로 제거하여 autovacuum 부하 제거
+- 파티션 생성/제거는 app.services.log_retention (maintain_log_partitions 백그라운드 작업)이 담당
+
+변경사항 (테이블별):
+1. 기존 테이블을 <table>_legacy로 이름 변경
+2. 동일 컬럼의 파티션 테이블 생성 (PARTITION BY RANGE (파티션 키))
+   - 파티션 키 NOT NULL, PRIMARY KEY (id, 파티션 키)
+   - 기존 id 시퀀스/외래키/인덱스 유지
+3. 기존 데이터 월 ~ 이번 달 + 2개월 월 파티션 + DEFAULT 파티션 생성
+4. 기존 데이터 복사 후 <table>_legacy 제거
+
+파티션 키:
+- webhook_logs.received_at
+- tracking_logs.created_at
+- order_fill_events.created_at
+
+주의:
+- 데이터 복사 동안 테이블 쓰기가 잠깁니다 (트래픽이 적은 시간대에 실행)
+- 이미 파티션 테이블이면 건너뜁니다
+
+롤백:
+- downgrade()는 일반 테이블로 되돌리고 데이터를 복사합니다
+
+작성일: 2025-11-13
+기능: log-retention
+"""
+
+from datetime import date
+
+from sqlalchemy import text
+
+MONTHS_AHEAD = 2
+
+# 테이블 → (파티션 키, 외래키, 인덱스)
+TABLES = {
+    'webhook_logs': {
+        'column': 'received_at',
+        'foreign_keys': [],
+        'indexes': [
+            ('idx_webhook_logs_received_at', 'received_at'),
+            ('idx_webhook_logs_webhook_received_at', 'webhook_received_at'),
+        ],
+    },
+    'tracking_logs': {
+        'column': 'created_at',
+        'foreign_keys': [
+            ('user_id', 'users'),
+            ('account_id', 'accounts'),
+            ('strategy_id', 'strategies'),
+        ],
+        'indexes': [
+            ('idx_tracking_log_type', 'log_type'),
+            ('idx_tracking_log_severity', 'severity'),
+            ('idx_tracking_log_created', 'created_at'),
+            ('idx_tracking_log_user', 'user_id'),
+            ('idx_tracking_log_symbol', 'symbol'),
+            ('idx_tracking_log_order', 'order_id'),
+        ],
+    },
+    'order_fill_events': {
+        'column': 'created_at',
+        'foreign_keys': [
+            ('account_id', 'accounts'),
+            ('strategy_account_id', 'strategy_accounts'),
+        ],
+        'indexes': [
+            ('idx_fill_order_id', 'exchange_order_id'),
+            ('idx_fill_processed', 'processed, event_time'),
+            ('idx_fill_account_symbol', 'account_id, symbol'),
+        ],
+    },
+}
+
+
+def _add_months(value, months):
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _table_exists(conn, table_name):
+    return conn.execute(text("""
+        SELECT EXISTS (
+            SELECT FROM information_schema.tables
+            WHERE table_name = :table_name
+        );
+    """), {'table_name': table_name}).scalar()
+
+
+def _is_partitioned(conn, table_name):
+    return conn.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM pg_partitioned_table pt
+            JOIN pg_class c ON c.oid = pt.partrelid
+            WHERE c.relname = :table_name
+        );
+    """), {'table_name': table_name}).scalar()
+
+
+def _partition_table(conn, table, spec):
+    column = spec['column']
+    legacy = f'{table}_legacy'
+    sequence = f'{table}_id_seq'
+
+    print(f'📝 {table} 파티션 전환 중...')
+
+    # 1. 기존 테이블 이름 변경 + 파티션 키 NULL 보정
+    conn.execute(text(f"ALTER TABLE {table} RENAME TO {legacy}"))
+    conn.execute(text(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey"))
+    conn.execute(text(f"UPDATE {legacy} SET {column} = now() WHERE {column} IS NULL"))
+
+    # 2. 파티션 테이블 생성 (컬럼/기본값 복사, id 시퀀스 공유)
+    conn.execute(text(f"""
+        CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS)
+        PARTITION BY RANGE ({column})
+    """))
+    conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} SET NOT NULL"))
+    conn.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id, {column})"))
+    for fk_column, referenced in spec['foreign_keys']:
+        conn.execute(text(
+            f"ALTER TABLE {table} ADD FOREIGN KEY ({fk_column}) REFERENCES {referenced}(id)"
+        ))
+
+    # 3. 월 파티션 (기존 데이터 첫 달 ~ 이번 달 + MONTHS_AHEAD) + DEFAULT
+    first = conn.execute(text(f"SELECT MIN({column}) FROM {legacy}")).scalar()
+    current = date.today().replace(day=1)
+    month = first.date().replace(day=1) if first else current
+    while month <= _add_months(current, MONTHS_AHEAD):
+        upper = _add_months(month, 1)
+        conn.execute(text(
+            f"CREATE TABLE {table}_p{month.strftime('%Y%m')} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{upper.isoformat()}')"
+        ))
+        month = upper
+    conn.execute(text(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT"))
+
+    # 4. 데이터 복사 + 시퀀스 소유권 이전 후 기존 테이블 제거
+    conn.execute(text(f"INSERT INTO {table} SELECT * FROM {legacy}"))
+    conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id"))
+    conn.execute(text(f"DROP TABLE {legacy}"))
+
+    # 5. 인덱스 (부모에 생성하면 모든 파티션에 전파)
+    for index_name, columns in spec['indexes']:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})"))
+
+    print(f'✅ {table} 파티션 전환 완료')
+
+
+def _unpartition_table(conn, table, spec):
+    column = spec['column']
+    partitioned = f'{table}_partitioned'
+    sequence = f'{table}_id_seq'
+
+    print(f'📝 {table} 일반 테이블로 복원 중...')
+
+    conn.execute(text(f"ALTER TABLE {table} RENAME TO {partitioned}"))
+    conn.execute(text(f"ALTER TABLE {partitioned} RENAME CONSTRAINT {table}_pkey TO {partitioned}_pkey"))
+    for index_name, _ in spec['indexes']:
+        conn.execute(text(f"DROP INDEX IF EXISTS {index_name}"))
+
+    conn.execute(text(f"CREATE TABLE {table} (LIKE {partitioned} INCLUDING DEFAULTS)"))
+    conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} DROP NOT NULL"))
+    conn.execute(text(f"ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY (id)"))
+    for fk_column, referenced in spec['foreign_keys']:
+        conn.execute(text(
+            f"ALTER TABLE {table} ADD FOREIGN KEY ({fk_column}) REFERENCES {referenced}(id)"
+        ))
+
+    conn.execute(text(f"INSERT INTO {table} SELECT * FROM {partitioned}"))
+    conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY {table}.id"))
+    conn.execute(text(f"DROP TABLE {partitioned}"))
+
+    for index_name, columns in spec['indexes']:
+        conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {table} ({columns})"))
+
+    print(f'✅ {table} 복원 완료')
+
+
+def upgrade(engine):
+    """로그 테이블 월별 파티션 전환"""
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            print('🚀 로그 테이블 파티션 전환 시작...')
+
+            for table, spec in TABLES.items():
+                if not _table_exists(conn, table):
+                    print(f'ℹ️  {table} table not found. Skipping (initial install).')
+                    continue
+                if _is_partitioned(conn, table):
+                    print(f'ℹ️  {table} is already partitioned. Skipping.')
+                    continue
+                _partition_table(conn, table, spec)
+
+            trans.commit()
+            print('✅ 로그 테이블 파티션 전환 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 마이그레이션 실패: {e}')
+            raise
+
+
+def downgrade(engine):
+    """파티션 테이블을 일반 테이블로 복원 (롤백)"""
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            for table, spec in TABLES.items():
+                if not _table_exists(conn, table) or not _is_partitioned(conn, table):
+                    continue
+                _unpartition_table(conn, table, spec)
+
+            trans.commit()
+            print('✅ 롤백 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 롤백 실패: {e}')
+            raise
+
+
+if __name__ == '__main__':
+    """
+    마이그레이션 스크립트 직접 실행
+
+    Usage:
+        python migrations/20251113_partition_log_tables.py
+    """
+    import os
+    import sys
+    from sqlalchemy import create_engine
+
+    # 프로젝트 루트 디렉토리를 Python 경로에 추가
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+    # 환경 변수에서 데이터베이스 URL 가져오기
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        print('❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.')
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+
+    print('=' * 60)
+    print('로그 테이블 파티션 마이그레이션')
+    print('=' * 60)
+    upgrade(engine)
+    print('=' * 60)
@@ -0,0 +1,98 @@
+"""
+마이그레이션: strategy_positions.unrealized_pnl 컬럼 추가
+
+@FEAT:position-tracking @COMP:migration @TYPE:core
+
+목적:
+- calculate_unrealized_pnl 백그라운드 작업이 계산한 미실현 손익을 저장
+  (기존에는 저장할 컬럼이 없어 계산 결과가 버려졌음)
+- 작업은 UPDATE ... FROM (VALUES ...) 한 번으로 일괄 갱신
+
+변경사항:
+- strategy_positions.unrealized_pnl DOUBLE PRECISION NOT NULL DEFAULT 0
+
+롤백:
+- downgrade() 메서드로 안전한 롤백 지원
+
+작성일: 2025-11-14
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(engine):
+    """unrealized_pnl 컬럼 추가"""
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            result = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'strategy_positions'
+                );
+            """))
+            if not result.scalar():
+                print('ℹ️  strategy_positions table not found. Skipping (initial install).')
+                trans.rollback()
+                return
+
+            print('📝 strategy_positions.unrealized_pnl 컬럼 추가 중...')
+            conn.execute(text("""
+                ALTER TABLE strategy_positions
+                ADD COLUMN IF NOT EXISTS unrealized_pnl DOUBLE PRECISION NOT NULL DEFAULT 0;
+            """))
+
+            trans.commit()
+            print('✅ unrealized_pnl 컬럼 추가 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 마이그레이션 실패: {e}')
+            raise
+
+
+def downgrade(engine):
+    """unrealized_pnl 컬럼 제거 (롤백)"""
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            conn.execute(text("ALTER TABLE strategy_positions DROP COLUMN IF EXISTS unrealized_pnl;"))
+            trans.commit()
+            print('✅ 롤백 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 롤백 실패: {e}')
+            raise
+
+
+if __name__ == '__main__':
+    """
+    마이그레이션 스크립트 직접 실행
+
+    Usage:
+        python migrations/20251114_add_position_unrealized_pnl.py
+    """
+    import os
+    import sys
+    from sqlalchemy import create_engine
+
+    # 프로젝트 루트 디렉토리를 Python 경로에 추가
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+    # 환경 변수에서 데이터베이스 URL 가져오기
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        print('❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.')
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+
+    print('=' * 60)
+    print('포지션 미실현 손익 컬럼 마이그레이션')
+    print('=' * 60)
+    upgrade(engine)
+    print('=' * 60)
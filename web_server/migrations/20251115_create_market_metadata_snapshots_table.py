@@ -0,0 +1,122 @@
+"""
+마이그레이션: market_metadata_snapshots 테이블 생성 (심볼 정보 스냅샷)
+
+@FEAT:symbol-validation @COMP:migration @TYPE:core
+
+목적:
+- SymbolValidator가 기동 시 exchangeInfo 다운로드 없이 MarketInfo 테이블을 복원
+- 최신 정보는 기동 후 백그라운드에서 병렬로 받아 교체하고 스냅샷도 갱신
+
+변경사항:
+- market_metadata_snapshots 테이블 생성 (거래소 × market_type당 1행)
+- payload: zlib 압축 JSON (BYTEA), schema_version/fetched_at으로 유효성 판단
+
+롤백:
+- downgrade() 메서드로 안전한 롤백 지원 (스냅샷이 없으면 기존처럼 API로 로드)
+
+실행 방법:
+1. 수동 실행: python migrations/20251115_create_market_metadata_snapshots_table.py
+2. 최초 스냅샷은 다음 기동(또는 매시 15분 Symbol 갱신) 시 자동 저장
+
+작성일: 2025-11-15
+기능: symbol-validation
+"""
+
+from sqlalchemy import text
+
+
+def upgrade(engine):
+    """
+    심볼 정보 스냅샷 테이블 생성
+
+    테이블:
+    1. market_metadata_snapshots: 거래소 × market_type별 파싱된 MarketInfo 스냅샷
+    """
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            # Check table existence
+            result = conn.execute(text("""
+                SELECT EXISTS (
+                    SELECT FROM information_schema.tables
+                    WHERE table_name = 'market_metadata_snapshots'
+                );
+            """))
+            if result.scalar():
+                print('ℹ️  market_metadata_snapshots table already exists. Skipping.')
+                trans.rollback()
+                return
+
+            print('📝 market_metadata_snapshots 테이블 생성 중...')
+            conn.execute(text("""
+                CREATE TABLE market_metadata_snapshots (
+                    exchange VARCHAR(20) NOT NULL,
+                    market_type VARCHAR(10) NOT NULL,
+                    schema_version INTEGER NOT NULL,
+                    market_count INTEGER DEFAULT 0 NOT NULL,
+                    payload BYTEA NOT NULL,
+                    fetched_at TIMESTAMP NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+
+                    PRIMARY KEY (exchange, market_type)
+                );
+            """))
+
+            trans.commit()
+            print('✅ market_metadata_snapshots 테이블 생성 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 마이그레이션 실패: {e}')
+            raise
+
+
+def downgrade(engine):
+    """
+    심볼 정보 스냅샷 테이블 제거 (롤백)
+    """
+    with engine.connect() as conn:
+        trans = conn.begin()
+        try:
+            print('🗑️ market_metadata_snapshots 테이블 제거 중...')
+            conn.execute(text("DROP TABLE IF EXISTS market_metadata_snapshots;"))
+
+            trans.commit()
+            print('✅ 롤백 완료')
+
+        except Exception as e:
+            trans.rollback()
+            print(f'❌ 롤백 실패: {e}')
+            raise
+
+
+if __name__ == '__main__':
+    """
+    마이그레이션 스크립트 직접 실행
+
+    Usage:
+        python migrations/20251115_create_market_metadata_snapshots_table.py
+    """
+    import os
+    import sys
+    from sqlalchemy import create_engine
+
+    # 프로젝트 루트 디렉토리를 Python 경로에 추가
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+    # 환경 변수에서 데이터베이스 URL 가져오기
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    database_url = os.getenv('DATABASE_URL')
+    if not database_url:
+        print('❌ DATABASE_URL 환경 변수가 설정되지 않았습니다.')
+        sys.exit(1)
+
+    engine = create_engine(database_url)
+
+    print('=' * 60)
+    print('MarketMetadataSnapshot 테이블 마이그레이션')
+    print('=' * 60)
+    upgrade(engine)
+    print('=' * 60)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# @FEAT:order-tracking @FEAT:analytics @COMP:util @TYPE:helper
+"""
+핫 쿼리 실행 계획 점검 스크립트 (EXPLAIN)
+
+주문 상태 동기화, 일괄 취소, 분석 로더, 웹훅 로그 조회의 주요 쿼리 형태를 EXPLAIN 하여
+대상 테이블을 순차 스캔(Seq Scan / SCAN)하는 쿼리를 보고합니다.
+인덱스 마이그레이션(migrations/20251112_add_hot_query_indexes.py) 적용 확인용입니다.
+
+PostgreSQL은 기본적으로 enable_seqscan=off로 계획을 세워 "사용 가능한 인덱스가 있는지"를 봅니다
+(데이터가 적은 개발 DB에서는 인덱스가 있어도 순차 스캔이 더 싸게 계산되기 때문).
+실제 데이터 기준 계획은 --natural 옵션으로 확인하세요.
+
+실행 방법:
+    python web_server/scripts/check_query_plans.py
+    python web_server/scripts/check_query_plans.py --natural --verbose
+
+종료 코드: 순차 스캔이 있으면 1, 없으면 0
+"""
+
+import argparse
+import re
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# web_server를 Python path에 추가
+web_server_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(web_server_root))
+
+_SQLITE_SEQ_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+_POSTGRES_SEQ_SCAN = re.compile(r'Seq Scan on (\w+)')
+
+
+def build_query_shapes() -> List[Tuple[str, str, object]]:
+    """점검 대상 쿼리 형태 (이름, 대상 테이블, SELECT 구문) - 서비스 코드의 필터 조건과 동일"""
+    from sqlalchemy import select
+
+    from app.constants import OrderStatus
+    from app.models import OpenOrder, Trade, TradeExecution, WebhookLog
+
+    now = datetime.utcnow()
+    account_ids = [1, 2, 3]
+
+    return [
+        (
+            'update_open_orders_status (활성 + 미잠금 주문)', 'open_orders',
+            select(OpenOrder.id).where(
+                OpenOrder.status.in_(OrderStatus.get_active_statuses()),
+                OpenOrder.is_processing == False
+            ),
+        ),
+        (
+            'cancel_all_orders (계좌 + 심볼 미체결 주문)', 'open_orders',
+            select(OpenOrder.id).where(
+                OpenOrder.strategy_account_id == account_ids[0],
+                OpenOrder.symbol == 'BTC/USDT',
+                OpenOrder.status.in_(OrderStatus.get_open_statuses())
+            ),
+        ),
+        (
+            'cleanup_stuck_cancelling (CANCELLING 타임아웃)', 'open_orders',
+            select(OpenOrder.id).where(
+                OpenOrder.status == OrderStatus.CANCELLING,
+                OpenOrder.cancel_attempted_at < now - timedelta(minutes=2)
+            ),
+        ),
+        (
+            'load_trade_columns (계좌 거래 기간 조회)', 'trades',
+            select(Trade.timestamp, Trade.pnl).where(
+                Trade.strategy_account_id.in_(account_ids),
+                Trade.timestamp >= now - timedelta(days=30)
+            ).order_by(Trade.timestamp),
+        ),
+        (
+            'calculate_performance_range (계좌 체결 기간 조회)', 'trade_executions',
+            select(TradeExecution.execution_time, TradeExecution.realized_pnl).where(
+                TradeExecution.strategy_account_id.in_(account_ids),
+                TradeExecution.execution_time >= now - timedelta(days=7)
+            ),
+        ),
+        (
+            'webhook logs (최근 수신 로그)', 'webhook_logs',
+            select(WebhookLog.id).where(
+                WebhookLog.received_at >= now - timedelta(hours=1)
+            ).order_by(WebhookLog.received_at.desc()),
+        ),
+    ]
+
+
+def explain(connection, stmt) -> List[str]:
+    """SELECT 구문의 실행 계획 (줄 단위)"""
+    dialect = connection.dialect
+    compiled = stmt.compile(dialect=dialect, compile_kwargs={'render_postcompile': True})
+    if compiled.positional:
+        params = tuple(compiled.params[name] for name in compiled.positiontup)
+    else:
+        params = compiled.params
+
+    if dialect.name == 'sqlite':
+        rows = connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}', params).fetchall()
+        return [row[-1] for row in rows]
+
+    rows = connection.exec_driver_sql(f'EXPLAIN {compiled}', params).fetchall()
+    return [row[0] for row in rows]
+
+
+def find_sequential_scans(plan: List[str], dialect_name: str) -> List[str]:
+    """실행 계획에서 순차 스캔 대상 테이블 목록"""
+    pattern = _SQLITE_SEQ_SCAN if dialect_name == 'sqlite' else _POSTGRES_SEQ_SCAN
+    tables = []
+    for line in plan:
+        match = pattern.search(line.strip())
+        if match:
+            tables.append(match.group(1))
+    return tables
+
+
+def check_query_plans(connection, force_index: bool = True) -> List[Dict]:
+    """
+    모든 쿼리 형태를 점검합니다.
+
+    Returns:
+        [{'name', 'table', 'seq_scan', 'plan'}] - seq_scan은 대상 테이블 순차 스캔 여부
+    """
+    dialect_name = connection.dialect.name
+    results = []
+
+    with connection.begin():
+        if force_index and dialect_name == 'postgresql':
+            connection.exec_driver_sql('SET LOCAL enable_seqscan = off')
+
+        for name, table, stmt in build_query_shapes():
+            plan = explain(connection, stmt)
+            results.append({
+                'name': name,
+                'table': table,
+                'seq_scan': table in find_sequential_scans(plan, dialect_name),
+                'plan': plan,
+            })
+
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='핫 쿼리 순차 스캔 점검 (EXPLAIN)')
+    parser.add_argument('--natural', action='store_true',
+                        help='PostgreSQL enable_seqscan 강제 해제 없이 실제 계획으로 점검')
+    parser.add_argument('--verbose', action='store_true', help='전체 실행 계획 출력')
+    args = parser.parse_args()
+
+    from app import create_app, db
+
+    app = create_app()
+    with app.app_context():
+        with db.engine.connect() as connection:
+            results = check_query_plans(connection, force_index=not args.natural)
+
+    seq_scans = 0
+    for result in results:
+        if result['seq_scan']:
+            seq_scans += 1
+            print(f"❌ {result['name']}: {result['table']} 순차 스캔")
+        else:
+            print(f"✅ {result['name']}")
+        if args.verbose or result['seq_scan']:
+            for line in result['plan']:
+                print(f"     {line}")
+
+    print(f"\n점검 {len(results)}건, 순차 스캔 {seq_scans}건")
+    return 1 if seq_scans else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())